@@ -0,0 +1,646 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Offline retrieval benchmark of the kit_fns, usd_code_fns and omni_ui_fns functions.
+
+Runs the retrieval functions of the three packages without NVIDIA endpoints:
+
+- ``kit_search_code_examples``: ``kit_fns.functions.search_code_examples``
+- ``kit_search_extensions``: ``kit_fns.functions.search_extensions``
+- ``usd_get_rag_context_code``: ``omni_aiq_usd_code.services.retrieval.get_rag_context_code``
+- ``omni_ui_code_examples``: ``omni_ui_fns.services.retrieval.get_rag_context_omni_ui_code``
+- ``omni_ui_window_examples``: ``omni_ui_fns.functions.get_window_examples``
+
+The functions use their ``local`` embedder and reranker backends, pointed at
+the deterministic models of ``stub_models.py``. Each target searches a FAISS
+index built from the labeled documents of ``queries.json`` and seeded filler
+documents, so the results are the same on every run.
+
+For every target, the benchmark reports:
+
+- recall@k and MRR of the labeled queries
+- per-query latency percentiles of the whole call and of its stages: ``embed``
+  (query embedding), ``search`` (FAISS search and docstore lookup), ``rerank``
+  and ``format`` (the rest of the call: result formatting, setup done per call)
+- queries per second and latency percentiles under concurrent callers
+- resident memory after building the target and after running it
+
+The results are written to a JSON file; ``--baseline`` compares them with the
+file of another commit.
+
+Usage:
+    python benchmark_retrieval.py --output results.json
+    python benchmark_retrieval.py --filler 20000 --concurrency 1 4 16 --embed-latency-ms 20
+    python benchmark_retrieval.py --output new.json --baseline old.json
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+import platform
+import random
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+HERE = Path(__file__).resolve().parent
+AIQ_ROOT = HERE.parent.parent
+for package_src in ["kit_fns/src", "usd_code_fns/src", "omni_ui_fns/src"]:
+    sys.path.insert(0, str(AIQ_ROOT / package_src))
+sys.path.insert(0, str(HERE))
+
+from stub_models import StubModelServer, embed_text
+
+RESULTS_VERSION = 1
+STAGES = ("embed", "search", "rerank", "format")
+RECALL_AT = (1, 5, 10)
+
+_REF_PATTERN = re.compile(r"\[ref:([^\]]+)\]")
+
+# Words of the filler documents, so they compete with the labeled ones
+FILLER_VOCABULARY = """
+stage prim layer reference payload variant attribute relationship mesh points xform transform camera light
+material shader bind viewport window menu widget button label field slider frame stack grid tree model item
+delegate style color event subscription callback update frame async command undo selection setting path
+extension manager registry notification dialog file open save asset browser search filter sort column row
+physics collider joint animation timeline sequencer graph node execute render capture image texture bound
+cache time sample query traverse instance scope hydra delegate scene overlay manipulator gizmo drag drop
+""".split()
+
+
+def filler_documents(target: str, count: int, seed: int) -> List[Dict[str, str]]:
+    """Generate documents made of random domain words."""
+    rng = random.Random(f"{target}:{seed}")
+    documents = []
+    for i in range(count):
+        words = rng.sample(FILLER_VOCABULARY, 3)
+        text = " ".join(rng.choice(FILLER_VOCABULARY) for _ in range(rng.randint(10, 24)))
+        code_lines = [f"    {rng.choice(FILLER_VOCABULARY)}_{j} = {rng.choice(FILLER_VOCABULARY)}()" for j in range(6)]
+        documents.append(
+            {
+                "ref": f"omni.filler.{target}.ext{i}" if target == "kit_search_extensions" else f"filler_{target}_{i}",
+                "title": "_".join(words),
+                "extension": f"omni.filler.ext{i % 97}",
+                "text": text,
+                "code": f"def {'_'.join(words)}():\n" + "\n".join(code_lines),
+            }
+        )
+    return documents
+
+
+def with_ref(code: str, ref: str) -> str:
+    """Mark the code of a document with its reference, so it can be found in the output."""
+    return f"# [ref:{ref}]\n{code}"
+
+
+def extract_refs(output: str) -> List[str]:
+    """References of the documents in the output of a function, in order."""
+    refs = []
+    for ref in _REF_PATTERN.findall(output or ""):
+        if ref not in refs:
+            refs.append(ref)
+    return refs
+
+
+# Index building
+
+
+def build_vectorstore(entries: List[Dict[str, Any]], output_path: Path):
+    """Save a FAISS vector store of (page content, embedded text, metadata) entries."""
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.embeddings import Embeddings
+
+    class StubEmbeddings(Embeddings):
+        def embed_documents(self, texts):
+            return [embed_text(text) for text in texts]
+
+        def embed_query(self, text):
+            return embed_text(text)
+
+    vectorstore = FAISS.from_embeddings(
+        text_embeddings=[(entry["page_content"], embed_text(entry["embed"])) for entry in entries],
+        embedding=StubEmbeddings(),
+        metadatas=[entry["metadata"] for entry in entries],
+    )
+    vectorstore.save_local(str(output_path))
+
+
+def kit_code_entries(documents):
+    for doc in documents:
+        code = with_ref(doc["code"], doc["ref"])
+        yield {
+            "page_content": f"Method: {doc['title']}\nExtension: {doc['extension']}\n{doc['text']}\nCode preview:\n{code}",
+            "embed": f"{doc['title']} {doc['text']}",
+            "metadata": {
+                "method_key": doc["ref"],
+                "name": doc["title"],
+                "extension": doc["extension"],
+                "file_path": f"{doc['extension'].replace('.', '/')}/impl.py",
+                "module": doc["extension"],
+                "source_code": code,
+                "line_count": code.count("\n") + 1,
+                "complexity_score": 3,
+                "is_async": doc["code"].startswith("async"),
+            },
+        }
+
+
+def kit_extension_entries(documents):
+    for doc in documents:
+        yield {
+            "page_content": f"{doc['ref']}: {doc['title']}. {doc['text']}",
+            "embed": f"{doc['ref']} {doc['title']} {doc['text']}",
+            "metadata": {
+                "extension_id": doc["ref"],
+                "version": "1.0.0",
+                "description": f"{doc['text']} [ref:{doc['ref']}]",
+            },
+        }
+
+
+def usd_code_entries(documents):
+    for doc in documents:
+        code = with_ref(doc["code"], doc["ref"])
+        yield {
+            "page_content": code,
+            "embed": f"{doc['title']} {doc['text']}",
+            "metadata": {
+                "index_text": doc["title"],
+                "index_text_tokens": len(doc["title"].split()),
+                "content_tokens": len(code.split()),
+            },
+        }
+
+
+def omni_ui_code_entries(documents):
+    for doc in documents:
+        yield {
+            "page_content": f"{doc['title']}: {doc['text']}",
+            "embed": f"{doc['title']} {doc['text']}",
+            "metadata": {
+                "file_name": f"{doc['title'].split('.')[0].lower()}.py",
+                "file_path": f"omni/ui/examples/{doc['title'].split('.')[0].lower()}.py",
+                "method_name": doc["title"],
+                "source_code": with_ref(doc["code"], doc["ref"]),
+            },
+        }
+
+
+def omni_ui_window_entries(documents):
+    for doc in documents:
+        class_name, _, function_name = doc["title"].rpartition(".")
+        yield {
+            "page_content": f"{doc['title']}: {doc['text']}",
+            "embed": f"{doc['title']} {doc['text']}",
+            "metadata": {
+                "description": doc["text"],
+                "code": with_ref(doc["code"], doc["ref"]),
+                "file_path": f"omni/ui/windows/{function_name.strip('_')}.py",
+                "function_name": function_name,
+                "class_name": class_name or "unknown",
+                "line_number": 1,
+            },
+        }
+
+
+# Targets
+
+
+class StageProbe:
+    """Measures the time of the embedding, search and rerank stages of the calls of each thread."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._patched = []
+
+    def begin(self):
+        self._local.times = {stage: 0.0 for stage in STAGES}
+
+    def end(self) -> Dict[str, float]:
+        times, self._local.times = self._local.times, None
+        return times
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                times = getattr(self._local, "times", None)
+                if times is not None:
+                    times[stage] += time.perf_counter() - start
+
+        return timed
+
+    def patch(self, owner: Any, name: str, stage: str):
+        original = getattr(owner, name)
+        self._patched.append((owner, name, original))
+        setattr(owner, name, self.wrap(stage, original))
+
+    def install(self):
+        from langchain_community.vectorstores import FAISS
+
+        self.patch(FAISS, "_embed_query", "embed")
+        self.patch(FAISS, "similarity_search_with_score_by_vector", "search")
+
+    def uninstall(self):
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched.clear()
+
+
+_loops = threading.local()
+
+
+def run_async(coroutine):
+    """Run a coroutine on the event loop of the calling thread."""
+    loop = getattr(_loops, "loop", None)
+    if loop is None:
+        loop = _loops.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coroutine)
+
+
+def setup_kit_search_code_examples(index_path: Path, work_dir: Path, server_url: str, probe: StageProbe):
+    from kit_fns.functions import search_code_examples as module
+    from kit_fns.services.code_search_service import CodeSearchService
+    from kit_fns.services.embedder_service import EmbedderFactory
+    from kit_fns.services.faiss_index import load_faiss_vectorstore
+    from kit_fns.services.reranking import create_reranker_with_config
+
+    service = CodeSearchService()
+    service.embedder = EmbedderFactory.create()
+    service.code_vectorstore = load_faiss_vectorstore(index_path, service.embedder)
+    service.test_vectorstore = service.code_vectorstore
+    module._code_search_service = service
+
+    reranker = create_reranker_with_config({"backend": "local", "local_url": server_url})
+    probe.patch(reranker, "rerank", "rerank")
+    module._reranker = reranker
+
+    return lambda query: run_async(module.search_code_examples(query))["result"]
+
+
+def setup_kit_search_extensions(index_path: Path, work_dir: Path, server_url: str, probe: StageProbe, documents=()):
+    from kit_fns.functions import search_extensions as module
+    from kit_fns.services.extension_service import ExtensionService
+    from kit_fns.services.kit_exts_atlas import KitExtensionsAtlasService
+
+    database_file = work_dir / "extensions_database.json"
+    database = {
+        "extensions": {
+            doc["ref"]: {
+                "version": "1.0.0",
+                "title": doc["title"],
+                "description": doc["text"],
+                "long_description": doc["text"],
+                "keywords": [],
+                "dependencies": [],
+            }
+            for doc in documents
+        }
+    }
+    database_file.write_text(json.dumps(database))
+
+    service = ExtensionService(faiss_db_path=str(index_path))
+    service.atlas_service = KitExtensionsAtlasService(
+        database_file_path=str(database_file), codeatlas_dir=str(work_dir), api_docs_dir=str(work_dir)
+    )
+    module._extension_service = service
+
+    return lambda query: run_async(module.search_extensions(query, top_k=10))["result"]
+
+
+def setup_usd_get_rag_context_code(index_path: Path, work_dir: Path, server_url: str, probe: StageProbe):
+    from omni_aiq_usd_code.services.reranking import create_reranker_with_config
+    from omni_aiq_usd_code.services.retrieval import Retriever, get_rag_context_code
+
+    retriever = Retriever(embedding_config={"endpoint": server_url}, load_path=str(index_path))
+    reranker = create_reranker_with_config({"backend": "local", "local_url": server_url})
+    probe.patch(reranker, "rerank", "rerank")
+
+    return lambda query: get_rag_context_code(query, retriever, reranker=reranker)
+
+
+def setup_omni_ui_code_examples(index_path: Path, work_dir: Path, server_url: str, probe: StageProbe):
+    from omni_ui_fns.services.reranking import create_reranker_with_config
+    from omni_ui_fns.services.retrieval import Retriever, get_rag_context_omni_ui_code
+
+    retriever = Retriever(embedding_config={"endpoint": server_url}, load_path=str(index_path))
+    reranker = create_reranker_with_config({"backend": "local", "local_url": server_url})
+    probe.patch(reranker, "rerank", "rerank")
+
+    return lambda query: get_rag_context_omni_ui_code(query, retriever, reranker=reranker)
+
+
+def setup_omni_ui_window_examples(index_path: Path, work_dir: Path, server_url: str, probe: StageProbe):
+    from omni_ui_fns.functions.get_window_examples import get_window_examples
+
+    # The function loads the index on every call, like the MCP tool does
+    return lambda query: run_async(get_window_examples(query, top_k=5, faiss_index_path=str(index_path)))["result"]
+
+
+TARGETS = {
+    "kit_search_code_examples": (kit_code_entries, setup_kit_search_code_examples),
+    "kit_search_extensions": (kit_extension_entries, setup_kit_search_extensions),
+    "usd_get_rag_context_code": (usd_code_entries, setup_usd_get_rag_context_code),
+    "omni_ui_code_examples": (omni_ui_code_entries, setup_omni_ui_code_examples),
+    "omni_ui_window_examples": (omni_ui_window_entries, setup_omni_ui_window_examples),
+}
+
+
+# Measurements
+
+
+def rss_mb() -> float:
+    """Current resident memory of the process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def percentiles(values_ms: List[float]) -> Dict[str, float]:
+    values = np.asarray(values_ms, dtype=np.float64)
+    return {
+        "mean": round(float(values.mean()), 3),
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p95": round(float(np.percentile(values, 95)), 3),
+        "p99": round(float(np.percentile(values, 99)), 3),
+    }
+
+
+def quality(outputs: List[str], queries: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Recall@k and mean reciprocal rank of the labeled documents in the outputs."""
+    recalls = {k: [] for k in RECALL_AT}
+    reciprocal_ranks = []
+    for output, query in zip(outputs, queries):
+        refs = extract_refs(output)
+        relevant = set(query["relevant"])
+        for k in RECALL_AT:
+            recalls[k].append(len(relevant & set(refs[:k])) / len(relevant))
+        rank = next((i for i, ref in enumerate(refs, 1) if ref in relevant), None)
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+
+    result = {f"recall@{k}": round(float(np.mean(values)), 4) for k, values in recalls.items()}
+    result["mrr"] = round(float(np.mean(reciprocal_ranks)), 4)
+    return result
+
+
+def timed_call(run: Callable[[str], str], query: str, probe: StageProbe):
+    probe.begin()
+    start = time.perf_counter()
+    output = run(query)
+    total = time.perf_counter() - start
+    stages = probe.end()
+    stages["format"] = max(0.0, total - stages["embed"] - stages["search"] - stages["rerank"])
+    return output, total, stages
+
+
+def benchmark_target(
+    name: str,
+    documents: List[Dict[str, str]],
+    queries: List[Dict[str, Any]],
+    work_dir: Path,
+    server_url: str,
+    probe: StageProbe,
+    rounds: int,
+    concurrency: List[int],
+) -> Dict[str, Any]:
+    entries_fn, setup_fn = TARGETS[name]
+    target_dir = work_dir / name
+    target_dir.mkdir()
+    index_path = target_dir / "faiss"
+
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    build_vectorstore(list(entries_fn(documents)), index_path)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kwargs = {"documents": documents} if name == "kit_search_extensions" else {}
+    # The services log errors for the missing packaged data they try to load on creation
+    logging.disable(logging.ERROR)
+    try:
+        run = setup_fn(index_path, target_dir, server_url, probe, **kwargs)
+    finally:
+        logging.disable(logging.NOTSET)
+    setup_time = time.perf_counter() - start
+    rss_setup = rss_mb()
+
+    texts = [query["query"] for query in queries]
+
+    # Warm up, then measure the calls one at a time
+    for text in texts:
+        run(text)
+
+    totals, stage_times, outputs = [], {stage: [] for stage in STAGES}, []
+    for _ in range(rounds):
+        outputs = []
+        for text in texts:
+            output, total, stages = timed_call(run, text, probe)
+            outputs.append(output)
+            totals.append(total * 1000)
+            for stage in STAGES:
+                stage_times[stage].append(stages[stage] * 1000)
+
+    concurrent_results = {}
+    for workers in concurrency:
+        calls = texts * rounds
+        latencies = []
+
+        def call(text):
+            start = time.perf_counter()
+            run(text)
+            return (time.perf_counter() - start) * 1000
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            latencies = list(executor.map(call, calls))
+            elapsed = time.perf_counter() - start
+
+        concurrent_results[str(workers)] = {"qps": round(len(calls) / elapsed, 2), "latency_ms": percentiles(latencies)}
+
+    return {
+        "documents": len(documents),
+        "queries": len(queries),
+        "quality": quality(outputs, queries),
+        "latency_ms": {"total": percentiles(totals), **{stage: percentiles(stage_times[stage]) for stage in STAGES}},
+        "concurrency": concurrent_results,
+        "memory_mb": {
+            "index_on_disk": round(sum(p.stat().st_size for p in index_path.iterdir()) / 2**20, 3),
+            "rss_increase_setup": round(rss_setup - rss_before, 2),
+            "rss_after_run": round(rss_mb(), 2),
+            "peak_rss": round(peak_rss_mb(), 2),
+        },
+        "build_s": round(build_time, 3),
+        "setup_s": round(setup_time, 3),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=HERE, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]):
+    """Print the changes from a baseline results file."""
+    print(f"\nCompared with {baseline.get('git_commit') or 'baseline'}:")
+    print(f"{'target':<28} {'p50 ms':>16} {'p95 ms':>16} {'qps':>16} {'mrr':>14}")
+    for name, target in results["targets"].items():
+        base = baseline.get("targets", {}).get(name)
+        if not base:
+            print(f"{name:<28} (not in baseline)")
+            continue
+
+        top = str(max(int(c) for c in target["concurrency"])) if target["concurrency"] else None
+        columns = []
+        for new, old in [
+            (target["latency_ms"]["total"]["p50"], base["latency_ms"]["total"]["p50"]),
+            (target["latency_ms"]["total"]["p95"], base["latency_ms"]["total"]["p95"]),
+            (
+                target["concurrency"].get(top, {}).get("qps", 0),
+                base.get("concurrency", {}).get(top, {}).get("qps", 0),
+            ),
+        ]:
+            change = f"{(new - old) / old * 100:+.0f}%" if old else "n/a"
+            columns.append(f"{new:9.2f} {change:>6}")
+        mrr = target["quality"]["mrr"]
+        columns.append(f"{mrr:7.3f} {mrr - base['quality']['mrr']:+.3f}")
+        print(f"{name:<28} " + " ".join(f"{column:>16}" for column in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, default=Path("retrieval_benchmark.json"), help="Results JSON file")
+    parser.add_argument("--baseline", type=Path, help="Results JSON file of another commit to compare with")
+    parser.add_argument("--queries", type=Path, default=HERE / "queries.json", help="Labeled documents and queries")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS), help="Targets to run")
+    parser.add_argument("--filler", type=int, default=2000, help="Filler documents added to every index")
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over the queries")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8], help="Concurrent callers")
+    parser.add_argument("--embed-latency-ms", type=float, default=0.0, help="Latency added to every embedding")
+    parser.add_argument("--rerank-latency-ms", type=float, default=0.0, help="Latency added to every ranking")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the filler documents")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(levelname)s - %(message)s")
+    # The window examples retriever passes its embedder as a function, which FAISS warns about on every load
+    logging.getLogger("langchain_community.vectorstores.faiss").setLevel(logging.ERROR)
+
+    with open(args.queries) as f:
+        fixture = json.load(f)
+
+    config = {
+        "queries_version": fixture["version"],
+        "filler": args.filler,
+        "rounds": args.rounds,
+        "concurrency": args.concurrency,
+        "embed_latency_ms": args.embed_latency_ms,
+        "rerank_latency_ms": args.rerank_latency_ms,
+        "seed": args.seed,
+    }
+    results = {
+        "version": RESULTS_VERSION,
+        "git_commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": config,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "targets": {},
+    }
+
+    probe = StageProbe()
+    with StubModelServer(args.embed_latency_ms / 1000, args.rerank_latency_ms / 1000) as server:
+        os.environ.update(
+            {
+                "TELEMETRY_ENABLED": "false",
+                "KIT_EMBEDDER_BACKEND": "local",
+                "KIT_LOCAL_EMBEDDER_URL": server.url,
+                "KIT_RERANKER_BACKEND": "local",
+                "KIT_LOCAL_RERANKER_URL": server.url,
+            }
+        )
+        probe.install()
+        try:
+            with tempfile.TemporaryDirectory() as work_dir:
+                for name in args.targets:
+                    spec = fixture["targets"][name]
+                    documents = spec["documents"] + filler_documents(name, args.filler, args.seed)
+                    print(f"Running {name} ({len(documents)} documents, {len(spec['queries'])} queries)...")
+                    results["targets"][name] = benchmark_target(
+                        name,
+                        documents,
+                        spec["queries"],
+                        Path(work_dir),
+                        server.url,
+                        probe,
+                        args.rounds,
+                        args.concurrency,
+                    )
+        finally:
+            probe.uninstall()
+
+    args.output.write_text(json.dumps(results, indent=2))
+
+    print(f"\n{'target':<28} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'embed':>7} {'search':>7} {'rerank':>7} "
+          f"{'format':>7} {'qps':>8} {'R@5':>6} {'MRR':>6}")
+    for name, target in results["targets"].items():
+        latency = target["latency_ms"]
+        top = str(max(args.concurrency))
+        print(
+            f"{name:<28} {latency['total']['p50']:>8.2f} {latency['total']['p95']:>8.2f} {latency['total']['p99']:>8.2f} "
+            + " ".join(f"{latency[stage]['p50']:>7.2f}" for stage in STAGES)
+            + f" {target['concurrency'][top]['qps']:>8.1f} {target['quality']['recall@5']:>6.2f} "
+            f"{target['quality']['mrr']:>6.2f}"
+        )
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Deterministic embedder and reranker served over the local NIM API.
+
+The embedder hashes the words of a text into a signed bag-of-words vector, and
+the reranker scores passages by the query words they contain, so the results
+only depend on the texts. ``StubModelServer`` serves both on
+``/v1/embeddings`` and ``/v1/ranking``, the endpoints the ``local`` embedder
+and reranker backends of the MCP function packages call.
+"""
+
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import numpy as np
+
+EMBEDDING_DIMENSION = 384
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lowercase words, also splitting identifiers like ``omni.ui.Button``."""
+    return _WORD_PATTERN.findall(text.lower())
+
+
+@lru_cache(maxsize=65536)
+def _word_slot(word: str):
+    digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % EMBEDDING_DIMENSION, 1.0 if (value >> 32) & 1 else -1.0
+
+
+def embed_text(text: str) -> List[float]:
+    """Embed a text as a normalized hashed bag of words with sublinear word counts."""
+    counts: Dict[str, int] = {}
+    for word in tokenize(text):
+        counts[word] = counts.get(word, 0) + 1
+
+    vector = np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
+    for word, count in counts.items():
+        slot, sign = _word_slot(word)
+        vector[slot] += sign * (1.0 + math.log(count))
+
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector /= norm
+    return vector.tolist()
+
+
+def rerank_scores(query: str, passages: List[str]) -> List[float]:
+    """Score passages by the query words they contain, rarer words across the passages counting more."""
+    query_words = set(tokenize(query))
+    passage_words = [set(tokenize(passage)) for passage in passages]
+
+    scores = []
+    for words in passage_words:
+        score = 0.0
+        for word in query_words & words:
+            frequency = sum(1 for other in passage_words if word in other)
+            score += math.log(1.0 + len(passages) / frequency)
+        scores.append(score)
+    return scores
+
+
+class StubModelServer:
+    """Serves the stub embedder and reranker on a local port.
+
+    Args:
+        embed_latency: Extra seconds spent on every embedding request
+        rerank_latency: Extra seconds spent on every ranking request
+    """
+
+    def __init__(self, embed_latency: float = 0.0, rerank_latency: float = 0.0):
+        self.embed_latency = embed_latency
+        self.rerank_latency = rerank_latency
+        self.requests = {"embeddings": 0, "ranking": 0}
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if self.path.endswith("/embeddings"):
+                    status, body = 200, server.handle_embeddings(payload)
+                elif self.path.endswith("/ranking"):
+                    status, body = 200, server.handle_ranking(payload)
+                else:
+                    status, body = 404, {"error": f"Unknown endpoint {self.path}"}
+
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _count(self, endpoint: str):
+        with self._lock:
+            self.requests[endpoint] += 1
+
+    def handle_embeddings(self, payload):
+        self._count("embeddings")
+        if self.embed_latency:
+            time.sleep(self.embed_latency)
+        texts = payload["input"] if isinstance(payload["input"], list) else [payload["input"]]
+        return {"data": [{"index": i, "embedding": embed_text(text)} for i, text in enumerate(texts)]}
+
+    def handle_ranking(self, payload):
+        self._count("ranking")
+        if self.rerank_latency:
+            time.sleep(self.rerank_latency)
+        passages = [passage["text"] for passage in payload["passages"]]
+        scores = rerank_scores(payload["query"]["text"], passages)
+        return {"rankings": [{"index": i, "logit": score} for i, score in enumerate(scores)]}
@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Concurrent, rate-limited batch embedding for the pipeline stages.
+
+``BatchEmbeddingExecutor`` keeps several batches in flight against the
+embedding endpoint. Batches are bounded by the number of texts and by the
+number of tokens, the batch size adapts to the failures of the endpoint, and
+requests go through a token bucket so the endpoint rate limit is respected.
+A batch that still fails after its retries is split in halves instead of
+being dropped, so a single bad text only fails itself.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def approximate_token_count(text: str) -> int:
+    """Rough token count used when no tokenizer is given."""
+    return len(text) // 4 + 1
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the request rate."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Requests per second
+            capacity: Maximum burst size (default: one second of requests, at least 1)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request can be made."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+
+
+class BatchEmbeddingExecutor:
+    """Embed many texts with several batches in flight.
+
+    Usage:
+        executor = BatchEmbeddingExecutor(embedder, batch_size=50, max_in_flight=4)
+        embeddings = executor.embed(texts_by_key)
+        failed = executor.failed  # key -> error message
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        batch_size: int = 50,
+        max_in_flight: int = 4,
+        max_batch_tokens: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        count_tokens: Optional[Callable[[str], int]] = None,
+        truncate: Optional[Callable[[str], str]] = None,
+    ):
+        """
+        Args:
+            embedder: Object with ``embed_documents(texts) -> List[List[float]]``
+            batch_size: Maximum number of texts in a batch
+            max_in_flight: Number of batches sent at the same time
+            max_batch_tokens: Maximum number of tokens in a batch, None for no limit
+            requests_per_second: Request rate limit, None for no limit
+            max_retries: Retries of a failed batch before it's split. The halves of a
+                split batch are retried once, their texts already went through the backoff
+            backoff_base: First retry delay in seconds, doubled on every retry
+            backoff_max: Maximum retry delay in seconds
+            count_tokens: Returns the number of tokens of a text
+            truncate: Applied to every text before it's sent, e.g. ``truncate_to_tokens``
+        """
+        self.embedder = embedder
+        self.max_batch_size = max(1, batch_size)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.count_tokens = count_tokens or approximate_token_count
+        self.truncate = truncate
+        self.rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+
+        # Adapted to the failures of the endpoint
+        self.batch_size = self.max_batch_size
+
+        self.failed: Dict[str, str] = {}
+        self._split_keys = set()
+        self.stats = {"requests": 0, "retries": 0, "splits": 0, "embedded": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name: str, value: int = 1):
+        with self._stats_lock:
+            self.stats[name] += value
+
+    def _next_batch(self, queue: Deque[str], token_counts: Dict[str, int]) -> List[str]:
+        """Take the next batch from the queue, bounded by the batch size and the token limit."""
+        batch = []
+        batch_tokens = 0
+        while queue and len(batch) < self.batch_size:
+            tokens = token_counts[queue[0]]
+            if batch and self.max_batch_tokens and batch_tokens + tokens > self.max_batch_tokens:
+                break
+            batch.append(queue.popleft())
+            batch_tokens += tokens
+        return batch
+
+    def _embed_batch(self, texts: Sequence[str], max_retries: int) -> List[List[float]]:
+        """Send one batch, retrying with exponential backoff and jitter."""
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            self._count("requests")
+            try:
+                embeddings = self.embedder.embed_documents(list(texts))
+                if len(embeddings) != len(texts):
+                    raise ValueError(f"Got {len(embeddings)} embeddings for {len(texts)} texts")
+                return embeddings
+            except Exception as e:
+                if attempt >= max_retries:
+                    raise
+
+                delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+                delay *= 0.5 + random.random() / 2
+                logger.warning(f"Embedding batch of {len(texts)} failed ({e}), retrying in {delay:.1f}s")
+                attempt += 1
+                self._count("retries")
+                time.sleep(delay)
+
+    def embed(self, texts: Dict[str, str]) -> Dict[str, List[float]]:
+        """Embed the texts.
+
+        Args:
+            texts: Dictionary of key to text
+
+        Returns:
+            Dictionary of key to embedding for the texts that were embedded.
+            The errors of the other texts are in ``failed``.
+        """
+        if self.truncate:
+            texts = {key: self.truncate(text) for key, text in texts.items()}
+
+        token_counts = {key: self.count_tokens(text) for key, text in texts.items()}
+        queue: Deque[str] = deque(texts)
+        results: Dict[str, List[float]] = {}
+        total = len(texts)
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="embed") as executor:
+            running = {}
+            while queue or running:
+                while queue and len(running) < self.max_in_flight:
+                    batch = self._next_batch(queue, token_counts)
+                    max_retries = min(1, self.max_retries) if batch[0] in self._split_keys else self.max_retries
+                    future = executor.submit(self._embed_batch, [texts[key] for key in batch], max_retries)
+                    running[future] = batch
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = running.pop(future)
+                    try:
+                        embeddings = future.result()
+                    except Exception as e:
+                        self._on_failure(batch, e, queue)
+                        continue
+
+                    results.update(zip(batch, embeddings))
+                    self._count("embedded", len(batch))
+                    # Grow back slowly after failures
+                    self.batch_size = min(self.max_batch_size, self.batch_size + 1)
+
+                logger.info(f"  Progress: {len(results) + len(self.failed)}/{total} embedded")
+
+        return results
+
+    def _on_failure(self, batch: List[str], error: Exception, queue: Deque[str]):
+        """Split a failed batch and queue the halves, or record the failure of a single text."""
+        if len(batch) == 1:
+            logger.error(f"Failed to embed {batch[0]}: {error}")
+            self.failed[batch[0]] = str(error)
+            return
+
+        # Halving the batch size splits the batch when it's taken from the queue
+        # again, and smaller batches are more likely to get through an
+        # overloaded endpoint
+        self.batch_size = max(1, min(self.batch_size, len(batch)) // 2)
+        self._count("splits")
+        self._split_keys.update(batch)
+        queue.extendleft(reversed(batch))
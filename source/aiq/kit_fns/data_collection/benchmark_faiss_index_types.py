@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Recall@k and query latency of the FAISS index types against the flat index.
+
+Builds every index type with ``build_faiss_index`` from the embeddings of a
+pipeline database, or from synthetic clustered vectors, and searches it with
+a sweep of ``nprobe`` / ``efSearch`` values. The queries are perturbed copies
+of random rows, and recall@k is the fraction of the exact top k found.
+
+Usage:
+    # Embeddings of a pipeline run
+    python benchmark_faiss_index_types.py --embeddings ../../../../_pipeline_output/kit/embeddings/code_examples_embeddings.json
+
+    # Synthetic vectors
+    python benchmark_faiss_index_types.py --num-vectors 50000 --dimension 1024
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+from faiss_index import build_faiss_index, describe_faiss_index
+
+
+def clustered_vectors(num_vectors: int, dimension: int, num_clusters: int = 64, seed: int = 0) -> np.ndarray:
+    """Generate float32 vectors around random centers, like the clusters of real embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(num_clusters, dimension)).astype(np.float32)
+    vectors = centers[rng.integers(num_clusters, size=num_vectors)]
+    return (vectors + 0.5 * rng.normal(size=(num_vectors, dimension))).astype(np.float32)
+
+
+def make_queries(vectors: np.ndarray, num_queries: int, seed: int = 1) -> np.ndarray:
+    """Take random rows and move them by a fraction of the spread of the vectors."""
+    rng = np.random.default_rng(seed)
+    rows = np.asarray(vectors[np.sort(rng.choice(len(vectors), num_queries, replace=False))], dtype=np.float32)
+    noise = rng.normal(size=rows.shape).astype(np.float32) * float(np.std(rows)) * 0.1
+    return rows + noise
+
+
+def recall_at_k(expected: np.ndarray, found: np.ndarray) -> float:
+    """Fraction of the exact neighbors of each query that were found."""
+    k = expected.shape[1]
+    hits = sum(len(set(e) & set(f)) for e, f in zip(expected.tolist(), found.tolist()))
+    return hits / (len(expected) * k)
+
+
+def measure(index, queries: np.ndarray, k: int):
+    """Search the queries one at a time like the services do.
+
+    Returns:
+        The ids found and the mean latency in milliseconds
+    """
+    ids = np.empty((len(queries), k), dtype=np.int64)
+    start = time.perf_counter()
+    for i, query in enumerate(queries):
+        _, ids[i] = index.search(query[None, :], k)
+    return ids, (time.perf_counter() - start) * 1000 / len(queries)
+
+
+def run_benchmark(
+    vectors: np.ndarray, queries: np.ndarray, k: int, nprobes: List[int], ef_searches: List[int]
+) -> List[Dict[str, Any]]:
+    """Build every index type and measure recall@k and latency for each search setting."""
+    import faiss
+
+    results = []
+
+    start = time.perf_counter()
+    flat = build_faiss_index(vectors, {"index_type": "flat"})
+    build_time = time.perf_counter() - start
+    expected, latency = measure(flat, queries, k)
+    results.append({"index": "flat", "search": "-", "build_s": build_time, "latency_ms": latency, "recall": 1.0})
+
+    for index_type in ["ivf_flat", "ivf_pq", "sq8", "hnsw"]:
+        start = time.perf_counter()
+        index = build_faiss_index(vectors, {"index_type": index_type, "min_vectors": 0})
+        build_time = time.perf_counter() - start
+
+        if index_type == "hnsw":
+            settings = [("efSearch", value) for value in ef_searches]
+        elif index_type.startswith("ivf"):
+            nlist = describe_faiss_index(index)["nlist"]
+            settings = [("nprobe", value) for value in nprobes if value <= nlist]
+        else:
+            settings = [(None, None)]
+
+        for name, value in settings:
+            if name == "nprobe":
+                faiss.extract_index_ivf(index).nprobe = value
+            elif name == "efSearch":
+                index.hnsw.efSearch = value
+            found, latency = measure(index, queries, k)
+            results.append(
+                {
+                    "index": index_type,
+                    "search": f"{name}={value}" if name else "-",
+                    "build_s": build_time,
+                    "latency_ms": latency,
+                    "recall": recall_at_k(expected, found),
+                }
+            )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--embeddings", type=Path, help="JSON embeddings file of the pipeline")
+    parser.add_argument("--num-vectors", type=int, default=20000, help="Number of synthetic vectors")
+    parser.add_argument("--dimension", type=int, default=1024, help="Dimension of the synthetic vectors")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("-k", type=int, default=10, help="Number of neighbors")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32, 64], help="nprobe values")
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[16, 32, 64, 128], help="efSearch values")
+    args = parser.parse_args()
+
+    if args.embeddings:
+        from embedding_store import open_embeddings
+
+        vectors = open_embeddings(args.embeddings).vectors()
+        source = str(args.embeddings)
+    else:
+        vectors = clustered_vectors(args.num_vectors, args.dimension)
+        source = "synthetic"
+
+    queries = make_queries(vectors, min(args.queries, len(vectors)))
+    results = run_benchmark(vectors, queries, args.k, args.nprobe, args.ef_search)
+
+    print(f"{source}: {vectors.shape[0]} vectors of dimension {vectors.shape[1]}, {len(queries)} queries, k={args.k}")
+    print(f"{'index':<10} {'search':<14} {'build (s)':>10} {'latency (ms)':>13} {'recall@' + str(args.k):>10}")
+    for row in results:
+        print(
+            f"{row['index']:<10} {row['search']:<14} {row['build_s']:>10.2f} "
+            f"{row['latency_ms']:>13.3f} {row['recall']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
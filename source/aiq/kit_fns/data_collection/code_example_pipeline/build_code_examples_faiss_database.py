@@ -28,13 +28,18 @@ import argparse
 import json
 import logging
 import os
+import sys
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from embedding_store import create_faiss_vectorstore, open_embeddings
+from faiss_index import save_faiss_vectorstore
+
 # Import embeddings creator
 try:
     from langchain_nvidia_ai_endpoints import NVIDIAEmbeddings
@@ -119,9 +124,64 @@ def create_embeddings(
         )
 
 
+class MethodSourceIndex:
+    """Serves method source code from the extracted JSON files, reading each file once.
+
+    The source of all the methods of an extension is indexed by method name
+    when the first method of the extension is requested. Only the indexes of
+    the most recently used extensions are kept, so memory stays bounded when
+    the methods are requested grouped by extension, as the embeddings store
+    lists them.
+    """
+
+    def __init__(self, extracted_methods_dir: Path, max_extensions: int = 8):
+        """
+        Args:
+            extracted_methods_dir: Path to the extracted methods directory
+            max_extensions: Number of extension indexes kept in memory
+        """
+        self.extracted_methods_dir = extracted_methods_dir
+        self.max_extensions = max(1, max_extensions)
+        self.files_read = 0
+        self._indexes: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+
+    def _load(self, extension_name: str) -> Dict[str, str]:
+        json_file = self.extracted_methods_dir / f"{extension_name}.example.json"
+        sources = {}
+
+        if json_file.exists():
+            try:
+                with open(json_file, "r") as f:
+                    data = json.load(f)
+                self.files_read += 1
+
+                # The first method with a name wins
+                for method in data.get("methods", []):
+                    sources.setdefault(method.get("name"), method.get("source_code", ""))
+            except Exception as e:
+                logger.warning(f"Failed to load sources of {extension_name}: {e}")
+
+        return sources
+
+    def get(self, extension_name: str, method_name: str) -> str:
+        """Get the source code of a method, or an empty string if not found."""
+        sources = self._indexes.get(extension_name)
+        if sources is None:
+            sources = self._load(extension_name)
+            self._indexes[extension_name] = sources
+            if len(self._indexes) > self.max_extensions:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(extension_name)
+
+        return sources.get(method_name) or ""
+
+
 def load_method_source_code(extracted_methods_dir: Path, extension_name: str, method_name: str) -> str:
     """Load the full source code for a method from the extracted JSON files.
 
+    Reads the whole extension file, use ``MethodSourceIndex`` for many methods.
+
     Args:
         extracted_methods_dir: Path to the extracted methods directory
         extension_name: Name of the extension
@@ -130,23 +190,7 @@ def load_method_source_code(extracted_methods_dir: Path, extension_name: str, me
     Returns:
         Source code string or empty string if not found
     """
-    json_file = extracted_methods_dir / f"{extension_name}.example.json"
-
-    if not json_file.exists():
-        return ""
-
-    try:
-        with open(json_file, "r") as f:
-            data = json.load(f)
-
-        # Find the method in the methods list
-        for method in data.get("methods", []):
-            if method.get("name") == method_name:
-                return method.get("source_code", "")
-    except Exception as e:
-        logger.warning(f"Failed to load source for {method_name}: {e}")
-
-    return ""
+    return MethodSourceIndex(extracted_methods_dir).get(extension_name, method_name)
 
 
 def create_method_page_content(method_key: str, method_data: Dict[str, Any], source_code: str = None) -> str:
@@ -212,6 +256,7 @@ def build_faiss_database(
     embedding_model: str = DEFAULT_EMBEDDING_MODEL,
     api_key: str = "",
     endpoint_url: str = None,
+    index_config: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Build FAISS database from code examples embeddings.
 
@@ -222,6 +267,7 @@ def build_faiss_database(
         embedding_model: Embedding model to use
         api_key: API key for authentication
         endpoint_url: Optional custom endpoint URL
+        index_config: Options of the ``[faiss]`` section of the pipeline configuration, flat index when None
     """
     logger.info("=" * 60)
     logger.info("Building FAISS Database for Code Examples")
@@ -243,42 +289,34 @@ def build_faiss_database(
         logger.error("Please run generate_code_examples_embeddings.py first")
         raise FileNotFoundError(f"Embeddings file not found: {embeddings_file}")
 
-    with open(embeddings_file, "r") as f:
-        embeddings_data = json.load(f)
-
-    # Extract methods
-    methods_embeddings = embeddings_data.get("methods", {})
+    # Memory mapped store of the embeddings, converted from the JSON file when needed
+    store = open_embeddings(embeddings_file, "methods")
 
-    logger.info(f"Loaded {len(methods_embeddings)} method embeddings")
+    logger.info(f"Loaded {len(store)} embeddings")
 
     # Prepare documents and embeddings for FAISS
     documents = []
-    embedding_vectors = []
-    skipped = 0
+    rows = []
+    # Records without an embedding are not in the store
+    skipped = store.metadata.get("skipped_records", 0)
 
     # Track statistics
     extensions_set = set()
     complexity_total = 0
     async_count = 0
 
-    for method_key, embedding_data in methods_embeddings.items():
-        try:
-            # Get the embedding vector
-            embedding_vector = embedding_data.get("embedding", [])
-
-            # Skip entries without valid embeddings
-            if not embedding_vector or len(embedding_vector) == 0:
-                logger.warning(f"Method {method_key} has no embedding vector, skipping")
-                skipped += 1
-                continue
+    # Every extracted methods file is read once
+    sources = MethodSourceIndex(extracted_methods_dir)
 
+    for row, method_key, embedding_data in store.records():
+        try:
             # Try to load source code from original extraction
             extension_name = embedding_data.get("extension", "")
             method_name = embedding_data.get("name", "")
             source_code = ""
 
             if extension_name and method_name:
-                source_code = load_method_source_code(extracted_methods_dir, extension_name, method_name)
+                source_code = sources.get(extension_name, method_name)
 
             # Create page content
             page_content = create_method_page_content(method_key, embedding_data, source_code)
@@ -322,7 +360,7 @@ def build_faiss_database(
             doc = Document(page_content=page_content, metadata=metadata)
 
             documents.append(doc)
-            embedding_vectors.append(embedding_vector)
+            rows.append(row)
 
             # Update statistics
             extensions_set.add(embedding_data.get("extension", ""))
@@ -336,6 +374,7 @@ def build_faiss_database(
             continue
 
     logger.info(f"Prepared {len(documents)} documents for FAISS database ({skipped} skipped)")
+    logger.info(f"Read {sources.files_read} extracted methods files")
 
     if len(documents) == 0:
         logger.error("No valid documents to create FAISS database")
@@ -346,16 +385,11 @@ def build_faiss_database(
         logger.info("Creating FAISS index...")
 
         # Create FAISS index from documents and embeddings
-        vectorstore = FAISS.from_embeddings(
-            text_embeddings=[(doc.page_content, emb) for doc, emb in zip(documents, embedding_vectors)],
-            embedding=embedder,
-            metadatas=[doc.metadata for doc in documents],
-        )
+        vectorstore = create_faiss_vectorstore(store.vectors(rows), documents, embedder, index_config)
 
         # Save the FAISS database
         logger.info(f"Saving FAISS database to: {faiss_output_path}")
-        faiss_output_path.mkdir(parents=True, exist_ok=True)
-        vectorstore.save_local(str(faiss_output_path))
+        index_description = save_faiss_vectorstore(vectorstore, faiss_output_path)
 
         logger.info(f"Successfully saved FAISS database to {faiss_output_path}")
         logger.info(f"Database contains {len(documents)} code example entries")
@@ -370,7 +404,8 @@ def build_faiss_database(
             "total_methods": len(documents),
             "skipped_methods": skipped,
             "embedding_model": embedding_model,
-            "embedding_dimension": len(embedding_vectors[0]) if embedding_vectors else 0,
+            "embedding_dimension": store.dimension or 0,
+            "index": index_description,
             "created_at": datetime.now().isoformat(),
             "source_files": {"embeddings": str(embeddings_file)},
             "statistics": {
@@ -18,6 +18,7 @@
 Generate embedding vectors for code examples extracted from Kit extensions.
 Creates embeddings using NVIDIA API and saves them to a separate embeddings file.
 Each method's source code and metadata are combined and truncated to 500 tokens.
+Methods whose document did not change since the last run reuse their embedding.
 
 Usage:
     python generate_code_examples_embeddings.py --mode regular  # For production code
@@ -29,12 +30,22 @@ import argparse
 import json
 import logging
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import tiktoken
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from batch_embedder import BatchEmbeddingExecutor
+from incremental_embeddings import (
+    content_hash,
+    load_existing_records,
+    plan_incremental_update,
+    save_embeddings_database,
+)
+
 # Import LangChain NVIDIA embeddings
 try:
     from langchain_nvidia_ai_endpoints import NVIDIAEmbeddings
@@ -259,9 +270,17 @@ def generate_embeddings_for_code_examples(
     endpoint_url: str,
     max_tokens: int,
     batch_size: int,
+    embedder: Optional[Any] = None,
+    max_in_flight: int = 4,
+    requests_per_second: Optional[float] = None,
+    max_batch_tokens: Optional[int] = None,
 ) -> None:
     """Generate embeddings for all code examples.
 
+    Embeddings of methods whose document text is unchanged since the last run
+    are taken from the existing output file, methods that no longer exist are
+    removed from it.
+
     Args:
         extracted_methods_dir: Path to the extracted methods directory
         output_dir: Path to save the embeddings database
@@ -271,6 +290,10 @@ def generate_embeddings_for_code_examples(
         batch_size: Number of methods to process in batch
         encoding_model: Encoding model to use
         model: Embedding model to use
+        embedder: Embedder to use instead of creating the NVIDIA one
+        max_in_flight: Number of batches sent to the embedder at the same time
+        requests_per_second: Request rate limit of the embedding endpoint
+        max_batch_tokens: Maximum number of tokens in a batch
     """
     # Load all extracted methods
     all_methods = load_extracted_methods(extracted_methods_dir)
@@ -283,12 +306,6 @@ def generate_embeddings_for_code_examples(
     total_methods = sum(len(methods) for methods in all_methods.values())
     logger.info(f"Total methods to process: {total_methods}")
 
-    # Create embedder
-    embedder = create_embeddings(embeddings_model, api_key, endpoint_url)
-    if not embedder:
-        logger.error("Failed to create embedder. Exiting.")
-        return
-
     # Initialize tiktoken encoder for token counting
     try:
         enc = tiktoken.get_encoding(encoding_model)
@@ -296,6 +313,21 @@ def generate_embeddings_for_code_examples(
         logger.error(f"Failed to initialize tiktoken: {e}")
         enc = None
 
+    # Build the document of every method once
+    documents = {}
+    methods_by_key = {}
+    for extension_name, methods in all_methods.items():
+        for method_data in methods:
+            # Create unique key for the method
+            method_key = f"{extension_name}::{method_data.get('name', 'unknown')}"
+            documents[method_key] = create_method_document(method_data, max_tokens)
+            methods_by_key[method_key] = (extension_name, method_data)
+
+    output_file = output_dir / "code_examples_embeddings.json"
+    existing = load_existing_records(output_file, "methods")
+    reused, pending, removed = plan_incremental_update(documents, existing, embeddings_model)
+    logger.info(f"Reusing {len(reused)} embeddings, embedding {len(pending)} methods, removing {len(removed)}")
+
     # Process methods and generate embeddings
     embeddings_database = {
         "metadata": {
@@ -311,109 +343,95 @@ def generate_embeddings_for_code_examples(
     processed = 0
     failed = 0
 
-    # Process each extension's methods
-    for extension_name, methods in all_methods.items():
-        logger.info(f"\nProcessing extension: {extension_name}")
-
-        # Process methods in batches
-        for i in range(0, len(methods), batch_size):
-            batch = methods[i : i + batch_size]
-            batch_texts = []
-            batch_keys = []
-
-            # Prepare batch
-            for method_data in batch:
-                # Create document text for embedding
-                document = create_method_document(method_data, max_tokens)
-
-                # Create unique key for the method
-                method_key = f"{extension_name}::{method_data.get('name', 'unknown')}"
-
-                batch_texts.append(document)
-                batch_keys.append(method_key)
-
-            if not batch_texts:
-                continue
-
-            try:
-                # Generate embeddings for batch
-                batch_num = i // batch_size + 1
-                total_batches = (len(methods) + batch_size - 1) // batch_size
-                logger.info(f"  Batch {batch_num}/{total_batches}: {len(batch_texts)} methods")
-
-                if len(batch_texts) == 1:
-                    # Single item - use embed_query
-                    embeddings = [embedder.embed_query(batch_texts[0])]
-                else:
-                    # Multiple items - use embed_documents
-                    embeddings = embedder.embed_documents(batch_texts)
-
-                # Store embeddings with metadata
-                for method_key, embedding, method_data in zip(batch_keys, embeddings, batch):
-                    # Count actual tokens if encoder available
-                    token_count = 0
-                    if enc:
-                        doc = create_method_document(method_data, max_tokens)
-                        token_count = len(enc.encode(doc))
-
-                    embeddings_database["methods"][method_key] = {
-                        "embedding": embedding,
-                        "extension": extension_name,
-                        "name": method_data.get("name", "unknown"),
-                        "module": method_data.get("module", ""),
-                        "file_path": method_data.get("file_path", ""),
-                        "line_count": method_data.get("line_count", 0),
-                        "complexity_score": method_data.get("complexity_score", 0),
-                        "is_async": method_data.get("is_async", False),
-                        "reasons": method_data.get("reasons", []),
-                        "description": method_data.get("description", ""),
-                        "token_count": token_count,
-                    }
-                    processed += 1
-
-                    # Set embedding dimension from first successful embedding
-                    if embeddings_database["metadata"]["embedding_dimension"] is None:
-                        embeddings_database["metadata"]["embedding_dimension"] = len(embedding)
-                        logger.info(f"  Embedding dimension: {len(embedding)}")
-
-                # Log progress
-                logger.info(f"  Progress: {processed}/{total_methods} methods")
-
-            except Exception as e:
-                logger.error(f"Failed to process batch: {e}")
-                # Add empty embeddings for failed batch
-                for method_key, method_data in zip(batch_keys, batch):
-                    embeddings_database["methods"][method_key] = {
-                        "embedding": [],
-                        "extension": extension_name,
-                        "name": method_data.get("name", "unknown"),
-                        "error": str(e),
-                    }
-                    failed += 1
+    if pending and embedder is None:
+        # Create embedder
+        embedder = create_embeddings(embeddings_model, api_key, endpoint_url)
+        if not embedder:
+            logger.error("Failed to create embedder. Exiting.")
+            return
+
+    new_records = {}
+
+    # Embed the changed methods with several batches in flight
+    embeddings = {}
+    if pending:
+        executor = BatchEmbeddingExecutor(
+            embedder,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            max_batch_tokens=max_batch_tokens,
+            requests_per_second=requests_per_second,
+            count_tokens=(lambda text: len(enc.encode(text))) if enc else None,
+        )
+        embeddings = executor.embed({method_key: documents[method_key] for method_key in pending})
+        logger.info(f"  Embedding requests: {executor.stats['requests']} ({executor.stats['retries']} retries)")
+
+    for method_key in pending:
+        extension_name, method_data = methods_by_key[method_key]
+
+        if method_key not in embeddings:
+            # Keep the failed method so it's embedded again on the next run
+            new_records[method_key] = {
+                "embedding": [],
+                "extension": extension_name,
+                "name": method_data.get("name", "unknown"),
+                "error": executor.failed.get(method_key, "not embedded"),
+            }
+            failed += 1
+            continue
+
+        document = documents[method_key]
+        new_records[method_key] = {
+            "embedding": embeddings[method_key],
+            "extension": extension_name,
+            "name": method_data.get("name", "unknown"),
+            "module": method_data.get("module", ""),
+            "file_path": method_data.get("file_path", ""),
+            "line_count": method_data.get("line_count", 0),
+            "complexity_score": method_data.get("complexity_score", 0),
+            "is_async": method_data.get("is_async", False),
+            "reasons": method_data.get("reasons", []),
+            "description": method_data.get("description", ""),
+            "token_count": len(enc.encode(document)) if enc else 0,
+            "content_hash": content_hash(document),
+            "model": embeddings_model,
+        }
+        processed += 1
+
+    # Merge with the reused embeddings, keeping the order of the extracted methods
+    for method_key in documents:
+        record = reused.get(method_key) or new_records.get(method_key)
+        if record is None:
+            continue
+        embeddings_database["methods"][method_key] = record
+
+        # Set embedding dimension from first successful embedding
+        if embeddings_database["metadata"]["embedding_dimension"] is None and record.get("embedding"):
+            embeddings_database["metadata"]["embedding_dimension"] = len(record["embedding"])
 
     # Add timestamp and statistics
     embeddings_database["metadata"]["generated_at"] = datetime.now().isoformat()
-    embeddings_database["metadata"]["successful_embeddings"] = processed
+    embeddings_database["metadata"]["successful_embeddings"] = processed + len(reused)
     embeddings_database["metadata"]["failed_embeddings"] = failed
+    embeddings_database["metadata"]["reused_embeddings"] = len(reused)
+    embeddings_database["metadata"]["removed_embeddings"] = len(removed)
 
-    output_file = output_dir / "code_examples_embeddings.json"
     # Save embeddings database
     logger.info(f"\nSaving embeddings database to: {output_file}")
-    output_dir.mkdir(exist_ok=True)
-
-    with open(output_file, "w") as f:
-        json.dump(embeddings_database, f, indent=2)
+    save_embeddings_database(output_file, embeddings_database, "methods")
 
     # Summary
     logger.info("=" * 60)
     logger.info("Code Examples Embedding Generation Complete")
     logger.info("=" * 60)
     logger.info(f"Total methods: {total_methods}")
-    logger.info(f"Successful embeddings: {processed}")
+    logger.info(f"New embeddings: {processed}")
+    logger.info(f"Reused embeddings: {len(reused)}")
+    logger.info(f"Removed embeddings: {len(removed)}")
     logger.info(f"Failed embeddings: {failed}")
     if embeddings_database["metadata"]["embedding_dimension"]:
         logger.info(f"Embedding dimension: {embeddings_database['metadata']['embedding_dimension']}")
-    logger.info(f"Output saved to: {OUTPUT_FILE}")
+    logger.info(f"Output saved to: {output_file}")
 
 
 def main():
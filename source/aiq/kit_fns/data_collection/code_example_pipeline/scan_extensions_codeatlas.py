@@ -36,7 +36,8 @@ import docstring_parser
 import tiktoken
 
 # Import from lc_agent.code_atlas
-from lc_agent.code_atlas import CodeAtlasCache
+from lc_agent.code_atlas import CodeAtlasCache, ModuleParser
+from lc_agent.code_atlas.module_analyzer import ModuleAnalyzer
 
 
 class ExtensionAnalyzer:
@@ -52,6 +53,8 @@ class ExtensionAnalyzer:
         concurrency: int = 20,
         batch_size: int = 10,
         excluded_modules: List[str] = None,
+        workers: Optional[int] = None,
+        parse_cache_dir: Optional[str] = None,
     ):
         """
         Initialize the analyzer with configurable thresholds.
@@ -65,10 +68,13 @@ class ExtensionAnalyzer:
             concurrency: Number of concurrent requests to the model
             batch_size: Number of methods to process in a single request
             excluded_modules: List of module names to exclude when scanning Python code
+            workers: Number of processes parsing the Python files (default: number of CPUs)
+            parse_cache_dir: Directory of the per-file parse cache, None to disable it
         """
         self.min_lines = min_lines
         self.min_complexity = min_complexity
         self.cache = CodeAtlasCache()
+        self.parser = ModuleParser(cache_dir=parse_cache_dir, max_workers=workers)
         self.interesting_methods = []
         self.debug_mode = debug_mode  # Debug mode flag
         self.scan_mode = scan_mode  # Control test scanning
@@ -119,7 +125,7 @@ class ExtensionAnalyzer:
 
         # Scan the extension
         try:
-            self.cache.scan(extension_path_posix, excluded_modules=self.excluded_modules)
+            self.cache.scan(extension_path_posix, excluded_modules=self.excluded_modules, parser=self.parser)
         except Exception as e:
             print(f"Error scanning extension: {e}")
             return {"error": str(e)}
@@ -235,6 +241,28 @@ class ExtensionAnalyzer:
 
         return results
 
+    def prefetch_extensions(self, extension_paths: List[str]):
+        """
+        Parse the Python files of all the extensions in the worker processes.
+
+        Fills the parse cache, so the extensions are then analyzed one by one
+        from cached files. Without a parse cache every extension is parsed in
+        parallel when it is analyzed.
+        """
+        if self.parser.cache_dir is None:
+            return
+
+        modules = []
+        for extension_path in extension_paths:
+            if not (Path(extension_path) / "omni").exists():
+                continue
+            module_analyzer = ModuleAnalyzer(extension_path.replace("\\", "/"), excluded_modules=self.excluded_modules)
+            modules.extend(module_analyzer.module_files())
+
+        print(f"Parsing {len(modules)} Python files with {self.parser.max_workers} workers")
+        self.parser.prefetch(modules, keep=False)
+        print(f"  Parsed {self.parser.stats['parsed']} files, the others are cached")
+
     def _get_file_path(self, method_info) -> str:
         """Get the file path for a method."""
         # First check if CodeAtlas provided a file_path
@@ -459,6 +487,8 @@ async def analyze_all_extensions_async(
     batch_size=10,
     resume=False,
     excluded_modules=None,
+    workers=None,
+    parse_cache_dir=None,
 ):
     """
     Analyze multiple extensions and provide summary.
@@ -475,6 +505,8 @@ async def analyze_all_extensions_async(
         batch_size: Number of methods to process in a single request (default: 10)
         resume: Whether to skip already-processed extensions (default: False)
         excluded_modules: List of module names to exclude when scanning Python code
+        workers: Number of processes parsing the Python files (default: number of CPUs)
+        parse_cache_dir: Directory of the per-file parse cache, reused between runs (default: no cache)
     """
     analyzer = ExtensionAnalyzer(
         min_lines=min_lines,
@@ -485,6 +517,8 @@ async def analyze_all_extensions_async(
         concurrency=concurrency,
         batch_size=batch_size,
         excluded_modules=excluded_modules,
+        workers=workers,
+        parse_cache_dir=parse_cache_dir,
     )
 
     # Determine extracted_methods directory based on scan mode
@@ -584,10 +618,15 @@ async def analyze_all_extensions_async(
     for idx, extension_path in enumerate(extensions_to_process, 1):
         tasks.append(_analyze_extension(idx, extension_path))
 
-    if tasks:
-        results_list = await asyncio.gather(*tasks, return_exceptions=True)
-    else:
-        results_list = []
+    try:
+        analyzer.prefetch_extensions(extensions_to_process)
+
+        if tasks:
+            results_list = await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            results_list = []
+    finally:
+        analyzer.parser.close()
 
     for results in results_list:
         if isinstance(results, Exception):
@@ -723,6 +762,17 @@ Examples:
         help="Directory containing Kit extensions (default: kit-app-template extscache)",
     )
 
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of processes parsing Python files (default: number of CPUs)"
+    )
+
+    parser.add_argument(
+        "--parse-cache-dir",
+        type=str,
+        default=None,
+        help="Directory of the per-file parse cache, reused between runs (default: no cache)",
+    )
+
     args = parser.parse_args()
 
     # Log configuration
@@ -733,6 +783,8 @@ Examples:
     print(f"  Min lines: {args.min_lines}")
     print(f"  Min complexity: {args.min_complexity}")
     print(f"  Debug mode: {args.debug}")
+    print(f"  Workers: {args.workers or os.cpu_count()}")
+    print(f"  Parse cache: {args.parse_cache_dir or 'disabled'}")
 
     # Analyze extensions with specified parameters
     asyncio.run(
@@ -744,6 +796,8 @@ Examples:
             min_complexity=args.min_complexity,
             debug_mode=args.debug,
             scan_mode=args.mode,
+            workers=args.workers,
+            parse_cache_dir=args.parse_cache_dir,
         )
     )
 
@@ -36,6 +36,8 @@ Features:
 - Resume from failures: Use --resume to continue from last successful stage
 - Force restart: Use --force to ignore checkpoints and start fresh
 - Stage selection: Use --start/--end to run specific stage ranges
+- Parallel stages: Stages declare their inputs/outputs and independent stages
+  (extension data, code examples, settings) run concurrently
 
 Usage:
     # Run complete pipeline
@@ -67,6 +69,9 @@ from typing import Dict, List, Optional, Tuple
 
 import toml
 
+sys.path.insert(0, str(Path(__file__).parent))
+from stage_scheduler import StageScheduler, build_dependencies
+
 
 class PipelineConfig:
     """Configuration management for the data collection pipeline."""
@@ -101,6 +106,7 @@ class PipelineConfig:
                 },
                 "processing": {
                     "include_source_code": False,
+                    "extension_detail_files": True,
                     "code_examples_min_lines": 50,
                     "code_examples_min_complexity": 3,
                     "max_extensions": -1,
@@ -122,6 +128,20 @@ class PipelineConfig:
                     "endpoint_url": "",
                     "max_tokens": 500,
                     "encoding_model": "cl100k_base",
+                    "max_in_flight": 4,
+                    "requests_per_second": 0,
+                    "max_batch_tokens": 0,
+                },
+                "faiss": {
+                    "index_type": "flat",
+                    "nlist": 0,
+                    "nprobe": 0,
+                    "hnsw_m": 32,
+                    "ef_construction": 200,
+                    "ef_search": 64,
+                    "pq_m": 0,
+                    "train_size": 0,
+                    "min_vectors": 1000,
                 },
                 "logging": {"level": "INFO", "log_file": "pipeline.log"},
             }
@@ -225,7 +245,15 @@ def find_build_directory(base_path: Path, build_type: Optional[str] = None) -> O
 
 
 class PipelineStage:
-    """Base class for pipeline stages."""
+    """Base class for pipeline stages.
+
+    Subclasses declare the artifacts they read in ``inputs`` and the artifacts
+    they write in ``outputs``. The scheduler uses them to find which stages can
+    run at the same time.
+    """
+
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
 
     def __init__(self, name: str, config: PipelineConfig, logger: logging.Logger):
         self.name = name
@@ -233,12 +261,14 @@ class PipelineStage:
         self.logger = logger
         self.start_time = None
         self.end_time = None
+        self.status = "pending"
         self.resume_mode = False  # Set to True when resuming from a checkpoint
 
     def run(self) -> bool:
         """Run the stage. Returns True if successful."""
         self.logger.info(f"Starting stage: {self.name}")
         self.start_time = time.time()
+        self.status = "running"
 
         try:
             success = self._execute()
@@ -246,14 +276,17 @@ class PipelineStage:
             duration = self.end_time - self.start_time
 
             if success:
+                self.status = "completed"
                 self.logger.info(f"Stage {self.name} completed successfully in {duration:.1f}s")
             else:
+                self.status = "failed"
                 self.logger.error(f"Stage {self.name} failed after {duration:.1f}s")
 
             return success
 
         except Exception as e:
             self.end_time = time.time()
+            self.status = "failed"
             duration = self.end_time - self.start_time
             self.logger.error(f"Stage {self.name} failed with exception after {duration:.1f}s: {e}")
             return False
@@ -268,10 +301,22 @@ class PipelineStage:
             return self.end_time - self.start_time
         return None
 
+    def get_state(self) -> Dict:
+        """Get the stage state stored in the checkpoint."""
+        return {
+            "status": self.status,
+            "started": datetime.fromtimestamp(self.start_time).isoformat() if self.start_time else None,
+            "finished": datetime.fromtimestamp(self.end_time).isoformat() if self.end_time else None,
+            "duration": self.get_duration(),
+        }
+
 
 class PreparationStage(PipelineStage):
     """Validate inputs and prepare output directories."""
 
+    inputs = ("exts_paths", "kit_version")
+    outputs = ("exts_path", "work_dirs")
+
     def _execute(self) -> bool:
         exts_paths = self.config.get("input.exts_paths")
         work_dir = self.config.get("output.work_dir")
@@ -329,6 +374,8 @@ class PreparationStage(PipelineStage):
 class PullRepoExtsStage(PipelineStage):
     """Clone repository and build it to get exts."""
 
+    outputs = ("exts_paths", "kit_version", "app_template_path")
+
     def _execute(self) -> bool:
         try:
             sys.path.insert(0, str(Path(__file__).parent))
@@ -400,6 +447,9 @@ class PullRepoExtsStage(PipelineStage):
 class ExtensionDataStage(PipelineStage):
     """Run the extension database builder pipeline."""
 
+    inputs = ("exts_path", "work_dirs")
+    outputs = ("extension_data",)
+
     def _execute(self) -> bool:
         # Import and run extension database builder
         try:
@@ -410,6 +460,7 @@ class ExtensionDataStage(PipelineStage):
             output_dir = work_dir / "extension_data"
             include_source = self.config.get("processing.include_source_code", False)
             excluded_modules = self.config.get("processing.excluded_modules", [])
+            detail_files = self.config.get("processing.extension_detail_files", True)
 
             self.logger.info(f"Processing extensions from: {exts_path}")
             self.logger.info(f"Output directory: {output_dir}")
@@ -422,6 +473,7 @@ class ExtensionDataStage(PipelineStage):
                 output_dir=str(output_dir),
                 include_source_code=include_source,
                 excluded_modules=excluded_modules,
+                detail_files=detail_files,
             )
 
             # Verify outputs
@@ -442,6 +494,9 @@ class ExtensionDataStage(PipelineStage):
 class CodeExamplesStage(PipelineStage):
     """Run the code examples extraction pipeline."""
 
+    inputs = ("exts_path", "work_dirs")
+    outputs = ("code_examples",)
+
     def _execute(self) -> bool:
         try:
             from code_example_pipeline.scan_extensions_codeatlas import analyze_all_extensions_async
@@ -455,6 +510,7 @@ class CodeExamplesStage(PipelineStage):
             max_extensions = self.config.get("processing.max_extensions")
             scan_mode = self.config.get("processing.code_examples_scan_mode")
             excluded_modules = self.config.get("processing.excluded_modules", [])
+            workers = self.config.get("processing.parallel_workers")
 
             self.logger.info(f"Analyzing extensions for code examples")
             self.logger.info(f"Min lines: {min_lines}, Min complexity: {min_complexity}")
@@ -479,6 +535,8 @@ class CodeExamplesStage(PipelineStage):
                     scan_mode=scan_mode,
                     resume=self.resume_mode,
                     excluded_modules=excluded_modules,
+                    workers=workers,
+                    parse_cache_dir=str(work_dir / ".codeatlas_parse_cache"),
                 )
             )
 
@@ -498,6 +556,9 @@ class CodeExamplesStage(PipelineStage):
 class SettingsStage(PipelineStage):
     """Run the settings extraction pipeline."""
 
+    inputs = ("exts_path", "work_dirs")
+    outputs = ("settings",)
+
     def _execute(self) -> bool:
         try:
             sys.path.insert(0, str(Path(__file__).parent))
@@ -507,10 +568,14 @@ class SettingsStage(PipelineStage):
             work_dir = Path(self.config.get("output.work_dir"))
             output_dir = work_dir / "settings"
 
+            workers = self.config.get("processing.parallel_workers")
+
             self.logger.info(f"Scanning extensions for settings")
 
-            # Create scanner and run
-            scanner = ExtensionSettingsScanner(exts_path)
+            # Create scanner and run, the file cache is shared by the runs of all Kit versions
+            scanner = ExtensionSettingsScanner(
+                exts_path, max_workers=workers, cache_dir=str(work_dir / ".settings_scan_cache")
+            )
             scanner.scan_all_extensions()
             scanner.save_results(output_dir)
 
@@ -536,6 +601,9 @@ class SettingsStage(PipelineStage):
 class EmbeddingsStage(PipelineStage):
     """Generate embeddings for extensions, code examples, and settings."""
 
+    inputs = ("exts_path", "extension_data", "code_examples", "settings")
+    outputs = ("embeddings",)
+
     def _generate_embeddings_for_extensions(self, input_dir: Path, output_dir: Path) -> bool:
         try:
             from extension_data.generate_embeddings_descriptions import generate_extensions_descriptions
@@ -561,6 +629,7 @@ class EmbeddingsStage(PipelineStage):
                 self.endpoint_url,
                 self.embeddings_model,
                 self.batch_size,
+                **self.batch_options,
             )
 
             if not embeddings_file.exists():
@@ -587,6 +656,7 @@ class EmbeddingsStage(PipelineStage):
                 self.endpoint_url,
                 self.max_tokens,
                 self.batch_size,
+                **self.batch_options,
             )
             embeddings_file = output_dir / "code_examples_embeddings.json"
             if not embeddings_file.exists():
@@ -605,7 +675,13 @@ class EmbeddingsStage(PipelineStage):
             settings_file = input_dir / "setting_summary.json"
             output_file = output_dir / "settings_embeddings.json"
             generate_embeddings_for_settings(
-                settings_file, output_file, self.embeddings_model, self.api_key, self.endpoint_url, self.batch_size
+                settings_file,
+                output_file,
+                self.embeddings_model,
+                self.api_key,
+                self.endpoint_url,
+                self.batch_size,
+                **self.batch_options,
             )
 
             if not output_file.exists():
@@ -632,6 +708,11 @@ class EmbeddingsStage(PipelineStage):
             self.endpoint_url = self.config.get("embeddings.endpoint_url")
             self.max_tokens = self.config.get("embeddings.max_tokens")
             self.batch_size = self.config.get("embeddings.batch_size")
+            self.batch_options = {
+                "max_in_flight": self.config.get("embeddings.max_in_flight", 4),
+                "requests_per_second": self.config.get("embeddings.requests_per_second") or None,
+                "max_batch_tokens": self.config.get("embeddings.max_batch_tokens") or None,
+            }
 
             # Validate API key is set
             if not self.api_key:
@@ -658,6 +739,9 @@ class EmbeddingsStage(PipelineStage):
 class FAISSStage(PipelineStage):
     """Build FAISS vector databases."""
 
+    inputs = ("extension_data", "code_examples", "settings", "embeddings")
+    outputs = ("faiss_databases",)
+
     def _execute(self) -> bool:
         try:
             work_dir = Path(self.config.get("output.work_dir"))
@@ -669,6 +753,7 @@ class FAISSStage(PipelineStage):
             self.embeddings_model = self.config.get("embeddings.model")
             self.api_key = self.config.get("embeddings.nvidia_api_key")
             self.endpoint_url = self.config.get("embeddings.endpoint_url")
+            self.index_config = self.config.get("faiss", {})
 
             # Validate API key is set
             if not self.api_key:
@@ -701,6 +786,7 @@ class FAISSStage(PipelineStage):
                     faiss_output_path / "index.faiss",
                     faiss_output_path / "index.pkl",
                     faiss_output_path / "metadata.json",
+                    faiss_output_path / "index_config.json",
                 ]
                 for expected_file in expected_files:
                     if not expected_file.exists():
@@ -727,6 +813,7 @@ class FAISSStage(PipelineStage):
                 self.embeddings_model,
                 self.api_key,
                 self.endpoint_url,
+                self.index_config,
             )
             return True
         except Exception as e:
@@ -747,6 +834,7 @@ class FAISSStage(PipelineStage):
                 self.embeddings_model,
                 self.api_key,
                 self.endpoint_url,
+                self.index_config,
             )
             return True
         except Exception as e:
@@ -766,6 +854,7 @@ class FAISSStage(PipelineStage):
                 self.embeddings_model,
                 self.api_key,
                 self.endpoint_url,
+                self.index_config,
             )
             return True
         except Exception as e:
@@ -776,6 +865,9 @@ class FAISSStage(PipelineStage):
 class FinalAssemblyStage(PipelineStage):
     """Copy generated files to target directory structure."""
 
+    inputs = ("kit_version", "app_template_path", "extension_data", "code_examples", "settings", "faiss_databases")
+    outputs = ("target_dir",)
+
     def _execute(self) -> bool:
         try:
             work_dir = Path(self.config.get("output.work_dir"))
@@ -943,6 +1035,9 @@ class DataCollectionPipeline:
 
         self.checkpoint_file = Path(self.config.get("output.work_dir")) / ".pipeline_checkpoint.json"
 
+        # Overrides advanced.max_parallel_stages from the config when set
+        self.max_parallel_stages: Optional[int] = None
+
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration."""
         logger = logging.getLogger("DataCollectionPipeline")
@@ -963,12 +1058,13 @@ class DataCollectionPipeline:
 
         return logger
 
-    def _save_checkpoint(self, completed_stages: List[str]):
+    def _save_checkpoint(self, completed_stages: List[str], stage_states: Optional[Dict[str, Dict]] = None):
         """Save pipeline checkpoint after successful stage completion."""
         try:
             checkpoint_data = {
                 "timestamp": datetime.now().isoformat(),
                 "completed_stages": completed_stages,
+                "stage_states": stage_states or {},
                 "config_snapshot": {
                     "exts_path": self.config.get("input.exts_path"),
                     "kit_version": self.config.get("input.kit_version"),
@@ -1155,26 +1251,39 @@ class DataCollectionPipeline:
         if completed_stages:
             self.logger.info(f"Skipping {len(completed_stages)} already completed stages: {completed_stages}")
 
-        # Run stages
-        for i, stage in enumerate(stages_to_run, 1):
-            self.logger.info(f"[{i}/{len(stages_to_run)}] Running stage: {stage.name}")
-
-            # Set resume mode for stages when resuming from checkpoint
-            # This allows stages to perform incremental resume (e.g., skip already-processed items)
-            if resume and checkpoint:
+        # Set resume mode for stages when resuming from checkpoint
+        # This allows stages to perform incremental resume (e.g., skip already-processed items)
+        if resume and checkpoint:
+            for stage in stages_to_run:
                 stage.resume_mode = True
 
-            success = stage.run()
-            if not success:
+        # Keep the state of the stages that completed in earlier runs
+        stage_states = dict(checkpoint.get("stage_states", {})) if resume and checkpoint else {}
+        failed_stages = []
+
+        def on_stage_finished(stage: PipelineStage, success: bool):
+            stage_states[stage.name] = stage.get_state()
+            if success:
+                completed_stages.append(stage.name)
+            else:
+                failed_stages.append(stage.name)
                 self.logger.error(f"Pipeline failed at stage: {stage.name}")
-                self.logger.info(f"You can resume from this point using: --resume")
-                # Save checkpoint with completed stages before this failed one
-                self._save_checkpoint(completed_stages)
-                return False
+            self._save_checkpoint(completed_stages, stage_states)
 
-            # Add to completed stages and save checkpoint
-            completed_stages.append(stage.name)
-            self._save_checkpoint(completed_stages)
+        max_workers = self.config.get("advanced.max_parallel_stages", 3)
+        if self.max_parallel_stages is not None:
+            max_workers = self.max_parallel_stages
+
+        # Run stages
+        scheduler = StageScheduler(stages_to_run, max_workers, self.logger, on_stage_finished)
+        success = scheduler.run()
+
+        if not success:
+            if not failed_stages:
+                self.logger.error("Pipeline stopped before all stages could run")
+            self.logger.info(f"You can resume from this point using: --resume")
+            scheduler.log_timing_report()
+            return False
 
         # Pipeline completion
         pipeline_duration = time.time() - pipeline_start
@@ -1182,12 +1291,7 @@ class DataCollectionPipeline:
         self.logger.info("Pipeline completed successfully!")
         self.logger.info(f"Total time: {pipeline_duration:.1f}s")
 
-        # Stage timing summary
-        self.logger.info("\nStage timing summary:")
-        for stage in stages_to_run:
-            duration = stage.get_duration()
-            if duration:
-                self.logger.info(f"  {stage.name}: {duration:.1f}s")
+        scheduler.log_timing_report()
 
         self.logger.info("=" * 80)
 
@@ -1198,9 +1302,11 @@ class DataCollectionPipeline:
 
     def list_stages(self):
         """List all available pipeline stages."""
+        dependencies = build_dependencies(self.pre_stages + self.stages)
         print("Available pipeline stages:")
         for i, stage in enumerate(self.stages, 1):
-            print(f"  {i}. {stage.name}")
+            depends_on = ", ".join(dependencies[stage.name]) or "-"
+            print(f"  {i}. {stage.name} (after: {depends_on})")
 
 
 def main():
@@ -1224,6 +1330,9 @@ Examples:
 
   # List available stages
   python data_collection_pipeline.py --list-stages
+
+  # Run the stages one after another
+  python data_collection_pipeline.py --max-parallel-stages 1
         """,
     )
     parser.add_argument("--config", type=Path, help="Path to pipeline configuration file")
@@ -1238,10 +1347,17 @@ Examples:
 
     parser.add_argument("--list-stages", action="store_true", help="List available pipeline stages and exit")
 
+    parser.add_argument(
+        "--max-parallel-stages",
+        type=int,
+        help="Maximum number of independent stages running at the same time (default: from config)",
+    )
+
     args = parser.parse_args()
 
     # Create pipeline
     pipeline = DataCollectionPipeline(args.config)
+    pipeline.max_parallel_stages = args.max_parallel_stages
 
     # Handle list stages
     if args.list_stages:
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Binary, memory-mapped store for the embeddings of the pipeline.
+
+A store is a directory next to the JSON embeddings file
+(``code_examples_embeddings.json`` -> ``code_examples_embeddings.store``):
+
+- ``vectors.bin``: row-major float32 or float16 matrix, one row per record
+- ``records.jsonl``: one JSON object per row with the key and the record metadata
+- ``manifest.json``: dtype, dimension, keys and byte offsets of the records
+
+The matrix is memory mapped, so the FAISS builders can pass it to the index
+without going through Python lists, and single records are read by seeking to
+their offset.
+
+Usage:
+    # Convert existing JSON embeddings files
+    python embedding_store.py code_examples_embeddings.json settings_embeddings.json
+
+    # Store the vectors as float16
+    python embedding_store.py extensions_embeddings.json --dtype float16
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from faiss_index import build_faiss_index
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+SUPPORTED_DTYPES = ("float32", "float16")
+
+VECTORS_FILE = "vectors.bin"
+RECORDS_FILE = "records.jsonl"
+MANIFEST_FILE = "manifest.json"
+
+
+def store_path_for(embeddings_file: Path) -> Path:
+    """Get the store directory that belongs to a JSON embeddings file."""
+    embeddings_file = Path(embeddings_file)
+    return embeddings_file.with_name(embeddings_file.stem + ".store")
+
+
+class EmbeddingStore:
+    """Append-only embedding matrix with row-aligned record metadata.
+
+    Use ``EmbeddingStore.create`` to start a new store and ``EmbeddingStore(path)``
+    to open an existing one. Appended rows become visible to other readers after
+    ``flush`` or ``close``.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+        with open(self.path / MANIFEST_FILE, "r") as f:
+            manifest = json.load(f)
+
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported embedding store version: {manifest.get('format_version')}")
+
+        self.dtype: str = manifest["dtype"]
+        self.dimension: Optional[int] = manifest["dimension"]
+        self.metadata: Dict[str, Any] = manifest.get("metadata", {})
+        self._keys: List[str] = manifest["keys"]
+        self._offsets: List[int] = manifest["offsets"]
+        self._records_size: int = manifest["records_size"]
+        self._rows: Dict[str, int] = {key: row for row, key in enumerate(self._keys)}
+
+        self._vectors_file = None
+        self._records_file = None
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        dimension: Optional[int] = None,
+        dtype: str = "float32",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "EmbeddingStore":
+        """Create an empty store, replacing the store at the path if there is one.
+
+        Args:
+            path: Directory of the store
+            dimension: Embedding dimension, taken from the first appended row if None
+            dtype: "float32" or "float16"
+            metadata: File-level metadata, e.g. the model of the embeddings
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype}. Must be one of {SUPPORTED_DTYPES}")
+
+        path = Path(path)
+        if path.exists():
+            shutil.rmtree(path)
+        path.mkdir(parents=True)
+
+        (path / VECTORS_FILE).touch()
+        (path / RECORDS_FILE).touch()
+        cls._write_manifest(path, dtype, dimension, metadata or {}, [], [], 0)
+
+        return cls(path)
+
+    @staticmethod
+    def _write_manifest(path, dtype, dimension, metadata, keys, offsets, records_size):
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "dtype": dtype,
+            "dimension": dimension,
+            "count": len(keys),
+            "metadata": metadata,
+            "keys": keys,
+            "offsets": offsets,
+            "records_size": records_size,
+        }
+        tmp_file = path / (MANIFEST_FILE + ".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(tmp_file, path / MANIFEST_FILE)
+
+    def __enter__(self) -> "EmbeddingStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def keys(self) -> List[str]:
+        """Get the record keys in row order."""
+        return list(self._keys)
+
+    def row(self, key: str) -> int:
+        """Get the row of a record in the matrix."""
+        return self._rows[key]
+
+    def append(self, key: str, embedding: Sequence[float], record: Optional[Dict[str, Any]] = None) -> int:
+        """Append a row and return its index.
+
+        Raises:
+            KeyError: If the key is already in the store
+            ValueError: If the embedding doesn't match the store dimension
+        """
+        if key in self._rows:
+            raise KeyError(f"Key already in embedding store: {key}")
+
+        vector = np.asarray(embedding, dtype=self.dtype)
+        if vector.ndim != 1:
+            raise ValueError(f"Embedding of {key} must be a flat vector")
+        if self.dimension is None:
+            self.dimension = int(vector.shape[0])
+        elif vector.shape[0] != self.dimension:
+            raise ValueError(f"Embedding of {key} has dimension {vector.shape[0]}, expected {self.dimension}")
+
+        if self._vectors_file is None:
+            self._open_for_append()
+
+        line = json.dumps({"key": key, **(record or {})}, separators=(",", ":")).encode("utf-8") + b"\n"
+        offset = self._records_size
+
+        self._vectors_file.write(vector.tobytes())
+        self._records_file.write(line)
+        self._records_size += len(line)
+
+        row = len(self._keys)
+        self._keys.append(key)
+        self._offsets.append(offset)
+        self._rows[key] = row
+        return row
+
+    def _open_for_append(self):
+        # Drop rows written after the last flush, they are not in the manifest
+        vectors_size = len(self._keys) * (self.dimension or 0) * np.dtype(self.dtype).itemsize
+        self._vectors_file = open(self.path / VECTORS_FILE, "r+b")
+        self._vectors_file.truncate(vectors_size)
+        self._vectors_file.seek(vectors_size)
+        self._records_file = open(self.path / RECORDS_FILE, "r+b")
+        self._records_file.truncate(self._records_size)
+        self._records_file.seek(self._records_size)
+
+    def flush(self):
+        """Write the appended rows and the manifest to disk."""
+        if self._vectors_file is not None:
+            self._vectors_file.flush()
+            self._records_file.flush()
+        self._write_manifest(
+            self.path, self.dtype, self.dimension, self.metadata, self._keys, self._offsets, self._records_size
+        )
+
+    def close(self):
+        """Flush and close the files opened for appending."""
+        if self._vectors_file is not None:
+            self.flush()
+            self._vectors_file.close()
+            self._records_file.close()
+            self._vectors_file = None
+            self._records_file = None
+
+    def matrix(self) -> np.ndarray:
+        """Get the embedding matrix as a read-only memory map of shape (rows, dimension).
+
+        The map has the dtype of the store. Use ``vectors`` for a float32 array.
+        """
+        if self._vectors_file is not None:
+            self._vectors_file.flush()
+
+        if not self._keys:
+            return np.empty((0, self.dimension or 0), dtype=self.dtype)
+
+        return np.memmap(self.path / VECTORS_FILE, dtype=self.dtype, mode="r", shape=(len(self._keys), self.dimension))
+
+    def vectors(self, rows: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Get the float32 embeddings of the rows, or of all rows if None.
+
+        When all rows of a float32 store are requested the memory map is
+        returned as is, without copying.
+        """
+        matrix = self.matrix()
+        if rows is not None and not (len(rows) == len(matrix) and all(i == row for i, row in enumerate(rows))):
+            matrix = matrix[np.asarray(rows, dtype=np.int64)]
+        if matrix.dtype != np.float32:
+            matrix = matrix.astype(np.float32)
+        return matrix
+
+    def get_vector(self, key: str) -> np.ndarray:
+        """Get the embedding of a record as a float32 array."""
+        return np.asarray(self.matrix()[self._rows[key]], dtype=np.float32)
+
+    def get_record(self, key: str) -> Dict[str, Any]:
+        """Get the metadata of a record without reading the others."""
+        if self._records_file is not None:
+            self._records_file.flush()
+
+        with open(self.path / RECORDS_FILE, "rb") as f:
+            f.seek(self._offsets[self._rows[key]])
+            record = json.loads(f.readline())
+
+        record.pop("key", None)
+        return record
+
+    def get(self, key: str) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Get the embedding and the metadata of a record."""
+        return self.get_vector(key), self.get_record(key)
+
+    def records(self) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """Iterate over (row, key, record metadata) in row order."""
+        if self._records_file is not None:
+            self._records_file.flush()
+
+        with open(self.path / RECORDS_FILE, "rb") as f:
+            for row, line in enumerate(f):
+                if row >= len(self._keys):
+                    break
+                record = json.loads(line)
+                key = record.pop("key")
+                yield row, key, record
+
+
+def _find_section(data: Dict[str, Any]) -> str:
+    sections = [name for name, value in data.items() if name != "metadata" and isinstance(value, dict)]
+    if len(sections) != 1:
+        raise ValueError(f"Can't find the records section of the embeddings file, candidates: {sections}")
+    return sections[0]
+
+
+def write_embedding_store(
+    store_path: Path,
+    records: Dict[str, Dict[str, Any]],
+    metadata: Optional[Dict[str, Any]] = None,
+    dtype: str = "float32",
+) -> EmbeddingStore:
+    """Write records in the JSON embeddings layout ({key: {"embedding": [...], ...}}) to a store.
+
+    Records without an embedding (failed batches) are not stored, their
+    number is kept in the ``skipped_records`` metadata.
+    """
+    store_metadata = dict(metadata or {})
+    store_metadata["skipped_records"] = 0
+
+    store = EmbeddingStore.create(store_path, dtype=dtype, metadata=store_metadata)
+    with store:
+        for key, record in records.items():
+            embedding = record.get("embedding")
+            if not embedding:
+                store.metadata["skipped_records"] += 1
+                continue
+            store.append(key, embedding, {name: value for name, value in record.items() if name != "embedding"})
+        store.flush()
+
+    return store
+
+
+def convert_json_embeddings(
+    embeddings_file: Path,
+    store_path: Optional[Path] = None,
+    section: Optional[str] = None,
+    dtype: str = "float32",
+) -> EmbeddingStore:
+    """Convert a JSON embeddings file to a binary store.
+
+    Args:
+        embeddings_file: Path to the JSON embeddings file
+        store_path: Directory of the store (default: next to the JSON file)
+        section: Name of the records section, detected when None
+        dtype: "float32" or "float16"
+
+    Returns:
+        The new store
+    """
+    embeddings_file = Path(embeddings_file)
+    store_path = Path(store_path) if store_path else store_path_for(embeddings_file)
+
+    with open(embeddings_file, "r") as f:
+        data = json.load(f)
+
+    section = section or _find_section(data)
+    store = write_embedding_store(store_path, data.get(section, {}), data.get("metadata", {}), dtype)
+
+    logger.info(f"Converted {len(store)} embeddings from {embeddings_file} to {store_path}")
+    return store
+
+
+def open_embeddings(embeddings_file: Path, section: Optional[str] = None) -> EmbeddingStore:
+    """Open the store of a JSON embeddings file.
+
+    The JSON file is converted when the store is missing or older than it.
+
+    Args:
+        embeddings_file: Path to the JSON embeddings file
+        section: Name of the records section, detected when None
+    """
+    embeddings_file = Path(embeddings_file)
+    store_path = store_path_for(embeddings_file)
+    manifest = store_path / MANIFEST_FILE
+
+    if manifest.exists() and (
+        not embeddings_file.exists() or manifest.stat().st_mtime >= embeddings_file.stat().st_mtime
+    ):
+        try:
+            return EmbeddingStore(store_path)
+        except Exception as e:
+            logger.warning(f"Rebuilding unreadable embedding store {store_path}: {e}")
+
+    return convert_json_embeddings(embeddings_file, store_path, section)
+
+
+def create_faiss_vectorstore(
+    vectors: np.ndarray, documents: List[Any], embedder: Any, index_config: Optional[Dict[str, Any]] = None
+):
+    """Create a LangChain FAISS vector store directly from an embedding matrix.
+
+    With the default configuration, builds the same flat L2 index as
+    ``FAISS.from_embeddings`` without converting the matrix to Python lists first.
+
+    Args:
+        vectors: float32 matrix with one row per document
+        documents: LangChain documents in the order of the rows
+        embedder: Embedder used to embed the queries
+        index_config: Options of the ``[faiss]`` section of the pipeline configuration
+    """
+    import uuid
+
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+
+    if len(vectors) != len(documents):
+        raise ValueError(f"Got {len(vectors)} vectors for {len(documents)} documents")
+
+    index = build_faiss_index(vectors, index_config)
+
+    ids = [str(uuid.uuid4()) for _ in documents]
+    docstore = InMemoryDocstore(
+        {
+            doc_id: Document(id=doc_id, page_content=doc.page_content, metadata=doc.metadata)
+            for doc_id, doc in zip(ids, documents)
+        }
+    )
+
+    return FAISS(embedder, index, docstore, dict(enumerate(ids)))
+
+
+def main():
+    """Convert JSON embeddings files to binary stores."""
+    parser = argparse.ArgumentParser(description="Convert JSON embeddings files to binary embedding stores")
+    parser.add_argument("embeddings_files", type=Path, nargs="+", help="JSON embeddings files to convert")
+    parser.add_argument("--dtype", choices=SUPPORTED_DTYPES, default="float32", help="Storage type of the vectors")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    for embeddings_file in args.embeddings_files:
+        store = convert_json_embeddings(embeddings_file, dtype=args.dtype)
+        json_size = embeddings_file.stat().st_size
+        store_size = sum(path.stat().st_size for path in store.path.iterdir())
+        logger.info(
+            f"{embeddings_file.name}: {len(store)} rows, {json_size / 1e6:.1f} MB JSON -> {store_size / 1e6:.1f} MB store"
+        )
+
+
+if __name__ == "__main__":
+    main()
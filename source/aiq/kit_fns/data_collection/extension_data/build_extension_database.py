@@ -36,6 +36,11 @@ from typing import Any, Dict, List, Optional, Set
 
 import toml
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # Token counting with tiktoken
 try:
     import tiktoken
@@ -48,6 +53,9 @@ except ImportError:
 # Import Code Atlas from lc_agent - using public API
 from lc_agent.code_atlas import CodeAtlasCache
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from record_store import RecordStoreWriter
+
 print("Using Code Atlas from lc_agent")
 
 # ============================================================================
@@ -72,14 +80,29 @@ def should_exclude_extension(extension_name: str) -> bool:
     return False
 
 
+_encodings: Dict[str, Any] = {}
+
+
+def get_encoding(model: str = "cl100k_base"):
+    """Get the tiktoken encoding, loaded once, or None if it is not available."""
+    if model not in _encodings:
+        _encodings[model] = None
+        if TIKTOKEN_AVAILABLE:
+            try:
+                _encodings[model] = tiktoken.get_encoding(model)
+            except Exception as e:
+                print(f"Error loading tokenizer {model}, estimating token counts: {e}")
+    return _encodings[model]
+
+
 def count_tokens(text: str, model: str = "cl100k_base") -> int:
     """Count tokens in text using tiktoken."""
-    if not TIKTOKEN_AVAILABLE:
+    encoding = get_encoding(model)
+    if encoding is None:
         # Fallback: rough estimation (1 token ≈ 4 characters)
         return len(text) // 4
 
     try:
-        encoding = tiktoken.get_encoding(model)
         tokens = encoding.encode(text)
         return len(tokens)
     except Exception as e:
@@ -87,6 +110,97 @@ def count_tokens(text: str, model: str = "cl100k_base") -> int:
         return len(text) // 4  # Fallback estimation
 
 
+class TokenCounter:
+    """Count the tokens of a text written in pieces, like count_tokens counts the whole text.
+
+    The pieces are encoded in blocks cut after a line break. The tokenizer ends
+    a token at a line break that is not followed by another one, as in indented
+    JSON, so the block counts add up to the count of the whole text while only
+    one block is in memory.
+    """
+
+    def __init__(self, model: str = "cl100k_base", block_size: int = 1 << 20):
+        self.encoding = get_encoding(model)
+        self.block_size = block_size
+        self.tokens = 0
+        self.characters = 0
+        self._pending: List[str] = []
+        self._pending_size = 0
+
+    def write(self, text: str):
+        self.characters += len(text)
+        if self.encoding is None:
+            return
+
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= self.block_size:
+            block = "".join(self._pending)
+            cut = block.rfind("\n") + 1
+            if cut > 0:
+                self._count(block[:cut])
+                block = block[cut:]
+            self._pending = [block]
+            self._pending_size = len(block)
+
+    def _count(self, text: str):
+        try:
+            self.tokens += len(self.encoding.encode(text))
+        except Exception as e:
+            print(f"Error counting tokens: {e}")
+            self.tokens += len(text) // 4
+
+    @property
+    def total(self) -> int:
+        if self.encoding is None:
+            # Fallback: rough estimation (1 token ≈ 4 characters)
+            return self.characters // 4
+        if self._pending:
+            self._count("".join(self._pending))
+            self._pending = []
+            self._pending_size = 0
+        return self.tokens
+
+
+class _Tee:
+    """Write to several file-like objects."""
+
+    def __init__(self, *outputs):
+        self.outputs = outputs
+
+    def write(self, text: str):
+        for output in self.outputs:
+            output.write(text)
+
+
+def dump_json_counting_tokens(data: Any, path: Optional[Path] = None) -> int:
+    """Write data as indented JSON and count its tokens without building the JSON string.
+
+    Args:
+        data: Data to serialize
+        path: File to write, None to only count the tokens
+
+    Returns:
+        The number of tokens of the indented JSON
+    """
+    counter = TokenCounter()
+    if path is None:
+        json.dump(data, counter, indent=2)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, _Tee(f, counter), indent=2)
+    return counter.total
+
+
+def peak_memory_mb() -> Optional[float]:
+    """Peak resident memory of the process in MB, None where it is not available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / 2**20 if sys.platform == "darwin" else peak / 2**10, 1)
+
+
 # ============================================================================
 # Extension Processor using lc_agent Code Atlas
 # ============================================================================
@@ -545,12 +659,21 @@ def generate_api_docs(code_atlas: dict, extension_path: Path) -> dict:
 
 
 class ExtensionsDatabaseBuilder:
-    """Build the main extensions database index."""
+    """Build the main extensions database index.
+
+    Entries are written to the compact JSON database as they are added.
+    """
 
-    def __init__(self):
-        self.database = {}
+    def __init__(self, output_path: Path):
+        self.db_file = output_path / "extensions_database.json"
+        self.extension_ids: Set[str] = set()
         self.embedding_counter = 0
 
+        # Add metadata
+        header = {"database_version": "1.0.0", "generated_at": datetime.now().isoformat()}
+        self._file = open(self.db_file, "w", encoding="utf-8")
+        self._file.write(json.dumps(header, separators=(",", ":"))[:-1] + ',"extensions":{')
+
     def add_extension(
         self,
         metadata: dict,
@@ -589,26 +712,19 @@ class ExtensionsDatabaseBuilder:
             "optional_dependencies": metadata.get("optional_dependencies", []),
         }
 
-        self.database[ext_id] = entry
+        # A repeated extension ID replaces the previous entry when the JSON is loaded
+        separator = "," if self.extension_ids else ""
+        self._file.write(f"{separator}{json.dumps(ext_id)}:{json.dumps(entry, separators=(',', ':'))}")
+        self.extension_ids.add(ext_id)
         self.embedding_counter += 1
 
-    def save(self, output_path: Path):
-        """Save the extensions database to JSON."""
-        db_file = output_path / "extensions_database.json"
+    def save(self):
+        """Finish the extensions database JSON."""
+        self._file.write(f'}},"total_extensions":{len(self.extension_ids)}}}')
+        self._file.close()
 
-        # Add metadata
-        output = {
-            "database_version": "1.0.0",
-            "generated_at": datetime.now().isoformat(),
-            "total_extensions": len(self.database),
-            "extensions": self.database,
-        }
-
-        with open(db_file, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2)
-
-        print(f"  → Saved extensions database: {db_file}")
-        return db_file
+        print(f"  → Saved extensions database: {self.db_file}")
+        return self.db_file
 
 
 # ============================================================================
@@ -621,14 +737,20 @@ def process_all_extensions(
     output_dir: str = "extension_detail",
     include_source_code: bool = False,
     excluded_modules: List[str] = None,
+    detail_files: bool = True,
 ):
     """Process all extensions in the extscache directory.
 
+    The Code Atlas and API docs of every extension are written to the compact
+    record stores of the codeatlas and api_docs directories, and to indented
+    JSON files of their own with detail_files.
+
     Args:
         extscache_path: Path to the extscache directory
         output_dir: Output directory for generated files
         include_source_code: Whether to include function source code in Code Atlas (default: False)
         excluded_modules: List of module names to exclude when scanning Python code
+        detail_files: Whether to also write a JSON file per extension (default: True)
     """
     extscache = Path(extscache_path)
     if not extscache.exists():
@@ -662,8 +784,10 @@ def process_all_extensions(
     print(f"  - Processing: {len(extensions)}")
     print(f"  - Excluded: {excluded_count}")
 
-    # Initialize database builder
-    db_builder = ExtensionsDatabaseBuilder()
+    # Initialize database builder and record stores, written as the extensions are processed
+    db_builder = ExtensionsDatabaseBuilder(output_path)
+    codeatlas_records = RecordStoreWriter(codeatlas_dir)
+    api_docs_records = RecordStoreWriter(api_docs_dir)
 
     # Summary data
     summary = {"total_extensions": len(extensions), "processed": 0, "failed": 0, "extensions": []}
@@ -688,17 +812,12 @@ def process_all_extensions(
             api_docs_token_count = 0
 
             if has_api_content:
-                # Save Code Atlas JSON
-                codeatlas_filename = f"{metadata['extension_id']}-{metadata['version']}.codeatlas.json"
-                codeatlas_file = codeatlas_dir / codeatlas_filename
-
-                # Convert to JSON string for token counting
-                codeatlas_json_str = json.dumps(code_atlas, indent=2)
-                codeatlas_token_count = count_tokens(codeatlas_json_str)
-
-                # Save the JSON file
-                with open(codeatlas_file, "w", encoding="utf-8") as f:
-                    f.write(codeatlas_json_str)
+                # Save Code Atlas JSON, counting the tokens of the indented JSON while it is written
+                record_key = f"{metadata['extension_id']}-{metadata['version']}"
+                codeatlas_filename = f"{record_key}.codeatlas.json"
+                codeatlas_file = codeatlas_dir / codeatlas_filename if detail_files else None
+                codeatlas_token_count = dump_json_counting_tokens(code_atlas, codeatlas_file)
+                codeatlas_records.add(record_key, code_atlas)
                 print(f"  → Saved: codeatlas/{codeatlas_filename} ({codeatlas_token_count:,} tokens)")
 
                 # Generate and save API documentation
@@ -710,16 +829,12 @@ def process_all_extensions(
 
                 # Only save API docs if there are public APIs
                 if num_public_classes > 0 or num_public_methods > 0:
-                    api_docs_filename = f"{metadata['extension_id']}-{metadata['version']}.api_docs.json"
-                    api_docs_file = api_docs_dir / api_docs_filename
-
-                    # Convert to JSON and count tokens
-                    api_docs_json_str = json.dumps(api_docs, indent=2)
-                    api_docs_token_count = count_tokens(api_docs_json_str)
+                    api_docs_filename = f"{record_key}.api_docs.json"
+                    api_docs_file = api_docs_dir / api_docs_filename if detail_files else None
 
-                    # Save API docs JSON
-                    with open(api_docs_file, "w", encoding="utf-8") as f:
-                        f.write(api_docs_json_str)
+                    # Save API docs JSON and count tokens
+                    api_docs_token_count = dump_json_counting_tokens(api_docs, api_docs_file)
+                    api_docs_records.add(record_key, api_docs)
                     print(
                         f"  → Saved: api_docs/{api_docs_filename} ({num_public_classes} classes, {num_public_methods} methods, {api_docs_token_count:,} tokens)"
                     )
@@ -754,8 +869,11 @@ def process_all_extensions(
             traceback.print_exc()
             summary["failed"] += 1
 
-    # Save the database
-    db_file = db_builder.save(output_path)
+    # Finish the database and the record indexes
+    db_file = db_builder.save()
+    codeatlas_records.close()
+    api_docs_records.close()
+    summary["peak_memory_mb"] = peak_memory_mb()
 
     # Save summary
     summary_file = output_path / "extensions_summary.json"
@@ -769,6 +887,8 @@ def process_all_extensions(
     print(f"  Total extensions: {len(extensions)}")
     print(f"  Processed: {summary['processed']}")
     print(f"  Failed: {summary['failed']}")
+    if summary["peak_memory_mb"] is not None:
+        print(f"  Peak memory: {summary['peak_memory_mb']:,.1f} MB")
     print(f"  Extensions database: {db_file}")
     print(f"  Summary saved to: {summary_file}")
     print(f"{'='*60}")
@@ -790,11 +910,18 @@ def main():
         default=False,
         help="Set to True to include function source code (increases size significantly)",
     )
+    parser.add_argument(
+        "--no-detail-files",
+        action="store_true",
+        help="Only write the compact record stores, not a JSON file per extension",
+    )
     args = parser.parse_args()
 
     print("\nProcessing ALL extensions...")
     print(f"Include source code: {args.include_source_code}")
-    process_all_extensions(args.extensions_dir, include_source_code=args.include_source_code)
+    process_all_extensions(
+        args.extensions_dir, include_source_code=args.include_source_code, detail_files=not args.no_detail_files
+    )
 
 
 if __name__ == "__main__":
@@ -22,12 +22,16 @@ Creates a searchable vector database for finding relevant extensions.
 import json
 import logging
 import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from embedding_store import create_faiss_vectorstore, open_embeddings
+from faiss_index import save_faiss_vectorstore
+
 # Import embeddings creator
 try:
     from langchain_nvidia_ai_endpoints import NVIDIAEmbeddings
@@ -89,6 +93,7 @@ def build_faiss_database(
     embedding_model: str = DEFAULT_EMBEDDING_MODEL,
     api_key: str = "",
     endpoint_url: str = None,
+    index_config: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Build FAISS database from extension embeddings.
 
@@ -100,6 +105,7 @@ def build_faiss_database(
         embedding_model: Embedding model to use
         api_key: API key for authentication
         endpoint_url: Optional custom endpoint URL
+        index_config: Options of the ``[faiss]`` section of the pipeline configuration, flat index when None
     """
     logger.info("=" * 60)
     logger.info("Building FAISS Database for Extensions")
@@ -122,8 +128,8 @@ def build_faiss_database(
         logger.error("Please run 'poetry run generate-embeddings' first")
         raise FileNotFoundError(f"Embeddings file not found: {embeddings_file}")
 
-    with open(embeddings_file, "r") as f:
-        embeddings_data = json.load(f)
+    # Memory mapped store of the embeddings, converted from the JSON file when needed
+    store = open_embeddings(embeddings_file, "extensions")
 
     # Load descriptions
     if not descriptions_file.exists():
@@ -147,27 +153,16 @@ def build_faiss_database(
     else:
         extensions_metadata = {}
 
-    logger.info(f"Loaded {len(embeddings_data.get('extensions', {}))} embeddings")
+    logger.info(f"Loaded {len(store)} embeddings")
 
     # Prepare documents and embeddings for FAISS
     documents = []
-    embedding_vectors = []
-    skipped = 0
-
-    # Get extensions from embeddings data
-    extensions = embeddings_data.get("extensions", {})
+    rows = []
+    # Records without an embedding are not in the store
+    skipped = store.metadata.get("skipped_records", 0)
 
-    for ext_id, ext_embedding_data in extensions.items():
+    for row, ext_id, ext_embedding_data in store.records():
         try:
-            # Get the embedding vector
-            embedding_vector = ext_embedding_data.get("embedding", [])
-
-            # Skip entries without valid embeddings
-            if not embedding_vector or len(embedding_vector) == 0:
-                logger.warning(f"Extension {ext_id} has no embedding vector, skipping")
-                skipped += 1
-                continue
-
             # Get the description text (for page_content)
             description_text = ""
             if ext_id in descriptions_data:
@@ -212,7 +207,7 @@ def build_faiss_database(
             doc = Document(page_content=description_text, metadata=metadata)
 
             documents.append(doc)
-            embedding_vectors.append(embedding_vector)
+            rows.append(row)
 
         except Exception as e:
             logger.error(f"Failed to process extension {ext_id}: {e}")
@@ -230,16 +225,11 @@ def build_faiss_database(
         logger.info("Creating FAISS index...")
 
         # Create FAISS index from documents and embeddings
-        vectorstore = FAISS.from_embeddings(
-            text_embeddings=[(doc.page_content, emb) for doc, emb in zip(documents, embedding_vectors)],
-            embedding=embedder,
-            metadatas=[doc.metadata for doc in documents],
-        )
+        vectorstore = create_faiss_vectorstore(store.vectors(rows), documents, embedder, index_config)
 
         # Save the FAISS database
         logger.info(f"Saving FAISS database to: {faiss_output_path}")
-        faiss_output_path.mkdir(parents=True, exist_ok=True)
-        vectorstore.save_local(str(faiss_output_path))
+        index_description = save_faiss_vectorstore(vectorstore, faiss_output_path)
 
         logger.info(f"Successfully saved FAISS database to {faiss_output_path}")
         logger.info(f"Database contains {len(documents)} extension entries")
@@ -250,7 +240,8 @@ def build_faiss_database(
             "total_extensions": len(documents),
             "skipped_extensions": skipped,
             "embedding_model": embedding_model,
-            "embedding_dimension": len(embedding_vectors[0]) if embedding_vectors else 0,
+            "embedding_dimension": store.dimension or 0,
+            "index": index_description,
             "created_at": None,
         }
 
@@ -17,6 +17,7 @@
 """
 Generate embedding vectors for extension descriptions.
 Creates embeddings using NVIDIA API and saves them to a separate database file.
+Extensions whose description did not change since the last run reuse their embedding.
 """
 
 import argparse
@@ -24,9 +25,19 @@ import json
 import logging
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from batch_embedder import BatchEmbeddingExecutor
+from incremental_embeddings import (
+    content_hash,
+    load_existing_records,
+    plan_incremental_update,
+    save_embeddings_database,
+)
+
 # Import LangChain NVIDIA embeddings
 try:
     from langchain_nvidia_ai_endpoints import NVIDIAEmbeddings
@@ -154,9 +165,17 @@ def generate_embeddings_for_extensions(
     endpoint_url: Optional[str] = None,
     model: str = DEFAULT_EMBEDDING_MODEL,
     batch_size: int = 10,
+    embedder: Optional[Any] = None,
+    max_in_flight: int = 4,
+    requests_per_second: Optional[float] = None,
+    max_batch_tokens: Optional[int] = None,
 ) -> None:
     """Generate embeddings for all extension descriptions.
 
+    Embeddings of extensions whose description is unchanged since the last run
+    are taken from the existing output file, extensions that no longer exist
+    are removed from it.
+
     Args:
         descriptions_file: Path to the descriptions JSON file
         output_file: Path to save the embeddings database
@@ -164,6 +183,10 @@ def generate_embeddings_for_extensions(
         endpoint_url: Optional custom endpoint URL
         model: Embedding model to use
         batch_size: Number of descriptions to process in batch
+        embedder: Embedder to use instead of creating the NVIDIA one
+        max_in_flight: Number of batches sent to the embedder at the same time
+        requests_per_second: Request rate limit of the embedding endpoint
+        max_batch_tokens: Maximum number of tokens in a batch
     """
     # Load descriptions
     if not descriptions_file.exists():
@@ -177,11 +200,22 @@ def generate_embeddings_for_extensions(
 
     logger.info(f"Found {len(descriptions_data)} extension descriptions")
 
-    # Create embedder
-    embedder = create_embeddings(api_key, endpoint_url, model)
-    if not embedder:
-        logger.error("Failed to create embedder. Exiting.")
-        return
+    documents = {
+        ext_id: ext_data["description"]
+        for ext_id, ext_data in descriptions_data.items()
+        if isinstance(ext_data, dict) and "description" in ext_data
+    }
+
+    existing = load_existing_records(output_file, "extensions")
+    reused, pending, removed = plan_incremental_update(documents, existing, model)
+    logger.info(f"Reusing {len(reused)} embeddings, embedding {len(pending)} extensions, removing {len(removed)}")
+
+    if pending and embedder is None:
+        # Create embedder
+        embedder = create_embeddings(api_key, endpoint_url, model)
+        if not embedder:
+            logger.error("Failed to create embedder. Exiting.")
+            return
 
     # Process extensions and generate embeddings
     embeddings_database = {
@@ -196,89 +230,80 @@ def generate_embeddings_for_extensions(
 
     processed = 0
     failed = 0
+    new_records = {}
+
+    def record_for(ext_id: str, embedding: List[float]) -> Dict[str, Any]:
+        ext_data = descriptions_data[ext_id]
+        return {
+            "embedding": embedding,
+            "version": ext_data.get("version", ""),
+            "token_count": ext_data.get("token_count", 0),
+            "has_overview": ext_data.get("has_overview", False),
+            "has_python_api": ext_data.get("has_python_api", False),
+        }
+
+    # Embed the changed descriptions with several batches in flight
+    embeddings = {}
+    if pending:
+        executor = BatchEmbeddingExecutor(
+            embedder,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            max_batch_tokens=max_batch_tokens,
+            requests_per_second=requests_per_second,
+        )
+        embeddings = executor.embed({ext_id: documents[ext_id] for ext_id in pending})
+        logger.info(f"Embedding requests: {executor.stats['requests']} ({executor.stats['retries']} retries)")
+
+    for ext_id in pending:
+        if ext_id in embeddings:
+            record = record_for(ext_id, embeddings[ext_id])
+            record["content_hash"] = content_hash(documents[ext_id])
+            record["model"] = model
+            processed += 1
+        else:
+            # Keep the failed extension so it's embedded again on the next run
+            record = record_for(ext_id, [])
+            record["error"] = executor.failed.get(ext_id, "not embedded")
+            failed += 1
+        new_records[ext_id] = record
+
+    # Merge with the reused embeddings, keeping the order of the descriptions
+    for ext_id in documents:
+        if ext_id in reused:
+            # Refresh the metadata, only the embedding is reused
+            record = record_for(ext_id, reused[ext_id]["embedding"])
+            record["content_hash"] = reused[ext_id]["content_hash"]
+            record["model"] = model
+        else:
+            record = new_records.get(ext_id)
+            if record is None:
+                continue
+        embeddings_database["extensions"][ext_id] = record
 
-    # Convert to list for batch processing
-    extensions_list = list(descriptions_data.items())
-
-    for i in range(0, len(extensions_list), batch_size):
-        batch = extensions_list[i : i + batch_size]
-        batch_texts = []
-        batch_ids = []
-
-        # Prepare batch
-        for ext_id, ext_data in batch:
-            if isinstance(ext_data, dict) and "description" in ext_data:
-                batch_texts.append(ext_data["description"])
-                batch_ids.append(ext_id)
-
-        if not batch_texts:
-            continue
-
-        try:
-            # Generate embeddings for batch
-            logger.info(f"Processing batch {i//batch_size + 1}: {len(batch_texts)} extensions")
-
-            if len(batch_texts) == 1:
-                # Single item - use embed_query
-                embeddings = [embedder.embed_query(batch_texts[0])]
-            else:
-                # Multiple items - use embed_documents
-                embeddings = embedder.embed_documents(batch_texts)
-
-            # Store embeddings
-            for ext_id, embedding in zip(batch_ids, embeddings):
-                embeddings_database["extensions"][ext_id] = {
-                    "embedding": embedding,
-                    "version": descriptions_data[ext_id].get("version", ""),
-                    "token_count": descriptions_data[ext_id].get("token_count", 0),
-                    "has_overview": descriptions_data[ext_id].get("has_overview", False),
-                    "has_python_api": descriptions_data[ext_id].get("has_python_api", False),
-                }
-                processed += 1
-
-                # Set embedding dimension from first successful embedding
-                if embeddings_database["metadata"]["embedding_dimension"] is None:
-                    embeddings_database["metadata"]["embedding_dimension"] = len(embedding)
-                    logger.info(f"Embedding dimension: {len(embedding)}")
-
-            # Log progress
-            progress = (i + len(batch)) / len(extensions_list) * 100
-            logger.info(f"Progress: {processed}/{len(descriptions_data)} extensions ({progress:.1f}%)")
-
-        except Exception as e:
-            logger.error(f"Failed to process batch starting at {i}: {e}")
-            # Add empty embeddings for failed batch
-            for ext_id in batch_ids:
-                embeddings_database["extensions"][ext_id] = {
-                    "embedding": [],
-                    "version": descriptions_data[ext_id].get("version", ""),
-                    "token_count": descriptions_data[ext_id].get("token_count", 0),
-                    "has_overview": descriptions_data[ext_id].get("has_overview", False),
-                    "has_python_api": descriptions_data[ext_id].get("has_python_api", False),
-                    "error": str(e),
-                }
-                failed += 1
+        # Set embedding dimension from first successful embedding
+        if embeddings_database["metadata"]["embedding_dimension"] is None and record["embedding"]:
+            embeddings_database["metadata"]["embedding_dimension"] = len(record["embedding"])
 
     # Add timestamp
-    from datetime import datetime
-
     embeddings_database["metadata"]["generated_at"] = datetime.now().isoformat()
-    embeddings_database["metadata"]["successful_embeddings"] = processed
+    embeddings_database["metadata"]["successful_embeddings"] = processed + len(reused)
     embeddings_database["metadata"]["failed_embeddings"] = failed
+    embeddings_database["metadata"]["reused_embeddings"] = len(reused)
+    embeddings_database["metadata"]["removed_embeddings"] = len(removed)
 
     # Save embeddings database
     logger.info(f"Saving embeddings database to: {output_file}")
-    output_file.parent.mkdir(exist_ok=True)
-
-    with open(output_file, "w") as f:
-        json.dump(embeddings_database, f, indent=2)
+    save_embeddings_database(output_file, embeddings_database, "extensions")
 
     # Summary
     logger.info("=" * 60)
     logger.info("Embedding Generation Complete")
     logger.info("=" * 60)
     logger.info(f"Total extensions: {len(descriptions_data)}")
-    logger.info(f"Successful embeddings: {processed}")
+    logger.info(f"New embeddings: {processed}")
+    logger.info(f"Reused embeddings: {len(reused)}")
+    logger.info(f"Removed embeddings: {len(removed)}")
     logger.info(f"Failed embeddings: {failed}")
     if embeddings_database["metadata"]["embedding_dimension"]:
         logger.info(f"Embedding dimension: {embeddings_database['metadata']['embedding_dimension']}")
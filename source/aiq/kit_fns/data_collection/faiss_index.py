@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+FAISS index types for the pipeline databases.
+
+The index type is chosen in the ``[faiss]`` section of ``pipeline_config.toml``:
+
+- ``flat``: exact search, the default
+- ``ivf_flat``: inverted lists over k-means cells, searches ``nprobe`` cells
+- ``hnsw``: graph index, searches with a candidate list of ``ef_search`` entries
+- ``ivf_pq``: inverted lists with product-quantized vectors
+- ``sq8``: exact search over 8-bit scalar-quantized vectors
+
+All index types use the L2 distance of the flat index, so the scores seen by
+the services keep their meaning. The indexes that need training are trained on
+a seeded random sample of the vectors, and small corpora fall back to the flat
+index.
+
+Next to the LangChain files, ``save_faiss_vectorstore`` writes
+``index_config.json`` with the type and search parameters of the index, which
+the services read to set ``nprobe`` / ``efSearch`` when loading it.
+"""
+
+import json
+import logging
+import math
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# The services read index_config.json, kit_fns.config names it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from kit_fns.config import INDEX_CONFIG_FILE  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+INDEX_TYPES = ("flat", "ivf_flat", "hnsw", "ivf_pq", "sq8")
+
+DEFAULT_INDEX_CONFIG = {
+    "index_type": "flat",
+    # Number of IVF cells, 0 for about 4 * sqrt(number of vectors)
+    "nlist": 0,
+    # IVF cells searched per query, 0 for nlist / 8
+    "nprobe": 0,
+    "hnsw_m": 32,
+    "ef_construction": 200,
+    "ef_search": 64,
+    # PQ sub-quantizers, 0 for one per 8 dimensions
+    "pq_m": 0,
+    "pq_nbits": 8,
+    # Maximum number of training vectors, 0 for 256 per centroid
+    "train_size": 0,
+    # Corpora smaller than this use the flat index
+    "min_vectors": 1000,
+    "seed": 1234,
+}
+
+# Rows added to the index at a time, which bounds the copies of a memory-mapped matrix
+ADD_BATCH_SIZE = 65536
+
+
+def resolve_index_config(index_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge an index configuration with the defaults and validate it."""
+    config = dict(DEFAULT_INDEX_CONFIG)
+    config.update({key: value for key, value in (index_config or {}).items() if value is not None})
+
+    if config["index_type"] not in INDEX_TYPES:
+        raise ValueError(f"Unknown FAISS index type '{config['index_type']}', expected one of {', '.join(INDEX_TYPES)}")
+    return config
+
+
+def sample_training_vectors(vectors: np.ndarray, train_size: int, seed: int) -> np.ndarray:
+    """Get a random sample of ``train_size`` rows as a float32 matrix.
+
+    The rows are read in order, so a memory-mapped matrix is read sequentially.
+    """
+    if len(vectors) <= train_size:
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
+    rows = np.sort(np.random.default_rng(seed).choice(len(vectors), train_size, replace=False))
+    return np.ascontiguousarray(vectors[rows], dtype=np.float32)
+
+
+def _pq_subquantizers(dimension: int, requested: int) -> int:
+    if requested:
+        if dimension % requested:
+            raise ValueError(f"pq_m={requested} does not divide the embedding dimension {dimension}")
+        return requested
+
+    # The largest divisor of the dimension up to one sub-quantizer per 8 dimensions
+    return next(m for m in range(max(1, dimension // 8), 0, -1) if dimension % m == 0)
+
+
+def build_faiss_index(vectors: np.ndarray, index_config: Optional[Dict[str, Any]] = None):
+    """Build and fill a FAISS index of the given type.
+
+    Args:
+        vectors: float32 or float16 matrix with one row per document, may be memory mapped
+        index_config: Options of the ``[faiss]`` section, defaults to a flat index
+
+    Returns:
+        The FAISS index with all the vectors added
+    """
+    import faiss
+
+    config = resolve_index_config(index_config)
+    index_type = config["index_type"]
+    num_vectors, dimension = vectors.shape
+
+    if index_type != "flat" and num_vectors < config["min_vectors"]:
+        logger.info(f"Using a flat index instead of {index_type} for {num_vectors} vectors")
+        index_type = "flat"
+
+    if index_type in ("ivf_flat", "ivf_pq"):
+        nlist = config["nlist"] or int(4 * math.sqrt(num_vectors))
+        # k-means needs about 39 training points per centroid
+        nlist = max(1, min(nlist, num_vectors // 39))
+        quantizer = faiss.IndexFlatL2(dimension)
+        if index_type == "ivf_flat":
+            index = faiss.IndexIVFFlat(quantizer, dimension, nlist, faiss.METRIC_L2)
+            train_size = 256 * nlist
+        else:
+            pq_m = _pq_subquantizers(dimension, config["pq_m"])
+            index = faiss.IndexIVFPQ(quantizer, dimension, nlist, pq_m, config["pq_nbits"], faiss.METRIC_L2)
+            # The PQ codebooks have 2 ** pq_nbits centroids each
+            train_size = max(256 * nlist, 256 * 2 ** config["pq_nbits"])
+        index.nprobe = min(nlist, config["nprobe"] or max(1, nlist // 8))
+        train_size = config["train_size"] or train_size
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dimension, config["hnsw_m"], faiss.METRIC_L2)
+        index.hnsw.efConstruction = config["ef_construction"]
+        index.hnsw.efSearch = config["ef_search"]
+        train_size = 0
+    elif index_type == "sq8":
+        index = faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+        train_size = config["train_size"] or 65536
+    else:
+        index = faiss.IndexFlatL2(dimension)
+        train_size = 0
+
+    if not index.is_trained:
+        training = sample_training_vectors(vectors, train_size, config["seed"])
+        logger.info(f"Training {index_type} index on {len(training)} of {num_vectors} vectors")
+        index.train(training)
+        del training
+
+    for start in range(0, num_vectors, ADD_BATCH_SIZE):
+        index.add(np.ascontiguousarray(vectors[start : start + ADD_BATCH_SIZE], dtype=np.float32))
+
+    return index
+
+
+def describe_faiss_index(index) -> Dict[str, Any]:
+    """Get the type and search parameters of a FAISS index for ``index_config.json``."""
+    import faiss
+
+    description = {"dimension": index.d, "num_vectors": index.ntotal, "metric": "l2"}
+
+    if isinstance(index, faiss.IndexHNSW):
+        description.update(
+            index_type="hnsw",
+            hnsw_m=index.hnsw.nb_neighbors(1),
+            ef_construction=index.hnsw.efConstruction,
+            ef_search=index.hnsw.efSearch,
+        )
+    elif isinstance(index, faiss.IndexIVFPQ):
+        description.update(
+            index_type="ivf_pq", nlist=index.nlist, nprobe=index.nprobe, pq_m=index.pq.M, pq_nbits=index.pq.nbits
+        )
+    elif isinstance(index, faiss.IndexIVF):
+        description.update(index_type="ivf_flat", nlist=index.nlist, nprobe=index.nprobe)
+    elif isinstance(index, faiss.IndexScalarQuantizer):
+        description.update(index_type="sq8")
+    else:
+        description.update(index_type="flat")
+
+    return description
+
+
+def save_faiss_vectorstore(vectorstore: Any, output_path: Path) -> Dict[str, Any]:
+    """Save a LangChain FAISS vector store with its ``index_config.json``.
+
+    Returns:
+        The description of the index written to ``index_config.json``
+    """
+    output_path = Path(output_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+    vectorstore.save_local(str(output_path))
+
+    description = describe_faiss_index(vectorstore.index)
+    with open(output_path / INDEX_CONFIG_FILE, "w") as f:
+        json.dump(description, f, indent=2)
+
+    logger.info(f"Saved {description['index_type']} FAISS index with {description['num_vectors']} vectors")
+    return description
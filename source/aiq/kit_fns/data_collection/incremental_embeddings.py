@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for incremental re-embedding of pipeline documents.
+
+Every record of an embeddings file keeps the hash of the text it was embedded
+from and the id of the embedding model. On the next run only the documents
+whose text or model changed are sent to the embedder, the other embeddings
+are reused, and the records of documents that no longer exist are dropped.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from embedding_store import store_path_for, write_embedding_store
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """Get the hash used to detect changes of a document text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_existing_records(output_file: Path, section: str) -> Dict[str, Dict[str, Any]]:
+    """Load the records of a previously generated embeddings file.
+
+    Args:
+        output_file: Path to the embeddings JSON file
+        section: Name of the records section, e.g. "methods" or "extensions"
+
+    Returns:
+        Dictionary of record key to record, empty if the file is missing or unreadable
+    """
+    if not output_file.exists():
+        return {}
+
+    try:
+        with open(output_file, "r") as f:
+            data = json.load(f)
+        return data.get(section, {})
+    except Exception as e:
+        logger.warning(f"Ignoring existing embeddings file {output_file}: {e}")
+        return {}
+
+
+def plan_incremental_update(
+    documents: Dict[str, str], existing: Dict[str, Dict[str, Any]], model: str
+) -> Tuple[Dict[str, Dict[str, Any]], List[str], List[str]]:
+    """Split documents into the ones that can reuse an embedding and the ones to embed.
+
+    A record is reused when it has an embedding, was created by the same model
+    and its content hash matches the current document text.
+
+    Args:
+        documents: Dictionary of record key to the text that would be embedded
+        existing: Records loaded from the previous embeddings file
+        model: Id of the embedding model of this run
+
+    Returns:
+        Tuple of (reused records by key, keys to embed, keys of removed records)
+    """
+    reused = {}
+    pending = []
+
+    for key, text in documents.items():
+        record = existing.get(key)
+        if (
+            record
+            and record.get("embedding")
+            and record.get("model") == model
+            and record.get("content_hash") == content_hash(text)
+        ):
+            reused[key] = record
+        else:
+            pending.append(key)
+
+    removed = [key for key in existing if key not in documents]
+    return reused, pending, removed
+
+
+def save_embeddings_database(
+    output_file: Path, embeddings_database: Dict[str, Any], section: Optional[str] = None
+) -> None:
+    """Write the embeddings database.
+
+    The file is written compactly to a temporary file first and then moved
+    over the old one, so a failed run never leaves a truncated store behind.
+    When ``section`` is given, the records are also written to the binary
+    embedding store read by the FAISS builders.
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+
+    with open(tmp_file, "w") as f:
+        json.dump(embeddings_database, f, separators=(",", ":"))
+
+    os.replace(tmp_file, output_file)
+
+    if section:
+        write_embedding_store(
+            store_path_for(output_file), embeddings_database[section], embeddings_database.get("metadata", {})
+        )
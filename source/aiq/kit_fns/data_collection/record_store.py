@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact JSON record store of the pipeline.
+
+A record store is a directory with ``records.jsonl``, one compact JSON record
+per line, and ``records.index.json``, the byte offset and length of every
+record by key. The kit_fns services read a single record with one seek instead
+of loading a file per record or the whole store.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+RECORDS_FILE = "records.jsonl"
+RECORDS_INDEX_FILE = "records.index.json"
+RECORDS_FORMAT_VERSION = 1
+
+
+class RecordStoreWriter:
+    """Append records to a record store and write its index on close.
+
+    Records are written as they are added, so only the record being written
+    is in memory. A key added twice points to the last record, like a key
+    repeated in a JSON object.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index: Dict[str, list] = {}
+        self._file = open(self.directory / RECORDS_FILE, "wb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add(self, key: str, record: Any) -> int:
+        """Append a record and return its size in bytes."""
+        data = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        self.index[key] = [self._file.tell(), len(data)]
+        self._file.write(data)
+        self._file.write(b"\n")
+        return len(data)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.close()
+        with open(self.directory / RECORDS_INDEX_FILE, "w", encoding="utf-8") as f:
+            json.dump({"format_version": RECORDS_FORMAT_VERSION, "records": self.index}, f, separators=(",", ":"))
+
@@ -22,13 +22,17 @@ Creates a searchable vector database for finding relevant Kit settings.
 import json
 import logging
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from embedding_store import create_faiss_vectorstore, open_embeddings
+from faiss_index import save_faiss_vectorstore
+
 # Import embeddings creator
 try:
     from langchain_nvidia_ai_endpoints import NVIDIAEmbeddings
@@ -133,6 +137,7 @@ def build_faiss_database(
     embedding_model: str = DEFAULT_EMBEDDING_MODEL,
     api_key: str = "",
     endpoint_url: str = None,
+    index_config: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Build FAISS database from settings embeddings.
 
@@ -142,6 +147,7 @@ def build_faiss_database(
         faiss_output_path: Path to save the FAISS database
         api_key: API key for authentication
         endpoint_url: Optional custom endpoint URL
+        index_config: Options of the ``[faiss]`` section of the pipeline configuration, flat index when None
     """
     logger.info("=" * 60)
     logger.info("Building FAISS Database for Settings")
@@ -164,8 +170,8 @@ def build_faiss_database(
         logger.error("Please run generate_settings_embeddings.py first")
         raise FileNotFoundError(f"Embeddings file not found: {embeddings_file}")
 
-    with open(embeddings_file, "r") as f:
-        embeddings_data = json.load(f)
+    # Memory mapped store of the embeddings, converted from the JSON file when needed
+    store = open_embeddings(embeddings_file, "settings")
 
     # Load settings for metadata
     if not settings_file.exists():
@@ -181,28 +187,17 @@ def build_faiss_database(
     else:
         settings = settings_data
 
-    logger.info(f"Loaded {len(embeddings_data.get('settings', {}))} embeddings")
+    logger.info(f"Loaded {len(store)} embeddings")
     logger.info(f"Loaded {len(settings)} settings metadata")
 
     # Prepare documents and embeddings for FAISS
     documents = []
-    embedding_vectors = []
-    skipped = 0
-
-    # Get embeddings from the embeddings data
-    settings_embeddings = embeddings_data.get("settings", {})
+    rows = []
+    # Records without an embedding are not in the store
+    skipped = store.metadata.get("skipped_records", 0)
 
-    for setting_key, embedding_data in settings_embeddings.items():
+    for row, setting_key, embedding_data in store.records():
         try:
-            # Get the embedding vector
-            embedding_vector = embedding_data.get("embedding", [])
-
-            # Skip entries without valid embeddings
-            if not embedding_vector or len(embedding_vector) == 0:
-                logger.warning(f"Setting {setting_key} has no embedding vector, skipping")
-                skipped += 1
-                continue
-
             # Get the full setting data for metadata
             setting_info = settings.get(setting_key, {})
 
@@ -250,7 +245,7 @@ def build_faiss_database(
             doc = Document(page_content=page_content, metadata=metadata)
 
             documents.append(doc)
-            embedding_vectors.append(embedding_vector)
+            rows.append(row)
 
         except Exception as e:
             logger.error(f"Failed to process setting {setting_key}: {e}")
@@ -268,16 +263,11 @@ def build_faiss_database(
         logger.info("Creating FAISS index...")
 
         # Create FAISS index from documents and embeddings
-        vectorstore = FAISS.from_embeddings(
-            text_embeddings=[(doc.page_content, emb) for doc, emb in zip(documents, embedding_vectors)],
-            embedding=embedder,
-            metadatas=[doc.metadata for doc in documents],
-        )
+        vectorstore = create_faiss_vectorstore(store.vectors(rows), documents, embedder, index_config)
 
         # Save the FAISS database
         logger.info(f"Saving FAISS database to: {faiss_output_path}")
-        faiss_output_path.mkdir(parents=True, exist_ok=True)
-        vectorstore.save_local(str(faiss_output_path))
+        index_description = save_faiss_vectorstore(vectorstore, faiss_output_path)
 
         logger.info(f"Successfully saved FAISS database to {faiss_output_path}")
         logger.info(f"Database contains {len(documents)} setting entries")
@@ -288,7 +278,8 @@ def build_faiss_database(
             "total_settings": len(documents),
             "skipped_settings": skipped,
             "embedding_model": DEFAULT_EMBEDDING_MODEL,
-            "embedding_dimension": len(embedding_vectors[0]) if embedding_vectors else 0,
+            "embedding_dimension": store.dimension or 0,
+            "index": index_description,
             "created_at": datetime.now().isoformat(),
             "source_files": {"embeddings": str(embeddings_file), "settings": str(settings_file)},
             "statistics": {"settings_by_prefix": {}, "settings_with_documentation": 0, "average_usage_count": 0},
@@ -28,6 +28,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from batch_embedder import BatchEmbeddingExecutor
+
 # Import LangChain NVIDIA embeddings
 try:
     from langchain_nvidia_ai_endpoints import NVIDIAEmbeddings
@@ -140,6 +143,9 @@ def generate_embeddings_for_settings(
     api_key: str = "",
     endpoint_url: Optional[str] = None,
     batch_size: int = 10,
+    max_in_flight: int = 4,
+    requests_per_second: Optional[float] = None,
+    max_batch_tokens: Optional[int] = None,
 ) -> None:
     """Generate embeddings for all settings.
 
@@ -149,6 +155,9 @@ def generate_embeddings_for_settings(
         api_key: NVIDIA API key
         endpoint_url: Optional custom endpoint URL
         batch_size: Number of settings to process in batch
+        max_in_flight: Number of batches sent to the embedder at the same time
+        requests_per_second: Request rate limit of the embedding endpoint
+        max_batch_tokens: Maximum number of tokens in a batch
     """
     # Load settings
     if not settings_file.exists():
@@ -190,72 +199,42 @@ def generate_embeddings_for_settings(
     processed = 0
     failed = 0
 
-    # Convert to list for batch processing
-    settings_list = list(settings.items())
-
-    for i in range(0, len(settings_list), batch_size):
-        batch = settings_list[i : i + batch_size]
-        batch_texts = []
-        batch_keys = []
-
-        # Prepare batch
-        for setting_key, setting_data in batch:
-            # Create document text for embedding
-            document = create_setting_document(setting_key, setting_data)
-            batch_texts.append(document)
-            batch_keys.append(setting_key)
-
-        if not batch_texts:
-            continue
-
-        try:
-            # Generate embeddings for batch
-            batch_num = i // batch_size + 1
-            total_batches = (len(settings_list) + batch_size - 1) // batch_size
-            logger.info(f"Processing batch {batch_num}/{total_batches}: {len(batch_texts)} settings")
-
-            if len(batch_texts) == 1:
-                # Single item - use embed_query
-                embeddings = [embedder.embed_query(batch_texts[0])]
-            else:
-                # Multiple items - use embed_documents
-                embeddings = embedder.embed_documents(batch_texts)
-
-            # Store embeddings with metadata
-            for setting_key, embedding, (_, setting_data) in zip(batch_keys, embeddings, batch):
-                embeddings_database["settings"][setting_key] = {
-                    "embedding": embedding,
-                    "type": setting_data.get("type", "unknown"),
-                    "default_value": setting_data.get("default_value"),
-                    "extensions_count": len(setting_data.get("extensions", [])),
-                    "usage_count": setting_data.get("usage_count", len(setting_data.get("found_in", []))),
-                    "has_documentation": bool(setting_data.get("documentation") or setting_data.get("description")),
-                }
-                processed += 1
-
-                # Set embedding dimension from first successful embedding
-                if embeddings_database["metadata"]["embedding_dimension"] is None:
-                    embeddings_database["metadata"]["embedding_dimension"] = len(embedding)
-                    logger.info(f"Embedding dimension: {len(embedding)}")
-
-            # Log progress
-            progress = (i + len(batch)) / len(settings_list) * 100
-            logger.info(f"Progress: {processed}/{len(settings)} settings ({progress:.1f}%)")
-
-        except Exception as e:
-            logger.error(f"Failed to process batch starting at {i}: {e}")
-            # Add empty embeddings for failed batch
-            for setting_key in batch_keys:
-                embeddings_database["settings"][setting_key] = {
-                    "embedding": [],
-                    "type": settings.get(setting_key, {}).get("type", "unknown"),
-                    "default_value": settings.get(setting_key, {}).get("default_value"),
-                    "extensions_count": len(settings.get(setting_key, {}).get("extensions", [])),
-                    "usage_count": settings.get(setting_key, {}).get("usage_count", 0),
-                    "has_documentation": bool(settings.get(setting_key, {}).get("documentation")),
-                    "error": str(e),
-                }
-                failed += 1
+    # Embed the settings with several batches in flight
+    documents = {
+        setting_key: create_setting_document(setting_key, setting_data) for setting_key, setting_data in settings.items()
+    }
+    executor = BatchEmbeddingExecutor(
+        embedder,
+        batch_size=batch_size,
+        max_in_flight=max_in_flight,
+        max_batch_tokens=max_batch_tokens,
+        requests_per_second=requests_per_second,
+    )
+    embeddings = executor.embed(documents)
+    logger.info(f"Embedding requests: {executor.stats['requests']} ({executor.stats['retries']} retries)")
+
+    for setting_key, setting_data in settings.items():
+        record = {
+            "embedding": embeddings.get(setting_key, []),
+            "type": setting_data.get("type", "unknown"),
+            "default_value": setting_data.get("default_value"),
+            "extensions_count": len(setting_data.get("extensions", [])),
+            "usage_count": setting_data.get("usage_count", len(setting_data.get("found_in", []))),
+            "has_documentation": bool(setting_data.get("documentation") or setting_data.get("description")),
+        }
+
+        if setting_key in embeddings:
+            processed += 1
+
+            # Set embedding dimension from first successful embedding
+            if embeddings_database["metadata"]["embedding_dimension"] is None:
+                embeddings_database["metadata"]["embedding_dimension"] = len(record["embedding"])
+                logger.info(f"Embedding dimension: {len(record['embedding'])}")
+        else:
+            record["error"] = executor.failed.get(setting_key, "not embedded")
+            failed += 1
+
+        embeddings_database["settings"][setting_key] = record
 
     # Add timestamp
     embeddings_database["metadata"]["generated_at"] = datetime.now().isoformat()
@@ -21,12 +21,18 @@ Extracts settings from extension.toml files and source code, converting to canon
 
 import argparse
 import ast
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import re
+from bisect import bisect_right
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import toml
 
@@ -34,13 +40,77 @@ import toml
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Bump when the extraction changes so cached file results are not reused
+SCANNER_VERSION = 1
+
+PARTIAL_PATHS = ["/exts", "/app", "/persistent", "/ext"]
+
+CPP_FILE_PATTERNS = ["*.cpp", "*.cc", "*.cxx", "*.h", "*.hpp"]
+
+# Patterns for carb.settings usage in Python
+PYTHON_PATTERNS = [
+    # settings.get("/path/to/setting")
+    (re.compile(r'settings\.get(?:_as_\w+)?\s*\(\s*["\']([^"\']+)["\']'), "get"),
+    # settings.set("/path/to/setting", value)
+    (re.compile(r'settings\.set\s*\(\s*["\']([^"\']+)["\'](?:\s*,\s*([^,\)]+))?'), "set"),
+    # Direct string literals that look like settings paths
+    (re.compile(r'["\']/(exts?|app|persistent|ext)/([^"\']+)["\']'), "literal"),
+]
+
+# Patterns for C++ Carbonite settings
+CPP_PATTERNS = [
+    # settings->get<Type>("/path/to/setting")
+    (re.compile(r'settings->get(?:Bool|Int|Float|String)?\s*(?:<[^>]+>)?\s*\(\s*"([^"]+)"'), "get"),
+    # settings->set("/path/to/setting", value)
+    (re.compile(r'settings->set(?:Bool|Int|Float|String)?\s*\(\s*"([^"]+)"'), "set"),
+    # String literals that look like settings paths
+    (re.compile(r'"/(exts?|app|persistent|ext)/([^"]+)"'), "literal"),
+]
+
+# Every setting found by the patterns above comes from a get or set call: the literal patterns only capture the
+# first path component, which is a skipped partial path. Files and lines without a call are not matched.
+SETTINGS_PREFILTER = re.compile(r"settings(?:\.|->)(?:get|set)")
+_SETTINGS_PREFILTER_BYTES = re.compile(SETTINGS_PREFILTER.pattern.encode("ascii"))
+
+
+def _scan_extension_files(extensions_dir: str, extension_dir: str, cache_dir: Optional[str], prefilter: bool):
+    """Extract the settings of the files of an extension. Runs in the worker processes."""
+    scanner = ExtensionSettingsScanner(extensions_dir, max_workers=1, cache_dir=cache_dir, prefilter=prefilter)
+    return scanner.extract_extension(Path(extension_dir)), scanner.stats
+
 
 class ExtensionSettingsScanner:
-    """Scanner for extracting settings from Omniverse Kit extensions."""
+    """Scanner for extracting settings from Omniverse Kit extensions.
+
+    The files of every extension are read in a process pool, and the settings
+    found in them are merged in the order of the sorted extension and file
+    paths, so the output is the same as a serial scan. Files and lines that
+    contain no settings path or settings call are skipped before the regular
+    expressions run. With a cache directory, the settings extracted from every
+    file are stored under its content hash and reused for unchanged files, also
+    by the scans of other Kit versions.
+    """
+
+    def __init__(
+        self,
+        extensions_dir: str,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        prefilter: bool = True,
+    ):
+        """Initialize the scanner with extensions directory path.
 
-    def __init__(self, extensions_dir: str):
-        """Initialize the scanner with extensions directory path."""
+        Args:
+            extensions_dir: Path to the extensions directory (extscache)
+            max_workers: Number of processes reading the extensions (default: number of CPUs)
+            cache_dir: Directory of the per-file result cache, None to disable it
+            prefilter: Skip the files and lines that cannot contain settings
+        """
         self.extensions_dir = Path(extensions_dir)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.prefilter = prefilter
+        self.stats = {"extracted": 0, "cached": 0, "skipped": 0}
         self.settings_data = defaultdict(
             lambda: {
                 "default_value": None,
@@ -162,44 +232,43 @@ class ExtensionSettingsScanner:
         else:
             return str(value), "unknown"
 
+    @staticmethod
+    def clean_extension_name(extension_name: str) -> str:
+        """Extract the clean extension name (without version).
+
+        e.g., "omni.kit.viewport.menubar.timeline-1.0.2" -> "omni.kit.viewport.menubar.timeline"
+        """
+        clean_ext_name = extension_name.split("-")[0] if "-" in extension_name else extension_name
+        return clean_ext_name.split("+")[0] if "+" in clean_ext_name else clean_ext_name
+
     def scan_extension_toml(self, toml_path: Path, extension_name: str):
         """Scan extension.toml file for settings."""
-        try:
-            with open(toml_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.splitlines()
+        self._scan_file(toml_path, "toml", extension_name)
 
-            # Parse TOML
-            data = toml.loads(content)
+    def extract_toml_settings(self, content: str, extension_name: str, records: List[Dict[str, Any]]):
+        """Extract the settings of a TOML file into records."""
+        lines = content.splitlines()
 
-            # Extract the clean extension name (without version)
-            # e.g., "omni.kit.viewport.menubar.timeline-1.0.2" -> "omni.kit.viewport.menubar.timeline"
-            clean_ext_name = extension_name.split("-")[0] if "-" in extension_name else extension_name
-            clean_ext_name = clean_ext_name.split("+")[0] if "+" in clean_ext_name else clean_ext_name
+        # Parse TOML
+        data = toml.loads(content)
 
-            # Extract settings from [settings] section
-            if "settings" in data:
-                self._process_settings_dict(data["settings"], toml_path, lines, extension_name, "", clean_ext_name)
+        clean_ext_name = self.clean_extension_name(extension_name)
 
-            # Also check for inline settings in dependencies
-            if "dependencies" in data:
-                for dep_name, dep_config in data.get("dependencies", {}).items():
-                    if isinstance(dep_config, dict) and "settings" in dep_config:
-                        self._process_settings_dict(
-                            dep_config["settings"], toml_path, lines, extension_name, "", clean_ext_name
-                        )
+        # Extract settings from [settings] section
+        if "settings" in data:
+            self._process_settings_dict(data["settings"], lines, records, "", clean_ext_name)
 
-            logger.debug(f"Scanned TOML: {toml_path}")
-
-        except Exception as e:
-            logger.warning(f"Error scanning TOML {toml_path}: {e}")
+        # Also check for inline settings in dependencies
+        if "dependencies" in data:
+            for dep_name, dep_config in data.get("dependencies", {}).items():
+                if isinstance(dep_config, dict) and "settings" in dep_config:
+                    self._process_settings_dict(dep_config["settings"], lines, records, "", clean_ext_name)
 
     def _process_settings_dict(
         self,
         settings: Dict,
-        file_path: Path,
         lines: List[str],
-        extension_name: str,
+        records: List[Dict[str, Any]],
         prefix: str = "",
         clean_ext_name: str = None,
     ):
@@ -231,9 +300,7 @@ class ExtensionSettingsScanner:
                         # Parse value and type
                         parsed_value, value_type = self.parse_toml_value(setting_value)
 
-                        self._store_setting(
-                            canonical_key, parsed_value, value_type, file_path, lines, line_num, extension_name, doc
-                        )
+                        self._add_toml_setting(records, canonical_key, parsed_value, value_type, lines, line_num, doc)
                 else:
                     # Check if this is actually a nested settings structure or just a dict value
                     has_nested_dicts = any(isinstance(v, dict) for k, v in value.items() if not k.startswith("_"))
@@ -241,7 +308,7 @@ class ExtensionSettingsScanner:
                     # Don't create entries for intermediate paths
                     if has_nested_dicts:
                         # Nested settings - recurse
-                        self._process_settings_dict(value, file_path, lines, extension_name, new_prefix, clean_ext_name)
+                        self._process_settings_dict(value, lines, records, new_prefix, clean_ext_name)
                     else:
                         # This dict might be a value or leaf settings
                         for sub_key, sub_value in value.items():
@@ -260,8 +327,8 @@ class ExtensionSettingsScanner:
                                 doc = self.extract_toml_comment(lines, line_num - 1)
 
                             parsed_value, value_type = self.parse_toml_value(sub_value)
-                            self._store_setting(
-                                canonical_key, parsed_value, value_type, file_path, lines, line_num, extension_name, doc
+                            self._add_toml_setting(
+                                records, canonical_key, parsed_value, value_type, lines, line_num, doc
                             )
             else:
                 # Actual setting (leaf node)
@@ -283,9 +350,7 @@ class ExtensionSettingsScanner:
                 # Parse value and type
                 parsed_value, value_type = self.parse_toml_value(value)
 
-                self._store_setting(
-                    canonical_key, parsed_value, value_type, file_path, lines, line_num, extension_name, doc
-                )
+                self._add_toml_setting(records, canonical_key, parsed_value, value_type, lines, line_num, doc)
 
     def convert_dot_to_slash_with_context(self, setting_path: str, clean_ext_name: str = None) -> str:
         """Convert dot notation to canonical slash notation with context awareness.
@@ -317,160 +382,179 @@ class ExtensionSettingsScanner:
         # Fall back to the original conversion method
         return self.convert_dot_to_slash(setting_path)
 
-    def _store_setting(
+    def _add_toml_setting(
         self,
+        records: List[Dict[str, Any]],
         canonical_key: str,
         parsed_value: Any,
         value_type: str,
-        file_path: Path,
-        lines: Any,
+        lines: List[str],
         line_num: Optional[int],
-        extension_name: str,
         doc: Optional[str],
     ):
-        """Store a setting in the settings data."""
+        """Add a setting found in a TOML file to the records of the file."""
+        record = {"key": canonical_key, "value": parsed_value, "type": value_type, "line": line_num, "doc": doc}
+        # Partial paths are skipped with a warning when the records are stored
+        if canonical_key in PARTIAL_PATHS and line_num and line_num > 0 and line_num <= len(lines):
+            record["line_content"] = lines[line_num - 1].strip()
+        records.append(record)
+
+    def _store_setting(self, record: Dict[str, Any], file_path: Path, extension_name: str):
+        """Store a setting record of a file in the settings data."""
+        canonical_key = record["key"]
+        line_num = record["line"]
+
+        # Simplified found_in format: "file@line"
+        file_ref = str(file_path.relative_to(self.extensions_dir))
+        if line_num:
+            file_ref = f"{file_ref}@{line_num}"
+
         # Skip partial paths and warn about them
-        partial_paths = ["/exts", "/app", "/persistent", "/ext"]
-        if canonical_key in partial_paths:
-            file_ref = str(file_path.relative_to(self.extensions_dir))
-            if line_num:
-                file_ref = f"{file_ref}@{line_num}"
+        if canonical_key in PARTIAL_PATHS:
             logger.warning(f"Skipping partial path '{canonical_key}' found in {file_ref}")
-            logger.warning(f"  Context: extension={extension_name}, value={parsed_value}, type={value_type}")
-            # Only try to show line content if lines is a list
-            if isinstance(lines, list) and line_num and line_num > 0 and line_num <= len(lines):
-                logger.warning(f"  Line content: {lines[line_num-1].strip()}")
+            logger.warning(f"  Context: extension={extension_name}, value={record['value']}, type={record['type']}")
+            if record.get("line_content"):
+                logger.warning(f"  Line content: {record['line_content']}")
             return
 
         # Update settings data
         setting_info = self.settings_data[canonical_key]
-        if setting_info["default_value"] is None:
-            setting_info["default_value"] = parsed_value
-            setting_info["type"] = value_type
+        if record["value"] is not None and setting_info["default_value"] is None:
+            setting_info["default_value"] = record["value"]
+            setting_info["type"] = record["type"]
 
-        if doc and not setting_info["documentation"]:
-            setting_info["documentation"] = doc
-
-        # Simplified found_in format: "file@line"
-        file_ref = str(file_path.relative_to(self.extensions_dir))
-        if line_num:
-            file_ref = f"{file_ref}@{line_num}"
+        if record["doc"] and not setting_info["documentation"]:
+            setting_info["documentation"] = record["doc"]
 
         setting_info["found_in"].append(file_ref)
         setting_info["extensions"].add(extension_name)
 
     def scan_python_file(self, py_path: Path, extension_name: str):
         """Scan Python file for settings usage."""
-        try:
-            with open(py_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.splitlines()
-
-            # Pattern for carb.settings usage
-            patterns = [
-                # settings.get("/path/to/setting")
-                (r'settings\.get(?:_as_\w+)?\s*\(\s*["\']([^"\']+)["\']', "get"),
-                # settings.set("/path/to/setting", value)
-                (r'settings\.set\s*\(\s*["\']([^"\']+)["\'](?:\s*,\s*([^,\)]+))?', "set"),
-                # Direct string literals that look like settings paths
-                (r'["\']/(exts?|app|persistent|ext)/([^"\']+)["\']', "literal"),
-            ]
-
-            for line_num, line in enumerate(lines, 1):
-                for pattern, context_type in patterns:
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        setting_path = match.group(1)
-
-                        # Ensure it starts with /
-                        if not setting_path.startswith("/"):
-                            setting_path = "/" + setting_path
-
-                        # It's already in slash format from code
-                        canonical_key = setting_path
-
-                        # Try to extract default value if it's a set operation
-                        default_value = None
-                        value_type = None
-                        if context_type == "set" and len(match.groups()) > 1:
-                            value_str = match.group(2)
-                            if value_str:
-                                default_value, value_type = self._parse_python_value(value_str.strip())
-
-                        # Skip partial paths
-                        if canonical_key in ["/exts", "/app", "/persistent", "/ext"]:
-                            logger.debug(
-                                f"Skipping partial path '{canonical_key}' in Python file {py_path.name}@{line_num}"
-                            )
-                            continue
-
-                        # Update settings data
-                        setting_info = self.settings_data[canonical_key]
-
-                        if default_value is not None and setting_info["default_value"] is None:
-                            setting_info["default_value"] = default_value
-                            setting_info["type"] = value_type
-
-                        # Simplified found_in format: "file@line"
-                        file_ref = f"{str(py_path.relative_to(self.extensions_dir))}@{line_num}"
-                        setting_info["found_in"].append(file_ref)
-
-                        setting_info["extensions"].add(extension_name)
-
-            logger.debug(f"Scanned Python: {py_path}")
-
-        except Exception as e:
-            logger.warning(f"Error scanning Python file {py_path}: {e}")
+        self._scan_file(py_path, "python", extension_name)
 
     def scan_cpp_file(self, cpp_path: Path, extension_name: str):
         """Scan C++ file for settings usage."""
-        try:
-            with open(cpp_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.splitlines()
-
-            # Patterns for C++ Carbonite settings
-            patterns = [
-                # settings->get<Type>("/path/to/setting")
-                (r'settings->get(?:Bool|Int|Float|String)?\s*(?:<[^>]+>)?\s*\(\s*"([^"]+)"', "get"),
-                # settings->set("/path/to/setting", value)
-                (r'settings->set(?:Bool|Int|Float|String)?\s*\(\s*"([^"]+)"', "set"),
-                # String literals that look like settings paths
-                (r'"/(exts?|app|persistent|ext)/([^"]+)"', "literal"),
-            ]
-
-            for line_num, line in enumerate(lines, 1):
-                for pattern, context_type in patterns:
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        setting_path = match.group(1)
-
-                        # Ensure it starts with /
-                        if not setting_path.startswith("/"):
-                            setting_path = "/" + setting_path
-
-                        canonical_key = setting_path
-
-                        # Skip partial paths
-                        if canonical_key in ["/exts", "/app", "/persistent", "/ext"]:
-                            logger.debug(
-                                f"Skipping partial path '{canonical_key}' in C++ file {cpp_path.name}@{line_num}"
-                            )
-                            continue
+        self._scan_file(cpp_path, "cpp", extension_name)
+
+    def _candidate_lines(self, content: str) -> Iterable[Tuple[int, str]]:
+        """Numbered lines of a source file that can contain settings, all of them without the prefilter."""
+        lines = content.splitlines()
+        if not self.prefilter:
+            return enumerate(lines, 1)
+
+        # Offset of the end of every line, to find the lines of the prefilter matches
+        line_ends = list(accumulate(map(len, content.splitlines(keepends=True))))
+        indices = sorted({bisect_right(line_ends, match.start()) for match in SETTINGS_PREFILTER.finditer(content)})
+        return [(i + 1, lines[i]) for i in indices]
+
+    def extract_code_settings(self, content: str, kind: str, records: List[Dict[str, Any]]):
+        """Extract the settings used in a Python or C++ file into records."""
+        patterns = PYTHON_PATTERNS if kind == "python" else CPP_PATTERNS
+
+        for line_num, line in self._candidate_lines(content):
+            for pattern, context_type in patterns:
+                for match in pattern.finditer(line):
+                    setting_path = match.group(1)
+
+                    # Ensure it starts with /
+                    if not setting_path.startswith("/"):
+                        setting_path = "/" + setting_path
+
+                    # It's already in slash format from code
+                    canonical_key = setting_path
+
+                    # Try to extract default value if it's a set operation (only Python values are parsed)
+                    default_value = None
+                    value_type = None
+                    if kind == "python" and context_type == "set" and len(match.groups()) > 1:
+                        value_str = match.group(2)
+                        if value_str:
+                            default_value, value_type = self._parse_python_value(value_str.strip())
+
+                    # Skip partial paths
+                    if canonical_key in PARTIAL_PATHS:
+                        logger.debug(f"Skipping partial path '{canonical_key}' in {kind} file @{line_num}")
+                        continue
+
+                    records.append(
+                        {
+                            "key": canonical_key,
+                            "value": default_value,
+                            "type": value_type,
+                            "line": line_num,
+                            "doc": None,
+                        }
+                    )
+
+    def _cache_file(self, kind: str, extension_name: str, content_hash: str) -> Path:
+        # The settings of TOML files depend on the extension name, those of source files only on the content
+        context = self.clean_extension_name(extension_name) if kind == "toml" else ""
+        key = hashlib.sha256(f"{SCANNER_VERSION}\0{kind}\0{context}\0{content_hash}".encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def extract_file_settings(self, file_path: Path, kind: str, extension_name: str) -> List[Dict[str, Any]]:
+        """Extract the settings of a file into records, from the cache if the file content was seen before.
 
-                        # Update settings data
-                        setting_info = self.settings_data[canonical_key]
+        Args:
+            file_path: Path of the file
+            kind: "toml", "python" or "cpp"
+            extension_name: Name of the extension directory
 
-                        # Simplified found_in format: "file@line"
-                        file_ref = f"{str(cpp_path.relative_to(self.extensions_dir))}@{line_num}"
-                        setting_info["found_in"].append(file_ref)
+        Returns:
+            Records with the canonical key, default value, type, line number and documentation of every
+            setting found, in the order of the file
+        """
+        records = []
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+
+            if self.prefilter:
+                if kind == "toml" and b"settings" not in raw:
+                    self.stats["skipped"] += 1
+                    return records
+                if kind != "toml" and not _SETTINGS_PREFILTER_BYTES.search(raw):
+                    self.stats["skipped"] += 1
+                    return records
+
+            cache_file = None
+            if self.cache_dir is not None:
+                cache_file = self._cache_file(kind, extension_name, hashlib.sha256(raw).hexdigest())
+                try:
+                    with open(cache_file, "r", encoding="utf-8") as f:
+                        records = json.load(f)
+                    self.stats["cached"] += 1
+                    return records
+                except (OSError, ValueError):
+                    pass
+
+            # Decode like text mode with universal newlines
+            content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            if kind == "toml":
+                self.extract_toml_settings(content, extension_name, records)
+            else:
+                self.extract_code_settings(content, kind, records)
+            self.stats["extracted"] += 1
 
-                        setting_info["extensions"].add(extension_name)
+            if cache_file is not None:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(records, f, separators=(",", ":"))
+                os.replace(tmp_file, cache_file)
 
-            logger.debug(f"Scanned C++: {cpp_path}")
+            logger.debug(f"Scanned {kind}: {file_path}")
 
         except Exception as e:
-            logger.warning(f"Error scanning C++ file {cpp_path}: {e}")
+            file_type = {"toml": "TOML", "python": "Python file", "cpp": "C++ file"}[kind]
+            logger.warning(f"Error scanning {file_type} {file_path}: {e}")
+
+        return records
+
+    def _scan_file(self, file_path: Path, kind: str, extension_name: str):
+        for record in self.extract_file_settings(file_path, kind, extension_name):
+            self._store_setting(record, file_path, extension_name)
 
     def _parse_python_value(self, value_str: str) -> Tuple[Any, str]:
         """Parse a Python value string to extract value and type."""
@@ -504,32 +588,65 @@ class ExtensionSettingsScanner:
 
         return value_str, "unknown"
 
-    def scan_extension(self, extension_path: Path):
-        """Scan a single extension directory."""
-        extension_name = extension_path.name
-        logger.info(f"Scanning extension: {extension_name}")
+    def extension_files(self, extension_path: Path) -> List[Tuple[Path, str]]:
+        """Files of an extension to scan with their kind, in the order their settings are merged."""
+        files = []
 
-        # Scan extension.toml
+        # extension.toml
         toml_path = extension_path / "extension.toml"
         if toml_path.exists():
-            self.scan_extension_toml(toml_path, extension_name)
+            files.append((toml_path, "toml"))
 
-        # Scan config directory for additional TOML files
+        # Config directory for additional TOML files
         config_dir = extension_path / "config"
         if config_dir.exists():
-            for toml_file in config_dir.glob("*.toml"):
-                self.scan_extension_toml(toml_file, extension_name)
+            files.extend((toml_file, "toml") for toml_file in sorted(config_dir.glob("*.toml")))
 
-        # Scan Python files
-        for py_file in extension_path.rglob("*.py"):
-            # Skip test files and __pycache__
+        # Python files, skipping test files and __pycache__
+        for py_file in sorted(extension_path.rglob("*.py")):
             if "__pycache__" not in str(py_file) and "test" not in py_file.name.lower():
-                self.scan_python_file(py_file, extension_name)
+                files.append((py_file, "python"))
 
-        # Scan C++ files
-        for cpp_ext in ["*.cpp", "*.cc", "*.cxx", "*.h", "*.hpp"]:
-            for cpp_file in extension_path.rglob(cpp_ext):
-                self.scan_cpp_file(cpp_file, extension_name)
+        # C++ files
+        for cpp_ext in CPP_FILE_PATTERNS:
+            files.extend((cpp_file, "cpp") for cpp_file in sorted(extension_path.rglob(cpp_ext)))
+
+        return files
+
+    def extract_extension(self, extension_path: Path) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Extract the settings of the files of an extension.
+
+        Returns:
+            The path of every file with settings relative to the extension, and its records
+        """
+        results = []
+        for file_path, kind in self.extension_files(extension_path):
+            records = self.extract_file_settings(file_path, kind, extension_path.name)
+            if records:
+                results.append((str(file_path.relative_to(extension_path)), records))
+        return results
+
+    def merge_extension(self, extension_path: Path, results: List[Tuple[str, List[Dict[str, Any]]]]):
+        """Store the settings extracted from the files of an extension."""
+        for relative_path, records in results:
+            for record in records:
+                self._store_setting(record, extension_path / relative_path, extension_path.name)
+
+    def scan_extension(self, extension_path: Path):
+        """Scan a single extension directory."""
+        logger.info(f"Scanning extension: {extension_path.name}")
+        self.merge_extension(extension_path, self.extract_extension(extension_path))
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # Forking a process that runs threads, like the data collection pipeline, can deadlock
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            if __name__ != "__main__":
+                # Import the scanner once in the server instead of in every worker
+                context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
 
     def scan_all_extensions(self):
         """Scan all extensions in the directory."""
@@ -537,18 +654,44 @@ class ExtensionSettingsScanner:
             logger.error(f"Extensions directory does not exist: {self.extensions_dir}")
             return
 
-        # Get all extension directories
-        extension_dirs = [d for d in self.extensions_dir.iterdir() if d.is_dir()]
+        # Get all extension directories, sorted so the merged settings do not depend on the file system order
+        extension_dirs = sorted(d for d in self.extensions_dir.iterdir() if d.is_dir())
         total = len(extension_dirs)
 
         logger.info(f"Found {total} extensions to scan")
 
-        for i, ext_dir in enumerate(extension_dirs, 1):
-            logger.info(f"Progress: {i}/{total} - Scanning {ext_dir.name}")
-            try:
-                self.scan_extension(ext_dir)
-            except Exception as e:
-                logger.error(f"Error scanning extension {ext_dir.name}: {e}")
+        if self.max_workers <= 1 or total <= 1:
+            for i, ext_dir in enumerate(extension_dirs, 1):
+                logger.info(f"Progress: {i}/{total} - Scanning {ext_dir.name}")
+                try:
+                    self.scan_extension(ext_dir)
+                except Exception as e:
+                    logger.error(f"Error scanning extension {ext_dir.name}: {e}")
+        else:
+            logger.info(f"Scanning with {self.max_workers} workers")
+            cache_dir = str(self.cache_dir) if self.cache_dir else None
+            with self._create_executor() as executor:
+                futures = [
+                    executor.submit(
+                        _scan_extension_files, str(self.extensions_dir), str(ext_dir), cache_dir, self.prefilter
+                    )
+                    for ext_dir in extension_dirs
+                ]
+                # Merge in the order of the extensions, not of completion
+                for i, (ext_dir, future) in enumerate(zip(extension_dirs, futures), 1):
+                    logger.info(f"Progress: {i}/{total} - Merging {ext_dir.name}")
+                    try:
+                        results, stats = future.result()
+                        self.merge_extension(ext_dir, results)
+                        for key, value in stats.items():
+                            self.stats[key] += value
+                    except Exception as e:
+                        logger.error(f"Error scanning extension {ext_dir.name}: {e}")
+
+        logger.info(
+            f"Files extracted: {self.stats['extracted']}, from cache: {self.stats['cached']}, "
+            f"skipped by the prefilter: {self.stats['skipped']}"
+        )
 
     def prepare_output(self) -> Dict[str, Any]:
         """Prepare the final output dictionary."""
@@ -678,6 +821,26 @@ def main():
         help="Path to the extensions directory (extscache)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of processes reading the extensions, the number of CPUs if not set",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory of the per-file result cache, reused between runs and Kit versions",
+    )
+
+    parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Run the regular expressions on every line of every source file",
+    )
+
     args = parser.parse_args()
 
     # Output directory (next to this script)
@@ -685,7 +848,9 @@ def main():
     output_dir = script_dir / "setting_data"
 
     # Create scanner and run
-    scanner = ExtensionSettingsScanner(args.extensions_dir)
+    scanner = ExtensionSettingsScanner(
+        args.extensions_dir, max_workers=args.workers, cache_dir=args.cache_dir, prefilter=not args.no_prefilter
+    )
 
     logger.info(f"Starting scan of extensions in: {args.extensions_dir}")
     scanner.scan_all_extensions()
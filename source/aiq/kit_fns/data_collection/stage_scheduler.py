@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Dependency-aware scheduler for the data collection pipeline stages.
+
+Every stage declares the artifacts it reads (``inputs``) and the artifacts it
+writes (``outputs``). A stage depends on the stages that produce its inputs,
+which turns the list of stages into a DAG. Stages whose dependencies are done
+run concurrently on a thread pool limited by ``max_workers``.
+
+Inputs that no scheduled stage produces are treated as already available, so
+running a subset of the stages (``--start``/``--end`` or ``--resume``) works
+the same way it did with the sequential runner.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def build_dependencies(stages: Sequence) -> Dict[str, List[str]]:
+    """Map each stage name to the names of the stages producing its inputs.
+
+    Args:
+        stages: Stages with ``name``, ``inputs`` and ``outputs`` attributes
+
+    Returns:
+        Dictionary of stage name to the list of stage names it depends on
+
+    Raises:
+        ValueError: If two stages produce the same artifact or the stages form a cycle
+    """
+    producers: Dict[str, str] = {}
+    for stage in stages:
+        for artifact in stage.outputs:
+            if artifact in producers:
+                raise ValueError(
+                    f"Artifact '{artifact}' is produced by both '{producers[artifact]}' and '{stage.name}'"
+                )
+            producers[artifact] = stage.name
+
+    dependencies = {}
+    for stage in stages:
+        deps = []
+        for artifact in stage.inputs:
+            producer = producers.get(artifact)
+            if producer and producer != stage.name and producer not in deps:
+                deps.append(producer)
+        dependencies[stage.name] = deps
+
+    topological_order(dependencies)
+    return dependencies
+
+
+def topological_order(dependencies: Dict[str, List[str]]) -> List[str]:
+    """Order the stage names so that every stage comes after its dependencies.
+
+    Stages keep their declaration order when they don't depend on each other.
+
+    Raises:
+        ValueError: If the dependencies form a cycle
+    """
+    order = []
+    done = set()
+    remaining = list(dependencies)
+
+    while remaining:
+        ready = [name for name in remaining if all(dep in done for dep in dependencies[name])]
+        if not ready:
+            raise ValueError(f"Stage dependencies form a cycle: {remaining}")
+
+        for name in ready:
+            order.append(name)
+            done.add(name)
+        remaining = [name for name in remaining if name not in done]
+
+    return order
+
+
+class StageScheduler:
+    """Run pipeline stages concurrently in dependency order.
+
+    A failed stage stops the scheduling of new stages. The stages that are
+    already running are allowed to finish so their results can be recorded in
+    the checkpoint.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence,
+        max_workers: int = 1,
+        logger: Optional[logging.Logger] = None,
+        on_stage_finished: Optional[Callable[[object, bool], None]] = None,
+    ):
+        """
+        Args:
+            stages: Stages to run, in declaration order
+            max_workers: Maximum number of stages running at the same time
+            logger: Logger for progress messages
+            on_stage_finished: Called from the scheduling thread with ``(stage, success)``
+                after each stage ends
+        """
+        self.stages = list(stages)
+        self.max_workers = max(1, int(max_workers))
+        self.logger = logger or logging.getLogger(__name__)
+        self.on_stage_finished = on_stage_finished
+
+        self.dependencies = build_dependencies(self.stages)
+        self.order = topological_order(self.dependencies)
+
+        self.results: Dict[str, bool] = {}
+        self.wall_time: Optional[float] = None
+
+    def run(self) -> bool:
+        """Run the stages. Returns True if all of them completed successfully."""
+        stages_by_name = {stage.name: stage for stage in self.stages}
+        pending = list(self.order)
+        running: Dict[Future, object] = {}
+        failed = False
+        started = 0
+        total = len(pending)
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as executor:
+            while pending or running:
+                if not failed:
+                    # Start all ready stages in declaration order while there are free workers
+                    for name in list(pending):
+                        if len(running) >= self.max_workers:
+                            break
+                        if all(self.results.get(dep) for dep in self.dependencies[name]):
+                            pending.remove(name)
+                            started += 1
+                            stage = stages_by_name[name]
+                            self.logger.info(f"[{started}/{total}] Running stage: {name}")
+                            running[executor.submit(stage.run)] = stage
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        success = bool(future.result())
+                    except Exception as e:
+                        self.logger.error(f"Stage {stage.name} raised: {e}")
+                        success = False
+
+                    self.results[stage.name] = success
+                    if not success:
+                        failed = True
+
+                    if self.on_stage_finished:
+                        self.on_stage_finished(stage, success)
+
+        self.wall_time = time.time() - start_time
+        return not failed and not pending
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """Find the chain of dependent stages with the longest total duration.
+
+        Only stages that ran are considered.
+
+        Returns:
+            Tuple of (stage names along the path, total duration in seconds)
+        """
+        durations = {stage.name: stage.get_duration() or 0.0 for stage in self.stages if stage.name in self.results}
+
+        best: Dict[str, Tuple[float, Optional[str]]] = {}
+        for name in self.order:
+            if name not in durations:
+                continue
+            previous = None
+            previous_length = 0.0
+            for dep in self.dependencies[name]:
+                if dep in best and best[dep][0] > previous_length:
+                    previous, previous_length = dep, best[dep][0]
+            best[name] = (previous_length + durations[name], previous)
+
+        if not best:
+            return [], 0.0
+
+        end = max(best, key=lambda name: best[name][0])
+        length = best[end][0]
+        path = []
+        while end is not None:
+            path.append(end)
+            end = best[end][1]
+
+        return list(reversed(path)), length
+
+    def log_timing_report(self):
+        """Log per-stage durations and the critical path of the run."""
+        path, length = self.critical_path()
+        on_path = set(path)
+
+        self.logger.info("\nStage timing summary:")
+        for name in self.order:
+            if name not in self.results:
+                continue
+            stage = next(stage for stage in self.stages if stage.name == name)
+            duration = stage.get_duration() or 0.0
+            marker = " *" if name in on_path else ""
+            self.logger.info(f"  {name}: {duration:.1f}s{marker}")
+
+        total = sum(stage.get_duration() or 0.0 for stage in self.stages if stage.name in self.results)
+        self.logger.info(f"Critical path (*): {' -> '.join(path)} ({length:.1f}s)")
+        if self.wall_time:
+            self.logger.info(
+                f"Sum of stage times: {total:.1f}s, wall time: {self.wall_time:.1f}s "
+                f"({total / self.wall_time:.2f}x with {self.max_workers} workers)"
+            )
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the batch embedding executor against a local stub endpoint."""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from batch_embedder import BatchEmbeddingExecutor, TokenBucket
+
+
+def embed_text(text):
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return [b / 255.0 for b in digest[:8]]
+
+
+class StubEndpoint:
+    """Local HTTP embedding endpoint with injected latency and errors."""
+
+    def __init__(self, latency: float = 0.0, transient_errors: int = 0, poison: str = None):
+        self.latency = latency
+        self.transient_errors = transient_errors
+        self.poison = poison
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                texts = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["input"]
+                status, body = endpoint.handle(texts)
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1/embeddings"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def handle(self, texts):
+        with self.lock:
+            self.batches.append(list(texts))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            transient = self.transient_errors > 0
+            if transient:
+                self.transient_errors -= 1
+
+        try:
+            time.sleep(self.latency)
+            if transient:
+                return 503, {"error": "overloaded"}
+            if self.poison in texts:
+                return 400, {"error": "invalid input"}
+            return 200, {"data": [{"embedding": embed_text(text)} for text in texts]}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class HTTPEmbedder:
+    """Minimal client of the stub endpoint."""
+
+    def __init__(self, url):
+        self.url = url
+
+    def embed_documents(self, texts):
+        request = urllib.request.Request(
+            self.url, data=json.dumps({"input": texts}).encode("utf-8"), headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return [item["embedding"] for item in json.loads(response.read())["data"]]
+
+
+@pytest.fixture
+def endpoint():
+    endpoints = []
+
+    def create(**kwargs):
+        endpoints.append(StubEndpoint(**kwargs))
+        return endpoints[-1]
+
+    yield create
+    for stub in endpoints:
+        stub.close()
+
+
+def texts(count):
+    return {f"key{i}": f"text {i}" for i in range(count)}
+
+
+def test_batches_are_sent_concurrently(endpoint):
+    stub = endpoint(latency=0.1)
+    executor = BatchEmbeddingExecutor(HTTPEmbedder(stub.url), batch_size=5, max_in_flight=4)
+
+    start = time.monotonic()
+    embeddings = executor.embed(texts(40))
+    elapsed = time.monotonic() - start
+
+    assert embeddings == {key: embed_text(text) for key, text in texts(40).items()}
+    assert len(stub.batches) == 8
+    assert stub.max_in_flight == 4
+    # 8 batches of 0.1s with 4 in flight take two rounds, not eight
+    assert elapsed < 0.6
+
+
+def test_requests_are_rate_limited(endpoint):
+    stub = endpoint()
+    executor = BatchEmbeddingExecutor(HTTPEmbedder(stub.url), batch_size=1, max_in_flight=4, requests_per_second=20)
+
+    start = time.monotonic()
+    executor.embed(texts(30))
+    elapsed = time.monotonic() - start
+
+    # The bucket starts with a burst of 20 requests, the other 10 come at 20 per second
+    assert elapsed >= 0.45
+    assert executor.stats["requests"] == 30
+
+
+def test_token_bucket_spacing():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_transient_errors_are_retried(endpoint):
+    stub = endpoint(transient_errors=2)
+    executor = BatchEmbeddingExecutor(HTTPEmbedder(stub.url), batch_size=10, max_in_flight=1, backoff_base=0.01)
+
+    embeddings = executor.embed(texts(10))
+
+    assert len(embeddings) == 10
+    assert executor.failed == {}
+    assert executor.stats["retries"] == 2
+    assert executor.stats["splits"] == 0
+
+
+def test_failed_batches_are_split_down_to_the_bad_text(endpoint):
+    stub = endpoint(poison="text 5")
+    executor = BatchEmbeddingExecutor(
+        HTTPEmbedder(stub.url), batch_size=8, max_in_flight=2, max_retries=1, backoff_base=0.01
+    )
+
+    embeddings = executor.embed(texts(16))
+
+    assert list(executor.failed) == ["key5"]
+    assert "400" in executor.failed["key5"]
+    assert set(embeddings) == set(texts(16)) - {"key5"}
+    assert executor.stats["splits"] >= 3
+
+
+def test_batches_are_bounded_by_tokens(endpoint):
+    stub = endpoint()
+    documents = {f"key{i}": "word " * (10 * (i + 1)) for i in range(6)}
+    executor = BatchEmbeddingExecutor(
+        HTTPEmbedder(stub.url),
+        batch_size=10,
+        max_in_flight=1,
+        max_batch_tokens=60,
+        count_tokens=lambda text: len(text.split()),
+    )
+
+    embeddings = executor.embed(documents)
+
+    assert len(embeddings) == 6
+    assert [len(batch) for batch in stub.batches] == [3, 1, 1, 1]
+    # A text above the limit is still sent, alone
+    for batch in stub.batches:
+        assert len(batch) == 1 or sum(len(text.split()) for text in batch) <= 60
+
+
+def test_texts_are_truncated_before_sending(endpoint):
+    stub = endpoint()
+    executor = BatchEmbeddingExecutor(HTTPEmbedder(stub.url), truncate=lambda text: text[:4])
+
+    embeddings = executor.embed({"a": "long text", "b": "other text"})
+
+    assert stub.batches == [["long", "othe"]]
+    assert embeddings["a"] == embed_text("long")
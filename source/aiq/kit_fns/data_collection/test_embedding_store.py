@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the binary embedding store of the data collection pipeline."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from embedding_store import (
+    EmbeddingStore,
+    convert_json_embeddings,
+    create_faiss_vectorstore,
+    open_embeddings,
+    store_path_for,
+)
+
+DIMENSION = 16
+
+
+def vector(seed: int):
+    return np.random.default_rng(seed).random(DIMENSION, dtype=np.float32).tolist()
+
+
+def write_json_embeddings(path: Path, count: int = 5):
+    data = {
+        "metadata": {"model": "stub/embedder", "embedding_dimension": DIMENSION},
+        "settings": {f"/exts/omni.test/setting{i}": {"embedding": vector(i), "type": "bool"} for i in range(count)},
+    }
+    data["settings"]["/exts/omni.test/failed"] = {"embedding": [], "error": "timeout"}
+    path.write_text(json.dumps(data, indent=2))
+    return data
+
+
+def test_append_and_random_access(tmp_path):
+    with EmbeddingStore.create(tmp_path / "store", metadata={"model": "stub"}) as store:
+        for i in range(3):
+            store.append(f"key{i}", vector(i), {"index": i})
+
+    store = EmbeddingStore(tmp_path / "store")
+    assert len(store) == 3
+    assert store.dimension == DIMENSION
+    assert store.metadata == {"model": "stub"}
+
+    embedding, record = store.get("key1")
+    assert np.allclose(embedding, vector(1))
+    assert record == {"index": 1}
+    assert [key for _, key, _ in store.records()] == ["key0", "key1", "key2"]
+
+
+def test_reopened_store_appends(tmp_path):
+    with EmbeddingStore.create(tmp_path / "store") as store:
+        store.append("key0", vector(0))
+
+    with EmbeddingStore(tmp_path / "store") as store:
+        store.append("key1", vector(1), {"late": True})
+        with pytest.raises(KeyError):
+            store.append("key0", vector(0))
+        with pytest.raises(ValueError):
+            store.append("short", [1.0, 2.0])
+
+    store = EmbeddingStore(tmp_path / "store")
+    assert store.keys() == ["key0", "key1"]
+    assert store.get_record("key1") == {"late": True}
+    assert np.allclose(store.matrix(), [vector(0), vector(1)])
+
+
+def test_unflushed_rows_are_dropped_on_append(tmp_path):
+    store = EmbeddingStore.create(tmp_path / "store")
+    store.append("key0", vector(0))
+    store.flush()
+    store.append("lost", vector(1))
+    # Simulate a crash: the row is written but the manifest is not updated
+    store._vectors_file.flush()
+    store._records_file.flush()
+
+    with EmbeddingStore(tmp_path / "store") as reopened:
+        reopened.append("key1", vector(2))
+
+    reopened = EmbeddingStore(tmp_path / "store")
+    assert reopened.keys() == ["key0", "key1"]
+    assert np.allclose(reopened.get_vector("key1"), vector(2))
+    assert reopened.get_record("key1") == {}
+
+
+def test_float32_matrix_is_memory_mapped(tmp_path):
+    with EmbeddingStore.create(tmp_path / "store") as store:
+        for i in range(4):
+            store.append(f"key{i}", vector(i))
+
+    store = EmbeddingStore(tmp_path / "store")
+    assert isinstance(store.vectors(), np.memmap)
+    assert isinstance(store.vectors([0, 1, 2, 3]), np.memmap)
+    assert np.allclose(store.vectors([3, 1]), [vector(3), vector(1)])
+
+
+def test_float16_store(tmp_path):
+    with EmbeddingStore.create(tmp_path / "store", dtype="float16") as store:
+        store.append("key0", vector(0))
+
+    store = EmbeddingStore(tmp_path / "store")
+    assert (tmp_path / "store" / "vectors.bin").stat().st_size == DIMENSION * 2
+    assert store.vectors().dtype == np.float32
+    assert np.allclose(store.get_vector("key0"), vector(0), atol=1e-3)
+
+
+def test_convert_json_embeddings(tmp_path):
+    embeddings_file = tmp_path / "settings_embeddings.json"
+    data = write_json_embeddings(embeddings_file)
+
+    store = convert_json_embeddings(embeddings_file)
+
+    assert store.path == store_path_for(embeddings_file)
+    assert len(store) == 5
+    assert store.metadata["model"] == "stub/embedder"
+    assert store.metadata["skipped_records"] == 1
+    for key, record in data["settings"].items():
+        if record["embedding"]:
+            assert np.allclose(store.get_vector(key), record["embedding"])
+            assert store.get_record(key) == {"type": "bool"}
+
+
+def test_open_embeddings_converts_stale_stores(tmp_path):
+    embeddings_file = tmp_path / "settings_embeddings.json"
+    write_json_embeddings(embeddings_file, count=2)
+    assert len(open_embeddings(embeddings_file)) == 2
+
+    write_json_embeddings(embeddings_file, count=4)
+    manifest = store_path_for(embeddings_file) / "manifest.json"
+    os.utime(manifest, (0, 0))
+
+    assert len(open_embeddings(embeddings_file)) == 4
+
+
+class FakeEmbedder(Embeddings):
+    def embed_query(self, text):
+        return vector(int(text))
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+
+def test_faiss_vectorstore_matches_from_embeddings(tmp_path):
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+
+    with EmbeddingStore.create(tmp_path / "store") as store:
+        for i in range(20):
+            store.append(str(i), vector(i), {"index": i})
+
+    store = EmbeddingStore(tmp_path / "store")
+    documents = [Document(page_content=key, metadata=record) for _, key, record in store.records()]
+
+    vectorstore = create_faiss_vectorstore(store.vectors(), documents, FakeEmbedder())
+    expected = FAISS.from_embeddings(
+        text_embeddings=[(str(i), vector(i)) for i in range(20)],
+        embedding=FakeEmbedder(),
+        metadatas=[{"index": i} for i in range(20)],
+    )
+
+    for query in ["3", "11"]:
+        results = vectorstore.similarity_search_with_score(query, k=4)
+        expected_results = expected.similarity_search_with_score(query, k=4)
+        assert [doc.page_content for doc, _ in results] == [doc.page_content for doc, _ in expected_results]
+        assert np.allclose([score for _, score in results], [score for _, score in expected_results])
+
+    vectorstore.save_local(str(tmp_path / "faiss"))
+    loaded = FAISS.load_local(str(tmp_path / "faiss"), FakeEmbedder(), allow_dangerous_deserialization=True)
+    assert loaded.similarity_search("7", k=1)[0].metadata == {"index": 7}
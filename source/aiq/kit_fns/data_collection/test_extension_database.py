@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the streamed extension database build and its compact record stores."""
+
+import json
+import sys
+from pathlib import Path
+
+import tiktoken
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from extension_data import build_extension_database
+from extension_data.build_extension_database import TokenCounter, count_tokens, process_all_extensions
+from record_store import RecordStoreWriter
+
+from kit_fns.services.kit_exts_atlas import KitExtensionsAtlasService
+from kit_fns.services.record_store import RecordStore
+
+EXTENSION_TOML = """
+[package]
+version = "{version}"
+description = "Demo widgets {index}"
+keywords = ["demo", "widget"]
+
+[dependencies]
+"omni.ui" = {{}}
+"omni.kit.menu" = {{ optional = true }}
+
+[[python.module]]
+name = "omni.demo.widgets{index}"
+"""
+
+WIDGET_SOURCE = '''
+class Widget{index}:
+    """A widget with a "quoted" name, unicode ✓ and
+    a docstring over two lines."""
+
+    def __init__(self, size: int = {index}):
+        self.size = size
+
+    def build(self, title: str = "Widget") -> str:
+        """Build the widget."""
+        return title * self.size
+
+
+def make_widget(size: int = 1) -> Widget{index}:
+    return Widget{index}(size)
+'''
+
+# cl100k_base pre-tokenizer with byte level ranks and a few merges, since the real ranks are not downloaded offline
+CL100K_PATTERN = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|"""
+    r"""\s+(?!\S)|\s"""
+)
+
+
+def build_extscache(root: Path, count: int = 3) -> Path:
+    for index in range(count):
+        version = f"1.{index}.0"
+        extension = root / f"omni.demo.widgets{index}-{version}"
+        (extension / "config").mkdir(parents=True)
+        (extension / "config" / "extension.toml").write_text(EXTENSION_TOML.format(version=version, index=index))
+        package = extension / "omni" / "demo" / f"widgets{index}"
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text("from .widget import *\n")
+        (package / "widget.py").write_text(WIDGET_SOURCE.format(index=index), encoding="utf-8")
+    return root
+
+
+def test_streamed_database_and_record_stores(tmp_path):
+    output_dir = tmp_path / "extension_data"
+    process_all_extensions(str(build_extscache(tmp_path / "extscache")), output_dir=str(output_dir))
+
+    database = json.loads((output_dir / "extensions_database.json").read_text(encoding="utf-8"))
+    assert database["total_extensions"] == 3
+    assert sorted(database["extensions"]) == [f"omni.demo.widgets{i}" for i in range(3)]
+
+    for kind in ("codeatlas", "api_docs"):
+        records = RecordStore(output_dir / kind)
+        assert records.exists()
+        for extension_id, entry in database["extensions"].items():
+            detail_file = output_dir / kind / f"{extension_id}-{entry['version']}.{kind}.json"
+            detail = json.loads(detail_file.read_text(encoding="utf-8"))
+            assert records.get(f"{extension_id}-{entry['version']}") == detail
+            token_count = entry["codeatlas_token_count" if kind == "codeatlas" else "api_docs_token_count"]
+            assert token_count == count_tokens(json.dumps(detail, indent=2))
+
+    atlas = RecordStore(output_dir / "codeatlas").get("omni.demo.widgets1-1.1.0")
+    assert "omni.demo.widgets1.Widget1" in atlas["classes"]
+
+    # The service reads single records, also without the files per extension
+    for detail_file in list((output_dir / "codeatlas").glob("*.codeatlas.json")):
+        detail_file.unlink()
+    for detail_file in list((output_dir / "api_docs").glob("*.api_docs.json")):
+        detail_file.unlink()
+    service = KitExtensionsAtlasService(
+        database_file_path=str(output_dir / "extensions_database.json"),
+        codeatlas_dir=str(output_dir / "codeatlas"),
+        api_docs_dir=str(output_dir / "api_docs"),
+    )
+    assert service.load_codeatlas("omni.demo.widgets1") == atlas
+    assert service.load_api_docs("omni.demo.widgets2") == RecordStore(output_dir / "api_docs").get(
+        "omni.demo.widgets2-1.2.0"
+    )
+    assert service.load_codeatlas("omni.demo.missing") is None
+
+
+def test_without_detail_files(tmp_path):
+    output_dir = tmp_path / "extension_data"
+    process_all_extensions(
+        str(build_extscache(tmp_path / "extscache", count=1)), output_dir=str(output_dir), detail_files=False
+    )
+
+    assert sorted(path.name for path in (output_dir / "codeatlas").iterdir()) == [
+        "records.index.json",
+        "records.jsonl",
+    ]
+    entry = json.loads((output_dir / "extensions_database.json").read_text())["extensions"]["omni.demo.widgets0"]
+    atlas = RecordStore(output_dir / "codeatlas").get("omni.demo.widgets0-1.0.0")
+    assert entry["codeatlas_token_count"] == count_tokens(json.dumps(atlas, indent=2))
+
+
+def test_record_store_last_record_wins(tmp_path):
+    with RecordStoreWriter(tmp_path) as writer:
+        writer.add("a", {"value": 1})
+        writer.add("b", ["ü", None])
+        writer.add("a", {"value": 2})
+
+    records = RecordStore(tmp_path)
+    assert records.get("a") == {"value": 2}
+    assert records.get("b") == ["ü", None]
+    assert "c" not in records and records.get("c") is None
+
+
+def test_token_counter_matches_whole_text(monkeypatch):
+    ranks = {bytes([i]): i for i in range(256)}
+    for merge in (b'  ', b'    ', b'": ', b'"name', b'\n ', b'in', b'def'):
+        ranks[merge] = len(ranks)
+    encoding = tiktoken.Encoding("cl100k_test", pat_str=CL100K_PATTERN, mergeable_ranks=ranks, special_tokens={})
+    monkeypatch.setitem(build_extension_database._encodings, "cl100k_base", encoding)
+
+    data = {
+        "modules": {
+            f"omni.demo.m{i}": {"name": f"m{i}", "doc": "Line one\nline  two ✓", "lines": [i, i + 1]} for i in range(40)
+        },
+        "empty": {},
+        "text": "   \n\n  trailing   ",
+    }
+    text = json.dumps(data, indent=2)
+    for block_size in (1, 7, 64, 1 << 20):
+        counter = TokenCounter(block_size=block_size)
+        json.dump(data, counter, indent=2)
+        assert counter.total == len(encoding.encode_ordinary(text)) == count_tokens(text)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the FAISS index types of the pipeline databases and their loading in the services."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kit_fns.services.faiss_index import load_faiss_vectorstore
+
+from benchmark_faiss_index_types import clustered_vectors, make_queries, measure, recall_at_k
+from embedding_store import create_faiss_vectorstore
+from faiss_index import INDEX_CONFIG_FILE, build_faiss_index, save_faiss_vectorstore
+
+
+class ZeroEmbedder(Embeddings):
+    def embed_query(self, text):
+        return [0.0] * 32
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+
+@pytest.fixture(scope="module")
+def vectors():
+    return clustered_vectors(4000, 32, num_clusters=16)
+
+
+@pytest.mark.parametrize(
+    "index_type, min_recall",
+    [("ivf_flat", 0.9), ("hnsw", 0.9), ("sq8", 0.9), ("ivf_pq", 0.3)],
+)
+def test_index_types_recall(vectors, index_type, min_recall):
+    queries = make_queries(vectors, 50)
+    expected, _ = measure(build_faiss_index(vectors), queries, 10)
+
+    index = build_faiss_index(vectors, {"index_type": index_type, "nprobe": 16})
+
+    assert index.ntotal == len(vectors)
+    found, _ = measure(index, queries, 10)
+    assert recall_at_k(expected, found) >= min_recall
+
+
+def test_small_corpora_use_the_flat_index(vectors):
+    index = build_faiss_index(vectors[:500], {"index_type": "ivf_pq"})
+    assert type(index).__name__ == "IndexFlatL2"
+
+    with pytest.raises(ValueError):
+        build_faiss_index(vectors, {"index_type": "annoy"})
+
+
+def test_saved_search_parameters_are_applied_on_load(vectors, tmp_path, monkeypatch):
+    import faiss
+
+    documents = [Document(page_content=str(i)) for i in range(len(vectors))]
+    vectorstore = create_faiss_vectorstore(vectors, documents, ZeroEmbedder(), {"index_type": "ivf_flat", "nlist": 64})
+    save_faiss_vectorstore(vectorstore, tmp_path / "ivf")
+
+    index_config = json.loads((tmp_path / "ivf" / INDEX_CONFIG_FILE).read_text())
+    assert index_config == {
+        "dimension": 32,
+        "num_vectors": 4000,
+        "metric": "l2",
+        "index_type": "ivf_flat",
+        "nlist": 64,
+        "nprobe": 8,
+    }
+
+    # The sidecar value is applied even if the index file does not keep it
+    index_config["nprobe"] = 5
+    (tmp_path / "ivf" / INDEX_CONFIG_FILE).write_text(json.dumps(index_config))
+    loaded = load_faiss_vectorstore(tmp_path / "ivf", ZeroEmbedder())
+    assert faiss.extract_index_ivf(loaded.index).nprobe == 5
+
+    monkeypatch.setenv("KIT_FAISS_NPROBE", "12")
+    loaded = load_faiss_vectorstore(tmp_path / "ivf", ZeroEmbedder())
+    assert faiss.extract_index_ivf(loaded.index).nprobe == 12
+    assert load_faiss_vectorstore(tmp_path / "ivf", ZeroEmbedder(), nprobe=20).index.nprobe == 20
+    assert len(loaded.similarity_search("query", k=3)) == 3
+
+    vectorstore = create_faiss_vectorstore(vectors, documents, ZeroEmbedder(), {"index_type": "hnsw", "ef_search": 40})
+    save_faiss_vectorstore(vectorstore, tmp_path / "hnsw")
+    monkeypatch.setenv("KIT_FAISS_EF_SEARCH", "80")
+    assert load_faiss_vectorstore(tmp_path / "hnsw", ZeroEmbedder()).index.hnsw.efSearch == 80
+    monkeypatch.delenv("KIT_FAISS_EF_SEARCH")
+    assert load_faiss_vectorstore(tmp_path / "hnsw", ZeroEmbedder()).index.hnsw.efSearch == 40
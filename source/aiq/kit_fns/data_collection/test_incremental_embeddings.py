@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the incremental re-embedding of code examples and extensions."""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from code_example_pipeline.generate_code_examples_embeddings import generate_embeddings_for_code_examples
+from extension_data.generate_extension_embeddings import generate_embeddings_for_extensions
+
+MODEL = "stub/embedder"
+
+
+class StubEmbedder:
+    """Deterministic local embedder that counts the embedded texts."""
+
+    def __init__(self, fail: bool = False):
+        self.embedded = []
+        self.fail = fail
+
+    def _embed(self, text):
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [b / 255.0 for b in digest[:8]]
+
+    def embed_documents(self, texts):
+        if self.fail:
+            raise RuntimeError("embedder unavailable")
+        self.embedded.extend(texts)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def write_methods(methods_dir: Path, extensions):
+    methods_dir.mkdir(parents=True, exist_ok=True)
+    for path in methods_dir.glob("*.example.json"):
+        path.unlink()
+    for extension_name, methods in extensions.items():
+        data = {"extension_name": extension_name, "methods": methods}
+        (methods_dir / f"{extension_name}.example.json").write_text(json.dumps(data))
+
+
+def method(name, source):
+    return {"name": name, "module": "omni.test", "source_code": source, "line_count": 3}
+
+
+def run_code_examples(tmp_path, embedder, model=MODEL):
+    generate_embeddings_for_code_examples(
+        tmp_path / "methods",
+        tmp_path / "out",
+        "cl100k_base",
+        model,
+        "",
+        "",
+        500,
+        2,
+        embedder=embedder,
+    )
+    return json.loads((tmp_path / "out" / "code_examples_embeddings.json").read_text())
+
+
+@pytest.fixture
+def methods(tmp_path):
+    extensions = {
+        "omni.a": [method("a1", "def a1(): pass"), method("a2", "def a2(): pass")],
+        "omni.b": [method("b1", "def b1(): pass"), method("b2", "def b2(): pass"), method("b3", "def b3(): pass")],
+    }
+    write_methods(tmp_path / "methods", extensions)
+    return extensions
+
+
+def test_code_examples_rerun_embeds_nothing(tmp_path, methods):
+    first = StubEmbedder()
+    database = run_code_examples(tmp_path, first)
+    assert len(first.embedded) == 5
+    assert all(record["content_hash"] and record["model"] == MODEL for record in database["methods"].values())
+
+    second = StubEmbedder()
+    rerun = run_code_examples(tmp_path, second)
+    assert second.embedded == []
+    assert rerun["methods"] == database["methods"]
+    assert rerun["metadata"]["reused_embeddings"] == 5
+
+
+def test_code_examples_only_changed_methods_are_embedded(tmp_path, methods):
+    database = run_code_examples(tmp_path, StubEmbedder())
+
+    methods["omni.a"][0] = method("a1", "def a1():\n    return 1")
+    del methods["omni.b"][2]
+    methods["omni.b"].append(method("b4", "def b4(): pass"))
+    write_methods(tmp_path / "methods", methods)
+
+    embedder = StubEmbedder()
+    updated = run_code_examples(tmp_path, embedder)
+
+    assert len(embedder.embedded) == 2
+    assert "omni.b::b3" not in updated["methods"]
+    assert "omni.b::b4" in updated["methods"]
+    assert updated["methods"]["omni.a::a1"]["embedding"] != database["methods"]["omni.a::a1"]["embedding"]
+    assert updated["methods"]["omni.a::a2"] == database["methods"]["omni.a::a2"]
+    assert updated["metadata"]["removed_embeddings"] == 1
+
+
+def test_code_examples_model_change_and_failures_are_reembedded(tmp_path, methods):
+    failed = run_code_examples(tmp_path, StubEmbedder(fail=True))
+    assert all(record["embedding"] == [] for record in failed["methods"].values())
+
+    embedder = StubEmbedder()
+    run_code_examples(tmp_path, embedder)
+    assert len(embedder.embedded) == 5
+
+    embedder = StubEmbedder()
+    run_code_examples(tmp_path, embedder, model="stub/other")
+    assert len(embedder.embedded) == 5
+
+
+def test_extensions_rerun_embeds_only_changed_descriptions(tmp_path):
+    descriptions_file = tmp_path / "extensions_descriptions.json"
+    output_file = tmp_path / "extensions_embeddings.json"
+    descriptions = {
+        "omni.a": {"description": "Extension A", "version": "1.0.0"},
+        "omni.b": {"description": "Extension B", "version": "1.0.0"},
+        "omni.c": {"description": "Extension C", "version": "1.0.0"},
+    }
+    descriptions_file.write_text(json.dumps(descriptions))
+
+    embedder = StubEmbedder()
+    generate_embeddings_for_extensions(descriptions_file, output_file, model=MODEL, embedder=embedder)
+    assert len(embedder.embedded) == 3
+
+    descriptions["omni.a"] = {"description": "Extension A", "version": "1.0.1"}
+    descriptions["omni.b"]["description"] = "Extension B, now with more features"
+    del descriptions["omni.c"]
+    descriptions_file.write_text(json.dumps(descriptions))
+
+    embedder = StubEmbedder()
+    generate_embeddings_for_extensions(descriptions_file, output_file, model=MODEL, embedder=embedder)
+    database = json.loads(output_file.read_text())
+
+    assert embedder.embedded == ["Extension B, now with more features"]
+    assert list(database["extensions"]) == ["omni.a", "omni.b"]
+    # Metadata of reused records is refreshed from the descriptions
+    assert database["extensions"]["omni.a"]["version"] == "1.0.1"
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the method source lookup of the code examples FAISS builder."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from code_example_pipeline.build_code_examples_faiss_database import MethodSourceIndex, load_method_source_code
+
+
+def write_methods(methods_dir: Path, extension_name: str, count: int):
+    methods = [{"name": f"method{i}", "source_code": f"def method{i}(): return {i}"} for i in range(count)]
+    methods.append({"name": "method0", "source_code": "duplicate"})
+    (methods_dir / f"{extension_name}.example.json").write_text(json.dumps({"methods": methods}))
+
+
+def test_each_file_is_read_once(tmp_path):
+    for name in ["omni.a", "omni.b"]:
+        write_methods(tmp_path, name, 50)
+
+    index = MethodSourceIndex(tmp_path)
+    for name in ["omni.a", "omni.b"]:
+        for i in range(50):
+            assert index.get(name, f"method{i}") == f"def method{i}(): return {i}"
+
+    assert index.files_read == 2
+    assert index.get("omni.a", "missing") == ""
+    assert index.get("omni.missing", "method0") == ""
+    assert load_method_source_code(tmp_path, "omni.b", "method0") == "def method0(): return 0"
+
+
+def test_only_recent_extensions_are_kept(tmp_path):
+    for name in ["omni.a", "omni.b", "omni.c"]:
+        write_methods(tmp_path, name, 2)
+
+    index = MethodSourceIndex(tmp_path, max_extensions=2)
+    index.get("omni.a", "method0")
+    index.get("omni.b", "method0")
+    index.get("omni.a", "method1")
+    index.get("omni.c", "method0")
+    assert list(index._indexes) == ["omni.a", "omni.c"]
+
+    index.get("omni.b", "method1")
+    assert index.files_read == 4
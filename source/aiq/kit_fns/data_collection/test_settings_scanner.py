@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the parallel, prefiltered and cached settings scanner."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from settings_pipeline.scan_extension_settings import ExtensionSettingsScanner
+
+EXTENSION_TOML = """
+[package]
+title = "Viewer"
+
+[settings]
+# Show the toolbar
+exts."omni.demo.viewer".showToolbar = true
+exts."omni.demo.viewer".maxItems = 20
+
+[settings.app.window]
+# Window width
+width = 1280.5
+
+[settings.persistent]
+exts.omni.demo.viewer.lastPath = "/tmp"
+
+[dependencies]
+"omni.kit.menu" = { settings = { app = { menu = { compact = false } } } }
+"""
+
+PYTHON_SOURCE = """import carb.settings
+
+settings = carb.settings.get_settings()
+enabled = settings.get("/exts/omni.demo.viewer/showToolbar")
+settings.set("/app/window/width", 1920)
+settings.set("/persistent/exts/omni.demo.viewer/recent", ["a", "b"])
+value = settings.get_as_int('/app/viewer/maxFps')
+path = "/app/viewer/unused"
+settings.set("/exts", None)
+"""
+
+CPP_SOURCE = """#include <carb/settings/ISettings.h>
+
+void init(carb::settings::ISettings* settings)
+{
+    settings->setBool("/app/viewer/enabled", true);
+    bool grid = settings->get<bool>("/exts/omni.demo.viewer/showGrid");
+    const char* path = "/persistent/viewer/unused";
+}
+"""
+
+
+def build_extensions(root: Path, copies: int = 3) -> Path:
+    """Write extensions with TOML, Python and C++ settings, including files the scanner skips."""
+    for i in range(copies):
+        extension = root / f"omni.demo.viewer-1.{i}.0+lx64"
+        (extension / "config").mkdir(parents=True)
+        (extension / "config" / "extension.toml").write_text(EXTENSION_TOML)
+        (extension / "config" / "extra.toml").write_text(f'[settings.app.viewer]\nlevel{i} = {i}\n')
+        package = extension / "omni" / "demo" / "viewer"
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text("from .extension import *\n")
+        (package / "extension.py").write_bytes(PYTHON_SOURCE.replace("\n", "\r\n").encode("utf-8"))
+        (package / f"window_{i}.py").write_text(f'settings.set("/exts/omni.demo.viewer/window{i}", {i}.5)\n')
+        (package / "test_viewer.py").write_text('settings.set("/app/skipped", 1)\n')
+        (package / "binary.py").write_bytes(b'settings.get("/app/bad")\n\xff\xfe')
+        (extension / "include").mkdir()
+        (extension / "include" / "viewer.h").write_text(CPP_SOURCE)
+        (extension / "include" / "math.hpp").write_text("inline int twice(int value) { return 2 * value; }\n")
+    (root / "omni.demo.empty-2.0.0").mkdir()
+    return root
+
+
+def scan(extensions_dir: Path, **kwargs) -> ExtensionSettingsScanner:
+    scanner = ExtensionSettingsScanner(str(extensions_dir), **kwargs)
+    scanner.scan_all_extensions()
+    return scanner
+
+
+def saved_output(scanner: ExtensionSettingsScanner):
+    # Compare what is written to the JSON files
+    return json.loads(json.dumps(scanner.prepare_output()))
+
+
+def test_parallel_cached_scan_matches_serial_scan(tmp_path):
+    extensions_dir = build_extensions(tmp_path / "exts")
+    cache_dir = tmp_path / "cache"
+
+    reference = saved_output(scan(extensions_dir, max_workers=1, prefilter=False))
+    assert reference["/exts/omni.demo.viewer/showToolbar"]["default_value"] is True
+    assert reference["/exts/omni.demo.viewer/showToolbar"]["documentation"] == "Show the toolbar"
+    assert reference["/app/window/width"]["default_value"] == 1280.5
+    assert reference["/app/menu/compact"]["default_value"] is False
+    assert reference["/app/viewer/maxFps"]["found_in"] == [
+        f"omni.demo.viewer-1.{i}.0+lx64/omni/demo/viewer/extension.py@7" for i in range(3)
+    ]
+    assert reference["/exts/omni.demo.viewer/showGrid"]["extensions"] == [
+        f"omni.demo.viewer-1.{i}.0+lx64" for i in range(3)
+    ]
+    assert "/app/skipped" not in reference and "/app/bad" not in reference and "/exts" not in reference
+
+    cold = scan(extensions_dir, max_workers=2, cache_dir=str(cache_dir))
+    assert saved_output(cold) == reference
+    assert cold.stats["skipped"] == 6
+
+    warm = scan(extensions_dir, max_workers=2, cache_dir=str(cache_dir))
+    assert saved_output(warm) == reference
+    assert warm.stats["extracted"] == 0
+
+    # Only changed files are extracted again
+    (extensions_dir / "omni.demo.viewer-1.1.0+lx64" / "include" / "viewer.h").write_text(
+        'settings->setInt("/app/viewer/limit", 3);\n'
+    )
+    serial = scan(extensions_dir, max_workers=1, cache_dir=str(cache_dir))
+    assert serial.stats["extracted"] == 1
+    assert saved_output(serial) == saved_output(scan(extensions_dir, max_workers=1, prefilter=False))
+    assert serial.prepare_output()["/app/viewer/limit"]["found_in"] == [
+        "omni.demo.viewer-1.1.0+lx64/include/viewer.h@1"
+    ]
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the dependency-aware stage scheduler of the data collection pipeline."""
+
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from data_collection_pipeline import DataCollectionPipeline, PipelineStage
+from stage_scheduler import StageScheduler, build_dependencies
+
+STAGE_SLEEP = 0.2
+LOGGER = logging.getLogger("test_stage_scheduler")
+
+
+class SleepStage(PipelineStage):
+    """Stage that sleeps and records when it ran."""
+
+    def __init__(self, name, inputs=(), outputs=(), sleep=STAGE_SLEEP, succeed=True):
+        super().__init__(name, None, LOGGER)
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.sleep = sleep
+        self.succeed = succeed
+        self.executed = False
+
+    def _execute(self) -> bool:
+        self.executed = True
+        time.sleep(self.sleep)
+        return self.succeed
+
+
+def make_stages(**overrides):
+    """Stages with the same shape as the real pipeline."""
+    specs = [
+        ("pull_repo_exts", (), ("exts_paths", "kit_version")),
+        ("preparation", ("exts_paths", "kit_version"), ("exts_path", "work_dirs")),
+        ("extension_data", ("exts_path", "work_dirs"), ("extension_data",)),
+        ("code_examples", ("exts_path", "work_dirs"), ("code_examples",)),
+        ("settings", ("exts_path", "work_dirs"), ("settings",)),
+        ("embeddings", ("extension_data", "code_examples", "settings"), ("embeddings",)),
+        ("faiss", ("embeddings",), ("faiss_databases",)),
+    ]
+    return [SleepStage(name, inputs, outputs, **overrides.get(name, {})) for name, inputs, outputs in specs]
+
+
+def by_name(stages):
+    return {stage.name: stage for stage in stages}
+
+
+def test_dependencies_follow_artifacts():
+    dependencies = build_dependencies(make_stages())
+
+    assert dependencies["preparation"] == ["pull_repo_exts"]
+    assert dependencies["extension_data"] == ["preparation"]
+    assert dependencies["code_examples"] == ["preparation"]
+    assert dependencies["embeddings"] == ["extension_data", "code_examples", "settings"]
+
+
+def test_inputs_outside_the_run_are_available():
+    stages = [stage for stage in make_stages() if stage.name not in ("pull_repo_exts", "preparation")]
+    dependencies = build_dependencies(stages)
+
+    assert dependencies["extension_data"] == []
+    assert dependencies["settings"] == []
+
+
+def test_cycle_and_duplicate_outputs_are_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        build_dependencies([SleepStage("a", ("y",), ("x",)), SleepStage("b", ("x",), ("y",))])
+
+    with pytest.raises(ValueError, match="produced by both"):
+        build_dependencies([SleepStage("a", (), ("x",)), SleepStage("b", (), ("x",))])
+
+
+def test_stages_start_after_their_dependencies():
+    stages = make_stages()
+    scheduler = StageScheduler(stages, max_workers=3, logger=LOGGER)
+
+    assert scheduler.run()
+
+    named = by_name(stages)
+    for name, dependencies in scheduler.dependencies.items():
+        for dependency in dependencies:
+            assert named[name].start_time >= named[dependency].end_time
+
+
+def test_independent_stages_run_concurrently():
+    branches = ["extension_data", "code_examples", "settings"]
+    serial = make_stages()
+    StageScheduler(serial, max_workers=1, logger=LOGGER).run()
+
+    parallel = make_stages()
+    scheduler = StageScheduler(parallel, max_workers=3, logger=LOGGER)
+    assert scheduler.run()
+
+    named = by_name(parallel)
+    latest_start = max(named[name].start_time for name in branches)
+    earliest_end = min(named[name].end_time for name in branches)
+    assert latest_start < earliest_end
+
+    serial_time = by_name(serial)["faiss"].end_time - by_name(serial)["pull_repo_exts"].start_time
+    parallel_time = named["faiss"].end_time - named["pull_repo_exts"].start_time
+    # Seven stages serially vs. five levels of the DAG in parallel
+    assert parallel_time < serial_time - STAGE_SLEEP
+
+
+def test_worker_budget_is_respected():
+    stages = make_stages()
+    StageScheduler(stages, max_workers=2, logger=LOGGER).run()
+
+    intervals = [(stage.start_time, stage.end_time) for stage in stages]
+    for start, _ in intervals:
+        running = sum(1 for other_start, other_end in intervals if other_start <= start < other_end)
+        assert running <= 2
+
+
+def test_failure_stops_dependent_stages():
+    stages = make_stages(code_examples={"succeed": False, "sleep": 0.05})
+    finished = []
+    scheduler = StageScheduler(
+        stages, max_workers=3, logger=LOGGER, on_stage_finished=lambda stage, ok: finished.append((stage.name, ok))
+    )
+
+    assert not scheduler.run()
+
+    named = by_name(stages)
+    # The sibling branches were already running and are allowed to finish
+    assert named["extension_data"].executed
+    assert named["settings"].executed
+    assert not named["embeddings"].executed
+    assert not named["faiss"].executed
+    assert ("code_examples", False) in finished
+    assert ("settings", True) in finished
+
+
+def test_critical_path_follows_the_slowest_branch():
+    stages = make_stages(code_examples={"sleep": 0.4})
+    scheduler = StageScheduler(stages, max_workers=3, logger=LOGGER)
+    scheduler.run()
+
+    path, length = scheduler.critical_path()
+
+    assert path == ["pull_repo_exts", "preparation", "code_examples", "embeddings", "faiss"]
+    assert length == pytest.approx(sum(by_name(stages)[name].get_duration() for name in path))
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    config_file = tmp_path / "pipeline_config.toml"
+    config_file.write_text(
+        f'[input]\n[output]\nwork_dir = "{(tmp_path / "work").as_posix()}"\n'
+        '[logging]\nlevel = "INFO"\nlog_file = ""\n[advanced]\nmax_parallel_stages = 3\n'
+    )
+    pipeline = DataCollectionPipeline(config_file)
+    stages = make_stages()
+    pipeline.pre_stages = stages[:2]
+    pipeline.stages = stages[2:]
+    return pipeline
+
+
+def test_checkpoint_records_stage_states_and_resumes(pipeline):
+    named = by_name(pipeline.pre_stages + pipeline.stages)
+    named["embeddings"].succeed = False
+
+    assert not pipeline.run()
+
+    checkpoint = json.loads(pipeline.checkpoint_file.read_text())
+    assert set(checkpoint["completed_stages"]) == {
+        "pull_repo_exts",
+        "preparation",
+        "extension_data",
+        "code_examples",
+        "settings",
+    }
+    assert checkpoint["stage_states"]["embeddings"]["status"] == "failed"
+    assert checkpoint["stage_states"]["settings"]["status"] == "completed"
+    assert checkpoint["stage_states"]["settings"]["duration"] > 0
+
+    for stage in named.values():
+        stage.executed = False
+    named["embeddings"].succeed = True
+
+    assert pipeline.run(resume=True)
+
+    assert not named["settings"].executed
+    assert named["embeddings"].executed
+    assert named["faiss"].executed
+    assert not pipeline.checkpoint_file.exists()
@@ -79,6 +79,11 @@ ENV_EMBEDDER_BACKEND = "KIT_EMBEDDER_BACKEND"  # "nvidia_api" or "local"
 ENV_LOCAL_EMBEDDER_URL = "KIT_LOCAL_EMBEDDER_URL"  # URL for local embedder (e.g., "http://10.34.1.127:8001")
 ENV_RERANKER_BACKEND = "KIT_RERANKER_BACKEND"  # "nvidia_api" or "local"
 ENV_LOCAL_RERANKER_URL = "KIT_LOCAL_RERANKER_URL"  # URL for local reranker (e.g., "http://10.34.1.127:8002")
+ENV_FAISS_NPROBE = "KIT_FAISS_NPROBE"  # IVF cells searched per query, overrides index_config.json
+ENV_FAISS_EF_SEARCH = "KIT_FAISS_EF_SEARCH"  # HNSW candidate list size, overrides index_config.json
+
+# Index type and search parameters, written next to a FAISS database by the data collection pipeline
+INDEX_CONFIG_FILE = "index_config.json"
 
 
 def get_env_bool(env_var: str, default: bool = False) -> bool:
@@ -15,6 +15,7 @@
 
 """Code search service for finding Kit code examples and test patterns using FAISS."""
 
+import importlib.util
 import json
 import logging
 import os
@@ -23,17 +24,17 @@ from typing import Any, Dict, List, Optional
 
 from ..config import DEFAULT_RAG_TOP_K_CODE, DEFAULT_RERANK_CODE, KIT_VERSION
 from .embedder_service import EmbedderFactory
+from .faiss_index import load_faiss_vectorstore
 
 logger = logging.getLogger(__name__)
 
-# Try to import FAISS (optional dependency)
+# Check for FAISS (optional dependency)
 try:
-    from langchain_community.vectorstores import FAISS  # type: ignore
-
-    FAISS_AVAILABLE = True
-except ImportError:
-    logger.warning("FAISS not available. Semantic search will be limited.")
+    FAISS_AVAILABLE = importlib.util.find_spec("langchain_community.vectorstores") is not None
+except ModuleNotFoundError:
     FAISS_AVAILABLE = False
+if not FAISS_AVAILABLE:
+    logger.warning("FAISS not available. Semantic search will be limited.")
 
 # Get the base path for data
 DATA_BASE = Path(__file__).parent.parent / "data"
@@ -92,9 +93,7 @@ class CodeSearchService:
                 faiss_path = CODE_EXAMPLES_FAISS_PATHS.get(mode)
                 if faiss_path and faiss_path.exists():
                     try:
-                        self.code_vectorstore = FAISS.load_local(
-                            str(faiss_path), self.embedder, allow_dangerous_deserialization=True
-                        )
+                        self.code_vectorstore = load_faiss_vectorstore(faiss_path, self.embedder)
                         logger.info(f"Successfully loaded code examples FAISS index from {faiss_path} (mode: {mode})")
                         code_faiss_loaded = True
                         break
@@ -104,9 +103,7 @@ class CodeSearchService:
             # Try legacy path if no mode-based database found
             if not code_faiss_loaded and LEGACY_CODE_EXAMPLES_FAISS_PATH.exists():
                 try:
-                    self.code_vectorstore = FAISS.load_local(
-                        str(LEGACY_CODE_EXAMPLES_FAISS_PATH), self.embedder, allow_dangerous_deserialization=True
-                    )
+                    self.code_vectorstore = load_faiss_vectorstore(LEGACY_CODE_EXAMPLES_FAISS_PATH, self.embedder)
                     logger.info(
                         f"Successfully loaded code examples FAISS index from legacy path: {LEGACY_CODE_EXAMPLES_FAISS_PATH}"
                     )
@@ -123,9 +120,7 @@ class CodeSearchService:
                 faiss_path = CODE_EXAMPLES_FAISS_PATHS.get(mode)
                 if faiss_path and faiss_path.exists():
                     try:
-                        self.test_vectorstore = FAISS.load_local(
-                            str(faiss_path), self.embedder, allow_dangerous_deserialization=True
-                        )
+                        self.test_vectorstore = load_faiss_vectorstore(faiss_path, self.embedder)
                         logger.info(f"Successfully loaded test examples FAISS index from {faiss_path} (mode: {mode})")
                         test_faiss_loaded = True
                         break
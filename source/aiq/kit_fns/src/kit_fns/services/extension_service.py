@@ -15,25 +15,26 @@
 
 """Extension service for managing Kit extension data with FAISS search."""
 
+import importlib.util
 import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
 from ..config import KIT_VERSION
 from .embedder_service import EmbedderFactory
+from .faiss_index import load_faiss_vectorstore
 from .kit_exts_atlas import KitExtensionsAtlasService
 
 logger = logging.getLogger(__name__)
 
-# Try to import FAISS (optional dependency)
+# Check for FAISS (optional dependency)
 # These are optional - semantic search will work if available, otherwise fallback to keyword search
 try:
-    from langchain_community.vectorstores import FAISS  # type: ignore
-
-    FAISS_AVAILABLE = True
-except ImportError:
-    logger.warning("FAISS not available. Semantic search will be limited.")
+    FAISS_AVAILABLE = importlib.util.find_spec("langchain_community.vectorstores") is not None
+except ModuleNotFoundError:
     FAISS_AVAILABLE = False
+if not FAISS_AVAILABLE:
+    logger.warning("FAISS not available. Semantic search will be limited.")
 
 # Get the path to FAISS database
 FAISS_DB_PATH = Path(__file__).parent.parent / "data" / KIT_VERSION / "extensions" / "extensions_faiss"
@@ -76,9 +77,7 @@ class ExtensionService:
             self.embedder = EmbedderFactory.create(model="nvidia/nv-embedqa-e5-v5")
 
             # Load FAISS index
-            self.vectorstore = FAISS.load_local(
-                str(self.faiss_db_path), self.embedder, allow_dangerous_deserialization=True
-            )
+            self.vectorstore = load_faiss_vectorstore(self.faiss_db_path, self.embedder)
 
             logger.info(f"Successfully loaded FAISS index from {self.faiss_db_path}")
 
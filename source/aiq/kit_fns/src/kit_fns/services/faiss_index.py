@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Loading of the FAISS databases with the search parameters of their index type."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import ENV_FAISS_EF_SEARCH, ENV_FAISS_NPROBE, INDEX_CONFIG_FILE, get_env_int
+
+logger = logging.getLogger(__name__)
+
+
+def read_index_config(faiss_path: Path) -> Dict[str, Any]:
+    """Read the index type and search parameters of a FAISS database.
+
+    Databases built before the index types were configurable have no
+    ``index_config.json`` and are flat indexes.
+    """
+    config_file = Path(faiss_path) / INDEX_CONFIG_FILE
+    if not config_file.exists():
+        return {"index_type": "flat"}
+
+    try:
+        with open(config_file, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read {config_file}: {e}")
+        return {"index_type": "flat"}
+
+
+def set_search_params(vectorstore: Any, nprobe: Optional[int] = None, ef_search: Optional[int] = None) -> Dict[str, int]:
+    """Set the search parameters of the index of a LangChain FAISS vector store.
+
+    Parameters that do not apply to the index type are ignored.
+
+    Args:
+        vectorstore: The FAISS vector store
+        nprobe: Number of IVF cells searched per query
+        ef_search: Size of the HNSW candidate list
+
+    Returns:
+        The parameters that were set
+    """
+    import faiss
+
+    index = vectorstore.index
+    applied = {}
+
+    if nprobe:
+        ivf = faiss.try_extract_index_ivf(index)
+        if ivf is not None:
+            ivf.nprobe = min(int(nprobe), ivf.nlist)
+            applied["nprobe"] = ivf.nprobe
+
+    if ef_search and isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = int(ef_search)
+        applied["ef_search"] = index.hnsw.efSearch
+
+    return applied
+
+
+def load_faiss_vectorstore(
+    faiss_path: Path, embedder: Any, nprobe: Optional[int] = None, ef_search: Optional[int] = None
+) -> Any:
+    """Load a FAISS database and set the search parameters of its index.
+
+    The parameters come from the arguments, then from the ``KIT_FAISS_NPROBE``
+    and ``KIT_FAISS_EF_SEARCH`` environment variables, then from the
+    ``index_config.json`` written when the index was built.
+
+    Args:
+        faiss_path: Directory of the FAISS database
+        embedder: Embedder used to embed the queries
+        nprobe: Number of IVF cells searched per query
+        ef_search: Size of the HNSW candidate list
+    """
+    from langchain_community.vectorstores import FAISS  # type: ignore
+
+    vectorstore = FAISS.load_local(str(faiss_path), embedder, allow_dangerous_deserialization=True)
+
+    index_config = read_index_config(faiss_path)
+    applied = set_search_params(
+        vectorstore,
+        nprobe=nprobe or get_env_int(ENV_FAISS_NPROBE, 0) or index_config.get("nprobe"),
+        ef_search=ef_search or get_env_int(ENV_FAISS_EF_SEARCH, 0) or index_config.get("ef_search"),
+    )
+    if applied:
+        logger.info(f"Searching {index_config.get('index_type')} index of {faiss_path} with {applied}")
+
+    return vectorstore
@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 from ..config import KIT_VERSION
+from .record_store import RecordStore
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,9 @@ class KitExtensionsAtlasService:
         self.extensions = {}
         self._cached_codeatlas = {}  # Cache for loaded Code Atlas files
         self._cached_api_docs = {}  # Cache for loaded API docs
+        # Compact record stores of the pipeline, preferred to the files of every extension
+        self._codeatlas_records = RecordStore(self.codeatlas_dir)
+        self._api_docs_records = RecordStore(self.api_docs_dir)
         self._load_database()
 
     def _load_database(self) -> None:
@@ -126,30 +130,24 @@ class KitExtensionsAtlasService:
         if not metadata:
             return None
 
-        # Construct file path
         version = metadata.get("version", "")
-        codeatlas_file = self.codeatlas_dir / f"{extension_id}-{version}.codeatlas.json"
-
-        if not codeatlas_file.exists():
-            # Try without version
-            codeatlas_file = self.codeatlas_dir / f"{extension_id}.codeatlas.json"
-            if not codeatlas_file.exists():
-                logger.debug(f"Code Atlas file not found for {extension_id}")
-                return None
-
         try:
-            with open(codeatlas_file, "r", encoding="utf-8") as f:
-                codeatlas_data = json.load(f)
-
-            # Cache the loaded data
-            self._cached_codeatlas[extension_id] = codeatlas_data
-            logger.debug(f"Loaded Code Atlas for {extension_id}")
-            return codeatlas_data
-
+            codeatlas_data = self._load_detail(
+                self._codeatlas_records, self.codeatlas_dir, extension_id, version, "codeatlas"
+            )
         except Exception as e:
             logger.error(f"Error loading Code Atlas for {extension_id}: {e}")
             return None
 
+        if codeatlas_data is None:
+            logger.debug(f"Code Atlas file not found for {extension_id}")
+            return None
+
+        # Cache the loaded data
+        self._cached_codeatlas[extension_id] = codeatlas_data
+        logger.debug(f"Loaded Code Atlas for {extension_id}")
+        return codeatlas_data
+
     def load_api_docs(self, extension_id: str) -> Optional[Dict[str, Any]]:
         """Load API documentation for a specific extension.
 
@@ -168,30 +166,46 @@ class KitExtensionsAtlasService:
         if not metadata:
             return None
 
-        # Construct file path
         version = metadata.get("version", "")
-        api_docs_file = self.api_docs_dir / f"{extension_id}-{version}.api_docs.json"
-
-        if not api_docs_file.exists():
-            # Try without version
-            api_docs_file = self.api_docs_dir / f"{extension_id}.api_docs.json"
-            if not api_docs_file.exists():
-                logger.debug(f"API docs file not found for {extension_id}")
-                return None
-
         try:
-            with open(api_docs_file, "r", encoding="utf-8") as f:
-                api_docs_data = json.load(f)
-
-            # Cache the loaded data
-            self._cached_api_docs[extension_id] = api_docs_data
-            logger.debug(f"Loaded API docs for {extension_id}")
-            return api_docs_data
-
+            api_docs_data = self._load_detail(
+                self._api_docs_records, self.api_docs_dir, extension_id, version, "api_docs"
+            )
         except Exception as e:
             logger.error(f"Error loading API docs for {extension_id}: {e}")
             return None
 
+        if api_docs_data is None:
+            logger.debug(f"API docs file not found for {extension_id}")
+            return None
+
+        # Cache the loaded data
+        self._cached_api_docs[extension_id] = api_docs_data
+        logger.debug(f"Loaded API docs for {extension_id}")
+        return api_docs_data
+
+    @staticmethod
+    def _load_detail(
+        records: RecordStore, directory: Path, extension_id: str, version: str, suffix: str
+    ) -> Optional[Dict[str, Any]]:
+        """Load detail data of an extension from the record store of a directory, or from its own file.
+
+        Records and files are named after the extension and its version, or the extension alone.
+        """
+        names = [f"{extension_id}-{version}", extension_id]
+        for name in names:
+            record = records.get(name)
+            if record is not None:
+                return record
+
+        for name in names:
+            detail_file = directory / f"{name}.{suffix}.json"
+            if detail_file.exists():
+                with open(detail_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+
+        return None
+
     def get_modules(self, extension_id: str = None) -> Dict[str, Any]:
         """Get modules information.
 
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reading single records of the compact record stores written by the data collection pipeline."""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+RECORDS_FILE = "records.jsonl"
+RECORDS_INDEX_FILE = "records.index.json"
+
+
+class RecordStore:
+    """Read records of a record store directory by key.
+
+    The index is loaded on first use; every record is read with a seek to its
+    offset and parsed alone.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._index: Optional[Dict[str, list]] = None
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Check if the directory has a record store."""
+        return (self.directory / RECORDS_INDEX_FILE).exists()
+
+    def _load_index(self) -> Dict[str, list]:
+        with self._lock:
+            if self._index is None:
+                try:
+                    with open(self.directory / RECORDS_INDEX_FILE, "r", encoding="utf-8") as f:
+                        self._index = json.load(f)["records"]
+                except FileNotFoundError:
+                    self._index = {}
+                except Exception as e:
+                    logger.error(f"Error loading record index of {self.directory}: {e}")
+                    self._index = {}
+        return self._index
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load_index()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Read the record of a key, None if the store has no record for it."""
+        location = self._load_index().get(key)
+        if location is None:
+            return None
+
+        offset, length = location
+        with open(self.directory / RECORDS_FILE, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
@@ -15,6 +15,7 @@
 
 """Settings service for managing Kit settings data with FAISS search."""
 
+import importlib.util
 import json
 import logging
 import os
@@ -23,17 +24,17 @@ from typing import Any, Dict, List, Optional
 
 from ..config import KIT_VERSION
 from .embedder_service import EmbedderFactory
+from .faiss_index import load_faiss_vectorstore
 
 logger = logging.getLogger(__name__)
 
-# Try to import FAISS (optional dependency)
+# Check for FAISS (optional dependency)
 try:
-    from langchain_community.vectorstores import FAISS  # type: ignore
-
-    FAISS_AVAILABLE = True
-except ImportError:
-    logger.warning("FAISS not available. Settings search will be limited.")
+    FAISS_AVAILABLE = importlib.util.find_spec("langchain_community.vectorstores") is not None
+except ModuleNotFoundError:
     FAISS_AVAILABLE = False
+if not FAISS_AVAILABLE:
+    logger.warning("FAISS not available. Settings search will be limited.")
 
 SETTINGS_DATA_BASE = Path(__file__).parent.parent / "data" / KIT_VERSION / "settings"
 # Get the path to settings FAISS database
@@ -103,9 +104,7 @@ class SettingsService:
             self.embedder = EmbedderFactory.create(model="nvidia/nv-embedqa-e5-v5")
 
             # Load FAISS index
-            self.vectorstore = FAISS.load_local(
-                str(self.faiss_db_path), self.embedder, allow_dangerous_deserialization=True
-            )
+            self.vectorstore = load_faiss_vectorstore(self.faiss_db_path, self.embedder)
 
             logger.info(f"Successfully loaded FAISS index for settings from {self.faiss_db_path}")
 
@@ -0,0 +1,80 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the module functions system message of ModuleFunctionsSystemModifier.
+
+Measures the construction of the modifiers with the signature extraction of
+every instance and with the shared catalog, the catalog stored on disk, and
+the size of the system message with the whole catalog and with the top-k
+functions of a few questions.
+
+Usage:
+    python benchmark_module_function_catalog.py [--module usdcode] [--modifiers 20] [--top-k 10]
+"""
+
+from importlib import import_module
+from lc_agent_interactive.modifiers import module_function_catalog
+from lc_agent_interactive.modifiers.module_function_catalog import get_module_function_catalog
+from lc_agent_interactive.nodes.usd_meta_functions_parser import extract_module_functions
+import argparse
+import tempfile
+import time
+
+QUESTIONS = [
+    "Create a red sphere above the selected prim",
+    "Move the camera to look at the cube",
+    "Add a variant set with two materials",
+    "List the children of /World that are meshes",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="usdcode", help="Helper module to list")
+    parser.add_argument("--modifiers", type=int, default=20, help="Modifiers to construct")
+    parser.add_argument("--top-k", type=int, default=10, help="Functions listed per question")
+    args = parser.parse_args()
+
+    module = import_module(args.module)
+
+    start = time.perf_counter()
+    for _ in range(args.modifiers):
+        full_text = extract_module_functions(module)
+    extract_time = time.perf_counter() - start
+
+    module_function_catalog._catalogs.clear()
+    start = time.perf_counter()
+    for _ in range(args.modifiers):
+        catalog = get_module_function_catalog(args.module)
+    catalog_time = time.perf_counter() - start
+    assert catalog.text == full_text
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        module_function_catalog._catalogs.clear()
+        get_module_function_catalog(args.module, cache_dir)
+        module_function_catalog._catalogs.clear()
+        start = time.perf_counter()
+        get_module_function_catalog(args.module, cache_dir)
+        disk_time = time.perf_counter() - start
+
+    print(f"{args.module}: {len(catalog)} functions, {args.modifiers} modifiers")
+    print(f"{'extract per modifier':>24} {extract_time * 1000:>10.1f} ms")
+    print(f"{'shared catalog':>24} {catalog_time * 1000:>10.1f} ms")
+    print(f"{'catalog from disk':>24} {disk_time * 1000:>10.1f} ms")
+    print(f"{'whole catalog':>24} {len(catalog.text):>10,} chars")
+    for question in QUESTIONS:
+        start = time.perf_counter()
+        text = catalog.select(question, args.top_k)
+        select_time = time.perf_counter() - start
+        print(f"{'top ' + str(args.top_k):>24} {len(text):>10,} chars {select_time * 1000:>8.2f} ms  {question}")
+
+
+if __name__ == "__main__":
+    main()
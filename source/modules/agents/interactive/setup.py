@@ -16,7 +16,7 @@ install_requires = req_file("requirements.txt")
 
 setup(
     name="lc_agent_interactive",
-    version="0.1.1",
+    version="0.1.2",
     author="Omniverse GenAI Team",
     author_email="doyopk-org@exchange.nvidia.com",
     description="Interactive base for module-guided assistants",
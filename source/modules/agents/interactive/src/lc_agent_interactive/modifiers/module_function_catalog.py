@@ -0,0 +1,246 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Process-wide catalog of the public functions of helper modules.
+
+The signatures and docstrings of a module are extracted once per process and
+module version, and optionally stored on disk for the next processes. The
+catalog can also select the functions that match a question with a small
+BM25 index over the function names and docstrings.
+"""
+
+from collections import Counter
+from importlib import import_module
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as distribution_version
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import functools
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import threading
+
+CATALOG_VERSION = 1
+
+# Directory of the catalogs stored on disk when no cache_dir is given
+CACHE_DIR_ENV = "LC_AGENT_MODULE_CATALOG_CACHE"
+
+_TOKEN_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has if in is it of on or that the this to with "
+    "args returns return none optional default str int float bool list dict".split()
+)
+
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+_catalogs: Dict[Tuple[str, str], "ModuleFunctionCatalog"] = {}
+_catalogs_lock = threading.Lock()
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of a text, identifiers are split at underscores and case changes."""
+    tokens = []
+    for token in _TOKEN_RE.findall(text):
+        token = token.lower()
+        if len(token) < 2 or token in _STOP_WORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+@functools.lru_cache(maxsize=None)
+def _distribution_version(top_level: str) -> Optional[str]:
+    try:
+        return distribution_version(top_level)
+    except (PackageNotFoundError, ValueError):
+        return None
+
+
+def module_version(module) -> str:
+    """Version of a module: its distribution version and the modification times of its source files."""
+    version = _distribution_version(module.__name__.split(".")[0]) or str(getattr(module, "__version__", ""))
+
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return version
+
+    module_path = Path(module_file)
+    files = sorted(module_path.parent.rglob("*.py")) if module_path.name == "__init__.py" else [module_path]
+    digest = hashlib.sha256()
+    for file in files:
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        digest.update(f"{file}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode("utf-8"))
+    return f"{version}+{digest.hexdigest()[:16]}"
+
+
+class ModuleFunctionCatalog:
+    """The signatures of the public functions of a module.
+
+    Args:
+        module_name: Name of the module.
+        version: Version of the module the signatures were extracted from.
+        entries: Name and signature with docstring of every function.
+    """
+
+    def __init__(self, module_name: str, version: str, entries: List[Tuple[str, str]]):
+        self.module_name = module_name
+        self.version = version
+        self.entries = entries
+        self.text = "\n\n".join(entry for _, entry in entries).strip()
+
+        self._index_lock = threading.Lock()
+        self._term_frequencies: Optional[List[Counter]] = None
+        self._idf: Dict[str, float] = {}
+        self._lengths: List[int] = []
+        self._average_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _build_index(self):
+        term_frequencies = []
+        document_frequencies = Counter()
+        for name, entry in self.entries:
+            # The name counts twice, it is the best summary of a function
+            frequencies = Counter(tokenize(name) * 2 + tokenize(entry))
+            term_frequencies.append(frequencies)
+            document_frequencies.update(frequencies.keys())
+
+        count = len(term_frequencies)
+        self._idf = {
+            term: math.log(1.0 + (count - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequencies.items()
+        }
+        self._lengths = [sum(frequencies.values()) for frequencies in term_frequencies]
+        self._average_length = (sum(self._lengths) / count) if count else 0.0
+        self._term_frequencies = term_frequencies
+
+    def rank(self, question: str) -> List[float]:
+        """BM25 score of every function for a question."""
+        if self._term_frequencies is None:
+            with self._index_lock:
+                if self._term_frequencies is None:
+                    self._build_index()
+
+        terms = [term for term in set(tokenize(question)) if term in self._idf]
+        scores = []
+        for frequencies, length in zip(self._term_frequencies, self._lengths):
+            score = 0.0
+            normalization = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * length / (self._average_length or 1.0))
+            for term in terms:
+                frequency = frequencies.get(term)
+                if frequency:
+                    score += self._idf[term] * frequency * (_BM25_K1 + 1.0) / (frequency + normalization)
+            scores.append(score)
+        return scores
+
+    def select(self, question: str, top_k: int) -> str:
+        """The signatures of the top_k functions that match the question best, in the order of the module."""
+        if top_k <= 0 or top_k >= len(self.entries):
+            return self.text
+
+        scores = self.rank(question)
+        # Ties keep the order of the module
+        selected = heapq.nlargest(top_k, range(len(scores)), key=lambda index: (scores[index], -index))
+        return "\n\n".join(self.entries[index][1] for index in sorted(selected)).strip()
+
+    def to_dict(self) -> dict:
+        return {
+            "catalog_version": CATALOG_VERSION,
+            "module_name": self.module_name,
+            "version": self.version,
+            "entries": self.entries,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["ModuleFunctionCatalog"]:
+        if data.get("catalog_version") != CATALOG_VERSION:
+            return None
+        return cls(data["module_name"], data["version"], [tuple(entry) for entry in data["entries"]])
+
+
+def _catalog_file(cache_dir: str, module_name: str, version: str) -> Path:
+    key = hashlib.sha256(f"{module_name}\0{version}".encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"{module_name}-{key}.json"
+
+
+def _load_catalog(cache_dir: str, module_name: str, version: str) -> Optional[ModuleFunctionCatalog]:
+    try:
+        with open(_catalog_file(cache_dir, module_name, version), "r") as f:
+            catalog = ModuleFunctionCatalog.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if catalog is None or catalog.module_name != module_name or catalog.version != version:
+        return None
+    return catalog
+
+
+def _store_catalog(cache_dir: str, catalog: ModuleFunctionCatalog):
+    catalog_file = _catalog_file(cache_dir, catalog.module_name, catalog.version)
+    try:
+        catalog_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = catalog_file.with_name(f"{catalog_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(catalog.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_file, catalog_file)
+    except OSError:
+        # The catalog on disk is an optimization only
+        pass
+
+
+def get_module_function_catalog(module_name: str, cache_dir: Optional[str] = None) -> ModuleFunctionCatalog:
+    """The catalog of the public functions of a module.
+
+    The catalog is extracted once per process and module version. With a cache
+    directory, or the directory of the LC_AGENT_MODULE_CATALOG_CACHE environment
+    variable, it is also stored on disk and reused by the next processes.
+
+    Raises:
+        Exception: The errors of importing the module.
+    """
+    # Import here to avoid circular dependency
+    from ..nodes.usd_meta_functions_parser import extract_module_function_entries
+
+    module = import_module(module_name)
+    version = module_version(module)
+    key = (module_name, version)
+
+    catalog = _catalogs.get(key)
+    if catalog is not None:
+        return catalog
+
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is not None:
+            return catalog
+
+        cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+        catalog = _load_catalog(cache_dir, module_name, version) if cache_dir else None
+        if catalog is None:
+            catalog = ModuleFunctionCatalog(module_name, version, extract_module_function_entries(module))
+            if cache_dir:
+                _store_catalog(cache_dir, catalog)
+
+        # Catalogs of the previous versions of the module are not used anymore
+        for previous_key in [previous_key for previous_key in _catalogs if previous_key[0] == module_name]:
+            del _catalogs[previous_key]
+        _catalogs[key] = catalog
+        return catalog
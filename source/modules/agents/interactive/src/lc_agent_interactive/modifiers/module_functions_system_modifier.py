@@ -7,7 +7,6 @@
 ## license agreement from NVIDIA CORPORATION is strictly prohibited.
 ##
 
-from importlib import import_module
 from typing import Any, Callable, Optional
 
 from langchain_core.messages import SystemMessage
@@ -18,6 +17,8 @@ from lc_agent_rag_modifiers import BaseRagModifier
 from lc_agent.utils.pydantic import BaseModel
 from pydantic import Field, model_serializer
 
+from .module_function_catalog import ModuleFunctionCatalog, get_module_function_catalog
+
 
 class ModuleFunctionsAppender(BaseModel, RunnableLambda):
     """
@@ -72,26 +73,37 @@ class ModuleFunctionsSystemModifier(BaseRagModifier):
 
     It reuses the RAG injection lifecycle (leaf-node detection, parent lookup) via BaseRagModifier,
     but does not call any retriever.
+
+    The functions come from the process-wide catalog of the module. With top_k, only the top_k
+    functions that match the question of the node are listed.
     """
 
-    def __init__(self, module_name: str, title: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        module_name: str,
+        title: Optional[str] = None,
+        top_k: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ) -> None:
         super().__init__()
         self._module_name = module_name
         self._title = title or "The following functions are available for you to use in the module: {module}"
+        self._top_k = top_k
+        self._cache_dir = cache_dir
+        self._catalog: Optional[ModuleFunctionCatalog] = None
 
-        # Precompute once to avoid repeated imports/inspection per invoke
+        # The catalog is shared by all the modifiers of the module
         self._content = self._build_content()
 
     def _build_content(self) -> str:
-        # Import here to avoid circular dependency
-        from ..nodes.usd_meta_functions_parser import extract_module_functions
-        
         try:
-            mod = import_module(self._module_name)
+            self._catalog = get_module_function_catalog(self._module_name, self._cache_dir)
         except Exception as e:
             return f"Failed to import module '{self._module_name}': {e}"
 
-        signatures = extract_module_functions(mod)
+        return self._format_content(self._catalog.text)
+
+    def _format_content(self, signatures: str) -> str:
         header = self._title.replace("{module}", self._module_name)
         return f"{header}\n\n{signatures}" if signatures else header
 
@@ -103,7 +115,11 @@ class ModuleFunctionsSystemModifier(BaseRagModifier):
 
         node.metadata[injected_key] = True
 
-        appender = ModuleFunctionsAppender(content=self._content)
+        content = self._content
+        if self._catalog is not None and self._top_k:
+            content = self._format_content(self._catalog.select(question, self._top_k))
+
+        appender = ModuleFunctionsAppender(content=content)
         # Put the module functions system message at the beginning
         node.inputs.insert(0, appender)
 
@@ -57,7 +57,9 @@ class BaseInteractiveNetworkNode(NetworkNode):
             self.add_modifier(SystemMessageModifier(system_message=system_message))
 
         # Add helper-module system message injector (signatures + docstrings)
-        self.add_modifier(ModuleFunctionsSystemModifier(module_name=helper_module))
+        # With module_functions_top_k, only the functions that match the question are listed
+        module_functions_top_k = self.find_metadata("module_functions_top_k")
+        self.add_modifier(ModuleFunctionsSystemModifier(module_name=helper_module, top_k=module_functions_top_k))
 
         # Read optional RAG limits from metadata
         rag_top_k = self.find_metadata("rag_top_k")
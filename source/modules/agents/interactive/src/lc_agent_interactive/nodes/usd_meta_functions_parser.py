@@ -7,7 +7,7 @@
 ## license agreement from NVIDIA CORPORATION is strictly prohibited.
 ##
 
-from typing import Union
+from typing import List, Tuple, Union
 from typing import get_origin, get_args
 import ast
 import inspect
@@ -140,25 +140,17 @@ def format_type_annotation(annotation) -> str:
     return str(annotation)
 
 
-def extract_module_functions(module) -> str:
-    """Extract function signatures from a module object.
+def extract_module_function_entries(module) -> List[Tuple[str, str]]:
+    """Extract the function signatures of a module object one by one.
 
     Args:
         module: A Python module object to extract functions from.
 
     Returns:
-        str: A string containing all function signatures with their docstrings,
-             but without function bodies.
-
-    Example:
-        >>> import usdcode
-        >>> signatures = extract_module_functions(usdcode)
-        >>> print(signatures)
-        def function1(arg1: str, arg2: int) -> None:
-            '''Function docstring'''
-            ...
+        List[Tuple[str, str]]: The name and the signature with its docstring of
+            every public function, in the order of `extract_module_functions`.
     """
-    output = ""
+    entries = []
 
     # Get all module attributes
     for name, obj in inspect.getmembers(module):
@@ -199,12 +191,33 @@ def extract_module_functions(module) -> str:
         func_def = "async def" if is_async else "def"
 
         # Format function definition
-        output += f"{func_def} {name}({', '.join(params)}) -> {return_annotation_str}:\n"
+        entry = f"{func_def} {name}({', '.join(params)}) -> {return_annotation_str}:"
 
         # Add docstring if it exists
         if obj.__doc__:
-            output += f'    """{obj.__doc__}"""\n'
+            entry += f'\n    """{obj.__doc__}"""'
 
-        output += "\n"
+        entries.append((name, entry))
 
-    return output.strip()
+    return entries
+
+
+def extract_module_functions(module) -> str:
+    """Extract function signatures from a module object.
+
+    Args:
+        module: A Python module object to extract functions from.
+
+    Returns:
+        str: A string containing all function signatures with their docstrings,
+             but without function bodies.
+
+    Example:
+        >>> import usdcode
+        >>> signatures = extract_module_functions(usdcode)
+        >>> print(signatures)
+        def function1(arg1: str, arg2: int) -> None:
+            '''Function docstring'''
+            ...
+    """
+    return "\n\n".join(entry for _, entry in extract_module_function_entries(module)).strip()
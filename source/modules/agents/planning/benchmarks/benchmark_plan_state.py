@@ -0,0 +1,162 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the plan parsing and the plan-step lookups of PlanningModifier.
+
+A fake chat model streams a plan of 30 steps into `PlanParser`, which tells
+at which chunk the text is a plan. The streamed text is then parsed with the
+regular expressions PlanningModifier used before, and with `PlanParser` as a
+whole and chunk by chunk. The plan is then executed step by step, and every
+supervisor hook looks up the next pending step with the linear scans used
+before and with `PlanState`.
+
+Usage:
+    python benchmark_plan_state.py [--steps 30] [--hooks 8] [--sessions 200]
+"""
+
+from types import SimpleNamespace
+import lc_agent  # noqa: F401
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from omni_nat_planning.modifiers.plan_state import PlanParser
+from omni_nat_planning.modifiers.planning_modifier import PlanningModifier
+import argparse
+import asyncio
+import re
+import time
+
+
+def make_plan_text(steps: int) -> str:
+    text = "PLAN: Build a warehouse scene with shelves, boxes and lights\n\n"
+    for step in range(1, steps + 1):
+        text += f"Step {step}: Create shelf row {step} along the east wall\n"
+        text += f"- Place shelf row {step} at x={step * 2.5}, z=0 with 4 levels\n"
+        text += "- Use the default metal material for the frame\n"
+        text += "- Verify that the row does not overlap the previous one\n\n"
+    return text.strip()
+
+
+def legacy_parse(content: str):
+    plan_header = re.search(r"PLAN:\s*(.+?)(?:\n|$)", content)
+    if plan_header is None or not re.findall(r"Step \d+:", content):
+        return None
+
+    steps = []
+    for match in re.finditer(r"Step (\d+):\s*(.+?)(?=\nStep \d+:|$)", content, re.DOTALL):
+        step_content = match.group(2).strip()
+        details = [line.strip()[1:].strip() for line in step_content.split("\n") if line.strip().startswith("-")]
+        steps.append(
+            {"step_number": int(match.group(1)), "title": step_content.split("\n")[0].strip(), "details": details}
+        )
+    steps.sort(key=lambda x: x["step_number"])
+    return {"title": plan_header.group(1).strip(), "steps": steps}
+
+
+def legacy_next_pending(plan_status, current_plan):
+    step_number = next((number for number in plan_status.keys() if plan_status[number] == "pending"), None)
+    if step_number is None:
+        return None
+    step = next((step for step in current_plan["steps"] if step["step_number"] == step_number), None)
+    return (step_number, step) if step is not None else None
+
+
+async def stream_plan(text: str):
+    """Stream the plan and return the chunks and the chunk that made the text a plan."""
+    model = GenericFakeChatModel(messages=iter([AIMessage(content=text)]))
+    parser = PlanParser()
+    chunks = []
+    recognized_at = None
+    async for chunk in model.astream("Plan the scene"):
+        chunks.append(chunk.content)
+        if parser.feed(chunk.content) and recognized_at is None:
+            recognized_at = len(chunks)
+    parser.close()
+    return chunks, recognized_at
+
+
+def parse_chunks(chunks):
+    parser = PlanParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def timed(function, *args, repeat: int = 20):
+    """The result and the best time of a call."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def run_sessions(plan, sessions: int, hooks: int, use_state: bool) -> float:
+    modifier = PlanningModifier()
+    elapsed = 0.0
+    for _ in range(sessions):
+        status = {step["step_number"]: "pending" for step in plan["steps"]}
+        network = SimpleNamespace(metadata={"current_plan": plan, "plan_status": status})
+        start = time.perf_counter()
+        while True:
+            for _ in range(hooks - 1):
+                # Hooks of the nodes that do not take a step
+                if use_state:
+                    modifier._get_plan_state(network)
+                else:
+                    modifier._get_plan_metadata(network)
+            if use_state:
+                plan_state = modifier._get_plan_state(network)
+                next_step = plan_state.next_pending()
+                if next_step is None:
+                    break
+                plan_state.set_status(next_step[0], "in_progress")
+            else:
+                plan_status, current_plan = modifier._get_plan_metadata(network)
+                next_step = legacy_next_pending(plan_status, current_plan)
+                if next_step is None:
+                    break
+                plan_status[next_step[0]] = "in_progress"
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=30, help="Steps of the plan")
+    parser.add_argument("--hooks", type=int, default=8, help="Modifier hooks per plan step")
+    parser.add_argument("--sessions", type=int, default=200, help="Plan executions")
+    args = parser.parse_args()
+
+    chunks, recognized_at = asyncio.run(stream_plan(make_plan_text(args.steps)))
+    text = "".join(chunks)
+
+    legacy_plan, legacy_parse_time = timed(legacy_parse, text)
+    plan, parse_time = timed(parse_chunks, [text])
+    streamed_plan, stream_parse_time = timed(parse_chunks, chunks)
+    assert plan == streamed_plan == legacy_plan and len(plan["steps"]) == args.steps
+
+    legacy_time = run_sessions(plan, args.sessions, args.hooks, use_state=False)
+    state_time = run_sessions(plan, args.sessions, args.hooks, use_state=True)
+    lookups = args.sessions * (args.steps + 1)
+
+    print(f"Plan of {args.steps} steps, {len(text):,} characters in {len(chunks):,} chunks")
+    print(f"  recognized as a plan at chunk {recognized_at}")
+    print(f"  regular expressions            {legacy_parse_time * 1e6:>10.1f} us")
+    print(f"  parser, whole text             {parse_time * 1e6:>10.1f} us")
+    print(f"  parser, fed chunk by chunk     {stream_parse_time * 1e6:>10.1f} us")
+    print(f"Next pending step, {args.hooks} hooks per step, {args.sessions} sessions")
+    print(f"  linear scans {legacy_time * 1e6 / lookups:>8.2f} us per step")
+    print(f"  plan state   {state_time * 1e6 / lookups:>8.2f} us per step")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,7 +32,7 @@ install_requires = req_file("requirements.txt")
 
 setup(
     name="omni_nat_planning",
-    version="0.1.4",
+    version="0.1.5",
     author="NVIDIA",
     author_email="doyopk-org@exchange.nvidia.com",
     description="Planning Agent plugin for NAT",
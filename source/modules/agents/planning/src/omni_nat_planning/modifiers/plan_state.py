@@ -0,0 +1,189 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Parsing of the plans of PlanningGenNode and tracking of their execution.
+
+`PlanParser` reads a plan line by line as it is generated and knows whether
+the text is a plan as soon as the title and the first step are read.
+`PlanState` indexes the steps of a plan by number and keeps the position of
+the next pending step, so finding it does not scan the plan.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import re
+
+_STEP_RE = re.compile(r"Step (\d+):")
+
+
+class PlanParser:
+    """Single-pass parser of the plan format of PlanningGenNode.
+
+    The text is fed in chunks of any size. The result is the same as parsing
+    the whole text with the plan regular expressions:
+
+    - The title is the text after the first "PLAN:"
+    - The first step starts at the first "Step <n>:", every next one at a
+      line that starts with "Step <n>:"
+    - The details of a step are its lines that start with "-"
+    """
+
+    def __init__(self):
+        self.title: Optional[str] = None
+        self._title_pending = False
+        self._partial = ""
+        # Step number, raw lines and whether there is text in the lines of every step
+        self._steps: List[list] = []
+
+    @property
+    def is_plan(self) -> bool:
+        """True when the text read so far has a title and a step."""
+        return self.title is not None and bool(self._steps)
+
+    def feed(self, text: str) -> bool:
+        """Read a chunk of the text, returns `is_plan`."""
+        if "\n" not in text:
+            self._partial += text
+            return self.title is not None and bool(self._steps)
+
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._read_line(line, False)
+        return self.is_plan
+
+    def close(self) -> Optional[Dict[str, Any]]:
+        """Read the end of the text, returns the plan or None if the text is not a plan."""
+        self._read_line(self._partial, True)
+        self._partial = ""
+        return self.plan() if self.is_plan else None
+
+    def _read_line(self, line: str, last: bool):
+        if self.title is None:
+            if self._title_pending:
+                if line.strip():
+                    self.title = line.strip()
+            else:
+                position = line.find("PLAN:")
+                if position != -1:
+                    title = line[position + 5 :].strip()
+                    if title:
+                        self.title = title
+                    elif not last:
+                        self._title_pending = True
+
+        steps = self._steps
+        if not steps:
+            match = _STEP_RE.search(line)
+            if match:
+                self._add_step(int(match.group(1)), line[match.end() :])
+            return
+
+        # A step ends at a line that starts with the next step, once the step has text
+        step = steps[-1]
+        match = _STEP_RE.match(line) if step[2] else None
+        if match:
+            self._add_step(int(match.group(1)), line[match.end() :])
+        else:
+            step[1].append(line)
+            step[2] = step[2] or not line.isspace() and bool(line)
+
+    def _add_step(self, step_number: int, text: str):
+        self._steps.append([step_number, [text], bool(text) and not text.isspace()])
+
+    def plan(self) -> Dict[str, Any]:
+        """The plan read so far, see `PlanningModifier._extract_plan` for the format."""
+        steps = []
+        for index, (step_number, lines, _) in enumerate(self._steps):
+            step_content = "\n".join(lines)
+            if index == len(self._steps) - 1:
+                # The text of the whole plan is stripped
+                step_content = step_content.rstrip()
+                if not step_content:
+                    continue
+            step_content = step_content.strip()
+
+            details = []
+            for step_line in step_content.split("\n"):
+                if step_line.strip().startswith("-"):
+                    details.append(step_line.strip()[1:].strip())
+
+            steps.append({"step_number": step_number, "title": step_content.split("\n")[0].strip(), "details": details})
+
+        # Sort steps by step number to ensure proper ordering
+        steps.sort(key=lambda x: x["step_number"])
+
+        return {"title": self.title if self.title is not None else "Untitled Plan", "steps": steps}
+
+
+def parse_plan(content: str) -> Optional[Dict[str, Any]]:
+    """Parse a whole plan text, None if it is not a plan."""
+    parser = PlanParser()
+    parser.feed(content.strip())
+    return parser.close()
+
+
+class PlanState(dict):
+    """Execution state of a plan: the steps by number and the position of the next pending step.
+
+    The state works on the plan and the status dictionaries of the network
+    metadata. The status of a step is changed with `set_status`, which keeps
+    the position of the next pending step. The state is kept in the network
+    metadata and is serialized as a dictionary with the position only; a
+    state restored from metadata is built again from the plan and the status.
+    """
+
+    __slots__ = ("_plan", "_status", "_steps", "_order", "_positions")
+
+    def __init__(self, plan: Dict[str, Any], status: Dict[int, str]):
+        super().__init__(cursor=0)
+        self._plan = plan
+        self._status = status
+        self._steps: Dict[int, Dict[str, Any]] = {}
+        for step in plan["steps"]:
+            # The first step of a number wins, like the linear lookup
+            self._steps.setdefault(step["step_number"], step)
+        self._order: List[int] = list(status)
+        self._positions = {step_number: position for position, step_number in enumerate(self._order)}
+
+    def is_for(self, plan: Dict[str, Any], status: Dict[int, str]) -> bool:
+        """True if the state tracks these plan and status dictionaries."""
+        return self._plan is plan and self._status is status and len(self._order) == len(status)
+
+    def get_step(self, step_number: int) -> Optional[Dict[str, Any]]:
+        return self._steps.get(step_number)
+
+    def next_pending(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """The number and the data of the first pending step, None if there are no pending steps."""
+        order = self._order
+        status = self._status
+        cursor = self["cursor"]
+        while cursor < len(order) and status.get(order[cursor]) != "pending":
+            cursor += 1
+        self["cursor"] = cursor
+
+        if cursor == len(order):
+            return None
+
+        step_number = order[cursor]
+        step = self._steps.get(step_number)
+        if step is None:
+            return None
+        return step_number, step
+
+    def set_status(self, step_number: int, value: str):
+        """Set the status of a step."""
+        self._status[step_number] = value
+        position = self._positions.get(step_number)
+        if position is None:
+            # A step that was not in the status yet
+            self._order.append(step_number)
+            self._positions[step_number] = position = len(self._order) - 1
+        if value == "pending":
+            self["cursor"] = min(self["cursor"], position)
@@ -7,7 +7,6 @@
 ## license agreement from NVIDIA CORPORATION is strictly prohibited.
 ##
 
-import re
 from typing import Any, Dict
 from langchain_core.messages import AIMessage, HumanMessage
 from lc_agent import (
@@ -22,6 +21,8 @@ from lc_agent import (
 from lc_agent.utils.multi_agent_utils import get_routing_tools_info
 from pathlib import Path
 
+from .plan_state import PlanParser, PlanState, parse_plan
+
 
 # Helper function to read markdown files
 def read_md_file(file_path: str):
@@ -194,11 +195,11 @@ class PlanningModifier(NetworkModifier):
             if multi_agent_network_node and not isinstance(multi_agent_network_node, MultiAgentNetworkNode):
                 multi_agent_network_node = None
 
-            # Extract and validate the plan from the node output
-            plan_content = node.outputs.content.strip()
-            if self._is_valid_plan(plan_content):
+            # Extract and validate the plan from the node output in a single pass
+            plan = parse_plan(node.outputs.content)
+            if plan is not None:
                 # Store the extracted plan in multiple places for accessibility
-                self.current_plan = self._extract_plan(plan_content)
+                self.current_plan = plan
                 node.metadata["current_plan"] = self.current_plan
                 network.metadata["current_plan"] = self.current_plan
 
@@ -216,6 +217,7 @@ class PlanningModifier(NetworkModifier):
                     # Initialize plan execution status tracking
                     self.plan_status = {step["step_number"]: "pending" for step in self.current_plan["steps"]}
                     multi_agent_network_node.metadata["plan_status"] = self.plan_status
+                    multi_agent_network_node.metadata["plan_state"] = PlanState(self.current_plan, self.plan_status)
                     
         # ============================================
         # BRANCH 2: Add details to plan steps on request
@@ -236,14 +238,14 @@ class PlanningModifier(NetworkModifier):
                 planning_node_name = network.metadata.get("plan_gen_node", None)
 
                 # Get the current plan and execution status
-                plan_metadata = self._get_plan_metadata(network)
-                if not plan_metadata:
+                plan_state = self._get_plan_state(network)
+                if plan_state is None:
                     return
 
-                plan_status, current_plan = plan_metadata
+                current_plan = network.metadata["current_plan"]
 
                 # Find the next pending step that needs details
-                next_step_info = self._get_next_pending_step(plan_status, current_plan)
+                next_step_info = plan_state.next_pending()
                 if not next_step_info:
                     return
 
@@ -298,14 +300,12 @@ class PlanningModifier(NetworkModifier):
         ):
             # It adds the follow the plan message to the superviser
             # Get the current plan and its execution status
-            plan_metadata = self._get_plan_metadata(network)
-            if not plan_metadata:
+            plan_state = self._get_plan_state(network)
+            if plan_state is None:
                 return
 
-            plan_status, current_plan = plan_metadata
-
             # Find the next pending step to execute
-            next_step_info = self._get_next_pending_step(plan_status, current_plan)
+            next_step_info = plan_state.next_pending()
             if not next_step_info:
                 return
 
@@ -323,7 +323,7 @@ class PlanningModifier(NetworkModifier):
                 node._add_parent(follow_the_plan_node)
 
             # Update the step status to in_progress
-            plan_status[current_step_number] = "in_progress"
+            plan_state.set_status(current_step_number, "in_progress")
             
         # ============================================
         # BRANCH 2: Add tools information to planning node
@@ -361,34 +361,27 @@ class PlanningModifier(NetworkModifier):
 
         return plan_status, current_plan
 
-    def _get_next_pending_step(self, plan_status, current_plan):
+    def _get_plan_state(self, network):
         """
-        Find the next step that needs to be executed.
+        Retrieve the plan state cached in the network metadata.
 
-        Args:
-            plan_status: Dictionary mapping step numbers to their status
-            current_plan: The current execution plan
+        The state is built again when the plan or the status in the metadata
+        were replaced, or were restored from a serialized network.
 
         Returns:
-            tuple: (step_number, step_data) or None if no pending steps
+            PlanState: The plan state or None if there is no plan
         """
-        # Find the first pending step number
-        current_step_number = next(
-            (step_num for step_num in plan_status.keys() if plan_status[step_num] == "pending"), None
-        )
-
-        if current_step_number is None:
+        plan_metadata = self._get_plan_metadata(network)
+        if not plan_metadata:
             return None
 
-        # Find the corresponding step data
-        current_step = next(
-            (step for step in current_plan["steps"] if step["step_number"] == current_step_number), None
-        )
-
-        if current_step is None:
-            return None
+        plan_status, current_plan = plan_metadata
+        plan_state = network.metadata.get("plan_state")
+        if not isinstance(plan_state, PlanState) or not plan_state.is_for(current_plan, plan_status):
+            plan_state = PlanState(current_plan, plan_status)
+            network.metadata["plan_state"] = plan_state
 
-        return current_step_number, current_step
+        return plan_state
 
     def _build_step_instruction_message(self, step_number, step_data):
         """
@@ -426,9 +419,7 @@ class PlanningModifier(NetworkModifier):
             bool: True if content contains a valid plan
         """
         # Check if content contains a plan header and at least one step
-        plan_header = re.search(r"PLAN:\s*(.+?)(?:\n|$)", content)
-        steps = re.findall(r"Step \d+:", content)
-        return plan_header is not None and len(steps) > 0
+        return parse_plan(content) is not None
 
     def _extract_plan(self, content: str) -> Dict[str, Any]:
         """
@@ -451,27 +442,7 @@ class PlanningModifier(NetworkModifier):
                     ]
                 }
         """
-        # Extract plan title
-        plan_title_match = re.search(r"PLAN:\s*(.+?)(?:\n|$)", content)
-        plan_title = plan_title_match.group(1).strip() if plan_title_match else "Untitled Plan"
-
-        # Extract steps
-        steps = []
-        step_matches = re.finditer(r"Step (\d+):\s*(.+?)(?=\nStep \d+:|$)", content, re.DOTALL)
-
-        for match in step_matches:
-            step_number = int(match.group(1))
-            step_content = match.group(2).strip()
-
-            # Extract details from bullet points
-            details = []
-            for line in step_content.split("\n"):
-                if line.strip().startswith("-"):
-                    details.append(line.strip()[1:].strip())
-
-            steps.append({"step_number": step_number, "title": step_content.split("\n")[0].strip(), "details": details})
-
-        # Sort steps by step number to ensure proper ordering
-        steps.sort(key=lambda x: x["step_number"])
-
-        return {"title": plan_title, "steps": steps}
+        parser = PlanParser()
+        parser.feed(content.strip())
+        parser.close()
+        return parser.plan()
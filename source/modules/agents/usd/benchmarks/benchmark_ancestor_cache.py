@@ -0,0 +1,113 @@
+## Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the ancestor metrics used by NetworkLenghtModifier and
+MFRagModifier on a synthetic network.
+
+The network is grown one node at a time and the metrics are queried for
+every new node, the same way the modifiers do it while a conversation grows.
+
+Usage:
+    python benchmark_ancestor_cache.py [--nodes 500]
+"""
+
+from lc_agent import RunnableHumanNode
+from lc_agent import RunnableNetwork
+from lc_agent_usd.modifiers.ancestor_cache import AncestorCache
+from lc_agent_usd.modifiers.network_length_modifier import is_countable
+import argparse
+import sys
+import time
+
+sys.setrecursionlimit(100000)
+
+
+def uncached_max_countable_nodes(network, node):
+    """The recursive walk NetworkLenghtModifier used before the cache."""
+    node_countable_value = 1 if is_countable(network, node) else 0
+    parents = network.get_parents(node)
+    if not parents:
+        return node_countable_value
+
+    max_countable = 0
+    for parent in parents:
+        max_countable = max(max_countable, uncached_max_countable_nodes(network, parent))
+
+    return max_countable + node_countable_value
+
+
+def uncached_metafunctions(network, node):
+    """The recursive walk MFRagModifier used before the cache."""
+    all_metafunctions = []
+    visited = set()
+
+    def collect_from_ancestors(current_node):
+        if current_node in visited:
+            return
+        visited.add(current_node)
+        all_metafunctions.extend(current_node.metadata.get("retreived_metafunctions", []))
+        for parent in network.get_parents(current_node):
+            collect_from_ancestors(parent)
+
+    collect_from_ancestors(node)
+
+    seen = set()
+    result = []
+    for mf in all_metafunctions:
+        key = (mf["class_name"], mf["method_name"])
+        if key not in seen:
+            seen.add(key)
+            result.append(mf)
+    return result
+
+
+def make_node(index):
+    node = RunnableHumanNode(f"message {index}")
+    node.metadata["retreived_metafunctions"] = [
+        {"class_name": f"usdcode.Group{index % 7}", "method_name": f"method_{index % 50}"}
+    ]
+    return node
+
+
+def grow(num_nodes, max_countable, metafunctions):
+    """Grows the network and returns the time spent in the metrics only."""
+    network = RunnableNetwork()
+    results = []
+    elapsed = 0.0
+    for index in range(num_nodes):
+        node = network.add_node(make_node(index))
+        start = time.perf_counter()
+        results.append((max_countable(network, node), len(metafunctions(network, node))))
+        elapsed += time.perf_counter() - start
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=500, help="Number of nodes in the synthetic network")
+    args = parser.parse_args()
+
+    uncached_time, uncached_results = grow(args.nodes, uncached_max_countable_nodes, uncached_metafunctions)
+    cached_time, cached_results = grow(
+        args.nodes,
+        lambda network, node: AncestorCache.get(network).max_countable(node, is_countable),
+        lambda network, node: AncestorCache.get(network).metafunctions(node),
+    )
+
+    assert uncached_results == cached_results
+
+    print(f"Nodes:    {args.nodes}")
+    print(f"Uncached: {uncached_time * 1000:.1f} ms")
+    print(f"Cached:   {cached_time * 1000:.1f} ms")
+    print(f"Speedup:  {uncached_time / cached_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
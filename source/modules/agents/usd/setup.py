@@ -33,7 +33,7 @@ install_requires = req_file("requirements.txt")
 
 setup(
     name="lc_agent_usd",
-    version="0.2.5",
+    version="0.2.7",
     author="Omniverse GenAI Team",
     author_email="doyopk-org@exchange.nvidia.com",
     description="USD Code Agent",
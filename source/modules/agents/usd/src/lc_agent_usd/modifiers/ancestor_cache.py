@@ -0,0 +1,249 @@
+## Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+from lc_agent import RunnableNetwork
+from lc_agent import RunnableNode
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import weakref
+
+METAFUNCTIONS_KEY = "retreived_metafunctions"
+
+
+def _always_countable(network, node):
+    return True
+
+
+def metafunction_key(metafunction: Dict[str, Any]) -> Tuple[Any, Any]:
+    return (metafunction["class_name"], metafunction["method_name"])
+
+
+class _Entry:
+    """Cached aggregate of a node and the state it was computed from."""
+
+    __slots__ = ("node", "parents", "own", "value")
+
+    def __init__(self, node: RunnableNode, parents: List[RunnableNode], own: Any, value: Any):
+        # Keeps the node alive, so its id is not reused by another node
+        self.node = node
+        self.parents = parents
+        self.own = own
+        self.value = value
+
+
+class AncestorCache:
+    """
+    Incremental per-network cache of aggregates over the ancestors of a node.
+
+    Every aggregate of a node is computed from the aggregates of its parents,
+    so extending the network by one node combines O(parents) values instead
+    of the values of the whole history. The entries are dropped when the
+    network reports a graph edit. Each entry also remembers the parents and
+    the own value it was computed from, and a query checks them for all the
+    ancestors of the node, which is cheaper than combining them again. So
+    the nodes reconnected without an event or whose own value changed in
+    place are recomputed with all their descendants.
+
+    Use `AncestorCache.get(network)` to get the cache of the network.
+    """
+
+    _caches: Dict[int, "AncestorCache"] = {}
+
+    @classmethod
+    def get(cls, network: RunnableNetwork) -> "AncestorCache":
+        """Returns the cache of the network, creating it on first use."""
+        cache = cls._caches.get(id(network))
+        if cache is None or cache._network() is not network:
+            cache = cls(network)
+            cls._caches[id(network)] = cache
+            weakref.finalize(network, cls._caches.pop, id(network), None)
+        return cache
+
+    def __init__(self, network: RunnableNetwork):
+        self._network = weakref.ref(network)
+        # Aggregate name -> id of the node -> entry, hashing the nodes is slower
+        self._tables: Dict[Any, Dict[int, _Entry]] = {}
+        network.set_event_fn(self._on_event)
+
+    def invalidate(self):
+        """Drops all the cached aggregates."""
+        self._tables.clear()
+
+    def _on_event(self, event: RunnableNetwork.Event, payload: Dict[str, Any]):
+        if event == RunnableNetwork.Event.NODE_REMOVED:
+            # Children of the removed node are reconnected to its parents
+            self.invalidate()
+        elif event == RunnableNetwork.Event.NODE_ADDED:
+            node = payload.get("node")
+            if any(id(node) in table for table in self._tables.values()):
+                # The node was already in the network and got new parents
+                self.invalidate()
+        elif event in (
+            RunnableNetwork.Event.CONNECTION_ADDED,
+            RunnableNetwork.Event.CONNECTION_REMOVED,
+        ):
+            self.invalidate()
+
+    def _aggregate(
+        self,
+        name: Any,
+        node: RunnableNode,
+        get_own: Callable[[RunnableNode], Any],
+        is_own_valid: Optional[Callable[[Any, RunnableNode], bool]],
+        combine: Callable[[RunnableNode, List[Any]], Any],
+    ) -> Any:
+        """
+        Returns the aggregate `name` of the node.
+
+        When a query replaces an entry, the descendants it visited are
+        recomputed and the entries of the nodes it didn't visit are dropped,
+        so every entry in the table is combined from the current entries of
+        its parents and checking the nodes themselves is enough. The
+        parents are resolved iteratively, so long histories don't hit the
+        recursion limit.
+
+        Args:
+            name: The key of the aggregate table.
+            node: The node to compute the aggregate for.
+            get_own: Returns the value of the node that is remembered to
+                validate the entry.
+            is_own_valid: Checks the remembered value against the node, None
+                when the aggregate doesn't depend on the node.
+            combine: Builds the aggregate of the node from the aggregates of
+                its parents.
+        """
+        table = self._tables.setdefault(name, {})
+        get_entry = table.get
+
+        # Check all the ancestors, the order doesn't matter
+        stale = set()
+        replaced = False
+        visited = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            key = id(current)
+            if key in visited:
+                continue
+            visited.add(key)
+            parents = current.parents
+            entry = get_entry(key)
+            if entry is None:
+                stale.add(key)
+            elif entry.parents != parents or (is_own_valid is not None and not is_own_valid(entry.own, current)):
+                stale.add(key)
+                replaced = True
+            stack.extend(parents)
+
+        if not stale:
+            return table[id(node)].value
+
+        # Without a replaced entry only the new nodes are computed, otherwise
+        # all the visited descendants of the changed nodes
+        region = visited if replaced else stale
+        recomputed = set()
+        done = set()
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            key = id(current)
+            if expanded:
+                done.add(key)
+                parents = current.parents
+                if key in stale or any(id(p) in recomputed for p in parents):
+                    parent_values = [table[id(p)].value for p in parents if id(p) in table]
+                    table[key] = _Entry(current, list(parents), get_own(current), combine(current, parent_values))
+                    recomputed.add(key)
+                continue
+
+            if key in done:
+                continue
+
+            # Marked done before the parents, so a cycle doesn't loop
+            done.add(key)
+            stack.append((current, True))
+            for parent in reversed(current.parents):
+                parent_key = id(parent)
+                if parent_key in region and parent_key not in done:
+                    stack.append((parent, False))
+
+        if replaced:
+            # The entries of the descendants that were not visited are stale
+            for key in [key for key in table if key not in visited]:
+                del table[key]
+
+        return table[id(node)].value
+
+    def max_countable(
+        self,
+        node: RunnableNode,
+        is_countable: Callable[[RunnableNetwork, RunnableNode], bool],
+    ) -> int:
+        """
+        Returns the maximum number of countable nodes on a path from a root to
+        the node, including the node itself.
+        """
+        network = self._network()
+
+        def combine(current, parent_values):
+            own = 1 if is_countable(network, current) else 0
+            return max(parent_values, default=0) + own
+
+        return self._aggregate(
+            ("max_countable", is_countable),
+            node,
+            lambda current: None,
+            None,
+            combine,
+        )
+
+    def depth(self, node: RunnableNode) -> int:
+        """Returns the number of nodes on the longest path from a root to the node."""
+        return self.max_countable(node, _always_countable)
+
+    def metafunctions(self, node: RunnableNode, key: str = METAFUNCTIONS_KEY) -> List[Dict[str, Any]]:
+        """
+        Returns the metafunctions stored in the metadata of the node and its
+        ancestors without duplicates.
+
+        The order is the same as a depth-first walk that starts from the node
+        and visits the parents in order. The returned list is shared with the
+        cache and must not be modified.
+        """
+
+        def get_own(current) -> Tuple[Dict[str, Any], ...]:
+            # A copy, the list can change in place
+            return tuple(current.metadata.get(key) or ())
+
+        def is_own_valid(own, current) -> bool:
+            return own == tuple(current.metadata.get(key) or ())
+
+        def combine(current, parent_values):
+            result = []
+            seen = set()
+            for metafunctions in [current.metadata.get(key) or []] + parent_values:
+                for metafunction in metafunctions:
+                    mf_key = metafunction_key(metafunction)
+                    if mf_key not in seen:
+                        seen.add(mf_key)
+                        result.append(metafunction)
+            return result
+
+        return self._aggregate(("metafunctions", key), node, get_own, is_own_valid, combine)
+
+    def parent_metafunctions(self, node: RunnableNode, key: str = METAFUNCTIONS_KEY) -> List[Dict[str, Any]]:
+        """Same as `metafunctions` but only for the ancestors of the node."""
+        result = []
+        seen = set()
+        for parent in node.parents:
+            for metafunction in self.metafunctions(parent, key):
+                mf_key = metafunction_key(metafunction)
+                if mf_key not in seen:
+                    seen.add(mf_key)
+                    result.append(metafunction)
+        return result
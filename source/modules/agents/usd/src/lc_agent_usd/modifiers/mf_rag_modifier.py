@@ -7,6 +7,7 @@
 ## license agreement from NVIDIA CORPORATION is strictly prohibited.
 ##
 
+from .ancestor_cache import AncestorCache
 from collections import defaultdict
 from lc_agent import RunnableNetwork, RunnableNode
 from lc_agent_rag_modifiers import RetrieverMessage, SystemRagModifier
@@ -153,7 +154,7 @@ class MFRagModifier(SystemRagModifier):
 
     def _inject_rag(self, network: RunnableNetwork, node: RunnableNode, question: str):
         # Collect retreived_metafunctions from parents and their ancestors
-        parent_metafunctions = self._collect_parent_metafunctions(network, node)
+        parent_metafunctions = AncestorCache.get(network).parent_metafunctions(node)
 
         # Combine parent metafunctions (removing duplicates)
         if "retreived_metafunctions" not in node.metadata:
@@ -179,24 +180,8 @@ class MFRagModifier(SystemRagModifier):
         node.inputs.insert(1, retriever_message)
 
     def _collect_parent_metafunctions(self, network: RunnableNetwork, node: RunnableNode):
-        all_metafunctions = []
-        visited = set()
-
-        def collect_from_ancestors(current_node):
-            if current_node in visited:
-                return
-            visited.add(current_node)
-
-            if hasattr(current_node, "metadata") and "retreived_metafunctions" in current_node.metadata:
-                all_metafunctions.extend(current_node.metadata["retreived_metafunctions"])
-
-            parents = network.get_parents(current_node)
-            if parents:
-                for parent in parents:
-                    collect_from_ancestors(parent)
-
-        collect_from_ancestors(node)
-        return all_metafunctions
+        """Returns the metafunctions retrieved by the node and its ancestors."""
+        return list(AncestorCache.get(network).metafunctions(node))
 
     def _combine_metafunctions(self, metafunctions):
         combined = set()
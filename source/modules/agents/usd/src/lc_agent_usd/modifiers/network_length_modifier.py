@@ -8,6 +8,7 @@
 ##
 
 from ..nodes.usd_code_gen_node import USDCodeGenNode
+from .ancestor_cache import AncestorCache
 from langchain_core.messages import AIMessage
 from lc_agent import NetworkModifier
 from lc_agent import NetworkNode
@@ -34,17 +35,11 @@ def is_countable(network, node):
 
 
 def get_max_countable_nodes(network, node):
-    node_countable_value = 1 if is_countable(network, node) else 0
-    parents = network.get_parents(node)
-    if not parents:
-        return node_countable_value
-
-    max_countable = 0
-    for parent in parents:
-        parent_countable = get_max_countable_nodes(network, parent)
-        max_countable = max(max_countable, parent_countable)
-
-    return max_countable + node_countable_value
+    """
+    Returns the maximum number of countable nodes on a path from a root to
+    the node. The counts of the ancestors are cached per network.
+    """
+    return AncestorCache.get(network).max_countable(node, is_countable)
 
 
 class NetworkLenghtModifier(NetworkModifier):
@@ -9,8 +9,15 @@
 
 from .code_patcher_modifier import CodePatcherModifier
 from lc_agent.code_atlas import USDAtlasTool
+from collections import OrderedDict
+from typing import FrozenSet
+from typing import Optional
+from typing import Tuple
 import ast
+import functools
+import hashlib
 import re
+import threading
 import typing
 
 
@@ -47,61 +54,73 @@ def fix_pxr_import(code):
     return result
 
 
-def collect_usd_types():
+@functools.lru_cache(maxsize=1)
+def collect_usd_types() -> FrozenSet[str]:
+    """
+    Returns the names of all USD classes known to the USD atlas.
+
+    Loading the atlas is expensive, so the set is built once per process and
+    shared by every patcher.
+    """
     code_atlas_tool = USDAtlasTool()
 
     # Update class reordering logic
     all_modules = code_atlas_tool.cache._modules
 
-    return set([c.split(".")[-1] for c in all_modules.keys()])
+    return frozenset(c.split(".")[-1] for c in all_modules.keys())
 
 
-def fix_typing_import(code: str) -> str:
-    """Adds imports for used types."""
+TYPING_TYPES = frozenset(t for t in dir(typing) if not t.startswith("__"))
 
-    usd_types = collect_usd_types()
-    typing_types = [t for t in dir(typing) if not t.startswith("__")]
 
-    usd_types_set = set(usd_types)
-    typing_types_set = set(typing_types)
+class _ImportCollector(ast.NodeVisitor):
+    """Collects the USD and typing names used and imported in a module."""
 
-    class ImportCollector(ast.NodeVisitor):
-        def __init__(self):
-            self.usd_imports = set()
-            self.typing_imports = set()
-            self.existing_usd_imports = set()
-            self.existing_typing_imports = set()
+    def __init__(self, usd_types: FrozenSet[str], typing_types: FrozenSet[str]):
+        self.usd_types = usd_types
+        self.typing_types = typing_types
+        self.usd_imports = set()
+        self.typing_imports = set()
+        self.existing_usd_imports = set()
+        self.existing_typing_imports = set()
 
-        def visit_Name(self, node):
-            if node.id in usd_types_set:
-                self.usd_imports.add(node.id)
-            elif node.id in typing_types_set:
-                self.typing_imports.add(node.id)
-            self.generic_visit(node)
+    def visit_Name(self, node):
+        if node.id in self.usd_types:
+            self.usd_imports.add(node.id)
+        elif node.id in self.typing_types:
+            self.typing_imports.add(node.id)
 
-        def visit_Attribute(self, node):
-            if isinstance(node.value, ast.Attribute):
-                self.visit_Attribute(node.value)
-            elif isinstance(node.value, ast.Name) and node.value.id in usd_types_set:
-                if f"{node.value.id}.{node.attr}" in usd_types_set:
+    def visit_Attribute(self, node):
+        # Nested attributes are reached through generic_visit
+        if isinstance(node.value, ast.Name):
+            if node.value.id in self.usd_types:
+                if f"{node.value.id}.{node.attr}" in self.usd_types:
                     self.usd_imports.add(f"{node.value.id}.{node.attr}")
                 else:
                     self.usd_imports.add(node.value.id)
-            elif isinstance(node.value, ast.Name) and node.value.id in typing_types_set:
+            elif node.value.id in self.typing_types:
                 self.typing_imports.add(node.value.id)
-            self.generic_visit(node)
-
-        def visit_ImportFrom(self, node):
-            if node.module == "pxr":
-                for alias in node.names:
-                    self.existing_usd_imports.add(alias.name)
-            elif node.module == "typing":
-                for alias in node.names:
-                    self.existing_typing_imports.add(alias.name)
-            self.generic_visit(node)
-
-    tree = ast.parse(code)
-    collector = ImportCollector()
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node):
+        if node.module == "pxr":
+            for alias in node.names:
+                self.existing_usd_imports.add(alias.name)
+        elif node.module == "typing":
+            for alias in node.names:
+                self.existing_typing_imports.add(alias.name)
+
+
+def fix_typing_import(code: str, tree: Optional[ast.AST] = None) -> str:
+    """
+    Adds imports for used types.
+
+    `tree` is the already parsed `code`. It's parsed here when not given.
+    """
+    if tree is None:
+        tree = ast.parse(code)
+
+    collector = _ImportCollector(collect_usd_types(), TYPING_TYPES)
     collector.visit(tree)
 
     # Filter out already imported types
@@ -121,15 +140,51 @@ def fix_typing_import(code: str) -> str:
     return "\n".join(import_lines) + code
 
 
+# The same code is usually patched several times per turn, so the patched
+# result is cached by the hash of the input code.
+_PATCH_CACHE_SIZE = 256
+_patch_cache: "OrderedDict[Tuple[type, str], str]" = OrderedDict()
+_patch_cache_lock = threading.Lock()
+
+
+def _code_hash(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+def clear_patch_cache():
+    """Drops all the cached patch results."""
+    with _patch_cache_lock:
+        _patch_cache.clear()
+
+
 class USDCodeGenPatcherModifier(CodePatcherModifier):
     def _patch_code(self, code):
         """Patches the given code snippet."""
+        key = (type(self), _code_hash(code))
+        with _patch_cache_lock:
+            patched = _patch_cache.get(key)
+            if patched is not None:
+                _patch_cache.move_to_end(key)
+                return patched
+
+        patched = self._apply_fixers(code)
+
+        with _patch_cache_lock:
+            _patch_cache[key] = patched
+            while len(_patch_cache) > _PATCH_CACHE_SIZE:
+                _patch_cache.popitem(last=False)
+
+        return patched
+
+    def _apply_fixers(self, code):
+        """Runs the text fixers, then parses the code once for the AST fixers."""
         code = super()._patch_code(code)
         code = fix_pxr_import(code)
 
         # this can fail on wrongly formatted code
         try:
-            code = fix_typing_import(code)
+            tree = ast.parse(code)
+            code = fix_typing_import(code, tree)
         except Exception as e:
             print("Failed to fix typing imports:", e)
 
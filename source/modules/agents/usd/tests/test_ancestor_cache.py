@@ -0,0 +1,160 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+from lc_agent import RunnableHumanNode
+from lc_agent import RunnableNetwork
+from lc_agent_usd.modifiers.ancestor_cache import METAFUNCTIONS_KEY
+from lc_agent_usd.modifiers.ancestor_cache import AncestorCache
+from lc_agent_usd.modifiers.ancestor_cache import metafunction_key
+import pytest
+
+
+def walk_metafunctions(network, node):
+    """The recursive walk MFRagModifier used before the cache."""
+    all_metafunctions = []
+    visited = set()
+
+    def collect_from_ancestors(current_node):
+        if current_node in visited:
+            return
+        visited.add(current_node)
+        all_metafunctions.extend(current_node.metadata.get(METAFUNCTIONS_KEY, []))
+        for parent in network.get_parents(current_node):
+            collect_from_ancestors(parent)
+
+    collect_from_ancestors(node)
+
+    seen = set()
+    result = []
+    for mf in all_metafunctions:
+        if metafunction_key(mf) not in seen:
+            seen.add(metafunction_key(mf))
+            result.append(mf)
+    return result
+
+
+def walk_parent_metafunctions(network, node):
+    result = []
+    seen = set()
+    for parent in network.get_parents(node):
+        for mf in walk_metafunctions(network, parent):
+            if metafunction_key(mf) not in seen:
+                seen.add(metafunction_key(mf))
+                result.append(mf)
+    return result
+
+
+def walk_depth(network, node):
+    return 1 + max((walk_depth(network, parent) for parent in network.get_parents(node)), default=0)
+
+
+def metafunction(class_name, method_name):
+    return {"class_name": class_name, "method_name": method_name}
+
+
+def make_node(index):
+    node = RunnableHumanNode(f"message {index}")
+    node.metadata[METAFUNCTIONS_KEY] = [metafunction(f"usdcode.Group{index}", "method")]
+    return node
+
+
+@pytest.fixture
+def network():
+    # root -> a -> b -> leaf, and root -> c -> leaf
+    network = RunnableNetwork()
+    root = network.add_node(make_node(0))
+    a = network.add_node(make_node(1), parent=root)
+    b = network.add_node(make_node(2), parent=a)
+    c = network.add_node(make_node(3), parent=root)
+    network.add_node(make_node(4), parent=[b, c])
+    return network
+
+
+def assert_matches_walk(network):
+    cache = AncestorCache.get(network)
+    for node in network.nodes:
+        assert cache.metafunctions(node) == walk_metafunctions(network, node)
+        assert cache.parent_metafunctions(node) == walk_parent_metafunctions(network, node)
+        assert cache.depth(node) == walk_depth(network, node)
+
+
+def test_matches_walk(network):
+    assert_matches_walk(network)
+    assert [len(AncestorCache.get(network).metafunctions(node)) for node in network.nodes] == [1, 2, 3, 2, 5]
+
+
+def test_ancestor_metadata_changed_in_place(network):
+    root, a, b, c, leaf = network.nodes
+    assert_matches_walk(network)
+
+    # Appended to the list of an ancestor
+    root.metadata[METAFUNCTIONS_KEY].append(metafunction("usdcode.Root", "appended"))
+    assert_matches_walk(network)
+
+    # Replaced with a list of the same length
+    a.metadata[METAFUNCTIONS_KEY] = [metafunction("usdcode.A", "replaced")]
+    assert_matches_walk(network)
+
+    # Same length, changed in place
+    root.metadata[METAFUNCTIONS_KEY][0] = metafunction("usdcode.Root", "changed")
+    assert_matches_walk(network)
+    b.metadata[METAFUNCTIONS_KEY][:] = [metafunction("usdcode.Group1", "method")]
+    assert_matches_walk(network)
+
+    # Removed
+    del c.metadata[METAFUNCTIONS_KEY]
+    assert_matches_walk(network)
+    assert metafunction("usdcode.A", "replaced") in AncestorCache.get(network).metafunctions(leaf)
+
+
+def test_descendants_of_changed_node(network):
+    root, a, b, c, leaf = network.nodes
+    cache = AncestorCache.get(network)
+    assert_matches_walk(network)
+
+    # Only a branch is queried after the change, the other descendants too
+    root.metadata[METAFUNCTIONS_KEY][0] = metafunction("usdcode.Root", "changed")
+    assert cache.metafunctions(b) == walk_metafunctions(network, b)
+    assert cache.metafunctions(leaf) == walk_metafunctions(network, leaf)
+    assert cache.parent_metafunctions(c) == [metafunction("usdcode.Root", "changed")]
+
+    b._clear_parents()
+    assert cache.depth(b) == 1
+    assert cache.depth(leaf) == 3
+    assert_matches_walk(network)
+
+
+def test_parents_changed(network):
+    root, a, b, c, leaf = network.nodes
+    assert_matches_walk(network)
+
+    # Reconnected without an event
+    b._clear_parents()
+    b._add_parent(c)
+    assert_matches_walk(network)
+
+    # Reconnected by the network
+    network.remove_node(c)
+    assert_matches_walk(network)
+    network.add_node(make_node(5), parent=leaf)
+    assert_matches_walk(network)
+
+
+def test_long_history():
+    network = RunnableNetwork()
+    for index in range(3000):
+        network.add_node(make_node(index % 100))
+    first, last = network.nodes[0], network.nodes[-1]
+
+    cache = AncestorCache.get(network)
+    assert cache.depth(last) == 3000
+    assert len(cache.metafunctions(last)) == 100
+
+    first.metadata[METAFUNCTIONS_KEY][0] = metafunction("usdcode.First", "changed")
+    assert cache.metafunctions(last)[-1] == metafunction("usdcode.First", "changed")
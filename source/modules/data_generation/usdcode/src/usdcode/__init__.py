@@ -10,26 +10,27 @@
 import importlib
 import os
 
-from .usd_meta_functions_get import *
-from .usd_meta_functions_set import *
-
-from .metafunction_modules import MFAr
-from .metafunction_modules import MFGf
-from .metafunction_modules import MFKind
-from .metafunction_modules import MFNdr
-from .metafunction_modules import MFPcp
-from .metafunction_modules import MFPlug
-from .metafunction_modules import MFSdf
-from .metafunction_modules import MFSdr
-from .metafunction_modules import MFTf
-from .metafunction_modules import MFTrace
-from .metafunction_modules import MFUsd
-from .metafunction_modules import MFUsdGeom
-from .metafunction_modules import MFUsdLux
-from .metafunction_modules import MFUsdPhysics
-from .metafunction_modules import MFUsdShade
-from .metafunction_modules import MFUsdSkel
-from .metafunction_modules import MFUsdUtils
-from .metafunction_modules import MFVt
-
+from ._lazy_map import LAZY_MAP
 from .setup import add_functions_from_file
+
+# The metafunctions are imported when they are accessed for the first time
+# (PEP 562), so `usdcode.MFGf.some_function` imports only MFGf. The map is
+# generated with `python -m usdcode.generate_lazy_map`.
+
+
+def __getattr__(name):
+    entry = LAZY_MAP.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = entry
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+
+    # Cache it in the namespace so __getattr__ is not called for it again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_MAP))
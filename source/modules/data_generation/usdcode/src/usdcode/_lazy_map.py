@@ -0,0 +1,130 @@
+## Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+# Generated by `python -m usdcode.generate_lazy_map`. Don't edit.
+#
+# Name in the usdcode namespace -> (module relative to usdcode, attribute of
+# the module or None when the name is the module itself).
+LAZY_MAP = {
+    "Any": (".usd_meta_functions_set", "Any"),
+    "Callable": (".usd_meta_functions_set", "Callable"),
+    "Dict": (".usd_meta_functions_set", "Dict"),
+    "Gf": (".usd_meta_functions_set", "Gf"),
+    "List": (".usd_meta_functions_set", "List"),
+    "MFAr": (".metafunction_modules.MFAr", None),
+    "MFGf": (".metafunction_modules.MFGf", None),
+    "MFKind": (".metafunction_modules.MFKind", None),
+    "MFNdr": (".metafunction_modules.MFNdr", None),
+    "MFPcp": (".metafunction_modules.MFPcp", None),
+    "MFPlug": (".metafunction_modules.MFPlug", None),
+    "MFSdf": (".metafunction_modules.MFSdf", None),
+    "MFSdr": (".metafunction_modules.MFSdr", None),
+    "MFTf": (".metafunction_modules.MFTf", None),
+    "MFTrace": (".metafunction_modules.MFTrace", None),
+    "MFUsd": (".metafunction_modules.MFUsd", None),
+    "MFUsdGeom": (".metafunction_modules.MFUsdGeom", None),
+    "MFUsdLux": (".metafunction_modules.MFUsdLux", None),
+    "MFUsdPhysics": (".metafunction_modules.MFUsdPhysics", None),
+    "MFUsdShade": (".metafunction_modules.MFUsdShade", None),
+    "MFUsdSkel": (".metafunction_modules.MFUsdSkel", None),
+    "MFUsdUtils": (".metafunction_modules.MFUsdUtils", None),
+    "MFVt": (".metafunction_modules.MFVt", None),
+    "Optional": (".usd_meta_functions_set", "Optional"),
+    "Sdf": (".usd_meta_functions_set", "Sdf"),
+    "Tuple": (".usd_meta_functions_set", "Tuple"),
+    "Union": (".usd_meta_functions_set", "Union"),
+    "Usd": (".usd_meta_functions_set", "Usd"),
+    "UsdGeom": (".usd_meta_functions_set", "UsdGeom"),
+    "UsdLux": (".usd_meta_functions_set", "UsdLux"),
+    "UsdShade": (".usd_meta_functions_set", "UsdShade"),
+    "Vt": (".usd_meta_functions_set", "Vt"),
+    "add_attr_variants": (".usd_meta_functions_set", "add_attr_variants"),
+    "add_geo_variants": (".usd_meta_functions_set", "add_geo_variants"),
+    "add_orient_op": (".usd_meta_functions_set", "add_orient_op"),
+    "add_reference": (".usd_meta_functions_set", "add_reference"),
+    "add_rel_variants": (".usd_meta_functions_set", "add_rel_variants"),
+    "add_rotate_xyz_op": (".usd_meta_functions_set", "add_rotate_xyz_op"),
+    "add_scale_op": (".usd_meta_functions_set", "add_scale_op"),
+    "add_translate_op": (".usd_meta_functions_set", "add_translate_op"),
+    "align_objects": (".usd_meta_functions_set", "align_objects"),
+    "asin": (".usd_meta_functions_set", "asin"),
+    "assign_material": (".usd_meta_functions_set", "assign_material"),
+    "atan2": (".usd_meta_functions_set", "atan2"),
+    "bisect": (".usd_meta_functions_set", "bisect"),
+    "ceil": (".usd_meta_functions_set", "ceil"),
+    "change_property": (".usd_meta_functions_set", "change_property"),
+    "clear_variant_selection": (".usd_meta_functions_set", "clear_variant_selection"),
+    "construct_parallel_arrays": (".usd_meta_functions_set", "construct_parallel_arrays"),
+    "construct_room": (".usd_meta_functions_set", "construct_room"),
+    "copy_prim": (".usd_meta_functions_set", "copy_prim"),
+    "cos": (".usd_meta_functions_set", "cos"),
+    "create_light": (".usd_meta_functions_set", "create_light"),
+    "create_material": (".usd_meta_functions_set", "create_material"),
+    "create_payload": (".usd_meta_functions_set", "create_payload"),
+    "create_prim": (".usd_meta_functions_set", "create_prim"),
+    "create_reference": (".usd_meta_functions_set", "create_reference"),
+    "create_usd_attribute": (".usd_meta_functions_set", "create_usd_attribute"),
+    "degrees": (".usd_meta_functions_set", "degrees"),
+    "delete_variant_set": (".usd_meta_functions_set", "delete_variant_set"),
+    "filter_valid_and_visible": (".usd_meta_functions_set", "filter_valid_and_visible"),
+    "find_attributes_in_prim": (".usd_meta_functions_set", "find_attributes_in_prim"),
+    "get_assigned_material": (".usd_meta_functions_set", "get_assigned_material"),
+    "get_bbox_local": (".usd_meta_functions_set", "get_bbox_local"),
+    "get_bbox_world": (".usd_meta_functions_set", "get_bbox_world"),
+    "get_camera_direction_backward": (".usd_meta_functions_set", "get_camera_direction_backward"),
+    "get_camera_direction_down": (".usd_meta_functions_set", "get_camera_direction_down"),
+    "get_camera_direction_forward": (".usd_meta_functions_set", "get_camera_direction_forward"),
+    "get_camera_direction_left": (".usd_meta_functions_set", "get_camera_direction_left"),
+    "get_camera_direction_right": (".usd_meta_functions_set", "get_camera_direction_right"),
+    "get_camera_direction_up": (".usd_meta_functions_set", "get_camera_direction_up"),
+    "get_camera_directions": (".usd_meta_functions_set", "get_camera_directions"),
+    "get_current_camera_path": (".usd_meta_functions_set", "get_current_camera_path"),
+    "get_current_variant_selection": (".usd_meta_functions_set", "get_current_variant_selection"),
+    "get_direction_down": (".usd_meta_functions_set", "get_direction_down"),
+    "get_direction_up": (".usd_meta_functions_set", "get_direction_up"),
+    "get_next_free_path": (".usd_meta_functions_set", "get_next_free_path"),
+    "get_prim_annotation": (".usd_meta_functions_set", "get_prim_annotation"),
+    "get_prim_color": (".usd_meta_functions_set", "get_prim_color"),
+    "get_rotate": (".usd_meta_functions_set", "get_rotate"),
+    "get_scale": (".usd_meta_functions_set", "get_scale"),
+    "get_selection": (".usd_meta_functions_set", "get_selection"),
+    "get_translate": (".usd_meta_functions_set", "get_translate"),
+    "get_variant_sets": (".usd_meta_functions_set", "get_variant_sets"),
+    "get_vec3_type_for_presision": (".usd_meta_functions_set", "get_vec3_type_for_presision"),
+    "get_visible_prim_attributes_by_name": (".usd_meta_functions_set", "get_visible_prim_attributes_by_name"),
+    "get_visible_prim_attributes_by_type": (".usd_meta_functions_set", "get_visible_prim_attributes_by_type"),
+    "is_prim_within_vertical_zone": (".usd_meta_functions_set", "is_prim_within_vertical_zone"),
+    "list_prims_within_vertical_zone": (".usd_meta_functions_set", "list_prims_within_vertical_zone"),
+    "list_variants": (".usd_meta_functions_set", "list_variants"),
+    "math": (".usd_meta_functions_set", "math"),
+    "metafunction_modules": (".metafunction_modules", None),
+    "pi": (".usd_meta_functions_set", "pi"),
+    "random": (".usd_meta_functions_set", "random"),
+    "re": (".usd_meta_functions_set", "re"),
+    "remove_prim": (".usd_meta_functions_set", "remove_prim"),
+    "remove_variant": (".usd_meta_functions_set", "remove_variant"),
+    "rotate_around_axis": (".usd_meta_functions_set", "rotate_around_axis"),
+    "scatter_prims": (".usd_meta_functions_set", "scatter_prims"),
+    "search_prims_by_annotation": (".usd_meta_functions_set", "search_prims_by_annotation"),
+    "search_prims_by_name": (".usd_meta_functions_set", "search_prims_by_name"),
+    "search_prims_by_type": (".usd_meta_functions_set", "search_prims_by_type"),
+    "search_visible_prims_by_annotation": (".usd_meta_functions_set", "search_visible_prims_by_annotation"),
+    "search_visible_prims_by_name": (".usd_meta_functions_set", "search_visible_prims_by_name"),
+    "search_visible_prims_by_type": (".usd_meta_functions_set", "search_visible_prims_by_type"),
+    "select_variant": (".usd_meta_functions_set", "select_variant"),
+    "set_rotate": (".usd_meta_functions_set", "set_rotate"),
+    "set_scale": (".usd_meta_functions_set", "set_scale"),
+    "set_selection": (".usd_meta_functions_set", "set_selection"),
+    "set_translate": (".usd_meta_functions_set", "set_translate"),
+    "sin": (".usd_meta_functions_set", "sin"),
+    "sqrt": (".usd_meta_functions_set", "sqrt"),
+    "stack_objects": (".usd_meta_functions_set", "stack_objects"),
+    "usd_meta_functions_get": (".usd_meta_functions_get", None),
+    "usd_meta_functions_set": (".usd_meta_functions_set", None),
+}
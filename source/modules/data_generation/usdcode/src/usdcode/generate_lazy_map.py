@@ -0,0 +1,102 @@
+## Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Generates `_lazy_map.py`, the map of the names of the usdcode namespace to the
+modules that define them.
+
+Run it after adding or removing metafunctions:
+
+    python -m usdcode.generate_lazy_map
+"""
+
+from typing import Dict, Optional, Tuple
+import importlib
+import os
+
+# Modules whose public names are exported from usdcode. If a name is defined
+# in several modules, the last one wins, the same way as with star imports.
+STAR_MODULES = [
+    ".usd_meta_functions_get",
+    ".usd_meta_functions_set",
+]
+
+# Submodules that are exported from usdcode by their name
+SUBMODULES = [
+    ".metafunction_modules.MFAr",
+    ".metafunction_modules.MFGf",
+    ".metafunction_modules.MFKind",
+    ".metafunction_modules.MFNdr",
+    ".metafunction_modules.MFPcp",
+    ".metafunction_modules.MFPlug",
+    ".metafunction_modules.MFSdf",
+    ".metafunction_modules.MFSdr",
+    ".metafunction_modules.MFTf",
+    ".metafunction_modules.MFTrace",
+    ".metafunction_modules.MFUsd",
+    ".metafunction_modules.MFUsdGeom",
+    ".metafunction_modules.MFUsdLux",
+    ".metafunction_modules.MFUsdPhysics",
+    ".metafunction_modules.MFUsdShade",
+    ".metafunction_modules.MFUsdSkel",
+    ".metafunction_modules.MFUsdUtils",
+    ".metafunction_modules.MFVt",
+]
+
+HEADER = """## Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+# Generated by `python -m usdcode.generate_lazy_map`. Don't edit.
+#
+# Name in the usdcode namespace -> (module relative to usdcode, attribute of
+# the module or None when the name is the module itself).
+"""
+
+
+def collect_lazy_map(package: str = "usdcode") -> Dict[str, Tuple[str, Optional[str]]]:
+    """Imports all the modules and returns the map of their exported names."""
+    lazy_map = {}
+
+    # Importing a submodule binds it in the parent package
+    for module_name in [".metafunction_modules"] + STAR_MODULES:
+        lazy_map[module_name.rsplit(".", 1)[-1]] = (module_name, None)
+
+    for module_name in STAR_MODULES:
+        module = importlib.import_module(module_name, package)
+        for name in dir(module):
+            # The names a star import without __all__ brings
+            if not name.startswith("_"):
+                lazy_map[name] = (module_name, name)
+
+    for module_name in SUBMODULES:
+        lazy_map[module_name.rsplit(".", 1)[-1]] = (module_name, None)
+
+    return dict(sorted(lazy_map.items()))
+
+
+def main():
+    lazy_map = collect_lazy_map()
+    path = os.path.join(os.path.dirname(__file__), "_lazy_map.py")
+    with open(path, "w") as f:
+        f.write(HEADER)
+        f.write("LAZY_MAP = {\n")
+        for name, (module_name, attribute) in lazy_map.items():
+            f.write(f"    {name!r}: ({module_name!r}, {attribute!r}),\n".replace("'", '"'))
+        f.write("}\n")
+    print(f"Wrote {len(lazy_map)} names to {path}")
+
+
+if __name__ == "__main__":
+    main()
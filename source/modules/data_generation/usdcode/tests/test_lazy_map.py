@@ -0,0 +1,60 @@
+## Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+import subprocess
+import sys
+import types
+
+import pytest
+import usdcode
+from usdcode._lazy_map import LAZY_MAP
+from usdcode.generate_lazy_map import collect_lazy_map
+
+
+def test_lazy_map_is_up_to_date():
+    # Fails when metafunctions were added or removed without running
+    # `python -m usdcode.generate_lazy_map`
+    assert LAZY_MAP == collect_lazy_map()
+
+
+@pytest.mark.parametrize("name", sorted(LAZY_MAP))
+def test_lazy_map_entry_resolves(name):
+    module_name, attribute = LAZY_MAP[name]
+    value = getattr(usdcode, name)
+
+    if attribute is None:
+        assert isinstance(value, types.ModuleType)
+        assert value.__name__ == "usdcode" + module_name
+    else:
+        assert value is getattr(sys.modules["usdcode" + module_name], attribute)
+
+
+def test_dir_lists_lazy_names():
+    names = dir(usdcode)
+
+    assert set(LAZY_MAP) <= set(names)
+    assert "add_functions_from_file" in names
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        usdcode.this_function_does_not_exist
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, usdcode\n"
+        "assert not [m for m in sys.modules if m.startswith('usdcode.metafunction_modules.')]\n"
+        "usdcode.MFKind.get_prim_kinds\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('usdcode.metafunction_modules.'))\n"
+        "assert loaded == ['usdcode.metafunction_modules.MFKind'], loaded\n"
+        "assert 'usdcode.usd_meta_functions_set' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
@@ -0,0 +1,138 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of `CodeAtlasCache.scan` with the serial parser, the process pool
+and the per-file parse cache.
+
+Generates a synthetic extension tree, scans it serially, with a `ModuleParser`
+on a cold cache and again on the warm cache, and checks that every scan saves
+the same code atlas.
+
+Usage:
+    python benchmark_codeatlas_scan.py --modules 4000 --workers 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from lc_agent.code_atlas import CodeAtlasCache, ModuleParser
+
+MODULE_TEMPLATE = '''"""Synthetic module {index}."""
+
+from .module_{previous} import Class{previous}
+
+
+class Class{index}(Class{previous}):
+    """Class {index}."""
+
+    scale = {index}
+
+    def __init__(self, name: str, size: int = 3):
+        super().__init__(name)
+        self.name = name
+        self.size = size
+
+{methods}
+
+def make_{index}(name: str) -> Class{index}:
+    """Creates Class{index}."""
+    return Class{index}(name)
+'''
+
+METHOD_TEMPLATE = '''    def method_{index}_{method}(self, values, threshold: float = 0.5):
+        """Method {method} of class {index}."""
+        result = []
+        for value in values:
+            if value > threshold:
+                result.append(value * self.scale)
+            elif value < -threshold:
+                result.append(-value)
+            else:
+                try:
+                    result.append(self.size / value)
+                except ZeroDivisionError:
+                    continue
+        return result
+'''
+
+
+def build_tree(root: Path, num_modules: int, modules_per_package: int = 100, methods: int = 8):
+    """Writes an extension with `num_modules` modules spread over packages."""
+    extension = root / "omni.synthetic.ext-1.0.0"
+    (extension / "config").mkdir(parents=True)
+    (extension / "config" / "extension.toml").write_text('[[python.module]]\nname = "omni.synthetic.ext"\n')
+
+    package_root = extension / "omni" / "synthetic" / "ext"
+    package_root.mkdir(parents=True)
+    (extension / "omni" / "__init__.py").write_text("")
+    (extension / "omni" / "synthetic" / "__init__.py").write_text("")
+
+    num_packages = (num_modules + modules_per_package - 1) // modules_per_package
+    (package_root / "__init__.py").write_text(
+        "".join(f"from .package_{p}.module_{p * modules_per_package} import *\n" for p in range(num_packages))
+    )
+
+    for index in range(num_modules):
+        package = package_root / f"package_{index // modules_per_package}"
+        if index % modules_per_package == 0:
+            package.mkdir()
+            (package / "__init__.py").write_text("")
+            (package / "module_base.py").write_text("class Classbase:\n    def __init__(self, name):\n        pass\n")
+        previous = index - 1 if index % modules_per_package else "base"
+        body = "\n".join(METHOD_TEMPLATE.format(index=index, method=m) for m in range(methods))
+        (package / f"module_{index}.py").write_text(MODULE_TEMPLATE.format(index=index, previous=previous, methods=body))
+
+    return extension
+
+
+def scan(extension: Path, output: Path, parser=None) -> float:
+    start = time.perf_counter()
+    cache = CodeAtlasCache()
+    cache.scan(str(extension), parser=parser)
+    elapsed = time.perf_counter() - start
+    cache.save(str(output))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=int, default=4000, help="Number of synthetic modules")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of parser processes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        extension = build_tree(tmp / "exts", args.modules)
+        cache_dir = tmp / "parse_cache"
+
+        serial = scan(extension, tmp / "serial.json")
+        with ModuleParser(max_workers=args.workers) as module_parser:
+            pool = scan(extension, tmp / "pool.json", module_parser)
+        with ModuleParser(cache_dir=str(cache_dir), max_workers=args.workers) as module_parser:
+            cold = scan(extension, tmp / "cold.json", module_parser)
+        with ModuleParser(cache_dir=str(cache_dir), max_workers=args.workers) as module_parser:
+            warm = scan(extension, tmp / "warm.json", module_parser)
+
+        expected = (tmp / "serial.json").read_bytes()
+        identical = all((tmp / f"{name}.json").read_bytes() == expected for name in ["pool", "cold", "warm"])
+
+        print(f"Modules: {args.modules}, workers: {args.workers}")
+        print(f"  serial:             {serial:7.2f} s")
+        print(f"  process pool:       {pool:7.2f} s")
+        print(f"  pool + cold cache:  {cold:7.2f} s")
+        print(f"  warm cache:         {warm:7.2f} s")
+        print(f"  identical output:   {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the metadata queries of `NetworkList` with stored conversations.
+
+Fills a network list with conversations of a few nodes, some of them
+bookmarked, and compares the queries of the history panel with a scan of all
+the networks and nodes: the networks by metadata and by uuid, the bookmarked
+nodes and the latest conversations by timestamp.
+
+Usage:
+    python benchmark_network_list_index.py --conversations 10000 --nodes 6
+"""
+
+import argparse
+import random
+import time
+
+from lc_agent import RunnableNetwork, RunnableNode
+from lc_agent.network_lists.network_list import NetworkList
+
+
+class MemoryNetworkList(NetworkList):
+    """Network list that isn't stored."""
+
+    def save(self, network=None):
+        pass
+
+    def load(self):
+        pass
+
+    def delete(self, network):
+        self.remove(network)
+
+    async def save_async(self, network=None):
+        pass
+
+    async def load_async(self):
+        pass
+
+    async def delete_async(self, network):
+        self.remove(network)
+
+
+def create_conversations(count: int, nodes: int) -> MemoryNetworkList:
+    random.seed(0)
+    network_list = MemoryNetworkList()
+    for index in range(count):
+        with RunnableNetwork() as network:
+            for _ in range(nodes):
+                node = RunnableNode()
+                node.metadata["bookmark"] = random.random() < 0.001
+        network.metadata["name"] = f"Conversation {index}"
+        network.metadata["agent"] = random.choice(["SceneEdit", "SceneInfo", "CodeGen"])
+        network.metadata["timestamp"] = 1_700_000_000.0 + index * 60
+        network_list.append(network)
+    return network_list
+
+
+def measure(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conversations", type=int, default=10000, help="Number of stored conversations")
+    parser.add_argument("--nodes", type=int, default=6, help="Number of nodes of a conversation")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of times every query runs")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    network_list = create_conversations(args.conversations, args.nodes)
+    print(f"{args.conversations} conversations of {args.nodes} nodes, created in {time.perf_counter() - start:.1f} s")
+
+    name = f"Conversation {args.conversations // 2}"
+    uuid = network_list[args.conversations // 3].uuid()
+    since = 1_700_000_000.0 + (args.conversations - 50) * 60
+
+    queries = [
+        (
+            "network by name",
+            lambda: network_list.find_network(lambda n: n.metadata.get("name") == name),
+            lambda: network_list.find_network_by_metadata({"name": name}),
+        ),
+        (
+            "network by uuid",
+            lambda: network_list.find_network(lambda n: n.metadata.get("uuid") == uuid),
+            lambda: [network_list.find_network_by_uuid(uuid)],
+        ),
+        (
+            "bookmarked nodes",
+            lambda: network_list.find_node(lambda n: n.metadata.get("bookmark") is True),
+            lambda: network_list.find_node_by_metadata({"bookmark": True}),
+        ),
+        (
+            "latest 50",
+            lambda: sorted(
+                network_list.find_network(lambda n: n.metadata.get("timestamp", 0) >= since),
+                key=lambda n: n.metadata["timestamp"],
+                reverse=True,
+            ),
+            lambda: network_list.find_network_by_range("timestamp", start=since, reverse=True),
+        ),
+    ]
+
+    for label, scan, indexed in queries:
+        # The first query of a node key or a range key builds its index
+        start = time.perf_counter()
+        indexed()
+        first = (time.perf_counter() - start) * 1000
+
+        scan_ms, scan_result = measure(scan, args.repeat)
+        indexed_ms, indexed_result = measure(indexed, args.repeat)
+        assert scan_result == indexed_result
+        print(
+            f"  {label:17} scan {scan_ms:8.3f} ms, index {indexed_ms:8.3f} ms "
+            f"(first {first:7.2f} ms), {len(indexed_result)} results"
+        )
+
+
+if __name__ == "__main__":
+    main()
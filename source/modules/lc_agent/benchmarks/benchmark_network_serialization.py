@@ -0,0 +1,110 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the saves of a conversation with `JsonNetworkList`, with the
+current format and with the compact format.
+
+Every turn of the conversation adds a question and an answer, and the answer
+keeps the whole prompt of the chat model in `chat_model_input`: the system
+message and all the previous messages. The conversation is saved after every
+turn, like the chat window does. The benchmark measures the time of the saves,
+the bytes written and the size of the file.
+
+Usage:
+    python benchmark_network_serialization.py --turns 100 --system-chars 8000
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from langchain_core.messages import AIMessage
+from lc_agent import JsonNetworkList, RunnableHumanNode, RunnableNetwork, RunnableNode, get_node_factory
+
+
+def add_turn(network: RunnableNetwork, system: str, turn: int):
+    history = [{"type": "system", "content": system}]
+    for node in network.nodes:
+        history.append({"type": node.outputs.type, "content": node.outputs.content})
+    question = f"Question {turn}: how do I change the intensity of the lights of the stage?"
+    history.append({"type": "human", "content": question})
+
+    with network:
+        RunnableHumanNode(question)
+        node = RunnableNode(outputs=AIMessage(content=f"Answer {turn}. " + "Set the intensity attribute. " * 40))
+    node.metadata["chat_model_input"] = history
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def run_session(turns: int, system: str, compact: bool, compact_every: int):
+    directory = tempfile.mkdtemp()
+    JsonNetworkList.SAVE_PATH = os.path.join(directory, "networks")
+    network_list = JsonNetworkList(compact=compact, compact_every=compact_every)
+    network = RunnableNetwork(metadata={"name": "Session"})
+    network_list.append(network)
+
+    elapsed = 0.0
+    written = 0
+    last_size = 0
+    try:
+        for turn in range(turns):
+            add_turn(network, system, turn)
+            start = time.perf_counter()
+            network_list.save()
+            elapsed += time.perf_counter() - start
+
+            size = directory_size(JsonNetworkList.SAVE_PATH)
+            # A rewrite writes the whole file, an append writes the growth
+            written += size if size < last_size or not compact else size - last_size
+            last_size = size
+
+        start = time.perf_counter()
+        loaded = JsonNetworkList(compact=compact)
+        loaded.load()
+        load_time = time.perf_counter() - start
+        assert loaded[0].model_dump() == network.model_dump()
+    finally:
+        shutil.rmtree(directory)
+
+    return elapsed, written, last_size, load_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=100, help="Number of turns of the conversation")
+    parser.add_argument("--system-chars", type=int, default=8000, help="Length of the system message")
+    parser.add_argument("--compact-every", type=int, default=50, help="Number of deltas between the snapshots")
+    args = parser.parse_args()
+
+    get_node_factory().register(RunnableNode)
+    get_node_factory().register(RunnableHumanNode)
+    system = ("You are an assistant of the USD scene. " * (args.system_chars // 39 + 1))[: args.system_chars]
+
+    # The saves print the paths
+    import contextlib
+    import io
+
+    print(f"{args.turns} turns, system message of {args.system_chars} characters, saved after every turn")
+    for name, compact in [("current", False), ("compact", True)]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            elapsed, written, size, load_time = run_session(args.turns, system, compact, args.compact_every)
+        print(
+            f"  {name:8} saves {elapsed * 1000:8.1f} ms, written {written / 1e6:8.2f} MB, "
+            f"file {size / 1e6:6.2f} MB, load {load_time * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the routing cache of `MultiAgentNetworkNode`.
+
+Routes a stream of user requests where some requests repeat and some are
+rephrased. The scripted chat model waits before it answers, like the round trip
+of a classification call. The requests are routed without the cache, with
+exact matches only and with a bag of words embedder for similar questions.
+
+Usage:
+    python benchmark_routing_cache.py --requests 200 --latency-ms 30
+"""
+
+from typing import List
+import argparse
+import asyncio
+import random
+import time
+
+from lc_agent import MultiAgentNetworkNode, RunnableHumanNode, RunnableNode
+from lc_agent import get_chat_model_registry, get_node_factory, get_routing_cache
+from lc_agent.utils.multi_agent_utils import determine_next_action
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+REQUESTS = [
+    ("Make it red", "SceneEdit"),
+    ("make it red!", "SceneEdit"),
+    ("Please make it red", "SceneEdit"),
+    ("Make the cube blue", "SceneEdit"),
+    ("Please make the cube blue", "SceneEdit"),
+    ("What lights are in the stage?", "SceneInfo"),
+    ("Which lights are in the stage", "SceneInfo"),
+    ("List the cameras of the stage", "SceneInfo"),
+    ("Write a script that randomizes the light intensities", "CodeGen"),
+    ("Write a script that randomizes the intensities of the lights", "CodeGen"),
+]
+
+VOCABULARY = sorted({word for question, _ in REQUESTS for word in question.lower().strip("!?").split()})
+
+CLASSIFICATIONS = 0
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Answers with the route of the question after the latency of a call."""
+
+    latency_seconds: float = 0.03
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _route(self, messages) -> str:
+        text = str(messages[-1].content)
+        for question, route in REQUESTS:
+            if question in text:
+                return f"{route} {question}"
+        return "FINAL I don't know"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._route(messages)))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        global CLASSIFICATIONS
+        CLASSIFICATIONS += 1
+        await asyncio.sleep(self.latency_seconds)
+        yield ChatGenerationChunk(message=AIMessageChunk(content=self._route(messages)))
+
+
+class RouteNode(RunnableNode):
+    """Handles the routed requests"""
+
+
+def embed(text: str) -> List[float]:
+    words = text.split()
+    return [words.count(word) for word in VOCABULARY]
+
+
+async def route_requests(requests, routing_cache: bool) -> float:
+    start = time.perf_counter()
+    for question in requests:
+        with MultiAgentNetworkNode(
+            route_nodes=["SceneEdit", "SceneInfo", "CodeGen"],
+            function_calling=False,
+            default_node="",
+            chat_model_name="scripted",
+            routing_cache=routing_cache,
+        ) as network:
+            human_node = RunnableHumanNode(question)
+        await determine_next_action(network, human_node)
+    return time.perf_counter() - start
+
+
+def main():
+    global CLASSIFICATIONS
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Number of routed requests")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Latency of a classification call")
+    parser.add_argument("--threshold", type=float, default=0.85, help="Similarity threshold of the embedder")
+    args = parser.parse_args()
+
+    get_chat_model_registry().register("scripted", ScriptedChatModel(latency_seconds=args.latency_ms / 1000.0))
+    for route in ["SceneEdit", "SceneInfo", "CodeGen"]:
+        get_node_factory().register(RouteNode, name=route)
+
+    random.seed(0)
+    requests = [random.choice(REQUESTS)[0] for _ in range(args.requests)]
+
+    print(f"{args.requests} requests, {args.latency_ms:.0f} ms per classification call")
+    routing_cache = get_routing_cache()
+    for name, enabled, embedder in [("no cache", False, None), ("exact", True, None), ("similar", True, embed)]:
+        routing_cache.invalidate()
+        routing_cache.embedder = embedder
+        routing_cache.similarity_threshold = args.threshold
+        CLASSIFICATIONS = 0
+        elapsed = asyncio.run(route_requests(requests, enabled))
+        print(f"  {name:10} {elapsed * 1000 / args.requests:7.2f} ms per request, {CLASSIFICATIONS} classification calls")
+
+
+if __name__ == "__main__":
+    main()
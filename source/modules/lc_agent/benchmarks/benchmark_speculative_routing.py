@@ -0,0 +1,118 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the routing latency of `MultiAgentNetworkNode` without function
+calling, with and without `speculative_routing`.
+
+A scripted chat model streams a classification with a delay per token: the
+route line, then text that ignores the one-line instruction. The route node
+takes some time to create, like a sub-network that assembles its prompts. The
+benchmark measures the time until the route node is ready and the number of
+tokens that were generated.
+
+Usage:
+    python benchmark_speculative_routing.py --token-ms 20 --create-ms 50
+"""
+
+from typing import List
+import argparse
+import asyncio
+import time
+
+from lc_agent import MultiAgentNetworkNode, RunnableHumanNode, RunnableNode
+from lc_agent import get_chat_model_registry, get_node_factory
+from lc_agent.utils.multi_agent_utils import determine_next_action
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+CLASSIFICATION = (
+    "SceneInfo Which prims of the stage are lights and what are their intensities?\n"
+    "The scene information agent can list the lights of the stage, then the answer can "
+    "compare their intensities and suggest the changes the user asked for."
+)
+
+ROUTE_CREATION_SECONDS = 0.05
+TOKENS: List[str] = []
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Streams the words of the classification with a delay per word."""
+
+    token_seconds: float = 0.02
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=CLASSIFICATION))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        for index, word in enumerate(CLASSIFICATION.split(" ")):
+            await asyncio.sleep(self.token_seconds)
+            TOKENS.append(word)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word if index == 0 else f" {word}"))
+
+
+class SceneInfoNode(RunnableNode):
+    """Answers the questions about the scene"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Prompt assembly and retriever setup of a sub-network
+        time.sleep(ROUTE_CREATION_SECONDS)
+
+
+async def route(speculative_routing: bool):
+    with MultiAgentNetworkNode(
+        route_nodes=["SceneInfo", "CodeGen"],
+        function_calling=False,
+        default_node="",
+        chat_model_name="scripted",
+        speculative_routing=speculative_routing,
+    ) as network:
+        human_node = RunnableHumanNode("Make the lights of the stage dimmer")
+
+    TOKENS.clear()
+    start = time.perf_counter()
+    classification = await determine_next_action(network, human_node)
+    route_node = classification.get("node") or get_node_factory().create_node(classification["action"])
+    elapsed = time.perf_counter() - start
+
+    assert isinstance(route_node, SceneInfoNode)
+    return elapsed, len(TOKENS), classification["content"]
+
+
+def main():
+    global ROUTE_CREATION_SECONDS
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--token-ms", type=float, default=20.0, help="Delay of every streamed word")
+    parser.add_argument("--create-ms", type=float, default=50.0, help="Time to create the route node")
+    args = parser.parse_args()
+
+    ROUTE_CREATION_SECONDS = args.create_ms / 1000.0
+    get_chat_model_registry().register("scripted", ScriptedChatModel(token_seconds=args.token_ms / 1000.0))
+    get_node_factory().register(SceneInfoNode, name="SceneInfo")
+    get_node_factory().register(SceneInfoNode, name="CodeGen")
+
+    total = len(CLASSIFICATION.split(" "))
+    full, full_tokens, full_content = asyncio.run(route(speculative_routing=False))
+    speculative, speculative_tokens, speculative_content = asyncio.run(route(speculative_routing=True))
+
+    print(f"Classification of {total} words, {args.token_ms:.0f} ms per word, {args.create_ms:.0f} ms to create")
+    print(f"  whole stream:   {full * 1000:7.1f} ms to route, {full_tokens} words generated")
+    print(f"  speculative:    {speculative * 1000:7.1f} ms to route, {speculative_tokens} words generated")
+    print(f"  same question:  {speculative_content == full_content.split(chr(10))[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,3 +34,9 @@ from .utils.profiling_utils import (
     format_profiling_tree,
 )
 from .utils.profiling_html import create_profiling_html
+
+# Routing decisions of the multi-agent networks
+from .utils.routing_cache import RoutingCache, get_routing_cache
+
+# Compact serialization of the networks
+from .utils.network_serialization import NetworkJournal, deserialize_network, serialize_network
@@ -21,19 +21,207 @@ from langchain_core.messages import (
 )
 from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
 from langchain_core.runnables import run_in_executor
+from pydantic import PrivateAttr
 from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 from typing import Any, Dict, List
+from collections import deque
 import aiohttp
+import asyncio
 import json
 import os
+import re
 import requests
+import threading
+import time
+
+# Connections kept open to the NVCF endpoint per event loop and per thread
+POOL_SIZE = 32
+
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+_DATA_LINE = re.compile(rb"^data:", re.MULTILINE)
+
+
+class SseParser:
+    """Incremental parser of a server-sent events stream.
+
+    Bytes are fed as they are read, in any fragments: a line is only parsed
+    once its line break arrived, and an event is complete at the blank line
+    that follows its data lines. The data lines of an event are joined with
+    line breaks, comments and the other fields are ignored.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._data: List[str] = []
+
+    def feed(self, data: bytes) -> List[str]:
+        """Parse a fragment of the stream and return the data of the events it completed."""
+        buffer = self._buffer + data
+        events = []
+        position = 0
+        for match in _LINE_BREAK.finditer(buffer):
+            if match.group() == b"\r" and match.end() == len(buffer):
+                # "\r\n" can be split between two fragments
+                break
+            self._parse_line(buffer[position : match.start()], events)
+            position = match.end()
+        self._buffer = buffer[position:]
+        return events
+
+    def close(self) -> List[str]:
+        """Return the data of the last event when the stream ended without a blank line."""
+        events = []
+        if self._buffer:
+            self._parse_line(self._buffer, events)
+            self._buffer = b""
+        self._parse_line(b"", events)
+        return events
+
+    def _parse_line(self, line: bytes, events: List[str]) -> None:
+        if not line:
+            if self._data:
+                events.append("\n".join(self._data))
+                self._data = []
+            return
+
+        field, _, value = line.partition(b":")
+        if field == b"data":
+            if value.startswith(b" "):
+                value = value[1:]
+            self._data.append(value.decode("utf-8", errors="replace"))
+
+
+def _decode_event(data: str) -> List[Dict[str, Any]]:
+    """Decode the JSON chunks of an event, skipping markers like "[DONE]"."""
+    start = data.find("{")
+    if start < 0:
+        return []
+    try:
+        return [json.loads(data[start:])]
+    except json.JSONDecodeError:
+        pass
+
+    # Servers that don't separate the events with blank lines send several chunks in one event
+    chunks = []
+    for line in data.splitlines():
+        line = line.strip()
+        if line.startswith("{"):
+            try:
+                chunks.append(json.loads(line))
+            except json.JSONDecodeError:
+                pass  # Handle cases where JSON is invalid
+    return chunks
+
+
+def _is_finished(chunk: Dict[str, Any]) -> bool:
+    choices = chunk.get("choices")
+    return bool(choices) and choices[0].get("finish_reason") is not None
+
+
+class StreamMetrics:
+    """Latencies of a streamed completion, in seconds.
+
+    The time to the first token includes the connection and the time until the
+    first chunk arrived; the inter-chunk latency is the time between chunks.
+    """
+
+    def __init__(self) -> None:
+        self.start_time = time.perf_counter()
+        self.first_chunk_time: Optional[float] = None
+        self.last_chunk_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.chunks = 0
+        self.max_inter_chunk_latency = 0.0
+
+    def add_chunk(self) -> None:
+        now = time.perf_counter()
+        if self.first_chunk_time is None:
+            self.first_chunk_time = now
+        else:
+            self.max_inter_chunk_latency = max(self.max_inter_chunk_latency, now - self.last_chunk_time)
+        self.last_chunk_time = now
+        self.chunks += 1
+
+    def finish(self) -> None:
+        if self.end_time is None:
+            self.end_time = time.perf_counter()
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        if self.first_chunk_time is None:
+            return None
+        return self.first_chunk_time - self.start_time
+
+    @property
+    def mean_inter_chunk_latency(self) -> Optional[float]:
+        if self.chunks < 2:
+            return None
+        return (self.last_chunk_time - self.first_chunk_time) / (self.chunks - 1)
+
+    @property
+    def total_time(self) -> Optional[float]:
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chunks": self.chunks,
+            "time_to_first_token": self.time_to_first_token,
+            "mean_inter_chunk_latency": self.mean_inter_chunk_latency,
+            "max_inter_chunk_latency": self.max_inter_chunk_latency,
+            "total_time": self.total_time,
+        }
+
+
+# One aiohttp session per event loop, closed when the loop shuts down its tasks
+_async_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+_sync_sessions = threading.local()
+
+
+async def _hold_async_session(loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession) -> None:
+    try:
+        await asyncio.Future()
+    finally:
+        if _async_sessions.get(loop) is session:
+            del _async_sessions[loop]
+        await session.close()
 
 
-class NvcfCallAsync:
-    def __init__(
-        self, payload: Dict[str, Any], headers: Dict[str, str], invoke_url: str
-    ) -> None:
+def get_async_session() -> aiohttp.ClientSession:
+    """Get the session with the connection pool of the running event loop."""
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=POOL_SIZE))
+        _async_sessions[loop] = session
+        # asyncio.run cancels the remaining tasks before closing the loop, which closes the session
+        loop.create_task(_hold_async_session(loop, session))
+    return session
+
+
+def get_sync_session() -> requests.Session:
+    """Get the session with the connection pool of the current thread."""
+    session = getattr(_sync_sessions, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _sync_sessions.session = session
+    return session
+
+
+def _is_event_stream(content_type: Optional[str]) -> bool:
+    return "text/event-stream" in (content_type or "")
+
+
+class _NvcfCall:
+    """Chunks of a streamed NVCF invocation, parsed as the events arrive."""
+
+    def __init__(self, payload: Dict[str, Any], headers: Dict[str, str], invoke_url: str) -> None:
         self._started = False
+        self._done = False
         self._finished = False
 
         self._payload = payload
@@ -41,148 +229,149 @@ class NvcfCallAsync:
         self._invoke_url = invoke_url
 
         self._response = None
-        self._session: aiohttp.ClientSession = None
-
-        self._stack: List[Dict[str, Any]] = []
-
-    def __aiter__(self) -> "NvcfCall":
+        self._parser = SseParser()
+        # The response read until it's known to be an event stream, None once it is
+        self._body: Optional[bytes] = b""
+        self.metrics = StreamMetrics()
+
+        # Holds the chunks of one read, the next read only happens once they are consumed
+        self._stack: deque = deque()
+
+    def _add_read(self, data: Optional[bytes], content_type: Optional[str]) -> None:
+        """Queue the chunks of a read of the response, empty or None at its end.
+
+        The response is an event stream when its content type says so or when
+        it has data lines, some endpoints stream the events with another
+        content type. Other responses, like errors, are a single chunk.
+        """
+        if self._body is None:
+            self._add_data(data)
+            return
+
+        self._body += data or b""
+        if not _is_event_stream(content_type) and not _DATA_LINE.search(self._body):
+            if not data:
+                self._add_event(self._body.decode("utf-8", errors="replace"))
+                self._set_done()
+            return
+
+        body, self._body = self._body, None
+        if body:
+            self._add_data(body)
+        if not data and not self._done:
+            self._add_data(None)
+
+    def _add_data(self, data: Optional[bytes]) -> None:
+        """Queue the chunks of the events completed by the data read, None at the end of the stream."""
+        events = self._parser.feed(data) if data else self._parser.close()
+        for event in events:
+            self._add_event(event)
+            if self._done:
+                return
+        if not data:
+            self._set_done()
+
+    def _add_event(self, event: str) -> None:
+        for json_data in _decode_event(event):
+            self._stack.append(json_data)
+            self.metrics.add_chunk()
+            if _is_finished(json_data):
+                self._set_done()
+                return
+
+    def _set_done(self) -> None:
+        self._done = True
+        self.metrics.finish()
+
+
+class NvcfCallAsync(_NvcfCall):
+    def __aiter__(self) -> "NvcfCallAsync":
         """Make this class an asynchronous iterator."""
         return self
 
     async def __anext__(self) -> Dict[str, Any]:
         """Asynchronous iterator method for fetching response chunks."""
-        if self._stack:
-            return self._stack.pop(0)
-
         if not self._started:
             await self._session_begin()
 
-        if self._started and not self._finished:
+        while not self._stack and not self._done:
             await self._fetch_next_chunk()
 
         if self._stack:
-            return self._stack.pop(0)
-        else:
-            raise StopAsyncIteration
+            return self._stack.popleft()
+
+        await self._session_end()
+        raise StopAsyncIteration
 
     async def _session_begin(self) -> None:
-        """Initializes the session and makes the first invocation to get the response."""
+        """Makes the invocation on a pooled connection to get the response."""
         if not self._started:
-            self._session = aiohttp.ClientSession()
-            self._response = await self._session.post(
+            self._started = True
+            self._response = await get_async_session().post(
                 self._invoke_url, headers=self._headers, json=self._payload
             )
-            self._started = True
 
     async def _session_end(self) -> None:
-        """Closes the session and associated resources."""
+        """Reads the rest of the response, like the end of stream marker, to return the connection to the pool."""
         if not self._finished:
-            if self._response:
-                await self._response.release()
-            if self._session:
-                await self._session.close()
             self._finished = True
-
-    async def _fetch_next_chunk(self) -> None:
-        """Fetch the next chunk and process it."""
-        chunk = await self._response.content.readany()
-        if chunk:
-            decoded_chunk = chunk.decode("utf-8")
-            for raw_str in decoded_chunk.split("data:"):
-                raw_str = raw_str.strip()
-                if not raw_str:
-                    continue
-
-                # Assuming JSON data starts with "{"
-                raw_str = raw_str[raw_str.find("{") :]
+            if self._response:
                 try:
-                    json_data = json.loads(raw_str)
-                    self._stack.append(json_data)
-                    if (
-                        "choices" in json_data
-                        and json_data["choices"][0].get("finish_reason") is not None
-                    ):
-                        await self._session_end()
-                        break
-                except json.JSONDecodeError:
-                    pass  # Handle cases where JSON is invalid
-        else:
-            await self._session_end()
-
+                    while await self._response.content.readany():
+                        pass
+                except aiohttp.ClientError:
+                    pass
+                self._response.release()
 
-class NvcfCallSync:
-    def __init__(self, payload: dict, headers: dict, invoke_url: str) -> None:
-        self._started = False
-        self._finished = False
-
-        self._payload = payload
-        self._headers = headers
-        self._invoke_url = invoke_url
-
-        self._response = None
-        self._session: requests.Session = requests.Session()
+    async def _fetch_next_chunk(self) -> None:
+        """Read from the response and queue the chunks of the events it completed."""
+        self._add_read(await self._response.content.readany(), self._response.content_type)
 
-        self._stack: list[dict] = []
 
+class NvcfCallSync(_NvcfCall):
     def __iter__(self) -> "NvcfCallSync":
         """Make this class a synchronous iterator."""
         return self
 
     def __next__(self) -> dict:
         """Iterator method for fetching response chunks."""
-        if self._stack:
-            return self._stack.pop(0)
-
         if not self._started:
             self._session_begin()
 
-        if self._started and not self._finished:
+        while not self._stack and not self._done:
             self._fetch_next_chunk()
 
         if self._stack:
-            return self._stack.pop(0)
-        else:
-            raise StopIteration
+            return self._stack.popleft()
+
+        self._session_end()
+        raise StopIteration
 
     def _session_begin(self) -> None:
-        """Initializes the session and makes the first invocation to get the response."""
+        """Makes the invocation on a pooled connection and streams the response."""
         if not self._started:
-            self._response = self._session.post(
-                self._invoke_url, headers=self._headers, json=self._payload
-            )
             self._started = True
+            self._response = get_sync_session().post(
+                self._invoke_url, headers=self._headers, json=self._payload, stream=True
+            )
+            # Yields the data as it arrives instead of filling blocks of a fixed size
+            self._reader = self._response.iter_content(chunk_size=None)
 
     def _session_end(self) -> None:
-        """Closes the session and associated resources."""
+        """Reads the rest of the response, like the end of stream marker, to return the connection to the pool."""
         if not self._finished:
-            self._session.close()
             self._finished = True
+            if self._response is not None:
+                try:
+                    for _ in self._reader:
+                        pass
+                except requests.RequestException:
+                    pass
+                self._response.close()
 
     def _fetch_next_chunk(self) -> None:
-        """Fetch the next chunk and process it."""
-        if self._response:
-            chunk = self._response.content.decode("utf-8")
-            # print("chunk", chunk)
-            for raw_str in chunk.split("data:"):
-                raw_str = raw_str.strip()
-                if not raw_str:
-                    continue
-
-                # Assuming JSON data starts with "{"
-                raw_str = raw_str[raw_str.find("{") :]
-                try:
-                    json_data = json.loads(raw_str)
-                    self._stack.append(json_data)
-                    if (
-                        "choices" in json_data
-                        and json_data["choices"][0].get("finish_reason") is not None
-                    ):
-                        self._session_end()
-                        break
-                except json.JSONDecodeError:
-                    pass  # Handle cases where JSON is invalid
-        else:
-            self._session_end()
+        """Read from the response and queue the chunks of the events it completed."""
+        self._add_read(next(self._reader, None), self._response.headers.get("Content-Type"))
 
 
 class ChatNVCF(SimpleChatModel):
@@ -196,6 +385,13 @@ class ChatNVCF(SimpleChatModel):
 
     call_depth: int = 0
 
+    _last_stream_metrics: Optional[StreamMetrics] = PrivateAttr(default=None)
+
+    @property
+    def last_stream_metrics(self) -> Optional[StreamMetrics]:
+        """Latencies of the last completion streamed by this model."""
+        return self._last_stream_metrics
+
     def __get_messages(self, messages: List[BaseMessage]) -> List[Dict[str, str]]:
         def get_message_role(message: BaseMessage) -> str:
             if isinstance(message, AIMessage):
@@ -273,7 +469,11 @@ class ChatNVCF(SimpleChatModel):
         if stream:
             payload["stream"] = True
 
-        nvcf_call = NvcfCallSync(payload, self._header, self._invoke_url)
+        header = self._header
+        header["Accept"] = "text/event-stream"
+
+        nvcf_call = NvcfCallSync(payload, header, self._invoke_url)
+        self._last_stream_metrics = nvcf_call.metrics
 
         response = None
         result = ""
@@ -294,7 +494,7 @@ class ChatNVCF(SimpleChatModel):
             if self.call_depth == 2:
                 print("URL", self._invoke_url)
                 print("The header is:")
-                print(json.dumps(self._header, indent=2))
+                print(json.dumps(header, indent=2))
                 print("The payload is:")
                 print(json.dumps(payload, indent=2))
 
@@ -323,9 +523,10 @@ class ChatNVCF(SimpleChatModel):
         }
 
         header = self._header
-        header["accept"] = "text/event-stream"
+        header["Accept"] = "text/event-stream"
 
         nvcf_call = NvcfCallAsync(payload, header, self._invoke_url)
+        self._last_stream_metrics = nvcf_call.metrics
 
         response = None
         # print("payload", json.dumps(payload, indent=2))
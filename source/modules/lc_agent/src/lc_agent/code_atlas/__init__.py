@@ -11,5 +11,6 @@ from .codeatlas_cache import CodeAtlasCache
 from .codeatlas_tool import CodeAtlasTool
 from .codeatlas_topic import CodeAtlasTopics
 from .codeinterpreter_tool import CodeInterpreterTool
+from .module_parser import ModuleParser
 from .usd_atlas_agent import USDAtlasAgent
 from .usd_atlas_tool import USDAtlasTool
@@ -12,6 +12,7 @@ from .codeatlas_module_info import CodeAtlasClassInfo
 from .codeatlas_module_info import CodeAtlasMethodInfo
 from .codeatlas_module_info import CodeAtlasModuleInfo
 from .codeatlas_lookup import CodeAtlasLookup
+from .module_parser import ModuleParser
 from collections import defaultdict
 from typing import Dict
 from typing import List
@@ -42,19 +43,22 @@ class CodeAtlasCache(CodeAtlasLookup):
     def empty(self):
         return not (self._modules or self._classes or self._methods or self._used_classes)
 
-    def scan(self, module_path: str, overwrite=True, excluded_modules=None):
+    def scan(self, module_path: str, overwrite=True, excluded_modules=None, parser: Optional[ModuleParser] = None):
         """
         Scan the module path and collect the code atlas information.
         Args:
             module_path (str): The path to the module to scan.
             overwrite (bool): Whether to overwrite the existing code atlas information.
             excluded_modules (Optional[List[str]]): A list of modules to exclude from the scan.
+            parser (Optional[ModuleParser]): Parses the module files in a process pool with a per-file cache.
         """
         # token = carb.tokens.get_tokens_interface()
         # module_path = token.resolve(module_path)
 
         # Primary library we are interested in
-        module_analyzer = ModuleAnalyzer(module_path, self._modules if not overwrite else None, excluded_modules=excluded_modules)
+        module_analyzer = ModuleAnalyzer(
+            module_path, self._modules if not overwrite else None, excluded_modules=excluded_modules, parser=parser
+        )
         module_analyzer.analyze()
 
         # All the classes in module analyzer directory
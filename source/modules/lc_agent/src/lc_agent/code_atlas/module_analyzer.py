@@ -7,49 +7,26 @@
 # license agreement from NVIDIA CORPORATION is strictly prohibited.
 #
 
-from .codeatlas_collector import CodeAtlasCollector
 from .codeatlas_module_info import CodeAtlasClassInfo
 from .codeatlas_module_info import CodeAtlasMethodInfo
 from .codeatlas_module_info import CodeAtlasModuleInfo
+from .module_parser import ModuleParser
+from .module_parser import ParsedModule
+from .module_parser import detect_encoding
+from .module_parser import parse_module_source
 from pathlib import Path
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
-import ast
 import glob
 import os
 import copy
 import toml
 from collections import namedtuple
-import re
 
 _ModuleObject = namedtuple('_ModuleObject', ['module_name', 'object_name'])
 
-def _replace_colons_outside_brackets(source):
-    processed_lines = []
-    for line in source.splitlines():
-        result = []
-        inside_brackets = False  # Track whether we're inside square brackets
-        chars = iter(enumerate(line))  # Create an iterator to go through line with index
-
-        for index, char in chars:
-            if char == "[":
-                inside_brackets = True
-            elif char == "]":
-                inside_brackets = False
-
-            # Check for '::' outside of square brackets
-            if not inside_brackets and char == ":" and (index + 1) < len(line) and line[index + 1] == ":":
-                result.append(".")
-                next(chars, None)  # Skip the next character as it's part of '::'
-            else:
-                result.append(char)
-
-        processed_lines.append("".join(result))
-
-    return "\n".join(processed_lines)
-
 def _process_equivalent_module(existing_module: CodeAtlasModuleInfo, new_module_name: str, modules: Dict[str, CodeAtlasModuleInfo], classes: Dict[str, CodeAtlasClassInfo], methods: Dict[str, CodeAtlasMethodInfo]):
     """Creates and saves a deep copy of a single module with the module name changed to the new module name into the modules dictionary and processes the classes in the module as well."""
     if not existing_module:
@@ -163,12 +140,15 @@ class ModuleResolver:
 class ModuleAnalyzer:
     """Analyzes a given directory to collect all Python modules present."""
 
-    def __init__(self, starting_directory: str, visited_modules=None, excluded_modules=None):
+    def __init__(self, starting_directory: str, visited_modules=None, excluded_modules=None, parser: Optional[ModuleParser] = None):
         self.starting_directory = Path(starting_directory)
         if visited_modules is None:
             visited_modules = {}
         self.visited_modules: Dict[str, CodeAtlasModuleInfo] = copy.copy(visited_modules)
+        self.visited_file_paths = set(m.file_path for m in self.visited_modules.values())
         self.excluded_modules: Optional[List[str]] = excluded_modules
+        # Parses the files in worker processes and caches them, None to parse them here
+        self.parser: Optional[ModuleParser] = parser
         self.found_modules: List[CodeAtlasModuleInfo] = []
         self.found_classes: List[CodeAtlasClassInfo] = []
         self.found_methods: List[CodeAtlasMethodInfo] = []
@@ -182,32 +162,55 @@ class ModuleAnalyzer:
         """Kick-starts the module analysis process and returns a list of found modules."""
         # Handling the case when the path includes a wildcard (*)
         starting_directories = glob.glob(str(self.starting_directory))
+
+        if self.parser is not None:
+            self.parser.prefetch(self.module_files(starting_directories))
+
         for starting_directory in starting_directories:
             print("Scan", starting_directory)
-            for root, dirs, files in os.walk(starting_directory, followlinks=True):
-                if self.excluded_modules and any(Path(root).relative_to(starting_directory).is_relative_to(Path(excluded_module)) for excluded_module in self.excluded_modules):
-                    continue
-                module_name = None
-                files_set = set(files)
+            for root, init_file, files in self._walk_module_files(starting_directory):
+                # Process each '__init__.py' or '__init__.pyi' file to identify modules
+                module_name = self.process_init_file(root, init_file) if init_file else None
+
                 for file in files:
-                    # Process each '__init__.py' or '__init__.pyi' file to identify modules
-                    if file in ("__init__.py", "__init__.pyi"):
-                        # Prefer .pyi files over .py if both are present
-                        if file == "__init__.py" and "__init__.pyi" in files_set:
-                            continue
-                        module_name = self.process_init_file(root, file)
-                        break
-
-                for file in files_set:
-                    if not any(file.endswith(ext) for ext in [".py", ".pyi"]) or file == "__init__.py":
-                        continue
                     submodule_name = (module_name if module_name is not None else self.module_name_from_path(root)) + "." + file.split(".")[0]
                     full_path = os.path.join(root, file)
-                    if submodule_name not in self.visited_modules and not any(m.file_path == Path(full_path).relative_to(starting_directory).as_posix() for m in self.visited_modules.values()):
+                    if submodule_name not in self.visited_modules and Path(full_path).relative_to(starting_directory).as_posix() not in self.visited_file_paths:
                         self.process_module(full_path, submodule_name, is_root=False)
 
         self._promote_publicly_exposed()
 
+    def _walk_module_files(self, starting_directory: str):
+        """
+        Yields (root, init file, module files) for the directories of the
+        starting directory, in a deterministic order.
+        """
+        for root, dirs, files in os.walk(starting_directory, followlinks=True):
+            dirs.sort()
+            if self.excluded_modules and any(Path(root).relative_to(starting_directory).is_relative_to(Path(excluded_module)) for excluded_module in self.excluded_modules):
+                continue
+            files_set = set(files)
+            # Prefer .pyi files over .py if both are present
+            init_file = next((f for f in ("__init__.pyi", "__init__.py") if f in files_set), None)
+            module_files = [
+                file for file in sorted(files_set) if any(file.endswith(ext) for ext in [".py", ".pyi"]) and file != "__init__.py"
+            ]
+            yield root, init_file, module_files
+
+    def module_files(self, starting_directories: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+        """Returns (file path, full module name) of the module files `analyze` visits."""
+        if starting_directories is None:
+            starting_directories = glob.glob(str(self.starting_directory))
+
+        modules = []
+        for starting_directory in starting_directories:
+            for root, init_file, files in self._walk_module_files(starting_directory):
+                module_name = self.module_name_from_path(root)
+                if init_file:
+                    modules.append((os.path.join(root, init_file), module_name))
+                modules.extend((os.path.join(root, file), f"{module_name}.{file.split('.')[0]}") for file in files)
+        return modules
+
     def _promote_publicly_exposed(self):
         """Promote classes and methods that are publicly exposed to the higher-level extension module."""
         classes = {c.full_name: c for c in self.found_classes}
@@ -294,25 +297,18 @@ class ModuleAnalyzer:
             # Read first 4 bytes to check for BOM
             first_bytes = file.read(4)
 
-        # Check for various BOM signatures
-        if first_bytes.startswith(b'\xef\xbb\xbf'):
-            # UTF-8 BOM
-            return 'utf-8-sig'
-        elif first_bytes.startswith(b'\xff\xfe\x00\x00'):
-            # UTF-32 LE BOM
-            return 'utf-32-le'
-        elif first_bytes.startswith(b'\x00\x00\xfe\xff'):
-            # UTF-32 BE BOM
-            return 'utf-32-be'
-        elif first_bytes.startswith(b'\xff\xfe'):
-            # UTF-16 LE BOM
-            return 'utf-16-le'
-        elif first_bytes.startswith(b'\xfe\xff'):
-            # UTF-16 BE BOM
-            return 'utf-16-be'
-        else:
-            # No BOM detected, assume UTF-8
-            return 'utf-8'
+        return detect_encoding(first_bytes)
+
+    def _parse_module(self, full_path: str, full_module_name: str) -> ParsedModule:
+        """Parses a module file with the parser, or in this process if there is no parser."""
+        if self.parser is not None:
+            return self.parser.parse(full_path, full_module_name)
+
+        # Read module's source code with proper encoding detection
+        encoding = self._detect_file_encoding(full_path)
+        with open(full_path, "r", encoding=encoding, errors="replace") as file:
+            source = file.read()
+        return parse_module_source(source, full_module_name)
 
     def process_module(self, full_path: str, full_module_name: str, is_root: bool = True):
         """Processes a single Python module to collect its information and any sub-module."""
@@ -346,27 +342,14 @@ class ModuleAnalyzer:
 
 
         self.visited_modules[full_module_name] = module_info
+        self.visited_file_paths.add(module_info.file_path)
         self.found_modules.append(module_info)
 
-        # Read module's source code with proper encoding detection
-        encoding = self._detect_file_encoding(full_path)
-        with open(full_path, "r", encoding=encoding, errors="replace") as file:
-            source = file.read()
-        # Remove placeholder that interferes with AST parsing
-        source = source.replace("None = 'none'", "")
-        source = source.replace("None:", "NONE:")
-        source = source.replace("${ext_name}Extension", "ExtNameExtension")
-        source = source.replace("${python_module}", "python_module")
-        source = _replace_colons_outside_brackets(source)
-        try:
-            parsed_source = ast.parse(source)
-        except SyntaxError as e:
-            print(f"Syntax error in {full_path}: {e}")
+        collector = self._parse_module(full_path, full_module_name)
+        if collector.error:
+            print(f"Syntax error in {full_path}: {collector.error}")
             return
 
-        collector = CodeAtlasCollector(full_module_name, source.splitlines(keepends=True))
-        collector.visit(parsed_source)
-
         if collector.equivalent_modules:
             module_info.equivalent_modules += collector.equivalent_modules
 
@@ -410,7 +393,7 @@ class ModuleAnalyzer:
 
         self._collect_object_references(collector, module_info, is_init_file)
 
-    def _collect_object_references(self, collector: CodeAtlasCollector, module_info: CodeAtlasModuleInfo, is_init_file: bool):
+    def _collect_object_references(self, collector: ParsedModule, module_info: CodeAtlasModuleInfo, is_init_file: bool):
         """Collects the object references of the current module."""
         module_object_map = {}
 
@@ -0,0 +1,324 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+
+from .codeatlas_collector import CodeAtlasCollector
+from .codeatlas_module_info import CodeAtlasClassInfo
+from .codeatlas_module_info import CodeAtlasMethodInfo
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+import ast
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+
+# Bump when the parsing or the collector changes so cached results are not reused
+PARSER_VERSION = 1
+
+
+def _replace_colons_outside_brackets(source):
+    processed_lines = []
+    for line in source.splitlines():
+        result = []
+        inside_brackets = False  # Track whether we're inside square brackets
+        chars = iter(enumerate(line))  # Create an iterator to go through line with index
+
+        for index, char in chars:
+            if char == "[":
+                inside_brackets = True
+            elif char == "]":
+                inside_brackets = False
+
+            # Check for '::' outside of square brackets
+            if not inside_brackets and char == ":" and (index + 1) < len(line) and line[index + 1] == ":":
+                result.append(".")
+                next(chars, None)  # Skip the next character as it's part of '::'
+            else:
+                result.append(char)
+
+        processed_lines.append("".join(result))
+
+    return "\n".join(processed_lines)
+
+
+def detect_encoding(first_bytes: bytes) -> str:
+    """Returns the encoding of a file from the BOM in its first bytes."""
+    if first_bytes.startswith(b'\xef\xbb\xbf'):
+        # UTF-8 BOM
+        return 'utf-8-sig'
+    elif first_bytes.startswith(b'\xff\xfe\x00\x00'):
+        # UTF-32 LE BOM
+        return 'utf-32-le'
+    elif first_bytes.startswith(b'\x00\x00\xfe\xff'):
+        # UTF-32 BE BOM
+        return 'utf-32-be'
+    elif first_bytes.startswith(b'\xff\xfe'):
+        # UTF-16 LE BOM
+        return 'utf-16-le'
+    elif first_bytes.startswith(b'\xfe\xff'):
+        # UTF-16 BE BOM
+        return 'utf-16-be'
+    else:
+        # No BOM detected, assume UTF-8
+        return 'utf-8'
+
+
+def decode_source(raw: bytes) -> str:
+    """Decodes the bytes of a source file the same way `open(..., "r")` reads it."""
+    return io.TextIOWrapper(io.BytesIO(raw), encoding=detect_encoding(raw[:4]), errors="replace").read()
+
+
+class ParsedModule:
+    """
+    The result of parsing one module file.
+
+    Has the same attributes as `CodeAtlasCollector`, so `ModuleAnalyzer` uses
+    it in place of the collector, and converts to plain data so it can be sent
+    between processes and cached on disk.
+    """
+
+    def __init__(
+        self,
+        classes: Optional[List[CodeAtlasClassInfo]] = None,
+        methods: Optional[List[CodeAtlasMethodInfo]] = None,
+        collected_modules: Optional[List[str]] = None,
+        wildcarts_modules: Optional[List[str]] = None,
+        equivalent_modules: Optional[List[str]] = None,
+        imports: Optional[Dict[str, str]] = None,
+        all_attribute_list: Optional[List[str]] = None,
+        error: Optional[str] = None,
+    ):
+        self.classes = classes or []
+        self.methods = methods or []
+        self.collected_modules = collected_modules or []
+        self.wildcarts_modules = wildcarts_modules or []
+        self.equivalent_modules = equivalent_modules or []
+        self.imports = imports or {}
+        self.all_attribute_list = all_attribute_list
+        self.error = error
+
+    @classmethod
+    def from_collector(cls, collector: CodeAtlasCollector) -> "ParsedModule":
+        return cls(
+            classes=collector.classes,
+            methods=collector.methods,
+            collected_modules=collector.collected_modules,
+            wildcarts_modules=collector.wildcarts_modules,
+            equivalent_modules=collector.equivalent_modules,
+            imports=collector.imports,
+            all_attribute_list=collector.all_attribute_list,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParsedModule":
+        return cls(
+            classes=[CodeAtlasClassInfo(**c) for c in data["classes"]],
+            methods=[CodeAtlasMethodInfo(**m) for m in data["methods"]],
+            collected_modules=data["collected_modules"],
+            wildcarts_modules=data["wildcarts_modules"],
+            equivalent_modules=data["equivalent_modules"],
+            imports=data["imports"],
+            all_attribute_list=data["all_attribute_list"],
+            error=data["error"],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "classes": [c.model_dump(by_alias=True) for c in self.classes],
+            "methods": [m.model_dump(by_alias=True) for m in self.methods],
+            "collected_modules": self.collected_modules,
+            "wildcarts_modules": self.wildcarts_modules,
+            "equivalent_modules": self.equivalent_modules,
+            "imports": self.imports,
+            "all_attribute_list": self.all_attribute_list,
+            "error": self.error,
+        }
+
+
+def parse_module_source(source: str, full_module_name: str) -> ParsedModule:
+    """Parses the source of a module and collects its classes, methods and imports."""
+    # Remove placeholder that interferes with AST parsing
+    source = source.replace("None = 'none'", "")
+    source = source.replace("None:", "NONE:")
+    source = source.replace("${ext_name}Extension", "ExtNameExtension")
+    source = source.replace("${python_module}", "python_module")
+    source = _replace_colons_outside_brackets(source)
+    try:
+        parsed_source = ast.parse(source)
+    except SyntaxError as e:
+        return ParsedModule(error=str(e))
+
+    collector = CodeAtlasCollector(full_module_name, source.splitlines(keepends=True))
+    collector.visit(parsed_source)
+    return ParsedModule.from_collector(collector)
+
+
+def _parse_file(full_path: str, full_module_name: str) -> Dict[str, Any]:
+    """Parses a module file. Runs in the worker processes, so it returns plain data."""
+    stat = os.stat(full_path)
+    with open(full_path, "rb") as file:
+        raw = file.read()
+
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "content_hash": hashlib.sha256(raw).hexdigest(),
+        "parsed": parse_module_source(decode_source(raw), full_module_name).to_dict(),
+    }
+
+
+class ModuleParser:
+    """
+    Parses module files for `ModuleAnalyzer` in a process pool and caches the results.
+
+    `prefetch` parses a batch of files in the worker processes before the
+    analyzer walks the modules, and `parse` hands the results to the analyzer
+    in the order it visits the modules, so the analysis is the same as a serial
+    one. Files that were not prefetched are parsed in this process.
+
+    With a cache directory, the result of every file is stored on disk and is
+    reused while the path, modification time, size and content hash of the file
+    and the parser version match.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            cache_dir (Optional[str]): Directory of the per-file result cache, None to disable it.
+            max_workers (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.stats = {"parsed": 0, "cached": 0}
+        self._prefetched: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _cache_file(self, full_path: str, full_module_name: str) -> Path:
+        key = hashlib.sha256(f"{os.path.abspath(full_path)}\0{full_module_name}".encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_cached(self, full_path: str, full_module_name: str) -> Optional[Dict[str, Any]]:
+        if self.cache_dir is None:
+            return None
+
+        cache_file = self._cache_file(full_path, full_module_name)
+        try:
+            with open(cache_file, "r") as f:
+                entry = json.load(f)
+            stat = os.stat(full_path)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("version") != PARSER_VERSION:
+            return None
+        if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry
+
+        # Touched but maybe not changed
+        with open(full_path, "rb") as file:
+            content_hash = hashlib.sha256(file.read()).hexdigest()
+        if entry["content_hash"] != content_hash:
+            return None
+
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        self._store(full_path, full_module_name, entry)
+        return entry
+
+    def _store(self, full_path: str, full_module_name: str, entry: Dict[str, Any]):
+        if self.cache_dir is None:
+            return
+
+        cache_file = self._cache_file(full_path, full_module_name)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        entry = dict(entry, version=PARSER_VERSION, path=os.path.abspath(full_path), module_name=full_module_name)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(entry, f, separators=(",", ":"))
+        os.replace(tmp_file, cache_file)
+
+    def prefetch(self, modules: Iterable[Tuple[str, str]], keep: bool = True):
+        """
+        Parses module files in the worker processes.
+
+        Args:
+            modules (Iterable[Tuple[str, str]]): Pairs of file path and full module name.
+            keep (bool): Keep the results in memory for `parse`. With a cache
+                directory, False only fills the cache, which bounds the memory
+                when many modules are prefetched at once.
+        """
+        pending = []
+        for full_path, full_module_name in modules:
+            key = (full_path, full_module_name)
+            if key in self._prefetched:
+                continue
+            entry = self._load_cached(full_path, full_module_name)
+            if entry is not None:
+                if keep:
+                    self._prefetched[key] = entry
+                    self.stats["cached"] += 1
+                continue
+            pending.append(key)
+
+        if not pending:
+            return
+
+        if self.max_workers > 1 and len(pending) > 1:
+            if self._executor is None:
+                # Forking a process that runs threads, like the data collection pipeline, can deadlock
+                if "forkserver" in multiprocessing.get_all_start_methods():
+                    context = multiprocessing.get_context("forkserver")
+                    # Import the parser once in the server instead of in every worker
+                    context.set_forkserver_preload([__name__])
+                else:
+                    context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            chunksize = max(1, len(pending) // (self.max_workers * 8))
+            paths, names = zip(*pending)
+            entries = self._executor.map(_parse_file, paths, names, chunksize=chunksize)
+        else:
+            entries = (_parse_file(full_path, full_module_name) for full_path, full_module_name in pending)
+
+        for key, entry in zip(pending, entries):
+            self.stats["parsed"] += 1
+            self._store(*key, entry)
+            if keep or self.cache_dir is None:
+                self._prefetched[key] = entry
+
+    def parse(self, full_path: str, full_module_name: str) -> ParsedModule:
+        """Returns the parsed module file, parsing it now if it was not prefetched or cached."""
+        entry = self._prefetched.pop((full_path, full_module_name), None)
+        if entry is None:
+            entry = self._load_cached(full_path, full_module_name)
+            if entry is not None:
+                self.stats["cached"] += 1
+            else:
+                entry = _parse_file(full_path, full_module_name)
+                self.stats["parsed"] += 1
+                self._store(full_path, full_module_name, entry)
+
+        return ParsedModule.from_dict(entry["parsed"])
@@ -16,6 +16,7 @@ from .runnable_node import RunnableNode
 from .runnable_utils import RunnableHumanNode, RunnableToolNode, RunnableAINode
 from .utils.multi_agent_utils import determine_next_action, create_classification_node
 from .utils.multi_agent_utils import parse_classification_result
+from .utils.multi_agent_utils import lookup_routing_decision, store_routing_decision
 from .utils.pydantic import BaseModel
 from .utils.pydantic import Field
 from langchain_core.messages import AIMessage, HumanMessage
@@ -42,6 +43,13 @@ class MultiAgentNetworkNode(NetworkNode):
     generate_prompt_per_agent: bool = True
     first_routing_instruction: str = ""  # Instructions for the AI's first tool selection
     subsequent_routing_instruction: str = ""  # Instructions for the AI's subsequent tool selections
+    # Without function calling, route as soon as the classification names a route: the generation is
+    # stopped at the end of the route line and the route node is created while the line streams
+    speculative_routing: bool = False
+    # Without function calling, reuse the routing decisions of the same or similar questions in the same
+    # context instead of classifying them again, see `get_routing_cache`
+    routing_cache: bool = False
+    routing_cache_context: int = 2  # Number of history messages before the question in the cache key
     loop_detection_message: Optional[str] = (
         "ERROR: "
         "The {tool} tool has already been called with the same arguments. "
@@ -209,7 +217,13 @@ class MultiAgentNetworkNode(NetworkNode):
                         RunnableAINode(content, metadata=metadata)
                 else:
                     # This node is a sub-agent or it calls the function
-                    created_node = gnf().create_node(classification["action"], metadata=metadata)
+                    created_node = classification.get("node")
+                    if created_node is None:
+                        created_node = gnf().create_node(classification["action"], metadata=metadata)
+                    else:
+                        # Created while the classification was streaming
+                        created_node.metadata.update(metadata)
+                        network.add_node(created_node)
 
                     # Loop detection
                     if network.loop_detection_message and "is_loop" in classification and classification["is_loop"]:
@@ -243,7 +257,7 @@ class MultiAgentNetworkNode(NetworkNode):
             if not network.nodes:
                 # entry point is here
                 if isinstance(network, MultiAgentNetworkNode) and not network.function_calling:
-                    if network.classification_node:
+                    if network.classification_node and not network.speculative_routing:
                         await self._create_classification_node(None, network)
                     else:
                         await self._create_next_action_node(network)
@@ -303,7 +317,7 @@ class MultiAgentNetworkNode(NetworkNode):
                 # Example: 'ChatUSD_USDCodeInteractive Create a sphere'
                 tool_call_name = metadata.get("tool_call_name")
                 if tool_call_name in network.route_nodes:
-                    if network.classification_node:
+                    if network.classification_node and not network.speculative_routing:
                         await self._create_classification_node(node, network)
                     else:
                         await self._create_next_action_node(network, node)
@@ -313,6 +327,7 @@ class MultiAgentNetworkNode(NetworkNode):
                 elif network.classification_node and type(node) is gnf().get_registered_node_type(network.default_node):
                     # Need to parse the classification result
                     classification_result = parse_classification_result(node.outputs.content, network)
+                    store_routing_decision(network, node, classification_result)
                     if classification_result and classification_result.get("action") == "FINAL":
                         network.outputs = AIMessage(classification_result.get("content"))
                         self._update_ui_for_networks(node)
@@ -416,6 +431,12 @@ class MultiAgentNetworkNode(NetworkNode):
                 supervisor_node.metadata["multi_agent_supervisor"] = True
 
         async def _create_classification_node(self, node, network):
+            classification = lookup_routing_decision(network, node)
+            if classification:
+                # The same question was classified in the same context
+                await self._create_next_action_node(network, node, classification)
+                return
+
             await create_classification_node(network, node)
 
         def _update_ui_for_networks(self, node):
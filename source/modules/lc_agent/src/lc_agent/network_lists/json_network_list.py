@@ -7,9 +7,11 @@
 ## license agreement from NVIDIA CORPORATION is strictly prohibited.
 ##
 
+from ..utils.network_serialization import NetworkJournal
+from ..utils.network_serialization import deserialize_network
 from ..utils.pydantic import is_using_pydantic_v1
 from .network_list import NetworkList
-from typing import Optional
+from typing import Any, Dict, Optional
 import getpass
 import glob
 import json
@@ -25,15 +27,32 @@ def _sanitize_filename(filename: str) -> str:
 
 
 class JsonNetworkList(NetworkList):
-    """Custom save/load for Network List"""
+    """
+    Custom save/load for Network List
+
+    With `compact`, every network is a JSON Lines file of the compact format
+    of `NetworkJournal`: a save appends the nodes created or changed since the
+    previous save instead of writing the whole conversation again.
+    """
 
     SAVE_PATH = "%%tmp%%/networks/%%user%%"
 
-    def __init__(self, username: Optional[str] = None, *args, **kwargs):
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        *args,
+        compact: bool = False,
+        compact_every: int = 50,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         # A dictionary to keep track of the checksums for each filename
         self.network_hashes = {}
         self._username = username
+        self._compact = compact
+        self._compact_every = compact_every
+        # filename -> (network, journal) of the compact files
+        self._journals = {}
 
     def _compute_hash(self, network: "RunnableNetwork") -> str:
         """Compute a fast hash for a given data"""
@@ -74,6 +93,12 @@ class JsonNetworkList(NetworkList):
 
         for idx, n in enumerate(networks_to_serialize):
             network_name = _sanitize_filename(n.name or n.metadata.get("name", None) or "RunnableNetwork")
+            if self._compact:
+                filename = f"{idx:04}_{network_name}.jsonl"
+                saved_files.append(filename)
+                self._save_journal(filename, n)
+                continue
+
             filename = f"{idx:04}_{network_name}.json"
             current_hash = self._compute_hash(n)
 
@@ -82,6 +107,8 @@ class JsonNetworkList(NetworkList):
             # Determine which networks have changed
             if filename not in self.network_hashes or self.network_hashes[filename] != current_hash:
                 to_save.append(n)
+                # The metadata could be changed in place
+                self._metadata_index.mark_dirty(n)
                 # Update hash
                 self.network_hashes[filename] = current_hash
 
@@ -94,14 +121,70 @@ class JsonNetworkList(NetworkList):
                 print(f"Network saved: {filepath}")
 
         # Remove old files that aren't in current list
-        all_files = set(glob.glob(os.path.join(dirpath, "*.json")))
+        all_files = set(glob.glob(os.path.join(dirpath, "*.json"))) | set(glob.glob(os.path.join(dirpath, "*.jsonl")))
         all_files_shortnames = {os.path.basename(f) for f in all_files}
 
         for old_file in all_files_shortnames - set(saved_files):
             os.remove(os.path.join(dirpath, old_file))
             self.network_hashes.pop(old_file, None)
+            self._journals.pop(old_file, None)
             print(f"Deleted old network file: {os.path.join(dirpath, old_file)}")
 
+    def _on_network_event(self, network: "RunnableNetwork", event: "RunnableNetwork.Event", payload: Dict[str, Any]):
+        super()._on_network_event(network, event, payload)
+
+        # The next save serializes the node again, even if it was changed in place
+        node = payload.get("node")
+        if node is not None:
+            for saved_network, journal in self._journals.values():
+                if saved_network is network:
+                    journal.mark_dirty(node)
+
+    def _save_journal(self, filename: str, network: "RunnableNetwork"):
+        """Appends the changes of the network to its compact file."""
+        saved_network, journal = self._journals.get(filename, (None, None))
+        if saved_network is not network:
+            # A new network or another network at this position: starts with a snapshot
+            journal = NetworkJournal(compact_every=self._compact_every)
+            self._journals[filename] = (network, journal)
+
+        record = journal.record(network)
+        if record is None:
+            return
+
+        # The metadata could be changed in place
+        self._metadata_index.mark_dirty(network)
+
+        filepath = self._get_save_path(filename)
+        # A snapshot replaces the previous records
+        with open(filepath, "w" if record["kind"] == "snapshot" else "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+        print(f"Network saved: {filepath}")
+
+    def _load_journal(self, filepath: str) -> "RunnableNetwork":
+        with open(filepath, "r", encoding="utf-8") as f:
+            text = f.read()
+        lines = [line for line in text.splitlines() if line.strip()]
+
+        records = []
+        for i, line in enumerate(lines):
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                if i + 1 < len(lines):
+                    raise
+                # The last save was interrupted, the previous records are complete
+                print(f"Skipped the incomplete last record of {filepath}")
+
+        journal = NetworkJournal(compact_every=self._compact_every)
+        network = journal.load(records)
+        if len(records) < len(lines) or not text.endswith("\n"):
+            # The next save can't be appended after a partial line, it rewrites the file with a snapshot
+            journal.compact()
+        self._journals[os.path.basename(filepath)] = (network, journal)
+        return network
+
     def load(self):
         from lc_agent import RunnableNetwork
 
@@ -111,23 +194,26 @@ class JsonNetworkList(NetworkList):
             print(f"Can't load history. Directory doesn't exist: {dirpath}")
             return
 
-        files = sorted(glob.glob(os.path.join(dirpath, "*.json")))
+        files = sorted(glob.glob(os.path.join(dirpath, "*.json")) + glob.glob(os.path.join(dirpath, "*.jsonl")))
 
         self.clear()
 
         self.network_hashes.clear()
+        self._journals.clear()
         for filepath in files:
             filename = os.path.basename(filepath)
             try:
-                if is_using_pydantic_v1():
+                if filename.endswith(".jsonl"):
+                    network = self._load_journal(filepath)
+                elif is_using_pydantic_v1():
                     network = RunnableNetwork.parse_file(filepath)
                 else:
                     # Read the JSON file and parse it into a Python dictionary
                     with open(filepath, "r", encoding="utf-8") as f:
                         data_dict = json.load(f)
 
-                    # Use model_validate with the dictionary
-                    network = RunnableNetwork.model_validate(data_dict)
+                    # Use model_validate with the dictionary, or the compact format
+                    network = deserialize_network(data_dict)
             except TypeError as e:
                 import traceback
 
@@ -141,7 +227,8 @@ class JsonNetworkList(NetworkList):
                 print(f"Can't load {filename} because {e}")
                 continue
             self.append(network)
-            self.network_hashes[filename] = self._compute_hash(network)
+            if filename.endswith(".json"):
+                self.network_hashes[filename] = self._compute_hash(network)
 
     def delete(self, network: "RunnableNetwork"):
         if network not in self:
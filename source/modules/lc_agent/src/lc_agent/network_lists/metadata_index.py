@@ -0,0 +1,327 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Inverted index of the metadata of the networks of a `NetworkList`.
+
+The index maps (metadata key, value) to the networks and to the nodes that have
+this metadata, and the uuids to the networks. The metadata of the networks is
+indexed when a network is added. The metadata of the nodes can be large, like
+the inputs of the chat model, so a node key is indexed on its first query and
+kept up to date after that. The same for the sorted values of a key used by
+the range queries.
+
+The metadata dicts can be changed in place without any event. The index only
+narrows the candidates: every candidate is compared with its live metadata, so
+a stale entry never gives a wrong result. A network is indexed again when it's
+marked dirty, on the node and metadata events of the network and on save.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+import threading
+
+# Posting of the values that can't be hashed, they are compared on the query
+_UNHASHABLE = object()
+_MISSING = object()
+
+
+def _posting_value(value: Any) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        return _UNHASHABLE
+    return value
+
+
+def _sort_rank(value: Any) -> Optional[int]:
+    """Group of the values that can be compared with each other: numbers, then strings."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        # NaN can't be ordered
+        return 0 if value == value else None
+    if isinstance(value, str):
+        return 1
+    return None
+
+
+def _matches(metadata: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
+    for key, value in criteria.items():
+        if metadata.get(key, _MISSING) != value:
+            return False
+    return True
+
+
+class _NetworkEntry:
+    """What is indexed for one network, to remove it when the network changes."""
+
+    __slots__ = ("network", "seq", "uuid", "postings", "node_postings", "nodes", "sorted_items")
+
+    def __init__(self, network: "RunnableNetwork", seq: int):
+        self.network = network
+        self.seq = seq
+        self.uuid: Optional[str] = None
+        # (key, value) of the network metadata
+        self.postings: List[Tuple[str, Hashable]] = []
+        # ((key, value), node id) of the node metadata
+        self.node_postings: List[Tuple[Tuple[str, Hashable], int]] = []
+        # node id -> (position in the network, node)
+        self.nodes: Dict[int, Tuple[int, "RunnableNode"]] = {}
+        # (key, item) of the sorted values of the network metadata
+        self.sorted_items: List[Tuple[str, Tuple]] = []
+
+
+class MetadataIndex:
+    """Index of the network and node metadata of a network list."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._next_seq = 0
+        # id(network) -> entry
+        self._entries: Dict[int, _NetworkEntry] = {}
+        self._by_uuid: Dict[str, _NetworkEntry] = {}
+        # (key, value) -> ids of the networks, a dict keeps the order of the insertion
+        self._networks: Dict[Tuple[str, Hashable], Dict[int, None]] = {}
+        # (key, value) -> id(node) -> id(network)
+        self._nodes: Dict[Tuple[str, Hashable], Dict[int, int]] = {}
+        # The node keys that are indexed
+        self._node_keys: Set[str] = set()
+        # key -> sorted (rank, value, seq, id(network))
+        self._sorted: Dict[str, List[Tuple]] = {}
+        # ids of the networks to index again before the next query
+        self._dirty: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, network: "RunnableNetwork"):
+        """Indexes a network added at the end of the list."""
+        with self._lock:
+            entry = self._entries.get(id(network))
+            if entry is None:
+                entry = self._entries[id(network)] = _NetworkEntry(network, self._next_seq)
+                self._next_seq += 1
+            else:
+                self._unindex(entry)
+            self._index(entry)
+
+    def remove(self, network: "RunnableNetwork"):
+        with self._lock:
+            entry = self._entries.pop(id(network), None)
+            if entry is not None:
+                self._unindex(entry)
+                self._dirty.discard(id(network))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_uuid.clear()
+            self._networks.clear()
+            self._nodes.clear()
+            self._node_keys.clear()
+            self._sorted.clear()
+            self._dirty.clear()
+
+    def mark_dirty(self, network: "RunnableNetwork"):
+        """The network is indexed again before the next query."""
+        self._dirty.add(id(network))
+
+    def reindex(self, network: Optional["RunnableNetwork"] = None):
+        """Indexes the network again, or all the networks."""
+        with self._lock:
+            entries = list(self._entries.values()) if network is None else [self._entries.get(id(network))]
+            for entry in entries:
+                if entry is not None:
+                    self._unindex(entry)
+                    self._index(entry)
+                    self._dirty.discard(id(entry.network))
+
+    def _flush(self):
+        while self._dirty:
+            entry = self._entries.get(self._dirty.pop())
+            if entry is not None:
+                self._unindex(entry)
+                self._index(entry)
+
+    def _index(self, entry: _NetworkEntry):
+        network = entry.network
+        network_id = id(network)
+        # Creates the uuid if the metadata was replaced
+        entry.uuid = network.uuid()
+        self._by_uuid[entry.uuid] = entry
+        metadata = network.metadata
+
+        for key, value in metadata.items():
+            posting = (key, _posting_value(value))
+            self._networks.setdefault(posting, {})[network_id] = None
+            entry.postings.append(posting)
+
+        for key, items in self._sorted.items():
+            item = self._sort_item(entry, metadata.get(key, _MISSING))
+            if item is not None:
+                insort(items, item)
+                entry.sorted_items.append((key, item))
+
+        for position, node in enumerate(network.nodes):
+            entry.nodes[id(node)] = (position, node)
+            if self._node_keys:
+                self._index_node(entry, node, self._node_keys)
+
+    def _index_node(self, entry: _NetworkEntry, node: "RunnableNode", keys: Iterable[str]):
+        metadata = node.metadata
+        for key in keys:
+            value = metadata.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            posting = (key, _posting_value(value))
+            self._nodes.setdefault(posting, {})[id(node)] = id(entry.network)
+            entry.node_postings.append((posting, id(node)))
+
+    def _unindex(self, entry: _NetworkEntry):
+        network_id = id(entry.network)
+        if entry.uuid is not None and self._by_uuid.get(entry.uuid) is entry:
+            del self._by_uuid[entry.uuid]
+        entry.uuid = None
+
+        for posting in entry.postings:
+            ids = self._networks.get(posting)
+            if ids is not None:
+                ids.pop(network_id, None)
+                if not ids:
+                    del self._networks[posting]
+        entry.postings = []
+
+        for posting, node_id in entry.node_postings:
+            ids = self._nodes.get(posting)
+            if ids is not None:
+                ids.pop(node_id, None)
+                if not ids:
+                    del self._nodes[posting]
+        entry.node_postings = []
+        entry.nodes = {}
+
+        for key, item in entry.sorted_items:
+            items = self._sorted.get(key)
+            if items:
+                index = bisect_left(items, item)
+                if index < len(items) and items[index] == item:
+                    del items[index]
+        entry.sorted_items = []
+
+    @staticmethod
+    def _sort_item(entry: _NetworkEntry, value: Any) -> Optional[Tuple]:
+        rank = _sort_rank(value)
+        if rank is None:
+            return None
+        return (rank, value, entry.seq, id(entry.network))
+
+    def _candidates(
+        self, postings: Dict[Tuple[str, Hashable], Dict[int, Any]], criteria: Dict[str, Any]
+    ) -> List[Tuple[int, Any]]:
+        """(id, posted value) in the postings of all the criteria, starting with the smallest posting."""
+        lists = []
+        for key, value in criteria.items():
+            ids = postings.get((key, _posting_value(value)))
+            if not ids:
+                return []
+            lists.append(ids)
+        lists.sort(key=len)
+        return [item for item in lists[0].items() if all(item[0] in ids for ids in lists[1:])]
+
+    def find_networks(self, metadata: Dict[str, Any]) -> List["RunnableNetwork"]:
+        """The networks that have all the metadata, in the order they were added."""
+        with self._lock:
+            self._flush()
+            if not metadata:
+                entries = self._entries.values()
+            else:
+                entries = [self._entries[network_id] for network_id, _ in self._candidates(self._networks, metadata)]
+            entries = sorted(entries, key=lambda entry: entry.seq)
+            return [entry.network for entry in entries if _matches(entry.network.metadata, metadata)]
+
+    def find_nodes(self, metadata: Dict[str, Any]) -> List["RunnableNode"]:
+        """The nodes that have all the metadata, in the order of the networks and the nodes in the networks."""
+        with self._lock:
+            self._flush()
+            new_keys = [key for key in metadata if key not in self._node_keys]
+            if new_keys:
+                # The first query of a key indexes the nodes
+                for entry in self._entries.values():
+                    for _, node in entry.nodes.values():
+                        self._index_node(entry, node, new_keys)
+                self._node_keys.update(new_keys)
+
+            found = []
+            if not metadata:
+                for entry in self._entries.values():
+                    found.extend((entry.seq, position, node) for position, node in entry.nodes.values())
+            else:
+                for node_id, network_id in self._candidates(self._nodes, metadata):
+                    entry = self._entries.get(network_id)
+                    if entry is None or node_id not in entry.nodes:
+                        continue
+                    position, node = entry.nodes[node_id]
+                    found.append((entry.seq, position, node))
+
+            found.sort(key=lambda item: item[:2])
+            return [node for _, _, node in found if _matches(node.metadata, metadata)]
+
+    def find_by_uuid(self, uuid: str) -> Optional["RunnableNetwork"]:
+        with self._lock:
+            self._flush()
+            entry = self._by_uuid.get(uuid)
+            if entry is not None and entry.network.metadata.get("uuid") == uuid:
+                return entry.network
+            return None
+
+    def find_in_range(
+        self,
+        key: str,
+        start: Any = None,
+        end: Any = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+    ) -> List["RunnableNetwork"]:
+        """The networks with the metadata value between start and end, included, sorted by the value."""
+        with self._lock:
+            self._flush()
+            items = self._sorted.get(key)
+            if items is None:
+                # The first range query of a key sorts the values
+                items = self._sorted[key] = []
+                for entry in self._entries.values():
+                    item = self._sort_item(entry, entry.network.metadata.get(key, _MISSING))
+                    if item is not None:
+                        items.append(item)
+                        entry.sorted_items.append((key, item))
+                items.sort()
+
+            if start is None and end is None:
+                low, high = 0, len(items)
+            else:
+                rank = _sort_rank(start if start is not None else end)
+                if rank is None or (start is not None and end is not None and _sort_rank(end) != rank):
+                    raise TypeError(f"Range of '{key}' should be two numbers or two strings: {start!r}, {end!r}")
+                low = bisect_left(items, (rank, start) if start is not None else (rank,))
+                high = bisect_right(items, (rank, end, float("inf"))) if end is not None else bisect_left(items, (rank + 1,))
+
+            selected = items[low:high]
+            if reverse:
+                selected = reversed(selected)
+
+            result = []
+            for _, value, _, network_id in selected:
+                entry = self._entries.get(network_id)
+                if entry is None or entry.network.metadata.get(key, _MISSING) != value:
+                    continue
+                result.append(entry.network)
+                if limit is not None and len(result) >= limit:
+                    break
+            return result
@@ -9,10 +9,13 @@
 
 __all__ = ["NetworkList"]
 
+from .metadata_index import MetadataIndex
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Callable
+from typing import Optional
+from typing import Union
 import abc
 import enum
 
@@ -35,6 +38,8 @@ class NetworkList:
                                  such as appending, removing, and indexing.
     - **Enhanced Search**: It offers powerful searching capabilities to find
                            networks or nodes based on given criteria or metadata.
+                           The metadata queries use an index, so they scale with
+                           the number of results rather than the stored nodes.
     - **Event-driven Programming**: Users can register callback functions to be
                                     invoked for specific events, such as when
                                     networks are added or removed.
@@ -56,6 +61,10 @@ class NetworkList:
         super().__init__()
         self._networks = []
         self._callbacks = {}
+        self._metadata_index = MetadataIndex()
+        # id(network) -> id of the event fn that keeps the index up to date
+        self._network_event_ids = {}
+        self._filter = None
 
     def append(self, network: "RunnableNetwork"):
         """
@@ -65,6 +74,7 @@ class NetworkList:
             network (RunnableNetwork): The node network to add.
         """
         self._networks.append(network)
+        self._watch_network(network)
         self.__event_callback(self.Event.NETWORK_ADDED, {"network": network})
 
     def remove(self, network: "RunnableNetwork"):
@@ -75,6 +85,8 @@ class NetworkList:
             network (RunnableNetwork): The node network to remove.
         """
         self._networks.remove(network)
+        if not any(n is network for n in self._networks):
+            self._unwatch_network(network)
         self.__event_callback(self.Event.NETWORK_REMOVED, {"network": network})
 
     def __getitem__(self, index: int) -> "RunnableNetwork":
@@ -101,7 +113,45 @@ class NetworkList:
 
         Clears the history, removing all node networks.
         """
+        for network in self._networks:
+            self._unwatch_network(network)
         self._networks.clear()
+        self._metadata_index.clear()
+
+    def _watch_network(self, network: "RunnableNetwork"):
+        """Indexes the metadata of the network and follows its changes."""
+        self._metadata_index.add(network)
+        if id(network) in self._network_event_ids:
+            return
+
+        def on_network_event(event, payload, network=network):
+            self._on_network_event(network, event, payload)
+
+        self._network_event_ids[id(network)] = network.set_event_fn(on_network_event)
+
+    def _on_network_event(self, network: "RunnableNetwork", event: "RunnableNetwork.Event", payload: Dict[str, Any]):
+        """Called on the events of the networks of the list."""
+        # Nodes added or removed, or metadata changed: index it again on the next query
+        self._metadata_index.mark_dirty(network)
+
+    def _unwatch_network(self, network: "RunnableNetwork"):
+        event_id = self._network_event_ids.pop(id(network), None)
+        if event_id is not None:
+            network.remove_event_fn(event_id)
+        self._metadata_index.remove(network)
+
+    def reindex(self, network: Optional["RunnableNetwork"] = None):
+        """
+        Indexes the metadata of a network again, or of all the networks.
+
+        The index follows the events of the networks and the saves. Call it
+        after changing the metadata of a node or a network in place when the
+        change should be found before the next save.
+
+        Args:
+            network (RunnableNetwork, optional): The network to index. If None, all networks are indexed.
+        """
+        self._metadata_index.reindex(network)
 
     def find_network(
         self, criteria: Callable[["RunnableNetwork"], bool]
@@ -134,7 +184,24 @@ class NetworkList:
         Returns:
             List[RunnableNode]: A list of RunnableNode objects that meet the criteria.
         """
-        pass
+        result = []
+        for network in self:
+            for node in network.nodes:
+                if criteria(node):
+                    result.append(node)
+        return result
+
+    def find_network_by_uuid(self, uuid: str) -> Optional["RunnableNetwork"]:
+        """
+        Finds the network with the given uuid.
+
+        Args:
+            uuid (str): The uuid of the network, see `RunnableNetwork.uuid`.
+
+        Returns:
+            RunnableNetwork: The network, or None if it's not in the list.
+        """
+        return self._metadata_index.find_by_uuid(uuid)
 
     def find_network_by_metadata(
         self, metadata: Dict[str, Any]
@@ -142,6 +209,8 @@ class NetworkList:
         """
         Searches for network that has the given metadata.
 
+        The metadata changed in place is found after the next save or `reindex`.
+
         Args:
             metadata (Dict[str, Any]): The network meets the criteria if it has
                                        metadata with all the name and values of
@@ -150,16 +219,33 @@ class NetworkList:
         Returns:
             List[RunnableNetwork]: A list of RunnableNetwork objects that meet the criteria.
         """
+        return self._metadata_index.find_networks(metadata)
+
+    def find_network_by_range(
+        self,
+        key: str,
+        start: Any = None,
+        end: Any = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+    ) -> List["RunnableNetwork"]:
+        """
+        Searches for networks with a metadata value in a range, sorted by this value.
 
-        def criteria(network, metadata=metadata):
-            meets = True
-            for key, value in metadata.items():
-                if network.metadata[key] != value:
-                    meets = False
-                    break
-            return meets
+        Useful to list the conversations by timestamp. The values are numbers
+        or strings like ISO dates, networks with other values are skipped.
 
-        return self.find_network(criteria)
+        Args:
+            key (str): The metadata key, like "timestamp".
+            start (Any, optional): The smallest value, included. If None, there is no lower bound.
+            end (Any, optional): The largest value, included. If None, there is no upper bound.
+            reverse (bool): Sort from the largest value.
+            limit (int, optional): Maximum number of networks to return.
+
+        Returns:
+            List[RunnableNetwork]: A list of RunnableNetwork objects sorted by the value.
+        """
+        return self._metadata_index.find_in_range(key, start, end, reverse, limit)
 
     def find_node_by_metadata(self, metadata: Dict[str, Any]) -> List["RunnableNode"]:
         """
@@ -175,16 +261,35 @@ class NetworkList:
         Returns:
             List[RunnableNode]: A list of RunnableNode objects that meet the criteria.
         """
-        pass
+        return self._metadata_index.find_nodes(metadata)
 
-    def filter_conversations(self, criteria: Callable[["RunnableNetwork"], bool]):
+    def filter_conversations(
+        self, criteria: Optional[Union[Callable[["RunnableNetwork"], bool], Dict[str, Any]]]
+    ) -> List["RunnableNetwork"]:
         """
         Temporarily hides networks from view if they don't meet the provided criteria.
 
+        The list itself keeps all the networks, so they are still saved. The
+        networks in view are in `visible_networks`.
+
         Args:
-            criteria (Callable[[RunnableNetwork], bool]): Evaluation function for each RunnableNetwork.
-        """
-        pass
+            criteria: Evaluation function for each RunnableNetwork, or the metadata
+                the networks should have. None shows all the networks.
+
+        Returns:
+            List[RunnableNetwork]: The networks in view.
+        """
+        self._filter = criteria
+        return self.visible_networks
+
+    @property
+    def visible_networks(self) -> List["RunnableNetwork"]:
+        """The networks that meet the criteria of `filter_conversations`."""
+        if self._filter is None:
+            return list(self._networks)
+        if isinstance(self._filter, dict):
+            return self.find_network_by_metadata(self._filter)
+        return self.find_network(self._filter)
 
     @abc.abstractmethod
     def save(self, network: "RunnableNetwork" = None):
@@ -82,6 +82,7 @@ class RedisNetworkList(NetworkList):
         if network:
             current_id = network.uuid()
             current_hash = self._compute_hash(network)
+            self._metadata_index.mark_dirty(network)
             await self._store_json(network)
 
         else:
@@ -91,6 +92,7 @@ class RedisNetworkList(NetworkList):
 
                 if current_id not in self.network_hashes or self.network_hashes[current_id] != current_hash:
                     self.network_hashes[current_id] = current_hash
+                    self._metadata_index.mark_dirty(n)
                     await self._store_json(n)
 
     def save(self, network: Optional["RunnableNetwork"] = None):
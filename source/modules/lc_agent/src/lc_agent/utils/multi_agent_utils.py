@@ -20,16 +20,23 @@ from ..runnable_network import RunnableNetwork
 from ..runnable_node import RunnableNode
 from ..runnable_utils import RunnableHumanNode
 from ..runnable_utils import RunnableSystemAppend
+from .profiling_utils import Profiler
+from .routing_cache import get_routing_cache
 from langchain_core.messages import AIMessage
 from langchain_core.messages import HumanMessage
+import hashlib
+import re
 import time
-from typing import Optional, Tuple, List, Dict
+from typing import Callable, Optional, Tuple, List, Dict
 
 # Debug flag for printing execution time.
 PRINT_TIME = False
 # Maximum iterations to avoid infinite loops.
 MAX_ITERATIONS = 100
 
+# A non-space character followed by a space: the first word of a line is complete.
+_WORD_END_RE = re.compile(r"\S\s")
+
 # Routing system prompts for long and short versions.
 ROUTING_SYSTEM_LONG = """
 Respond to the human as helpfully and accurately as possible. You have access to the following tools:
@@ -248,6 +255,7 @@ async def _process_network_stream(
     network: "MultiAgentNetworkNode",
     node: "RunnableNode",
     all_active_networks: List[RunnableNetwork],
+    route_parser: Optional["RouteStreamParser"] = None,
 ) -> str:
     """
     Asynchronously process the network stream and update the output.
@@ -260,31 +268,41 @@ async def _process_network_stream(
         network: The main multi-agent network.
         node: The current runnable node.
         all_active_networks: List of all active networks for UI updating.
+        route_parser: Optional parser of the stream. The stream is stopped when it commits to a route.
 
     Returns:
         The accumulated result as a string.
     """
     result = ""
-    # Stream results as they are generated.
-    async for c in tmp_network.astream():
-        result += c.content
-
-        # When the result starts with "final", update UI outputs.
-        if result[:5].lower() == "final":
-            text = result[6:]  # Extract text after "FINAL "
-            if not network.outputs or not isinstance(network.outputs, AIMessage):
-                network.outputs = AIMessage(text)
-            else:
-                network.outputs.content = text
-
-            # Update all active networks.
-            update_node = node
-            for update_network in all_active_networks:
-                update_network._event_callback(
-                    RunnableNetwork.Event.NODE_INVOKED,
-                    {"node": update_node, "network": update_network},
-                )
-                update_node = update_network
+    stream = tmp_network.astream()
+    try:
+        # Stream results as they are generated.
+        async for c in stream:
+            result += c.content
+
+            if route_parser and route_parser.feed(c.content):
+                # The route is known, the rest of the generation is not needed.
+                return route_parser.text
+
+            # When the result starts with "final", update UI outputs.
+            if result[:5].lower() == "final":
+                text = result[6:]  # Extract text after "FINAL "
+                if not network.outputs or not isinstance(network.outputs, AIMessage):
+                    network.outputs = AIMessage(text)
+                else:
+                    network.outputs.content = text
+
+                # Update all active networks.
+                update_node = node
+                for update_network in all_active_networks:
+                    update_network._event_callback(
+                        RunnableNetwork.Event.NODE_INVOKED,
+                        {"node": update_node, "network": update_network},
+                    )
+                    update_node = update_network
+    finally:
+        # Cancels the generation when the stream is stopped early
+        await stream.aclose()
     return result
 
 
@@ -298,6 +316,10 @@ async def determine_next_action(
     It checks whether the same tool call has already been made to avoid loops. Finally, it parses
     the classification result into an actionable dictionary.
 
+    With `speculative_routing` enabled on the network, the stream is parsed as it arrives. The node of the
+    route is created as soon as the route is named, and the generation is stopped at the end of its line.
+    The created node is returned in the "node" key of the dictionary.
+
     Args:
         network: The multi-agent network node.
         node: Optional starting runnable node; if not provided, determined from network.
@@ -317,6 +339,11 @@ async def determine_next_action(
     if not question:
         return False
 
+    # Reuse the decision of the same question in the same context.
+    cached_classification = lookup_routing_decision(network, node)
+    if cached_classification:
+        return cached_classification
+
     # Determine whether to use the long version of the prompt.
     use_long_prompt = network.generate_prompt_per_agent
     chat_model_name = network._get_chat_model_name(None, None, None)
@@ -346,10 +373,21 @@ async def determine_next_action(
     all_active_networks = list(RunnableNetwork.get_active_networks())
     previous_classifications = _get_previous_classifications(network, node)
 
+    # Nodes of the routes created while the classification streams
+    route_nodes: Dict[str, RunnableNode] = {}
+
+    def prewarm_route(action: str):
+        if action != "FINAL" and action not in route_nodes:
+            route_nodes[action] = create_route_node(network, action)
+
     # Process the streaming output and check for repeated tool calls.
     while True:
+        route_parser = None
+        if getattr(network, "speculative_routing", False):
+            route_parser = RouteStreamParser(network.route_nodes, on_action=prewarm_route)
+
         try:
-            result = await _process_network_stream(tmp_network, network, node, all_active_networks)
+            result = await _process_network_stream(tmp_network, network, node, all_active_networks, route_parser)
         except Exception as e:
             return False
 
@@ -382,6 +420,10 @@ async def determine_next_action(
     # Parse the result using the provided parser function.
     parsed_result = parse_classification_result(result, network)
     if parsed_result:
+        store_routing_decision(network, node, parsed_result)
+        created_node = route_nodes.get(parsed_result["action"])
+        if created_node is not None:
+            parsed_result["node"] = created_node
         return parsed_result
 
     return None
@@ -588,14 +630,252 @@ def parse_classification_result(result: str, network: "MultiAgentNetworkNode") -
         return {"action": "FINAL", "content": content, "full": result, "is_loop": False}
 
     # Handle route node action with loop detection
-    is_loop = False
+    is_loop = _is_loop(network, action, content)
+
+    return {"action": action, "content": content, "full": result, "is_loop": is_loop}
+
+
+def _is_loop(network: "MultiAgentNetworkNode", action: str, content: Optional[str]) -> bool:
+    """
+    Checks if the last tool call of the network is the same action with the same content.
+    """
     human_node, tools_called = _get_human_node_and_tools(network, network.get_leaf_node())
     if human_node and tools_called:
         last_tool_call = tools_called[-1]
         if last_tool_call["tool_call_name"] == action and last_tool_call["tool_call_content"] == content:
-            is_loop = True
+            return True
+    return False
 
-    return {"action": action, "content": content, "full": result, "is_loop": is_loop}
+
+def _get_routing_cache_key(
+    network: "MultiAgentNetworkNode", node: Optional["RunnableNode"]
+) -> Optional[Tuple[str, str, str, str]]:
+    """
+    Computes the key of the routing decision of the question of a node.
+
+    Returns:
+        The network key, the signature of its tool set, the question and the fingerprint of the recent
+        context, or None if there is no question to route.
+    """
+    human_node, tools_called = _get_human_node_and_tools(network, node)
+    if not human_node or len(tools_called) > MAX_ITERATIONS:
+        return None
+    question = str(human_node.outputs.content)
+    if not question:
+        return None
+
+    network_type = type(network)
+    network_key = f"{network_type.__module__}.{network_type.__qualname__}:{network.name or ''}"
+
+    # The decisions depend on the routes, their descriptions and the routing instructions
+    signature = hashlib.sha256()
+    for part in [
+        _get_routing_prompt(network, network.generate_prompt_per_agent),
+        network.default_node,
+        network.first_routing_instruction,
+        network.subsequent_routing_instruction,
+    ]:
+        signature.update(str(part).encode("utf-8"))
+        signature.update(b"\0")
+
+    # The tool calls of the question and the last messages of the history before it
+    context = hashlib.sha256()
+    for tool in tools_called:
+        for part in [tool["tool_call_name"], tool["tool_call_content"], tool["result"]]:
+            context.update(str(part).encode("utf-8"))
+            context.update(b"\0")
+    context.update(b"\1")
+    history_messages = 0
+    history_node = human_node.parents[0] if human_node.parents else None
+    while history_node and history_messages < network.routing_cache_context:
+        if history_node.metadata.get("contribute_to_history", True) and history_node.outputs is not None:
+            context.update(str(getattr(history_node.outputs, "content", history_node.outputs)).encode("utf-8"))
+            context.update(b"\0")
+            history_messages += 1
+        history_node = history_node.parents[0] if history_node.parents else None
+
+    return network_key, signature.hexdigest(), question, context.hexdigest()
+
+
+def lookup_routing_decision(
+    network: "MultiAgentNetworkNode", node: Optional["RunnableNode"]
+) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Finds the cached routing decision of the question of a node.
+
+    The decision is reused when the network has `routing_cache` enabled and the same question, or a similar
+    one with an embedder, was routed in the same context. The lookup is recorded by the Profiler with the
+    hit and miss counts of the cache.
+
+    Args:
+        network: The multi-agent network node.
+        node: The node that needs the next action.
+
+    Returns:
+        A dictionary like `parse_classification_result` returns, or None if the decision is not cached.
+    """
+    if not getattr(network, "routing_cache", False):
+        return None
+
+    key = _get_routing_cache_key(network, node)
+    if key is None:
+        return None
+
+    network_key, signature, question, context = key
+    routing_cache = get_routing_cache()
+    profiler = Profiler("routing_cache_lookup", "routing", network=network, auto_start=False)
+    with profiler:
+        hit = routing_cache.lookup(network_key, signature, question, context)
+        profiler.update_metadata(
+            hit=hit is not None,
+            exact=hit.exact if hit else False,
+            similarity=hit.similarity if hit else 0.0,
+            **routing_cache.get_stats(),
+        )
+
+    if hit is None:
+        return None
+
+    classification = hit.classification
+    if not hit.exact and network.generate_prompt_per_agent:
+        # The question of the route was generated for another question
+        classification["content"] = question
+        classification["full"] = f"{classification['action']} {question}"
+    classification["is_loop"] = _is_loop(network, classification["action"], classification["content"])
+    return classification
+
+
+def store_routing_decision(
+    network: "MultiAgentNetworkNode", node: Optional["RunnableNode"], classification: Dict[str, Optional[str]]
+) -> None:
+    """
+    Caches the routing decision of the question of a node.
+
+    Only routes are cached. FINAL answers and loops always go to the chat model.
+
+    Args:
+        network: The multi-agent network node.
+        node: The node that needed the next action, or the classification node.
+        classification: The parsed classification.
+    """
+    if not getattr(network, "routing_cache", False):
+        return
+    if not classification or classification["action"] == "FINAL" or classification.get("is_loop"):
+        return
+
+    key = _get_routing_cache_key(network, node)
+    if key is None:
+        return
+
+    network_key, signature, question, context = key
+    get_routing_cache().store(
+        network_key,
+        signature,
+        question,
+        context,
+        {"action": classification["action"], "content": classification["content"], "full": classification["full"]},
+    )
+
+
+class RouteStreamParser:
+    """
+    Finds the action of a classification while it streams.
+
+    The action is the one `_find_action_at_line_start` finds in the whole text: the first line that starts
+    with FINAL or a route node. It is known as soon as the first word of that line is complete. The routing
+    prompts ask for one line, so a route is committed when its line is complete and the rest of the
+    generation can be dropped. FINAL is never committed because its answer is streamed to the user.
+
+    Args:
+        route_nodes: Names of the route nodes.
+        on_action: Called with the action as soon as it is known.
+    """
+
+    def __init__(self, route_nodes: List[str], on_action: Optional[Callable[[str], None]] = None):
+        self._valid_actions = ["FINAL"] + list(route_nodes)
+        self._on_action = on_action
+        # Start of the line that is being read and where to look for its end
+        self._line_start = 0
+        self._search_start = 0
+        # The line that is being read doesn't start with an action
+        self._line_rejected = False
+        self.text = ""
+        self.action: Optional[str] = None
+        self.committed = False
+
+    def feed(self, text: str) -> bool:
+        """
+        Reads a chunk of the stream.
+
+        Returns:
+            True when the stream is committed to a route, `text` is the classification to parse.
+        """
+        if self.committed:
+            return True
+
+        self.text += text
+        if self.action == "FINAL":
+            return False
+
+        while True:
+            newline = self.text.find("\n", self._search_start)
+            if self.action is None and not self._line_rejected:
+                line = self.text[self._line_start :] if newline == -1 else self.text[self._line_start : newline]
+                if newline == -1 and not _WORD_END_RE.search(line):
+                    # The first word of the line can still change
+                    return False
+
+                self.action = _line_starts_with_action(line, self._valid_actions)
+                if self.action is None:
+                    self._line_rejected = True
+                else:
+                    if self._on_action:
+                        self._on_action(self.action)
+                    if self.action == "FINAL":
+                        return False
+
+            if newline == -1:
+                self._search_start = len(self.text)
+                return False
+
+            if self.action is not None:
+                self.text = self.text[:newline]
+                self.committed = True
+                return True
+
+            self._line_start = self._search_start = newline + 1
+            self._line_rejected = False
+
+
+def create_route_node(network: "MultiAgentNetworkNode", action: str) -> Optional["RunnableNode"]:
+    """
+    Creates the node of a route before the classification is complete.
+
+    The node is created outside of the network with the metadata that is known from the route, which lets
+    the node assemble its modifiers and prompts while the rest of the classification streams. It is added to
+    the network when the next action node is created.
+
+    Args:
+        network: The multi-agent network node.
+        action: The name of the route node.
+
+    Returns:
+        The created node, or None if it can't be created.
+    """
+    metadata = {"tool_call_name": action}
+    if isinstance(network, NetworkNode):
+        for metadata_key in ["rag_top_k", "rag_max_tokens"]:
+            metadata_value = network.find_metadata(metadata_key)
+            if metadata_value is not None:
+                metadata[metadata_key] = metadata_value
+
+    try:
+        with RunnableNetwork():
+            # No network is attached
+            return get_node_factory().create_node(action, metadata=metadata)
+    except Exception:
+        # The node is created again when the route is taken
+        return None
 
 
 def _get_human_node_and_tools(
@@ -0,0 +1,491 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Compact serialization of `RunnableNetwork`.
+
+The serialized network of `RunnableNetwork.serialize_model` repeats the same
+texts many times: every node keeps the whole prompt of its chat model in
+`chat_model_input`, with the system message and the previous messages of the
+conversation. The compact format stores every long string once in a
+content-addressed blob table and replaces it with `{"__blob__": key}`.
+
+A record of the compact format is a snapshot of the whole network, or a delta
+with the nodes created or changed since the previous record. `NetworkJournal`
+writes a snapshot, then deltas, and a new snapshot every `compact_every`
+deltas, so the records can be appended to a file. A delta only serializes the
+nodes marked by the events of the network and the nodes with a replaced
+field or metadata value, the snapshots compare all of them.
+
+Format of a record:
+
+    {
+        "__format__": "lc_agent.network",
+        "__version__": 1,
+        "kind": "snapshot" | "delta",
+        "blobs": {key: text},
+        # snapshot: the serialized network with the blob references
+        "network": {...},
+        # delta: the changed fields of the network, the created or changed
+        # nodes by uuid, and the order of the nodes and the connections if
+        # they changed
+        "fields": {...},
+        "removed_fields": [...],
+        "nodes": {uuid: {...}},
+        "order": [uuid, ...],
+        "__connections__": {...},
+    }
+"""
+
+from .pydantic import is_using_pydantic_v1
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+import hashlib
+import json
+
+COMPACT_FORMAT = "lc_agent.network"
+COMPACT_FORMAT_VERSION = 1
+
+_BLOB_REF = "__blob__"
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _blob_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()[:32]
+
+
+def _fingerprint(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class BlobTable:
+    """
+    Content-addressed table of the long strings of serialized networks.
+
+    Args:
+        blobs: The blobs of a loaded record, key -> text.
+        min_size: Strings of this length or longer are stored in the table.
+    """
+
+    def __init__(self, blobs: Optional[Dict[str, str]] = None, min_size: int = 256):
+        self.blobs: Dict[str, str] = dict(blobs or {})
+        self.min_size = min_size
+        # Blobs added since the last take_pending()
+        self._pending: Dict[str, str] = {}
+        # id(text) -> (text, key), the texts of a network are the same objects from one save to the next
+        self._keys: Dict[int, Tuple[str, str]] = {}
+
+    def put(self, text: str) -> str:
+        """Adds the text to the table and returns its key."""
+        known = self._keys.get(id(text))
+        if known is not None and known[0] is text:
+            key = known[1]
+        else:
+            key = _blob_key(text)
+            self._keys[id(text)] = (text, key)
+
+        if key not in self.blobs:
+            self.blobs[key] = text
+            self._pending[key] = text
+        return key
+
+    def take_pending(self) -> Dict[str, str]:
+        """The blobs added since the previous call."""
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def pack(self, value: Any) -> Any:
+        """Copy of a serialized value with the long strings replaced by blob references."""
+        if isinstance(value, str):
+            if len(value) >= self.min_size:
+                return {_BLOB_REF: self.put(value)}
+            return value
+        if isinstance(value, dict):
+            return {key: self.pack(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.pack(item) for item in value]
+        return value
+
+    def unpack(self, value: Any) -> Any:
+        """Copy of a packed value with the blob references replaced by the strings of the table."""
+        if isinstance(value, dict):
+            if len(value) == 1 and _BLOB_REF in value:
+                # The same string object for every reference
+                return self.blobs[value[_BLOB_REF]]
+            return {key: self.unpack(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.unpack(item) for item in value]
+        return value
+
+
+def is_compact(data: Any) -> bool:
+    """True if the data is a record of the compact format."""
+    return isinstance(data, dict) and data.get("__format__") == COMPACT_FORMAT
+
+
+def _dump_network(network: "RunnableNetwork") -> Dict[str, Any]:
+    """The network serialized with the current format."""
+    if is_using_pydantic_v1():
+        return json.loads(network.json())
+    return network.model_dump()
+
+
+def _dump_fields(network: "RunnableNetwork") -> Dict[str, Any]:
+    """The serialized fields of the network without the nodes."""
+    if is_using_pydantic_v1():
+        data = json.loads(network.copy(update={"nodes": []}).json())
+    else:
+        data = network.model_copy(update={"nodes": []}).model_dump()
+    data.pop("nodes", None)
+    data.pop("__connections__", None)
+    return data
+
+
+def _dump_node(node: "RunnableNode") -> Dict[str, Any]:
+    """The node serialized like in the serialized network."""
+    if is_using_pydantic_v1():
+        return json.loads(node.json())
+    return node.model_dump()
+
+
+def _leaf_signature(value: Any) -> Any:
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return (id(value), len(value))
+    return id(value)
+
+
+def _node_signature(node: "RunnableNode") -> Tuple:
+    """
+    Identity of the fields of the node, and of the values of its dicts and
+    messages. It changes when a field, a metadata value or a message is
+    replaced, without serializing the node.
+    """
+    signature = []
+    for name, value in vars(node).items():
+        if name == "parents":
+            continue
+        if isinstance(value, _SCALARS):
+            signature.append(value)
+            continue
+        if isinstance(value, dict):
+            items = value.items()
+        elif hasattr(value, "__dict__"):
+            items = vars(value).items()
+        else:
+            signature.append(_leaf_signature(value))
+            continue
+        signature.append((id(value), tuple((key, _leaf_signature(item)) for key, item in items)))
+    return tuple(signature)
+
+
+def _validate_network(data: Dict[str, Any], network_type: Optional[Type["RunnableNetwork"]]) -> "RunnableNetwork":
+    if network_type is None:
+        from ..runnable_network import RunnableNetwork
+
+        network_type = RunnableNetwork
+
+    if is_using_pydantic_v1():
+        return network_type.parse_obj(data)
+    return network_type.model_validate(data)
+
+
+def _node_key(node: Dict[str, Any], index: int) -> str:
+    return _metadata_key(node.get("metadata"), index)
+
+
+def _metadata_key(metadata: Any, index: int) -> str:
+    uuid = metadata.get("uuid") if isinstance(metadata, dict) else None
+    return uuid if isinstance(uuid, str) and uuid else f"#{index}"
+
+
+def _connections(connections: Dict[Any, List[int]]) -> Dict[str, List[int]]:
+    """The connections with the keys of JSON."""
+    return {str(key): list(value) for key, value in connections.items()}
+
+
+class _NetworkRecords:
+    """The serialized network rebuilt from the records."""
+
+    def __init__(self):
+        self.blobs: Dict[str, str] = {}
+        self.fields: Dict[str, Any] = {}
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.order: List[str] = []
+        self.connections: Dict[str, List[int]] = {}
+        # Number of deltas since the last snapshot, None before the first snapshot
+        self.deltas: Optional[int] = None
+
+    def apply(self, record: Dict[str, Any]):
+        if not is_compact(record):
+            raise ValueError("Not a record of the compact network format")
+        version = record.get("__version__")
+        if not isinstance(version, int) or version > COMPACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported version of the compact network format: {version}")
+
+        kind = record.get("kind")
+        if kind == "snapshot":
+            network = dict(record["network"])
+            nodes = network.pop("nodes", []) or []
+            self.blobs = dict(record.get("blobs", {}))
+            self.connections = _connections(network.pop("__connections__", {}) or {})
+            self.fields = network
+            self.order = [_node_key(node, index) for index, node in enumerate(nodes)]
+            self.nodes = dict(zip(self.order, nodes))
+            self.deltas = 0
+        elif kind == "delta":
+            if self.deltas is None:
+                raise ValueError("A delta of the compact network format needs a snapshot first")
+            self.blobs.update(record.get("blobs", {}))
+            self.fields.update(record.get("fields", {}))
+            for field in record.get("removed_fields", []):
+                self.fields.pop(field, None)
+            self.nodes.update(record.get("nodes", {}))
+            if "order" in record:
+                self.order = list(record["order"])
+                self.nodes = {key: self.nodes[key] for key in self.order}
+            if "__connections__" in record:
+                self.connections = _connections(record["__connections__"])
+            self.deltas += 1
+        else:
+            raise ValueError(f"Unknown record of the compact network format: {kind}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The serialized network with the blob references."""
+        return {
+            **self.fields,
+            "nodes": [self.nodes[key] for key in self.order],
+            "__connections__": self.connections,
+        }
+
+
+def serialize_network(network: "RunnableNetwork", min_blob_size: int = 256) -> Dict[str, Any]:
+    """
+    Serializes the network to a snapshot of the compact format.
+
+    Args:
+        network: The network to serialize.
+        min_blob_size: Strings of this length or longer are stored once in the blob table.
+
+    Returns:
+        The snapshot record, it can be saved with json.
+    """
+    return _snapshot(_dump_network(network), BlobTable(min_size=min_blob_size))
+
+
+def _snapshot(data: Dict[str, Any], blobs: BlobTable) -> Dict[str, Any]:
+    data = blobs.pack(data)
+    blobs.take_pending()
+    return {
+        "__format__": COMPACT_FORMAT,
+        "__version__": COMPACT_FORMAT_VERSION,
+        "kind": "snapshot",
+        "blobs": dict(blobs.blobs),
+        "network": data,
+    }
+
+
+def deserialize_network(
+    data: Union[Dict[str, Any], List[Dict[str, Any]]],
+    network_type: Optional[Type["RunnableNetwork"]] = None,
+) -> "RunnableNetwork":
+    """
+    Restores a network from the compact format or from the current format.
+
+    The long strings of the restored network are the strings of the blob
+    table, a text shared by many nodes is in memory once.
+
+    Args:
+        data: A snapshot, the records of a `NetworkJournal`, or a network
+            serialized with `RunnableNetwork.serialize_model`.
+        network_type: The class of the network, RunnableNetwork by default.
+
+    Returns:
+        The restored network.
+    """
+    if isinstance(data, dict) and not is_compact(data):
+        return _validate_network(data, network_type)
+
+    records = _NetworkRecords()
+    for record in [data] if isinstance(data, dict) else data:
+        records.apply(record)
+    if records.deltas is None:
+        raise ValueError("The records of the compact network format need a snapshot")
+    return _validate_network(BlobTable(records.blobs).unpack(records.to_dict()), network_type)
+
+
+class NetworkJournal:
+    """
+    Append-only records of the saves of a network.
+
+    The first record is a snapshot of the network. The next records are the
+    deltas with the nodes created or changed since the previous record, so a
+    save doesn't serialize the whole conversation again. Every
+    `compact_every` deltas, the record is a new snapshot that replaces the
+    previous records and drops the blobs that are not used anymore.
+
+    A delta serializes the nodes marked with `mark_dirty`, like on the events
+    of the network, and the nodes with a replaced field, metadata value or
+    message. A change deeper in a value of a node that isn't marked is saved
+    with the next snapshot.
+
+    Args:
+        min_blob_size: Strings of this length or longer are stored once in the blob table.
+        compact_every: Number of deltas after a snapshot before the next snapshot.
+    """
+
+    def __init__(self, min_blob_size: int = 256, compact_every: int = 50):
+        self.min_blob_size = min_blob_size
+        self.compact_every = compact_every
+        self._reset()
+
+    def _reset(self):
+        self._blobs = BlobTable(min_size=self.min_blob_size)
+        # None before the first snapshot
+        self._deltas: Optional[int] = None
+        self._fields: Dict[str, str] = {}
+        # node key -> (node, signature, fingerprint) of the last record
+        self._nodes: Dict[str, Tuple["RunnableNode", Tuple, str]] = {}
+        self._order: List[str] = []
+        self._connections: Dict[str, List[int]] = {}
+        # ids of the nodes to serialize in the next delta
+        self._dirty: Set[int] = set()
+
+    @property
+    def deltas(self) -> int:
+        """Number of deltas since the last snapshot."""
+        return self._deltas or 0
+
+    def compact(self):
+        """The next record is a snapshot."""
+        self._reset()
+
+    def mark_dirty(self, node: "RunnableNode"):
+        """The node is serialized in the next delta, for the changes in place."""
+        self._dirty.add(id(node))
+
+    def record(self, network: "RunnableNetwork") -> Optional[Dict[str, Any]]:
+        """
+        The record of a save of the network.
+
+        Returns:
+            A snapshot if the previous records should be replaced, a delta to
+            append to them, or None if nothing changed since the last record.
+        """
+        if self._deltas is None or self._deltas >= self.compact_every:
+            self._reset()
+            record = _snapshot(_dump_network(network), self._blobs)
+            self._remember(network, record["network"])
+            self._deltas = 0
+            return record
+
+        # The long strings are blob references, the fingerprints don't encode them
+        data = self._blobs.pack(_dump_fields(network))
+
+        record: Dict[str, Any] = {}
+        fields = {name: _fingerprint(value) for name, value in data.items()}
+        changed_fields = {name: data[name] for name, value in fields.items() if self._fields.get(name) != value}
+        if changed_fields:
+            record["fields"] = changed_fields
+        removed_fields = [name for name in self._fields if name not in fields]
+        if removed_fields:
+            record["removed_fields"] = removed_fields
+        self._fields = fields
+
+        order = []
+        positions = {}
+        changed_nodes = {}
+        nodes = {}
+        for index, node in enumerate(network.nodes):
+            key = _metadata_key(node.metadata, index)
+            order.append(key)
+            positions[id(node)] = index
+
+            signature = _node_signature(node)
+            known = self._nodes.get(key)
+            if known is not None and known[0] is node and known[1] == signature and id(node) not in self._dirty:
+                nodes[key] = known
+                continue
+
+            node_data = self._blobs.pack(_dump_node(node))
+            fingerprint = _fingerprint(node_data)
+            nodes[key] = (node, signature, fingerprint)
+            if known is None or known[2] != fingerprint:
+                changed_nodes[key] = node_data
+        if changed_nodes:
+            record["nodes"] = changed_nodes
+        self._nodes = nodes
+        self._dirty.clear()
+
+        if order != self._order:
+            record["order"] = order
+            self._order = order
+
+        # The connections of the serialized network, with the positions of the parents
+        connections = {
+            str(index): [positions[id(parent)] for parent in node.parents if id(parent) in positions]
+            for index, node in enumerate(network.nodes)
+        }
+        if connections != self._connections:
+            record["__connections__"] = connections
+            self._connections = connections
+
+        blobs = self._blobs.take_pending()
+        if not record:
+            return None
+
+        self._deltas += 1
+        return {
+            "__format__": COMPACT_FORMAT,
+            "__version__": COMPACT_FORMAT_VERSION,
+            "kind": "delta",
+            "blobs": blobs,
+            **record,
+        }
+
+    def _remember(self, network: "RunnableNetwork", data: Dict[str, Any]):
+        """Fingerprints of the network and its packed data, the next record is a delta from it."""
+        data = dict(data)
+        nodes = data.pop("nodes", []) or []
+        self._connections = _connections(data.pop("__connections__", {}) or {})
+        self._fields = {name: _fingerprint(value) for name, value in data.items()}
+        self._order = [_node_key(node, index) for index, node in enumerate(nodes)]
+        self._nodes = {
+            key: (node, _node_signature(node), _fingerprint(node_data))
+            for key, node, node_data in zip(self._order, network.nodes, nodes)
+        }
+        self._dirty.clear()
+
+    def load(
+        self, records: Iterable[Dict[str, Any]], network_type: Optional[Type["RunnableNetwork"]] = None
+    ) -> "RunnableNetwork":
+        """
+        Restores the network from the records, the next record continues them.
+
+        Args:
+            records: The records of the journal, a snapshot first.
+            network_type: The class of the network, RunnableNetwork by default.
+
+        Returns:
+            The restored network.
+        """
+        network_records = _NetworkRecords()
+        for record in records:
+            network_records.apply(record)
+
+        if network_records.deltas is None:
+            raise ValueError("The records of the compact network format need a snapshot")
+
+        self._blobs = BlobTable(network_records.blobs, min_size=self.min_blob_size)
+        network = _validate_network(self._blobs.unpack(network_records.to_dict()), network_type)
+        self._remember(network, self._blobs.pack(_dump_network(network)))
+        self._blobs.take_pending()
+        self._deltas = network_records.deltas
+        return network
@@ -0,0 +1,240 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Cache of the routing decisions of multi-agent networks.
+
+A routing decision is the classification that chooses the route of a
+question. It is cached by the normalized question and a fingerprint of the
+recent context, so a repeated question in the same context doesn't need a
+classification call. With an embedder, a question that is similar enough to a
+cached one reuses its decision too.
+
+The decisions are kept per network. The network also gives the signature of
+its tool set, and the decisions of a network are dropped when the signature
+changes.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import math
+import re
+import threading
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# Embeddings of the last questions, the lookup of a miss and the store after the classification embed the same question
+_EMBEDDING_MEMO_SIZE = 64
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase words of the question without punctuation, "Make it red!" is the same as "make it  red"."""
+    return " ".join(_PUNCTUATION_RE.sub(" ", question.lower()).split())
+
+
+class RoutingCacheHit(NamedTuple):
+    """A cached routing decision."""
+
+    classification: Dict[str, Any]
+    # Cosine similarity of the cached question, 1.0 for the same question
+    similarity: float
+    # True if the cached question is the same normalized question
+    exact: bool
+
+
+class _NetworkDecisions:
+    """The routing decisions of one network."""
+
+    def __init__(self, signature: str):
+        self.signature = signature
+        # (context, question) -> classification, the least recently used first
+        self.exact: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        # context -> (question, unit vector) of every question with an embedding
+        self.embeddings: Dict[str, List[Tuple[str, List[float]]]] = {}
+
+    def remove(self, key: Tuple[str, str]):
+        self.exact.pop(key, None)
+        context, question = key
+        embeddings = self.embeddings.get(context)
+        if embeddings:
+            embeddings[:] = [item for item in embeddings if item[0] != question]
+            if not embeddings:
+                del self.embeddings[context]
+
+
+class RoutingCache:
+    """
+    Process-wide cache of routing decisions.
+
+    Args:
+        max_entries: Maximum number of decisions of a network, the least recently used are dropped.
+        embedder: Optional function that returns the embedding of a text. Without it, only the same
+            normalized question is a hit.
+        similarity_threshold: Minimum cosine similarity of a similar question to reuse its decision.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.9,
+    ):
+        self.max_entries = max_entries
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        self._networks: Dict[str, _NetworkDecisions] = {}
+        self._embedding_memo: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _get_network(self, network_key: str, signature: str, create: bool) -> Optional[_NetworkDecisions]:
+        decisions = self._networks.get(network_key)
+        if decisions is not None and decisions.signature != signature:
+            # The tool set has changed, the decisions don't apply anymore
+            del self._networks[network_key]
+            self.invalidations += 1
+            decisions = None
+
+        if decisions is None and create:
+            decisions = self._networks[network_key] = _NetworkDecisions(signature)
+        return decisions
+
+    def _embed(self, question: str) -> Optional[List[float]]:
+        """Unit vector of the embedding of a normalized question, None if it can't be normalized."""
+        with self._lock:
+            vector = self._embedding_memo.get(question)
+            if vector is not None:
+                self._embedding_memo.move_to_end(question)
+                return vector
+
+        values = [float(value) for value in self.embedder(question)]
+        norm = math.sqrt(sum(value * value for value in values))
+        if not norm:
+            return None
+        vector = [value / norm for value in values]
+
+        with self._lock:
+            self._embedding_memo[question] = vector
+            if len(self._embedding_memo) > _EMBEDDING_MEMO_SIZE:
+                self._embedding_memo.popitem(last=False)
+        return vector
+
+    def lookup(self, network_key: str, signature: str, question: str, context: str) -> Optional[RoutingCacheHit]:
+        """
+        Finds the decision of a question.
+
+        Args:
+            network_key: The network the decision is for.
+            signature: Signature of the tool set of the network.
+            question: The question to route.
+            context: Fingerprint of the recent context of the question.
+
+        Returns:
+            The hit with a copy of the cached classification, or None.
+        """
+        question = normalize_question(question)
+        with self._lock:
+            decisions = self._get_network(network_key, signature, create=False)
+            key = (context, question)
+            classification = decisions.exact.get(key) if decisions is not None else None
+            if classification is not None:
+                decisions.exact.move_to_end(key)
+                self.hits += 1
+                return RoutingCacheHit(dict(classification), 1.0, True)
+
+            search_similar = self.embedder is not None and decisions is not None and context in decisions.embeddings
+
+        # The embedder can be slow, it doesn't hold the lock
+        vector = self._embed(question) if search_similar else None
+
+        with self._lock:
+            decisions = self._networks.get(network_key)
+            if vector is not None and decisions is not None and decisions.signature == signature:
+                best_question, best_similarity = None, -1.0
+                for cached_question, cached_vector in decisions.embeddings.get(context, ()):
+                    similarity = sum(a * b for a, b in zip(vector, cached_vector))
+                    if similarity > best_similarity:
+                        best_question, best_similarity = cached_question, similarity
+
+                key = (context, best_question)
+                if best_similarity >= self.similarity_threshold and key in decisions.exact:
+                    decisions.exact.move_to_end(key)
+                    self.hits += 1
+                    self.similar_hits += 1
+                    return RoutingCacheHit(dict(decisions.exact[key]), best_similarity, False)
+
+            self.misses += 1
+            return None
+
+    def store(self, network_key: str, signature: str, question: str, context: str, classification: Dict[str, Any]):
+        """
+        Caches the decision of a question.
+
+        Args:
+            network_key: The network the decision is for.
+            signature: Signature of the tool set of the network.
+            question: The routed question.
+            context: Fingerprint of the recent context of the question.
+            classification: The classification to reuse for the question.
+        """
+        question = normalize_question(question)
+        vector = self._embed(question) if self.embedder is not None else None
+        with self._lock:
+            decisions = self._get_network(network_key, signature, create=True)
+            key = (context, question)
+            if key not in decisions.exact and vector is not None:
+                decisions.embeddings.setdefault(context, []).append((question, vector))
+            decisions.exact[key] = dict(classification)
+            decisions.exact.move_to_end(key)
+
+            while len(decisions.exact) > self.max_entries:
+                oldest = next(iter(decisions.exact))
+                decisions.remove(oldest)
+
+    def invalidate(self, network_key: Optional[str] = None):
+        """Drops the decisions of a network, or of all the networks."""
+        with self._lock:
+            if network_key is None:
+                self._networks.clear()
+            else:
+                self._networks.pop(network_key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(decisions.exact) for decisions in self._networks.values())
+
+    def get_stats(self) -> Dict[str, int]:
+        """Numbers of hits, similar hits, misses, invalidations and cached decisions."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "similar_hits": self.similar_hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self),
+            }
+
+
+ROUTING_CACHE = RoutingCache()
+
+
+def get_routing_cache() -> RoutingCache:
+    """
+    Get the global routing cache of the multi-agent networks.
+
+    Returns:
+        The global RoutingCache.
+    """
+    global ROUTING_CACHE
+    return ROUTING_CACHE
@@ -7,11 +7,21 @@
 ## license agreement from NVIDIA CORPORATION is strictly prohibited.
 ##
 
+import asyncio
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import patch, MagicMock
-from lc_agent.chat_models.chat_nvcf import ChatNVCF, NvcfCallSync, NvcfCallAsync
+from lc_agent.chat_models import chat_nvcf as chat_nvcf_module
+from lc_agent.chat_models.chat_nvcf import ChatNVCF, NvcfCallSync, NvcfCallAsync, SseParser
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
+WORDS = ["Hello", " wörld", ", data:", " {braces}", " ✓", "\n", " done"]
+
 @pytest.fixture
 def chat_nvcf():
     return ChatNVCF()
@@ -93,5 +103,130 @@ def test_nvcf_call_sync_initialization():
     assert not call._started
     assert not call._finished
 
+def sse_stream(words, line_break="\n"):
+    events = [": keep-alive"]
+    for index, word in enumerate(words):
+        finish_reason = "stop" if index == len(words) - 1 else None
+        chunk = {"choices": [{"delta": {"content": word}, "finish_reason": finish_reason}]}
+        events.append(f"event: message{line_break}data: {json.dumps(chunk, ensure_ascii=False)}")
+    events.append("data: [DONE]")
+    return "".join(event + line_break * 2 for event in events).encode("utf-8")
+
+
+def fragments(data, seed):
+    rng = random.Random(seed)
+    position = 0
+    while position < len(data):
+        size = rng.randint(1, 7)
+        yield data[position : position + size]
+        position += size
+
+
+class SseHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.payloads.append(payload)
+        self.server.accepts.append(self.headers.get_all("Accept"))
+        self.send_response(200)
+        if self.server.content_type:
+            self.send_header("Content-Type", self.server.content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        data = sse_stream(WORDS, self.server.line_break)
+        for fragment in fragments(data, len(self.server.payloads)):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(fragment), fragment))
+            self.wfile.flush()
+            time.sleep(0.001)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+# Endpoints don't always label the stream as an event stream
+@pytest.fixture(
+    params=[("\n", "text/event-stream"), ("\r\n", "text/event-stream"), ("\n", "application/json"), ("\r\n", None)]
+)
+def sse_server(request):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SseHandler)
+    server.connections = 0
+    server.payloads = []
+    server.accepts = []
+    server.line_break, server.content_type = request.param
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_sse_parser_any_fragments():
+    data = sse_stream(WORDS, "\r\n") + b"data: {\"a\":\r\ndata: 1}"
+    expected = SseParser().feed(data) + ['{"a":\n1}']
+    assert [json.loads(event)["choices"][0]["delta"]["content"] for event in expected[: len(WORDS)]] == WORDS
+
+    for split in range(1, len(data)):
+        parser = SseParser()
+        events = parser.feed(data[:split]) + parser.feed(data[split:]) + parser.close()
+        assert events == expected
+
+    parser = SseParser()
+    events = [event for byte in range(len(data)) for event in parser.feed(data[byte : byte + 1])]
+    assert events + parser.close() == expected
+
+
+def test_nvcf_call_single_chunk_response():
+    call = NvcfCallSync({}, {}, "https://test.url")
+    for fragment in fragments(b'{"error": "Function not found"}', 0):
+        call._add_read(fragment, "application/json")
+    assert not call._stack
+    call._add_read(None, "application/json")
+    assert list(call._stack) == [{"error": "Function not found"}]
+    assert call._done
+
+
+def test_chat_nvcf_sync_stream(sse_server):
+    chat = ChatNVCF(invoke_url=f"http://127.0.0.1:{sse_server.server_address[1]}")
+
+    assert chat.invoke([HumanMessage(content="Hi")]).content == "".join(WORDS)
+    assert chat.invoke([HumanMessage(content="Hi")]).content == "".join(WORDS)
+
+    assert sse_server.payloads[0]["stream"] is True
+    assert sse_server.accepts[0] == ["text/event-stream"]
+    assert sse_server.connections == 1
+    metrics = chat.last_stream_metrics
+    assert metrics.chunks == len(WORDS)
+    assert 0 < metrics.time_to_first_token <= metrics.total_time
+    assert metrics.max_inter_chunk_latency >= metrics.mean_inter_chunk_latency > 0
+
+
+def test_chat_nvcf_async_stream(sse_server):
+    chat = ChatNVCF(invoke_url=f"http://127.0.0.1:{sse_server.server_address[1]}")
+
+    async def stream():
+        contents = []
+        for _ in range(2):
+            chunks = chat.astream([HumanMessage(content="Hi")])
+            contents.append([chunk.content async for chunk in chunks if chunk.content])
+        session = chat_nvcf_module.get_async_session()
+        return contents, session
+
+    contents, session = asyncio.run(stream())
+    assert contents == [WORDS, WORDS]
+    assert sse_server.accepts[0] == ["text/event-stream"]
+    assert sse_server.connections == 1
+    assert chat.last_stream_metrics.chunks == len(WORDS)
+    # The pooled session is closed with its event loop
+    assert session.closed
+    assert not chat_nvcf_module._async_sessions
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "test_chat_nvcf.py"])
\ No newline at end of file
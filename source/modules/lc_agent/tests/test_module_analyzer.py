@@ -9,7 +9,8 @@
 
 import pytest
 from unittest.mock import patch, mock_open
-from lc_agent.code_atlas.module_analyzer import ModuleAnalyzer, ModuleResolver, _replace_colons_outside_brackets
+from lc_agent.code_atlas.module_analyzer import ModuleAnalyzer, ModuleResolver
+from lc_agent.code_atlas.module_parser import _replace_colons_outside_brackets
 from lc_agent.code_atlas.codeatlas_module_info import CodeAtlasModuleInfo, CodeAtlasClassInfo, CodeAtlasMethodInfo
 import ast
 import os
@@ -0,0 +1,90 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+import os
+import pytest
+from lc_agent.code_atlas import CodeAtlasCache, ModuleParser
+from lc_agent.code_atlas.module_parser import decode_source, detect_encoding
+
+
+@pytest.fixture
+def extension_tree(tmp_path):
+    extension = tmp_path / "omni.test.ext-1.0.0"
+    package = extension / "omni" / "test" / "ext"
+    (package / "impl").mkdir(parents=True)
+    (extension / "omni" / "__init__.py").write_text("")
+    (extension / "omni" / "test" / "__init__.py").write_text("")
+    (extension / "config").mkdir()
+    (extension / "config" / "extension.toml").write_text('[[python.module]]\nname = "omni.test.ext"\n')
+    (package / "__init__.py").write_text(
+        "__all__ = ['Widget', 'make_widget']\nfrom .impl.widget import Widget\nfrom .impl.factory import make_widget\n"
+    )
+    (package / "impl" / "__init__.py").write_text("")
+    (package / "impl" / "widget.py").write_text(
+        'class Widget:\n    """A widget."""\n\n    def build(self, size: int = 3) -> int:\n'
+        "        if size > 2:\n            return size\n        return 0\n"
+    )
+    (package / "impl" / "factory.py").write_text(
+        "from .widget import Widget\n\n\ndef make_widget() -> Widget:\n    return Widget()\n"
+    )
+    (package / "impl" / "broken.py").write_text("def broken(:\n")
+    (package / "impl" / "crlf.py").write_bytes(b"\xef\xbb\xbfdef crlf():\r\n    return 1\r\n")
+    return extension
+
+
+def scan(path, tmp_path, parser=None):
+    cache = CodeAtlasCache()
+    cache.scan(str(path), parser=parser)
+    output = tmp_path / "atlas.json"
+    cache.save(str(output))
+    return output.read_bytes()
+
+
+def test_parallel_and_cached_scans_match_serial_scan(extension_tree, tmp_path):
+    expected = scan(extension_tree, tmp_path)
+
+    with ModuleParser(max_workers=2) as parser:
+        assert scan(extension_tree, tmp_path, parser) == expected
+        assert parser.stats["parsed"] == 8
+
+    cache_dir = tmp_path / "cache"
+    with ModuleParser(cache_dir=str(cache_dir), max_workers=2) as parser:
+        assert scan(extension_tree, tmp_path, parser) == expected
+    with ModuleParser(cache_dir=str(cache_dir), max_workers=2) as parser:
+        assert scan(extension_tree, tmp_path, parser) == expected
+        assert parser.stats == {"parsed": 0, "cached": 8}
+
+
+def test_changed_files_are_parsed_again(extension_tree, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    widget = extension_tree / "omni" / "test" / "ext" / "impl" / "widget.py"
+    with ModuleParser(cache_dir=cache_dir) as parser:
+        scan(extension_tree, tmp_path, parser)
+
+    # Touched but not changed: the cached result is still used
+    stat = widget.stat()
+    os.utime(widget, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with ModuleParser(cache_dir=cache_dir) as parser:
+        scan(extension_tree, tmp_path, parser)
+        assert parser.stats["parsed"] == 0
+
+    widget.write_text(widget.read_text().replace("class Widget:", "class Widget:\n    count = 0\n"))
+    with ModuleParser(cache_dir=cache_dir) as parser:
+        cached = scan(extension_tree, tmp_path, parser)
+        assert parser.stats["parsed"] == 1
+
+    assert cached == scan(extension_tree, tmp_path)
+
+
+def test_decode_source_matches_text_mode(tmp_path):
+    path = tmp_path / "module.py"
+    for raw in [b"a = 1\r\nb = 2\rc = 3\n", b"\xef\xbb\xbfa = '\xc3\xa9'\n", "a = 1\r\n".encode("utf-16"), b"a = '\xff'\n"]:
+        path.write_bytes(raw)
+        with open(path, "r", encoding=detect_encoding(raw[:4]), errors="replace") as f:
+            assert decode_source(raw) == f.read()
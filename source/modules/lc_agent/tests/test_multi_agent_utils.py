@@ -8,11 +8,20 @@
 ##
 
 import pytest
+from lc_agent import MultiAgentNetworkNode, RunnableHumanNode, RunnableNode
+from lc_agent import get_chat_model_registry, get_node_factory, get_routing_cache
+from lc_agent import disable_profiling, enable_profiling
 from lc_agent.utils.multi_agent_utils import (
+    RouteStreamParser,
     _line_starts_with_action,
     _find_action_at_line_start,
+    determine_next_action,
     parse_classification_result,
 )
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from typing import List
 from unittest.mock import MagicMock
 
 
@@ -225,6 +234,167 @@ class TestParseClassificationResult:
         assert result["content"] is None
 
 
+class TestRouteStreamParser:
+    """Tests for RouteStreamParser."""
+
+    def _feed(self, parser, chunks):
+        for index, chunk in enumerate(chunks):
+            if parser.feed(chunk):
+                return index
+        return None
+
+    def test_route_is_committed_at_end_of_line(self):
+        actions = []
+        parser = RouteStreamParser(["KitInfo", "UsdQuery"], on_action=actions.append)
+        chunks = ["Let me", " check\n", "Kit", "Info", " What is", " the name?", "\nUsdQuery more"]
+        assert self._feed(parser, chunks) == 6
+        assert actions == ["KitInfo"]
+        assert parser.text == "Let me check\nKitInfo What is the name?"
+
+    def test_action_is_known_when_word_is_complete(self):
+        actions = []
+        parser = RouteStreamParser(["KitInfo", "Kit"], on_action=actions.append)
+        assert not parser.feed("Kit")
+        assert parser.action is None
+        assert not parser.feed("Info")
+        assert parser.action is None
+        assert not parser.feed(" Wh")
+        assert actions == ["KitInfo"]
+
+    def test_final_is_not_committed(self):
+        parser = RouteStreamParser(["KitInfo"])
+        assert self._feed(parser, ["FINAL The", " answer\n", "KitInfo is", " long\n"]) is None
+        assert parser.action == "FINAL"
+        assert parser.text == "FINAL The answer\nKitInfo is long\n"
+
+    def test_lines_without_action_are_skipped(self):
+        parser = RouteStreamParser(["KitInfo"])
+        assert self._feed(parser, ["I think KitInfo", " KitInfo\n", "  kitinfo\n", "rest"]) == 2
+        assert parser.action == "KitInfo"
+        assert parser.text == "I think KitInfo KitInfo\n  kitinfo"
+
+
+STREAMED: List[str] = []
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Streams the scripted chunks and records the chunks that were generated."""
+
+    chunks: List[str]
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(self.chunks)))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        for chunk in self.chunks:
+            STREAMED.append(chunk)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=chunk))
+
+
+class RouteNode(RunnableNode):
+    """Answers the routed questions"""
+
+
+CLASSIFICATION = ["Let me", " check\n", "RouteA", " What is", " it?", "\n", "More", " text"]
+
+
+@pytest.fixture
+def routing():
+    STREAMED.clear()
+    get_chat_model_registry().register("scripted", ScriptedChatModel(chunks=CLASSIFICATION))
+    get_node_factory().register(RouteNode, name="RouteA")
+    get_node_factory().register(RouteNode, name="RouteB")
+    yield
+    get_node_factory().unregister("RouteB")
+    get_node_factory().unregister("RouteA")
+    get_chat_model_registry().unregister("scripted")
+
+
+def _create_network(speculative_routing=False, routing_cache=False, question="What is it?"):
+    with MultiAgentNetworkNode(
+        route_nodes=["RouteA", "RouteB"],
+        function_calling=False,
+        default_node="",
+        chat_model_name="scripted",
+        speculative_routing=speculative_routing,
+        routing_cache=routing_cache,
+    ) as network:
+        human_node = RunnableHumanNode(question)
+    return network, human_node
+
+
+@pytest.mark.asyncio
+async def test_speculative_routing_stops_generation(routing):
+    network, human_node = _create_network(speculative_routing=True)
+    result = await determine_next_action(network, human_node)
+
+    assert result["action"] == "RouteA"
+    assert result["content"] == "What is it?"
+    assert result["full"] == "Let me check\nRouteA What is it?"
+    assert "More" not in STREAMED
+
+    # The route node is created before the classification is complete
+    assert isinstance(result["node"], RouteNode)
+    assert result["node"].metadata["tool_call_name"] == "RouteA"
+    assert result["node"] not in network
+
+
+@pytest.mark.asyncio
+async def test_routing_without_speculation_reads_whole_stream(routing):
+    network, human_node = _create_network(speculative_routing=False)
+    result = await determine_next_action(network, human_node)
+
+    assert result["action"] == "RouteA"
+    assert result["content"] == "What is it?\nMore text"
+    assert "node" not in result
+    assert STREAMED == CLASSIFICATION
+
+
+@pytest.mark.asyncio
+async def test_routing_cache_skips_classification(routing):
+    get_routing_cache().invalidate()
+    network, human_node = _create_network(routing_cache=True)
+    first = await determine_next_action(network, human_node)
+    assert STREAMED == CLASSIFICATION
+
+    STREAMED.clear()
+    enable_profiling()
+    try:
+        network, human_node = _create_network(routing_cache=True, question="what is it")
+        second = await determine_next_action(network, human_node)
+    finally:
+        disable_profiling()
+
+    assert STREAMED == []
+    assert second == first
+    frame = network.profiling.frames[0]
+    assert frame.name == "routing_cache_lookup"
+    assert frame.metadata["hit"] and frame.metadata["exact"]
+
+    # Another question in the same network is classified
+    network, human_node = _create_network(routing_cache=True, question="What is that?")
+    await determine_next_action(network, human_node)
+    assert STREAMED == CLASSIFICATION
+
+
+@pytest.mark.asyncio
+async def test_routing_cache_is_invalidated_by_tools(routing):
+    get_routing_cache().invalidate()
+    network, human_node = _create_network(routing_cache=True)
+    await determine_next_action(network, human_node)
+
+    STREAMED.clear()
+    network, human_node = _create_network(routing_cache=True)
+    network.route_nodes = ["RouteA"]
+    result = await determine_next_action(network, human_node)
+    assert result["action"] == "RouteA"
+    assert STREAMED == CLASSIFICATION
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "test_multi_agent_utils.py"])
 
@@ -10,6 +10,7 @@
 import pytest
 from lc_agent.network_lists.network_list import NetworkList
 from lc_agent.runnable_network import RunnableNetwork
+from lc_agent.runnable_node import RunnableNode
 
 class TestNetworkList(NetworkList):
     def save(self, network=None):
@@ -125,5 +126,127 @@ def test_find_network_by_metadata_no_match(network_list, sample_networks):
     result = network_list.find_network_by_metadata({"type": "C"})
     assert len(result) == 0
 
+def test_find_network_by_metadata_missing_key(network_list, sample_networks):
+    for network in sample_networks:
+        network_list.append(network)
+    sample_networks[1].metadata["bookmark"] = True
+    network_list.reindex(sample_networks[1])
+
+    result = network_list.find_network_by_metadata({"bookmark": True})
+    assert result == [sample_networks[1]]
+
+def test_find_network_by_metadata_after_change(network_list, sample_networks):
+    for network in sample_networks:
+        network_list.append(network)
+    assert len(network_list.find_network_by_metadata({"type": "A"})) == 2
+
+    # Changed in place: the stale entry is not returned
+    sample_networks[0].metadata["type"] = "B"
+    assert network_list.find_network_by_metadata({"type": "A"}) == [sample_networks[2]]
+
+    # Found after the next save or reindex
+    network_list.reindex(sample_networks[0])
+    result = network_list.find_network_by_metadata({"type": "B"})
+    assert result == [sample_networks[0], sample_networks[1]]
+
+    network_list.remove(sample_networks[0])
+    assert network_list.find_network_by_metadata({"type": "B"}) == [sample_networks[1]]
+
+def test_find_network_by_uuid(network_list, sample_networks):
+    for network in sample_networks:
+        network_list.append(network)
+
+    network = sample_networks[2]
+    assert network_list.find_network_by_uuid(network.uuid()) is network
+    assert network_list.find_network_by_uuid("unknown") is None
+
+    # Replaced in place
+    network.metadata["uuid"] = "replaced"
+    assert network_list.find_network_by_uuid("replaced") is None
+    network_list.reindex(network)
+    assert network_list.find_network_by_uuid("replaced") is network
+
+    network_list.clear()
+    assert network_list.find_network_by_uuid(network.uuid()) is None
+
+def test_find_node_by_metadata(network_list):
+    with RunnableNetwork() as network1:
+        node1 = RunnableNode()
+        node2 = RunnableNode()
+    with RunnableNetwork() as network2:
+        node3 = RunnableNode()
+    network_list.append(network1)
+    network_list.append(network2)
+
+    node2.metadata["bookmark"] = True
+    node3.metadata["bookmark"] = True
+    assert network_list.find_node_by_metadata({"bookmark": True}) == [node2, node3]
+    assert network_list.find_node(lambda node: node.metadata.get("bookmark")) == [node2, node3]
+
+    # The added node is indexed
+    with network1:
+        node4 = RunnableNode()
+    node4.metadata["bookmark"] = True
+    assert network_list.find_node_by_metadata({"bookmark": True}) == [node2, node4, node3]
+
+    node2.metadata["bookmark"] = False
+    assert network_list.find_node_by_metadata({"bookmark": True}) == [node4, node3]
+
+    # A node changed in place is found after the next save or reindex
+    node1.metadata["bookmark"] = True
+    network_list.reindex(network1)
+    assert network_list.find_node_by_metadata({"bookmark": True}) == [node1, node4, node3]
+
+def test_find_node_by_unhashable_metadata(network_list):
+    with RunnableNetwork() as network:
+        node1 = RunnableNode()
+        node2 = RunnableNode()
+    node1.metadata["tags"] = ["red", "cube"]
+    node2.metadata["tags"] = ["blue"]
+    network_list.append(network)
+
+    assert network_list.find_node_by_metadata({"tags": ["blue"]}) == [node2]
+
+def test_find_network_by_range(network_list, sample_networks):
+    for timestamp, network in zip([30.0, 10.0, 20.0], sample_networks):
+        network.metadata["timestamp"] = timestamp
+        network_list.append(network)
+    network_list.append(RunnableNetwork())
+
+    network1, network2, network3 = sample_networks
+    assert network_list.find_network_by_range("timestamp") == [network2, network3, network1]
+    assert network_list.find_network_by_range("timestamp", 15, 30) == [network3, network1]
+    assert network_list.find_network_by_range("timestamp", end=20, reverse=True) == [network3, network2]
+    assert network_list.find_network_by_range("timestamp", reverse=True, limit=1) == [network1]
+
+    # The range index is kept up to date
+    network = RunnableNetwork()
+    network.metadata["timestamp"] = 25
+    network_list.append(network)
+    assert network_list.find_network_by_range("timestamp", 15, 30) == [network3, network, network1]
+
+    network2.metadata["timestamp"] = 40
+    assert network_list.find_network_by_range("timestamp", reverse=True, limit=2) == [network1, network]
+    network_list.reindex()
+    assert network_list.find_network_by_range("timestamp", reverse=True, limit=2) == [network2, network1]
+
+    with pytest.raises(TypeError):
+        network_list.find_network_by_range("timestamp", 10, "20")
+
+def test_filter_conversations(network_list, sample_networks):
+    for network in sample_networks:
+        network_list.append(network)
+
+    assert network_list.filter_conversations({"type": "A"}) == [sample_networks[0], sample_networks[2]]
+    assert len(network_list) == 3
+
+    network = RunnableNetwork()
+    network.metadata["type"] = "A"
+    network_list.append(network)
+    assert network_list.visible_networks == [sample_networks[0], sample_networks[2], network]
+
+    assert network_list.filter_conversations(lambda n: n.metadata["type"] == "B") == [sample_networks[1]]
+    assert network_list.filter_conversations(None) == list(network_list)
+
 if __name__ == "__main__":
     pytest.main(["-v", "test_network_list.py"])
\ No newline at end of file
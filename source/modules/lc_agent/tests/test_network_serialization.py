@@ -0,0 +1,282 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+from langchain_core.messages import AIMessage
+from lc_agent.network_lists.json_network_list import JsonNetworkList
+from lc_agent.network_node import NetworkNode
+from lc_agent.node_factory import get_node_factory
+from lc_agent.runnable_network import RunnableNetwork
+from lc_agent.runnable_node import RunnableNode
+from lc_agent.runnable_utils import RunnableHumanNode
+from typing import Any, Dict
+from lc_agent.utils import network_serialization
+from lc_agent.utils.network_serialization import NetworkJournal, deserialize_network, serialize_network
+import json
+import os
+import pytest
+import shutil
+import tempfile
+
+SYSTEM = "You are a helpful assistant of the USD scene. " * 20
+
+
+def add_turn(network, question, answer):
+    """A question and the answer of the chat model that saw the whole conversation."""
+    history = [{"type": "system", "content": SYSTEM}]
+    for node in network.nodes:
+        history.append({"type": node.outputs.type, "content": node.outputs.content})
+    history.append({"type": "human", "content": question})
+
+    with network:
+        RunnableHumanNode(question)
+        node = RunnableNode(outputs=AIMessage(content=answer))
+    node.metadata["chat_model_input"] = history
+    return node
+
+
+class AnswerNode(RunnableNode):
+    def invoke(self, input: Dict[str, Any] = {}, config=None, **kwargs):
+        self.outputs = AIMessage(content="Answer")
+        self.invoked = True
+        return self.outputs
+
+
+def create_session(turns):
+    network = RunnableNetwork(metadata={"name": "Session"})
+    for i in range(turns):
+        add_turn(network, f"Question {i}", f"Answer {i} " + "with a long explanation " * 20)
+    return network
+
+
+@pytest.fixture(autouse=True)
+def node_types():
+    node_types = [RunnableNode, RunnableHumanNode, NetworkNode, AnswerNode]
+    for node_type in node_types:
+        get_node_factory().register(node_type)
+    yield
+    for node_type in node_types:
+        get_node_factory().unregister(node_type)
+
+
+@pytest.fixture
+def temp_dir():
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+def test_round_trip_matches_current_format():
+    network = create_session(3)
+    with network:
+        with NetworkNode(name="Sub"):
+            RunnableNode(outputs=AIMessage(content="Sub answer " * 40))
+
+    data = json.loads(json.dumps(serialize_network(network)))
+    restored = deserialize_network(data)
+
+    assert restored.model_dump() == network.model_dump()
+    assert deserialize_network(network.model_dump()).model_dump() == network.model_dump()
+
+
+def test_blobs_are_stored_once():
+    network = create_session(4)
+    data = serialize_network(network)
+
+    assert list(data["blobs"].values()).count(SYSTEM) == 1
+    assert SYSTEM not in json.dumps(data["network"])
+    assert len(json.dumps(data)) < len(json.dumps(network.model_dump()))
+
+    # The nodes of the restored network reference the same string
+    restored = deserialize_network(json.loads(json.dumps(data)))
+    prompts = [node.metadata["chat_model_input"][0]["content"] for node in restored.nodes if node.metadata.get("chat_model_input")]
+    assert len(prompts) == 4
+    assert all(prompt is prompts[0] for prompt in prompts)
+
+
+def test_journal_deltas():
+    network = create_session(2)
+    journal = NetworkJournal()
+
+    records = [journal.record(network)]
+    assert records[0]["kind"] == "snapshot"
+    assert journal.record(network) is None
+
+    node = add_turn(network, "Question 2", "Answer 2")
+    records.append(journal.record(network))
+    delta = records[-1]
+    assert delta["kind"] == "delta"
+    assert len(delta["nodes"]) == 2
+    assert node.uuid() in delta["nodes"]
+    # The system prompt was in the snapshot
+    assert SYSTEM not in delta["blobs"].values()
+
+    network.metadata["name"] = "Renamed"
+    network.nodes[0].metadata["bookmark"] = True
+    records.append(journal.record(network))
+    assert records[-1]["fields"] == {"metadata": network.metadata}
+    assert list(records[-1]["nodes"]) == [network.nodes[0].uuid()]
+
+    network.remove_node(node)
+    records.append(journal.record(network))
+    assert node.uuid() not in records[-1]["order"]
+
+    records = json.loads(json.dumps(records))
+    assert deserialize_network(records).model_dump() == network.model_dump()
+
+    # The loaded journal continues with deltas
+    loaded = NetworkJournal()
+    restored = loaded.load(records)
+    assert restored.model_dump() == network.model_dump()
+    assert loaded.deltas == 3
+    add_turn(restored, "Question 3", "Answer 3")
+    assert loaded.record(restored)["kind"] == "delta"
+
+
+def test_journal_delta_serializes_changed_nodes(monkeypatch):
+    network = create_session(10)
+    journal = NetworkJournal()
+    records = [journal.record(network)]
+
+    dumped = []
+    dump_node = network_serialization._dump_node
+    monkeypatch.setattr(network_serialization, "_dump_node", lambda node: dumped.append(node) or dump_node(node))
+    monkeypatch.setattr(network_serialization, "_dump_network", None)
+
+    node = add_turn(network, "Question 10", "Answer 10")
+    records.append(journal.record(network))
+    assert dumped == network.nodes[-2:]
+    assert journal.record(network) is None
+    assert len(dumped) == 2
+
+    # A message replaced in place
+    network.nodes[1].outputs.content = "Edited answer"
+    records.append(journal.record(network))
+    assert list(records[-1]["nodes"]) == [network.nodes[1].uuid()]
+
+    # A change deeper in a value is saved when the node is marked
+    node.metadata["chat_model_input"][0]["content"] = "Another system message"
+    assert journal.record(network) is None
+    journal.mark_dirty(node)
+    records.append(journal.record(network))
+    assert list(records[-1]["nodes"]) == [node.uuid()]
+
+    records = json.loads(json.dumps(records))
+    assert deserialize_network(records).model_dump() == network.model_dump()
+
+
+def test_json_network_list_saves_nodes_of_events(temp_dir, monkeypatch):
+    # Only the events of the network mark the changed nodes
+    monkeypatch.setattr(network_serialization, "_node_signature", lambda node: ())
+    JsonNetworkList.SAVE_PATH = temp_dir + "/networks/test"
+    network_list = JsonNetworkList(compact=True)
+    network = create_session(1)
+    network_list.append(network)
+    with network:
+        node = AnswerNode()
+    network_list.save()
+
+    network.invoke()
+    assert node.outputs.content == "Answer"
+    network_list.save()
+
+    reloaded = JsonNetworkList(compact=True)
+    reloaded.load()
+    assert reloaded[0].model_dump() == network.model_dump()
+
+
+def test_journal_compaction():
+    network = create_session(1)
+    journal = NetworkJournal(compact_every=2)
+
+    kinds = []
+    for i in range(5):
+        add_turn(network, f"More {i}", f"Answer {i}")
+        kinds.append(journal.record(network)["kind"])
+    assert kinds == ["snapshot", "delta", "delta", "snapshot", "delta"]
+
+
+def test_json_network_list_compact(temp_dir):
+    JsonNetworkList.SAVE_PATH = temp_dir + "/networks/test"
+    network_list = JsonNetworkList(compact=True, compact_every=10)
+    network = create_session(1)
+    network_list.append(network)
+    network_list.save()
+
+    filepath = os.path.join(temp_dir, "networks", "test", "0000_Session.jsonl")
+    size = os.path.getsize(filepath)
+    for i in range(3):
+        add_turn(network, f"More {i}", f"Answer {i}")
+        network_list.save()
+    network_list.save()
+
+    with open(filepath) as f:
+        assert [json.loads(line)["kind"] for line in f] == ["snapshot", "delta", "delta", "delta"]
+    assert os.path.getsize(filepath) < size * 4
+
+    loaded = JsonNetworkList(compact=True, compact_every=10)
+    loaded.load()
+    assert len(loaded) == 1
+    assert loaded[0].model_dump() == network.model_dump()
+
+    # Continues the file, an interrupted save doesn't lose the previous saves
+    add_turn(loaded[0], "Last", "Answer")
+    loaded.save()
+    with open(filepath, "a") as f:
+        f.write('{"__format__": "lc_agent.net')
+
+    reloaded = JsonNetworkList(compact=True)
+    reloaded.load()
+    assert reloaded[0].model_dump() == loaded[0].model_dump()
+
+
+def test_json_network_list_save_after_interrupted_save(temp_dir):
+    JsonNetworkList.SAVE_PATH = temp_dir + "/networks/test"
+    filepath = os.path.join(temp_dir, "networks", "test", "0000_Session.jsonl")
+    network_list = JsonNetworkList(compact=True)
+    network_list.append(create_session(1))
+    network_list.save()
+    add_turn(network_list[0], "Second", "Answer")
+    network_list.save()
+    with open(filepath, "a") as f:
+        f.write('{"__format__": "lc_agent.net')
+
+    # Interrupted save -> load -> save -> load
+    loaded = JsonNetworkList(compact=True)
+    loaded.load()
+    add_turn(loaded[0], "Third", "Answer")
+    loaded.save()
+    add_turn(loaded[0], "Fourth", "Answer")
+    loaded.save()
+
+    with open(filepath) as f:
+        assert [json.loads(line)["kind"] for line in f] == ["snapshot", "delta"]
+
+    reloaded = JsonNetworkList(compact=True)
+    reloaded.load()
+    assert len(reloaded[0].nodes) == 8
+    assert reloaded[0].model_dump() == loaded[0].model_dump()
+
+
+def test_json_network_list_switches_format(temp_dir):
+    JsonNetworkList.SAVE_PATH = temp_dir + "/networks/test"
+    network_list = JsonNetworkList()
+    network_list.append(create_session(2))
+    network_list.save()
+
+    compact_list = JsonNetworkList(compact=True)
+    compact_list.load()
+    compact_list.save()
+    assert sorted(os.listdir(os.path.join(temp_dir, "networks", "test"))) == ["0000_Session.jsonl"]
+
+    network_list.load()
+    assert network_list[0].model_dump() == compact_list[0].model_dump()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "test_network_serialization.py"])
@@ -0,0 +1,91 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+import pytest
+from lc_agent.utils.routing_cache import RoutingCache, normalize_question
+
+VOCABULARY = ["make", "it", "red", "blue", "the", "cube", "sphere", "please", "create"]
+
+ROUTE = {"action": "SceneEdit", "content": "Make the cube red", "full": "SceneEdit Make the cube red"}
+
+
+def embed(text):
+    """Deterministic bag of words embedding."""
+    words = text.split()
+    return [words.count(word) for word in VOCABULARY]
+
+
+def test_normalize_question():
+    assert normalize_question("  Make it RED! ") == "make it red"
+    assert normalize_question("make, it red?") == "make it red"
+
+
+def test_exact_match():
+    cache = RoutingCache()
+    assert cache.lookup("network", "tools", "Make it red", "context") is None
+
+    cache.store("network", "tools", "Make it red", "context", ROUTE)
+    hit = cache.lookup("network", "tools", "make it red!", "context")
+    assert hit.classification == ROUTE
+    assert hit.exact and hit.similarity == 1.0
+
+    # The context and the network are part of the key
+    assert cache.lookup("network", "tools", "Make it red", "other context") is None
+    assert cache.lookup("other network", "tools", "Make it red", "context") is None
+
+    # The cached decision is a copy
+    hit.classification["content"] = "changed"
+    assert cache.lookup("network", "tools", "Make it red", "context").classification == ROUTE
+    assert cache.get_stats() == {"hits": 2, "similar_hits": 0, "misses": 3, "invalidations": 0, "entries": 1}
+
+
+def test_similarity_match():
+    cache = RoutingCache(embedder=embed, similarity_threshold=0.8)
+    cache.store("network", "tools", "Make the cube red", "context", ROUTE)
+
+    hit = cache.lookup("network", "tools", "Please make the cube red", "context")
+    assert hit.classification == ROUTE
+    assert not hit.exact
+    assert hit.similarity == pytest.approx(0.894, abs=1e-3)
+
+    # Below the threshold
+    assert cache.lookup("network", "tools", "Create the sphere", "context") is None
+    # Similar questions only match in the same context
+    assert cache.lookup("network", "tools", "Please make the cube red", "other context") is None
+    assert cache.similar_hits == 1
+
+
+def test_tool_set_change_invalidates_network():
+    cache = RoutingCache()
+    cache.store("network", "tools", "Make it red", "context", ROUTE)
+    cache.store("other network", "tools", "Make it red", "context", ROUTE)
+
+    assert cache.lookup("network", "new tools", "Make it red", "context") is None
+    assert cache.invalidations == 1
+    assert cache.lookup("network", "tools", "Make it red", "context") is None
+    assert cache.lookup("other network", "tools", "Make it red", "context") is not None
+
+    cache.invalidate("other network")
+    assert len(cache) == 0
+
+
+def test_least_recently_used_are_dropped():
+    cache = RoutingCache(max_entries=2, embedder=embed)
+    cache.store("network", "tools", "make it red", "context", ROUTE)
+    cache.store("network", "tools", "make it blue", "context", ROUTE)
+    assert cache.lookup("network", "tools", "make it red", "context") is not None
+
+    cache.store("network", "tools", "create the cube", "context", ROUTE)
+    assert len(cache) == 2
+    assert cache.lookup("network", "tools", "make it blue", "context") is None
+    assert cache.lookup("network", "tools", "make it red", "context") is not None
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "test_routing_cache.py"])
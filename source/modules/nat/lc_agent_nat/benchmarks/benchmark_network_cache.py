@@ -0,0 +1,92 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the network setup of multi-turn conversations with and without
+the `NetworkCache` of `LCAgentFunction`.
+
+Every turn sends the whole conversation, like a chat client does. Without the
+cache the network gets a node per message of every request; with the cache
+the network of the previous turn gets the new message only. The answer of
+every turn is added as an AI node in place of invoking a chat model.
+
+Usage:
+    python benchmark_network_cache.py --turns 200 --conversations 4
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+from lc_agent import RunnableAINode, RunnableHumanNode, RunnableNetwork
+from lc_agent_nat.utils.network_cache import NetworkCache
+
+
+def add_message_nodes(messages):
+    for message in messages:
+        if message.role == "user":
+            RunnableHumanNode(message.content)
+        else:
+            RunnableAINode(message.content)
+
+
+def run_conversations(turns: int, conversations: int, cache: NetworkCache = None):
+    """Run the conversations turn by turn and return the setup time of every turn and the nodes created."""
+    setup_times = [0.0] * turns
+    created_nodes = 0
+    histories = [[] for _ in range(conversations)]
+
+    for turn in range(turns):
+        for index, history in enumerate(histories):
+            history.append(SimpleNamespace(role="user", content=f"Conversation {index}, question {turn}: " + "x" * 200))
+
+            start = time.perf_counter()
+            network, cached_count = cache.take(history) if cache is not None else (None, 0)
+            if network is None:
+                network = RunnableNetwork(default_node="RunnableNode")
+            with network:
+                add_message_nodes(history[cached_count:])
+            setup_times[turn] += time.perf_counter() - start
+            created_nodes += len(history) - cached_count
+
+            answer = f"Answer {turn} of conversation {index}: " + "y" * 400
+            with network:
+                RunnableAINode(answer)
+            if cache is not None:
+                cache.put(history, answer, network)
+            history.append(SimpleNamespace(role="assistant", content=answer))
+
+    return setup_times, created_nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200, help="Turns of every conversation")
+    parser.add_argument("--conversations", type=int, default=4, help="Conversations running side by side")
+    args = parser.parse_args()
+
+    rebuild_times, rebuild_nodes = run_conversations(args.turns, args.conversations)
+
+    cache = NetworkCache(max_networks=args.conversations)
+    cached_times, cached_nodes = run_conversations(args.turns, args.conversations, cache)
+
+    print(f"{args.conversations} conversations of {args.turns} turns")
+    print(f"{'':>12} {'rebuild':>12} {'cached':>12}")
+    for turn in sorted({0, 9, 49, args.turns // 2, args.turns - 1}):
+        if turn < args.turns:
+            print(
+                f"{'turn ' + str(turn + 1):>12} {rebuild_times[turn] * 1000:>10.2f}ms {cached_times[turn] * 1000:>10.2f}ms"
+            )
+    print(f"{'total':>12} {sum(rebuild_times):>11.2f}s {sum(cached_times):>11.2f}s")
+    print(f"{'nodes':>12} {rebuild_nodes:>12,} {cached_nodes:>12,}")
+    print(f"Cache hits {cache.hits}, misses {cache.misses}, cached message size {cache.size / 1024:,.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Micro-benchmark of the input conversion of `FunctionRunnableNode`.
+
+The tool call inputs of the chat model are converted to the input schemas of
+the functions with the conversion that reads the schema fields on every call,
+and with the compiled `SchemaCoercer` of every schema. Invalid inputs render
+the validation error message with the schema help.
+
+Usage:
+    python benchmark_schema_coercer.py --calls 50000
+"""
+
+from typing import Optional
+import argparse
+import json
+import time
+
+from lc_agent_nat.utils.schema_coercer import get_coercer
+from pydantic import BaseModel, Field, ValidationError
+
+
+class QuerySchema(BaseModel):
+    query: str = Field(..., description="The search query")
+
+
+class SearchSchema(BaseModel):
+    query: str = Field(..., description="The search query")
+    scope: str = Field("all", description="Where to search")
+    limit: Optional[int] = Field(10, description="Maximum results")
+
+
+class CreateSchema(BaseModel):
+    prim_path: str = Field(..., description="Path of the new prim")
+    prim_type: str = Field(..., description="Type of the new prim")
+    size: float = Field(..., description="Size of the new prim")
+
+
+CALLS = [
+    (QuerySchema, "Find all the lights of the stage"),
+    (QuerySchema, '{"query": "Find all the cameras"}'),
+    (QuerySchema, {"query": "Find all the meshes"}),
+    (SearchSchema, '{"query": "Lights", "scope": "/World", "limit": 5}'),
+    (SearchSchema, "Lights"),
+    (SearchSchema, {"query": "Lights", "limit": 3}),
+    (CreateSchema, '{"prim_path": "/World/Cube", "prim_type": "Cube", "size": 2.0}'),
+    (CreateSchema, {"prim_path": "/World/Cube", "prim_type": "Cube", "size": "large"}),
+]
+
+
+def legacy_convert(value, input_schema):
+    """The conversion of a string that reads the schema fields on every call."""
+    model_fields = input_schema.model_fields
+    field_names = list(model_fields.keys())
+
+    if len(field_names) == 1:
+        field_name = field_names[0]
+        if isinstance(value, str):
+            try:
+                parsed_json = json.loads(value)
+                if isinstance(parsed_json, dict) and field_name in parsed_json:
+                    value = parsed_json[field_name]
+            except (json.JSONDecodeError, ValueError):
+                pass
+        if isinstance(value, dict) and field_name in value:
+            value = value[field_name]
+        try:
+            return input_schema(**{field_name: value})
+        except Exception:
+            pass
+    elif len(field_names) == 0:
+        return input_schema()
+    else:
+        if isinstance(value, str):
+            try:
+                json_data = json.loads(value)
+                return input_schema(**json_data)
+            except json.JSONDecodeError:
+                pass
+        try:
+            return input_schema(**{field_names[0]: value})
+        except Exception:
+            pass
+
+    field_descriptions = []
+    for name, field in model_fields.items():
+        field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
+        description = field.description or ""
+        field_descriptions.append(f"- {name} ({field_type}): {description}")
+    joined_descriptions = "\n".join(field_descriptions)
+    return (
+        f"Could not convert input to required schema. Input should be JSON formatted with these fields:\n"
+        f"{joined_descriptions}"
+    )
+
+
+def legacy_call(value, input_schema):
+    if isinstance(value, str):
+        return legacy_convert(value, input_schema)
+
+    field_names = list(input_schema.model_fields.keys())
+    if len(field_names) == 1 and field_names[0] in value:
+        value = value[field_names[0]]
+    try:
+        return input_schema(**{field_names[0]: value}) if len(field_names) == 1 else input_schema(**value)
+    except ValidationError as ve:
+        error_details = []
+        for error in ve.errors():
+            field = ".".join(str(loc) for loc in error["loc"])
+            error_details.append(f"  - {field}: {error['msg']}")
+        error_message = "Tool call validation error. Please fix these issues and try again:\n" + "\n".join(
+            error_details
+        )
+        error_message += "\n\nRequired schema:\n"
+        for name, field in input_schema.model_fields.items():
+            field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
+            required = "required" if field.is_required() else "optional"
+            error_message += f"  - {name} ({field_type}, {required}): {field.description or ''}\n"
+        return error_message
+
+
+def coercer_call(value, input_schema):
+    coercer = get_coercer(input_schema)
+    if isinstance(value, str):
+        return coercer.from_string(value)
+    try:
+        return coercer.from_dict(value)
+    except ValidationError as ve:
+        return coercer.input_error(ve)
+
+
+def run(call, calls: int) -> float:
+    start = time.perf_counter()
+    for index in range(calls):
+        input_schema, value = CALLS[index % len(CALLS)]
+        call(value, input_schema)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50000, help="Tool calls to convert")
+    args = parser.parse_args()
+
+    for input_schema, value in CALLS:
+        assert legacy_call(value, input_schema) == coercer_call(value, input_schema)
+
+    legacy = run(legacy_call, args.calls)
+    compiled = run(coercer_call, args.calls)
+    print(f"{args.calls:,} tool calls")
+    print(f"{'legacy':>10} {legacy * 1e6 / args.calls:>8.2f} us/call")
+    print(f"{'compiled':>10} {compiled * 1e6 / args.calls:>8.2f} us/call ({legacy / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Throughput benchmark of the streamed chunks of `LCAgentFunction`.
+
+A fake chat model streams its answer one character per chunk through a
+network. Every chunk is converted to an `AIQChatResponseChunk` and serialized
+to JSON like the NAT server does, with:
+
+- validated: the nested models of every chunk are validated
+- templates: the chunks are copies of validated templates
+- frames: the chunks are joined into frames with `ChunkFramer` first
+
+Usage:
+    python benchmark_stream_chunks.py --tokens 20000 --frame-chars 64
+"""
+
+import argparse
+import asyncio
+import datetime
+import time
+import uuid
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages.utils import _get_message_openai_role
+from lc_agent import RunnableHumanNode, RunnableNetwork, RunnableNode, get_chat_model_registry
+from lc_agent.runnable_node import AINodeMessageChunk
+from lc_agent_nat.utils.chunk_frames import ChunkFramer
+from lc_agent_nat.utils.lc_agent_function import LCAgentFunction, _build_choice
+from nat.data_models.api_server import AIQChatResponseChunk
+
+CHAT_MODEL_NAME = "benchmark_fake_streaming"
+
+
+def convert_validated(value: AINodeMessageChunk) -> AIQChatResponseChunk:
+    """The conversion that validates every chunk."""
+    role = _get_message_openai_role(value)
+    chunk_id = value.id if value.id is not None else str(uuid.uuid4())
+    created_time = datetime.datetime.now(datetime.timezone.utc)
+    return AIQChatResponseChunk(id=chunk_id, choices=[_build_choice(value.content, role)], created=created_time)
+
+
+async def stream(convert, frame_chars: int, frame_interval: float):
+    """Stream the answer and return the chunks of the model, the frames sent, their JSON size and the wall and CPU time."""
+    with RunnableNetwork(chat_model_name=CHAT_MODEL_NAME) as network:
+        RunnableHumanNode("Tell me a long story")
+        RunnableNode()
+
+    framer = ChunkFramer(frame_chars, frame_interval)
+    chunks = 0
+    frames = 0
+    size = 0
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    async for chunk in framer.paced(network.astream()):
+        if chunk is None:
+            frame = framer.flush()
+            size += len(convert(frame).model_dump_json())
+            frames += 1
+            continue
+        if not chunk.content:
+            continue
+        chunks += 1
+        for frame in framer.add(chunk):
+            size += len(convert(frame).model_dump_json())
+            frames += 1
+    frame = framer.flush()
+    if frame is not None:
+        size += len(convert(frame).model_dump_json())
+        frames += 1
+
+    return chunks, frames, size, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=20000, help="Characters streamed by the fake chat model")
+    parser.add_argument("--frame-chars", type=int, default=64, help="Frame size of the frames mode")
+    parser.add_argument("--frame-interval", type=float, default=0.05, help="Frame age of the frames mode")
+    args = parser.parse_args()
+
+    answer = ("The quick brown fox jumps over the lazy dog. " * (args.tokens // 45 + 1))[: args.tokens]
+    get_chat_model_registry().register(CHAT_MODEL_NAME, lambda: FakeListChatModel(responses=[answer]))
+
+    modes = [
+        ("validated", convert_validated, 0),
+        ("templates", LCAgentFunction.convert_chunk, 0),
+        ("frames", LCAgentFunction.convert_chunk, args.frame_chars),
+    ]
+    print(f"{'mode':>10} {'chunks':>8} {'frames':>8} {'JSON KB':>8} {'chunks/s':>10} {'CPU us/token':>13}")
+    for name, convert, frame_chars in modes:
+        chunks, frames, size, wall, cpu = asyncio.run(stream(convert, frame_chars, args.frame_interval))
+        print(
+            f"{name:>10} {chunks:>8,} {frames:>8,} {size / 1024:>8,.0f} {chunks / wall:>10,.0f} {cpu / chunks * 1e6:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
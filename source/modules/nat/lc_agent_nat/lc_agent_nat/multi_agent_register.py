@@ -63,6 +63,19 @@ class MultiAgentConfig(MultiAgentConfigBase, name="MultiAgent"):
     subsequent_routing_instruction: str = Field(
         default="", description="Instructions for the AI's subsequent tool selections"
     )
+    network_cache_size: int = Field(
+        default=16, description="Number of conversation networks reused by the next request, 0 disables the reuse"
+    )
+    network_cache_ttl: float = Field(default=900.0, description="Seconds an unused conversation network is kept")
+    network_cache_max_mb: float = Field(
+        default=64.0, description="Maximum size of the messages of the kept conversation networks in MB"
+    )
+    stream_frame_chars: int = Field(
+        default=64, description="Streamed tokens are sent in frames of this many characters, 0 sends every token"
+    )
+    stream_frame_interval: float = Field(
+        default=0.05, description="Seconds after which a frame of streamed tokens is sent"
+    )
 
 
 @register_function(config_type=MultiAgentConfig, framework_wrappers=[LLMFrameworkEnum.LANGCHAIN])
@@ -20,12 +20,16 @@ from pydantic import Field
 from pydantic import model_serializer
 from pydantic import ValidationError
 from typing import Any, List, Optional, Union, Dict, AsyncGenerator
-import json
 import re
+import textwrap
 import traceback
 import datetime
 import logging
 
+from ..utils.schema_coercer import format_validation_errors
+from ..utils.schema_coercer import get_coercer
+from ..utils.schema_coercer import tool_error_message
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +40,7 @@ class ValidationErrorHandlingFunction(Function):
         """Wrap an existing Function to add validation error handling."""
         # Don't call super().__init__(), just store the wrapped function
         self._wrapped = wrapped_function
+        self._coercer = get_coercer(wrapped_function.input_schema)
         
     def __getattr__(self, name):
         """Delegate all attribute access to the wrapped function."""
@@ -56,93 +61,36 @@ class ValidationErrorHandlingFunction(Function):
             return await self._wrapped.acall_invoke(*args, **kwargs)
         except ValidationError as ve:
             # Format Pydantic validation error for the LLM to understand
-            error_details = []
-            for error in ve.errors():
-                field = ".".join(str(loc) for loc in error['loc'])
-                msg = error['msg']
-                error_details.append(f"  - {field}: {msg}")
-            
-            error_message = f"ERROR: Tool call to '{self._wrapped.instance_name}' failed due to validation errors:\n" + "\n".join(error_details)
-            error_message += f"\n\nThe function was NOT executed. Please retry with correct parameters."
-            if self._wrapped.input_schema:
-                error_message += f"\n\nRequired schema for '{self._wrapped.instance_name}':\n"
-                for name, field in self._wrapped.input_schema.model_fields.items():
-                    field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-                    required = "required" if field.is_required() else "optional"
-                    description = field.description or ""
-                    default_info = f", default={field.default}" if field.default is not None and field.default != ... else ""
-                    error_message += f"  - {name} ({field_type}, {required}{default_info}): {description}\n"
-            
-            return error_message
-    
+            return self._validation_error_message(ve)
+
     async def ainvoke(self, value: Any, to_type: type | None = None):
         """Override ainvoke to catch validation errors."""
         # Special handling for single-field schemas when value is a dict
-        if isinstance(value, dict) and self._wrapped.input_schema:
-            field_names = list(self._wrapped.input_schema.model_fields.keys())
-            if len(field_names) == 1:
-                field_name = field_names[0]
-                # If the dict has exactly one key matching the field name, extract the value
-                if field_name in value and len(value) == 1:
-                    value = value[field_name]
-        
+        if self._coercer is not None:
+            value = self._coercer.unwrap(value)
+
         try:
             return await self._wrapped.ainvoke(value, to_type)
         except ValidationError as ve:
             # Format Pydantic validation error for the LLM to understand
-            error_details = []
-            for error in ve.errors():
-                field = ".".join(str(loc) for loc in error['loc'])
-                msg = error['msg']
-                error_details.append(f"  - {field}: {msg}")
-            
-            error_message = f"ERROR: Tool call to '{self._wrapped.instance_name}' failed due to validation errors:\n" + "\n".join(error_details)
-            error_message += f"\n\nThe function was NOT executed. Please retry with correct parameters."
-            if self._wrapped.input_schema:
-                error_message += f"\n\nRequired schema for '{self._wrapped.instance_name}':\n"
-                for name, field in self._wrapped.input_schema.model_fields.items():
-                    field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-                    required = "required" if field.is_required() else "optional"
-                    description = field.description or ""
-                    default_info = f", default={field.default}" if field.default is not None else ""
-                    error_message += f"  - {name} ({field_type}, {required}{default_info}): {description}\n"
-            
-            return error_message
-    
+            return self._validation_error_message(ve)
+
     async def astream(self, value: Any, to_type: type | None = None) -> AsyncGenerator[Any, None]:
         """Override astream to catch validation errors."""
         # Special handling for single-field schemas when value is a dict
-        if isinstance(value, dict) and self._wrapped.input_schema:
-            field_names = list(self._wrapped.input_schema.model_fields.keys())
-            if len(field_names) == 1:
-                field_name = field_names[0]
-                # If the dict has exactly one key matching the field name, extract the value
-                if field_name in value and len(value) == 1:
-                    value = value[field_name]
-        
+        if self._coercer is not None:
+            value = self._coercer.unwrap(value)
+
         try:
             async for item in self._wrapped.astream(value, to_type):
                 yield item
         except ValidationError as ve:
             # Format Pydantic validation error for the LLM to understand
-            error_details = []
-            for error in ve.errors():
-                field = ".".join(str(loc) for loc in error['loc'])
-                msg = error['msg']
-                error_details.append(f"  - {field}: {msg}")
-            
-            error_message = f"ERROR: Tool call to '{self._wrapped.instance_name}' failed due to validation errors:\n" + "\n".join(error_details)
-            error_message += f"\n\nThe function was NOT executed. Please retry with correct parameters."
-            if self._wrapped.input_schema:
-                error_message += f"\n\nRequired schema for '{self._wrapped.instance_name}':\n"
-                for name, field in self._wrapped.input_schema.model_fields.items():
-                    field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-                    required = "required" if field.is_required() else "optional"
-                    description = field.description or ""
-                    default_info = f", default={field.default}" if field.default is not None else ""
-                    error_message += f"  - {name} ({field_type}, {required}{default_info}): {description}\n"
-            
-            yield error_message
+            yield self._validation_error_message(ve)
+
+    def _validation_error_message(self, error: ValidationError) -> str:
+        function_name = self._wrapped.instance_name
+        return tool_error_message(function_name, error, self._coercer, f"Required schema for '{function_name}'")
 
 
 class FunctionRunnableNode(RunnableNode):
@@ -164,14 +112,8 @@ class FunctionRunnableNode(RunnableNode):
             return await super().ainvoke(input, config, **kwargs)
         except ValidationError as ve:
             # Format error
-            error_details = []
-            for error in ve.errors():
-                field = ".".join(str(loc) for loc in error['loc'])
-                msg = error['msg']
-                error_details.append(f"  - {field}: {msg}")
-            
             function_name = getattr(self.function, 'instance_name', 'unknown')
-            error_message = f"ERROR: Tool call to '{function_name}' failed validation:\n" + "\n".join(error_details)
+            error_message = f"ERROR: Tool call to '{function_name}' failed validation:\n" + format_validation_errors(ve)
             error_message += f"\n\nThe function was NOT executed. Please retry with correct parameters."
             
             # Set this as the output and return it without raising
@@ -225,75 +167,9 @@ class FunctionRunnableNode(RunnableNode):
             input_schema: The Pydantic model class that defines the schema
 
         Returns:
-            An instance of the input_schema class
+            An instance of the input_schema class, or an error message if the conversion failed
         """
-        # Get the model fields
-        model_fields = input_schema.model_fields
-        field_names = list(model_fields.keys())
-
-        # Case 1: If schema has only one field, try direct conversion
-        if len(field_names) == 1:
-            field_name = field_names[0]
-            
-            # Try to parse as JSON first if it's a string
-            if isinstance(value, str):
-                try:
-                    parsed_json = json.loads(value)
-                    # If parsed JSON is a dict with this field name, extract the value
-                    if isinstance(parsed_json, dict) and field_name in parsed_json:
-                        value = parsed_json[field_name]
-                except (json.JSONDecodeError, ValueError):
-                    # Not JSON, use the string value as-is
-                    pass
-            
-            # If value is still a dict with this field name, extract the value
-            if isinstance(value, dict) and field_name in value:
-                value = value[field_name]
-            
-            try:
-                return input_schema(**{field_name: value})
-            except Exception:
-                pass
-
-        # Case 2: If schema has no fields, return the value as is
-        elif len(field_names) == 0:
-            return input_schema()
-
-        # Case 3: Handle multi-field schemas
-        else:
-            # Try parsing as JSON if it's a string
-            if isinstance(value, str):
-                try:
-                    json_data = json.loads(value)
-                    return input_schema(**json_data)
-                except json.JSONDecodeError:
-                    pass
-
-            # Use value as first field and defaults for others
-            try:
-                kwargs = {field_names[0]: value}
-                # Add empty strings for other required string fields
-                for name in field_names[1:]:
-                    if model_fields[name].annotation == str and name in input_schema.model_fields_set:
-                        kwargs[name] = ""
-                return input_schema(**kwargs)
-            except Exception:
-                pass
-
-        # Provide detailed error information when conversion fails
-        field_descriptions = []
-        for name, field in model_fields.items():
-            field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-            description = field.description or ""
-            field_descriptions.append(f"- {name} ({field_type}): {description}")
-
-        # Join descriptions with newlines first, then use in f-string
-        joined_descriptions = "\n".join(field_descriptions)
-        error_msg = (
-            f"Could not convert input to required schema. Input should be JSON formatted with these fields:\n"
-            f"{joined_descriptions}"
-        )
-        return error_msg
+        return get_coercer(input_schema).from_string(value)
 
     def _format_error_message(self, function, error, input_schema=None, parsed_input=None):
         """Format an error message with useful debug information.
@@ -341,16 +217,7 @@ class FunctionRunnableNode(RunnableNode):
         if input_schema:
             schema_name = getattr(input_schema, "__name__", input_schema.__class__.__name__)
             # Get field descriptions in a detailed format
-            field_descriptions = []
-            for name, field in input_schema.model_fields.items():
-                field_type = (
-                    field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-                )
-                description = field.description or ""
-                field_descriptions.append(f"  - {name} ({field_type}): {description}")
-
-            # Join field descriptions first to avoid backslash in f-string expression
-            joined_field_descriptions = "\n".join(field_descriptions)
+            joined_field_descriptions = textwrap.indent(get_coercer(input_schema).fields_help, "  ")
             schema_info = f"""
 SCHEMA INFORMATION:
   Name:        {schema_name}
@@ -414,44 +281,23 @@ TRACEBACK:
         # Get the input value
         value = self._get_input_value(chat_model_input, invoke_input)
 
-        # Get the input schema
+        # Get the input schema and its compiled coercer
         input_schema = function.input_schema
+        coercer = get_coercer(input_schema)
 
         # Convert string value to appropriate input schema
         if isinstance(value, str):
-            converted_value = self._convert_value_to_schema(value, input_schema)
+            converted_value = coercer.from_string(value)
             if isinstance(converted_value, str):  # Error message
                 return AIMessage(content=converted_value)
             value = converted_value
         elif isinstance(value, dict):
-            # Special handling for single-field schemas: extract the value from the dict
-            field_names = list(input_schema.model_fields.keys())
-            if len(field_names) == 1:
-                field_name = field_names[0]
-                if field_name in value:
-                    # Extract the actual value to pass to the function
-                    value = value[field_name]
-            
             # Validate dict inputs against schema to catch missing/invalid fields early
             try:
-                value = input_schema(**{field_names[0]: value}) if len(field_names) == 1 else input_schema(**value)
+                value = coercer.from_dict(value)
             except ValidationError as ve:
                 # Format Pydantic validation error for the LLM to understand
-                error_details = []
-                for error in ve.errors():
-                    field = ".".join(str(loc) for loc in error['loc'])
-                    msg = error['msg']
-                    error_details.append(f"  - {field}: {msg}")
-                
-                error_message = f"Tool call validation error. Please fix these issues and try again:\n" + "\n".join(error_details)
-                error_message += f"\n\nRequired schema:\n"
-                for name, field in input_schema.model_fields.items():
-                    field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-                    required = "required" if field.is_required() else "optional"
-                    description = field.description or ""
-                    error_message += f"  - {name} ({field_type}, {required}): {description}\n"
-                
-                return AIMessage(content=error_message)
+                return AIMessage(content=coercer.input_error(ve))
 
         # Call function's ainvoke with the converted value, handling any exceptions
         # Catch ALL exceptions to prevent workflow from failing
@@ -461,22 +307,8 @@ TRACEBACK:
         except Exception as e:
             # Check if it's a ValidationError to provide better error messages
             if isinstance(e, ValidationError):
-                error_details = []
-                for error in e.errors():
-                    field = ".".join(str(loc) for loc in error['loc'])
-                    msg = error['msg']
-                    error_details.append(f"  - {field}: {msg}")
-                
                 function_name = getattr(function, 'instance_name', 'unknown function')
-                error_message = f"ERROR: Tool call to '{function_name}' failed due to validation errors:\n" + "\n".join(error_details)
-                error_message += f"\n\nThe function was NOT executed. Please retry with correct parameters."
-                error_message += f"\n\nRequired schema:\n"
-                for name, field in input_schema.model_fields.items():
-                    field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-                    required = "required" if field.is_required() else "optional"
-                    description = field.description or ""
-                    default_info = f", default={field.default}" if field.default is not None and field.default != ... else ""
-                    error_message += f"  - {name} ({field_type}, {required}{default_info}): {description}\n"
+                error_message = tool_error_message(function_name, e, coercer)
             else:
                 # Other exceptions - use the existing formatter
                 error_message = self._format_error_message(function, e, input_schema, value)
@@ -494,41 +326,20 @@ TRACEBACK:
 
         # Get input schema and convert value if necessary
         input_schema = function.input_schema
+        coercer = get_coercer(input_schema)
         if isinstance(value, str):
-            converted_value = self._convert_value_to_schema(value, input_schema)
+            converted_value = coercer.from_string(value)
             if isinstance(converted_value, str):  # Error message
                 yield AIMessageChunk(content=converted_value)
                 return
             value = converted_value
         elif isinstance(value, dict):
-            # Special handling for single-field schemas: extract the value from the dict
-            field_names = list(input_schema.model_fields.keys())
-            if len(field_names) == 1:
-                field_name = field_names[0]
-                if field_name in value:
-                    # Extract the actual value to pass to the function
-                    value = value[field_name]
-            
             # Validate dict inputs against schema to catch missing/invalid fields early
             try:
-                value = input_schema(**{field_names[0]: value}) if len(field_names) == 1 else input_schema(**value)
+                value = coercer.from_dict(value)
             except ValidationError as ve:
                 # Format Pydantic validation error for the LLM to understand
-                error_details = []
-                for error in ve.errors():
-                    field = ".".join(str(loc) for loc in error['loc'])
-                    msg = error['msg']
-                    error_details.append(f"  - {field}: {msg}")
-                
-                error_message = f"Tool call validation error. Please fix these issues and try again:\n" + "\n".join(error_details)
-                error_message += f"\n\nRequired schema:\n"
-                for name, field in input_schema.model_fields.items():
-                    field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-                    required = "required" if field.is_required() else "optional"
-                    description = field.description or ""
-                    error_message += f"  - {name} ({field_type}, {required}): {description}\n"
-                
-                yield AIMessageChunk(content=error_message)
+                yield AIMessageChunk(content=coercer.input_error(ve))
                 return
 
         # Stream results from the function, handling any exceptions
@@ -539,22 +350,8 @@ TRACEBACK:
         except Exception as e:
             # Check if it's a ValidationError to provide better error messages
             if isinstance(e, ValidationError):
-                error_details = []
-                for error in e.errors():
-                    field = ".".join(str(loc) for loc in error['loc'])
-                    msg = error['msg']
-                    error_details.append(f"  - {field}: {msg}")
-                
                 function_name = getattr(function, 'instance_name', 'unknown function')
-                error_message = f"ERROR: Tool call to '{function_name}' failed due to validation errors:\n" + "\n".join(error_details)
-                error_message += f"\n\nThe function was NOT executed. Please retry with correct parameters."
-                error_message += f"\n\nRequired schema:\n"
-                for name, field in input_schema.model_fields.items():
-                    field_type = field.annotation.__name__ if hasattr(field.annotation, "__name__") else str(field.annotation)
-                    required = "required" if field.is_required() else "optional"
-                    description = field.description or ""
-                    default_info = f", default={field.default}" if field.default is not None and field.default != ... else ""
-                    error_message += f"  - {name} ({field_type}, {required}{default_info}): {description}\n"
+                error_message = tool_error_message(function_name, e, coercer)
             else:
                 # Other exceptions - use the existing formatter
                 error_message = self._format_error_message(function, e, input_schema, value)
@@ -58,6 +58,8 @@ try:
 except ImportError:
     HAS_STREAMING_CHUNK_TYPES = False
 
+from .utils.chunk_frames import text_content
+
 # LLM Provider
 from pydantic import AliasChoices
 from pydantic import ConfigDict
@@ -247,9 +249,10 @@ async def simple_function(config: SimpleFunctionConfig, builder: Builder):
 
         # Use ChatResponseChunkChoice for streaming (correct type for AIQChatResponseChunk.choices)
         if HAS_STREAMING_CHUNK_TYPES:
+            # The delta only takes text
             choice = ChatResponseChunkChoice(
                 index=0,
-                delta=ChoiceDelta(content=value.content, role=role),
+                delta=ChoiceDelta(content=text_content(value.content), role=role),
                 finish_reason=None,
             )
         else:
@@ -0,0 +1,149 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Coalescing of streamed message chunks into frames.
+
+Chat models stream a chunk per token, and every chunk a function streams is
+converted and serialized on its own. The text chunks of a node are joined
+into frames instead, which are sent when they reach a size, when they are
+older than an interval, when the node changes and at the end of the stream.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, List, Optional, Tuple
+import asyncio
+import contextvars
+import time
+
+from lc_agent.runnable_node import AINodeMessageChunk
+
+
+def text_content(content: Any) -> Optional[str]:
+    """The text of the content of a message, the text parts joined when the content is a list."""
+    if content is None or isinstance(content, str):
+        return content
+    parts = []
+    for part in content:
+        if isinstance(part, str):
+            parts.append(part)
+        elif isinstance(part, dict) and part.get("type") == "text":
+            parts.append(part.get("text", ""))
+    return "".join(parts)
+
+
+class ChunkFramer:
+    """Join the consecutive text chunks of a node into frames.
+
+    Chunks that are not plain text, like tool call chunks, are passed through
+    as they are, after the frame before them.
+
+    Args:
+        max_chars: Size of the text of a frame that sends it, 0 sends every chunk on its own.
+        max_interval: Age in seconds after which a frame is sent, see `paced` to send it without the next chunk.
+    """
+
+    def __init__(self, max_chars: int = 64, max_interval: float = 0.05):
+        self.max_chars = max_chars
+        self.max_interval = max_interval
+
+        self._parts: List[str] = []
+        self._size = 0
+        self._first: Optional[AINodeMessageChunk] = None
+        self._start = 0.0
+
+    def add(self, chunk: AINodeMessageChunk) -> Tuple[AINodeMessageChunk, ...]:
+        """Add a chunk and return the frames to send."""
+        if self.max_chars <= 0:
+            return (chunk,)
+
+        if not self._is_text(chunk):
+            frame = self.flush()
+            return (frame, chunk) if frame is not None else (chunk,)
+
+        ready = ()
+        if self._first is not None and chunk.node is not self._first.node:
+            ready = (self.flush(),)
+
+        if self._first is None:
+            self._first = chunk
+            self._start = time.monotonic()
+        self._parts.append(chunk.content)
+        self._size += len(chunk.content)
+
+        if self._size >= self.max_chars or time.monotonic() - self._start >= self.max_interval:
+            ready += (self.flush(),)
+        return ready
+
+    def flush(self) -> Optional[AINodeMessageChunk]:
+        """Return the frame of the buffered chunks, None if there are none."""
+        first = self._first
+        if first is None:
+            return None
+
+        if len(self._parts) == 1:
+            frame = first
+        else:
+            frame = AINodeMessageChunk(content="".join(self._parts), node=first.node, id=first.id)
+
+        self._parts = []
+        self._size = 0
+        self._first = None
+        return frame
+
+    def time_left(self) -> Optional[float]:
+        """Seconds until the buffered frame is older than the interval, None if there is no frame."""
+        if self._first is None:
+            return None
+        return max(0.0, self._start + self.max_interval - time.monotonic())
+
+    async def paced(self, chunks: AsyncIterable[Any]) -> AsyncIterator[Optional[Any]]:
+        """Iterate the chunks, with None when the buffered frame is due before the next chunk.
+
+        The frame is flushed on None, so a pause of the stream, like a tool
+        call, doesn't hold it back. The steps of the stream run as tasks in one
+        context, the context variables it sets are kept between the steps.
+        """
+        if self.max_chars <= 0:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        iterator = chunks.__aiter__()
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        step = None
+        try:
+            while True:
+                if step is None:
+                    step = loop.create_task(iterator.__anext__(), context=context)
+                done, _ = await asyncio.wait((step,), timeout=self.time_left())
+                if not done:
+                    yield None
+                    continue
+
+                finished, step = step, None
+                try:
+                    chunk = finished.result()
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            if step is not None:
+                step.cancel()
+
+    @staticmethod
+    def _is_text(chunk: AINodeMessageChunk) -> bool:
+        return (
+            type(chunk) is AINodeMessageChunk
+            and isinstance(chunk.content, str)
+            and not chunk.tool_call_chunks
+            and not chunk.additional_kwargs
+            and not chunk.response_metadata
+            and not chunk.usage_metadata
+        )
@@ -16,7 +16,7 @@ RunnableNetwork system for processing messages and generating responses.
 
 import logging
 from collections.abc import AsyncGenerator
-from typing import Generic, TypeVar, Optional, Any
+from typing import Generic, TypeVar, Optional, Any, List
 import datetime
 import uuid
 
@@ -37,6 +37,9 @@ from nat.data_models.api_server import AIQChoice
 from nat.data_models.api_server import AIQChoiceMessage
 from nat.data_models.function import FunctionBaseConfig
 from lc_agent import get_node_factory, get_chat_model_registry
+from .chunk_frames import ChunkFramer
+from .chunk_frames import text_content
+from .network_cache import NetworkCache
 
 # Try to import streaming chunk types (correct for streaming responses)
 try:
@@ -48,6 +51,39 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Validated response chunk objects by role, copied with the content of every streamed chunk
+_chunk_templates = {}
+
+
+def _build_choice(content: Any, role: str):
+    # Use ChatResponseChunkChoice for streaming (correct type for AIQChatResponseChunk.choices)
+    if HAS_STREAMING_CHUNK_TYPES:
+        # The delta only takes text
+        return ChatResponseChunkChoice(
+            index=0,
+            delta=ChoiceDelta(content=text_content(content), role=role),
+            finish_reason=None,
+        )
+
+    # Fallback for older NAT versions without streaming chunk types
+    return AIQChoice(
+        index=0,
+        message=AIQChoiceMessage(content=content, role=role),
+    )
+
+
+def _chunk_template(role: str) -> tuple:
+    template = _chunk_templates.get(role)
+    if template is None:
+        choice = _build_choice("", role)
+        message_field = "delta" if HAS_STREAMING_CHUNK_TYPES else "message"
+        chunk = AIQChatResponseChunk(
+            id="", choices=[choice], created=datetime.datetime.now(datetime.timezone.utc)
+        )
+        template = (getattr(choice, message_field), choice, message_field, chunk)
+        _chunk_templates[role] = template
+    return template
+
 InputT = TypeVar("InputT")
 StreamingOutputT = TypeVar("StreamingOutputT")
 SingleOutputT = TypeVar("SingleOutputT")
@@ -104,6 +140,17 @@ class LCAgentFunction(Function[AIQChatRequest, str, str]):
         # Read output_mode option from config if available, default to "default"
         self.output_mode = getattr(config, "output_mode", "default")
 
+        # Streamed token chunks are sent in frames of this size or age, 0 sends every chunk
+        self.stream_frame_chars = getattr(config, "stream_frame_chars", 64)
+        self.stream_frame_interval = getattr(config, "stream_frame_interval", 0.05)
+
+        # Networks of the previous requests, extended when the conversation continues
+        self.network_cache = NetworkCache(
+            max_networks=getattr(config, "network_cache_size", 16),
+            ttl=getattr(config, "network_cache_ttl", 900.0),
+            max_size=int(getattr(config, "network_cache_max_mb", 64) * 1024 * 1024),
+        )
+
     @staticmethod
     def convert_base_message(value: BaseMessage) -> str:
         """Convert a BaseMessage to a string containing its content."""
@@ -111,26 +158,23 @@ class LCAgentFunction(Function[AIQChatRequest, str, str]):
 
     @staticmethod
     def convert_chunk(value: AINodeMessageChunk) -> AIQChatResponseChunk:
-        """Convert a AINodeMessageChunk to AIQChatResponseChunk."""
-        role = _get_message_openai_role(value)
-
-        # Use ChatResponseChunkChoice for streaming (correct type for AIQChatResponseChunk.choices)
-        if HAS_STREAMING_CHUNK_TYPES:
-            choice = ChatResponseChunkChoice(
-                index=0,
-                delta=ChoiceDelta(content=value.content, role=role),
-                finish_reason=None,
-            )
-        else:
-            # Fallback for older NAT versions without streaming chunk types
-            choice = AIQChoice(
-                index=0,
-                message=AIQChoiceMessage(content=value.content, role=role),
-            )
+        """Convert a AINodeMessageChunk to AIQChatResponseChunk.
 
+        Text chunks are copies of validated template objects with the content
+        of the chunk, so they skip the validation of the nested models.
+        """
+        role = _get_message_openai_role(value)
         chunk_id = value.id if value.id is not None else str(uuid.uuid4())
         created_time = datetime.datetime.now(datetime.timezone.utc)
-        return AIQChatResponseChunk(id=chunk_id, choices=[choice], created=created_time)
+
+        if not isinstance(value.content, str):
+            choice = _build_choice(value.content, role)
+            return AIQChatResponseChunk(id=chunk_id, choices=[choice], created=created_time)
+
+        message, choice, message_field, chunk = _chunk_template(role)
+        message = message.model_copy(update={"content": value.content})
+        choice = choice.model_copy(update={message_field: message})
+        return chunk.model_copy(update={"id": chunk_id, "choices": [choice], "created": created_time})
 
     async def pre_invoke(self, value: AIQChatRequest) -> None:
         """Called before invoking or streaming from the network.
@@ -240,8 +284,73 @@ class LCAgentFunction(Function[AIQChatRequest, str, str]):
 
         return network
 
+    def _add_message_node(self, msg: Any, system_messages: List[SystemMessage]) -> None:
+        """Add the node of an AIQChatRequest message to the active network."""
+        # Handle both string and list content
+        if isinstance(msg.content, str):
+            # Simple string content
+            if msg.role == "user":
+                RunnableHumanNode(msg.content)
+            elif msg.role == "assistant":
+                RunnableAINode(msg.content)
+            elif msg.role == "system":
+                system_messages.append(SystemMessage(content=msg.content))
+        elif isinstance(msg.content, list):
+            # Complex content - convert back to LangChain format
+            lc_content = []
+            for item in msg.content:
+                if hasattr(item, 'text'):
+                    # Regular TextContent
+                    lc_content.append({"type": "text", "text": item.text})
+                elif hasattr(item, 'image_url'):
+                    # Check if this is our custom ImageData with base64 data
+                    if hasattr(item.image_url, 'data'):
+                        # ImageData with base64 - extract the data
+                        lc_content.append({
+                            "type": "image_url",
+                            "image_url": {"url": item.image_url.data}
+                        })
+                    else:
+                        # Standard ImageContent with URL
+                        lc_content.append({
+                            "type": "image_url",
+                            "image_url": {"url": str(item.image_url.url)}
+                        })
+                else:
+                    # Unknown - convert to text
+                    lc_content.append({"type": "text", "text": str(item)})
+
+            # Create nodes with complex content
+            if msg.role == "user":
+                from langchain_core.messages import HumanMessage
+                human_msg = HumanMessage(content=lc_content)
+                # Create a node that outputs this message
+                from lc_agent import RunnableNode
+                class MessageNode(RunnableNode):
+                    def __init__(self):
+                        super().__init__()
+                        self.outputs = human_msg
+                MessageNode()
+            elif msg.role == "assistant":
+                from langchain_core.messages import AIMessage
+                ai_msg = AIMessage(content=lc_content)
+                from lc_agent import RunnableNode
+                class MessageNode(RunnableNode):
+                    def __init__(self):
+                        super().__init__()
+                        self.outputs = ai_msg
+                MessageNode()
+
+    def _use_network_cache(self) -> bool:
+        """Only top level requests carry the whole conversation, child agents extend the network of their parent."""
+        return RunnableNetwork.get_active_network() is None
+
     async def setup_network(self, config: FunctionBaseConfig, input_message: AIQChatRequest) -> RunnableNetwork:
-        """Set up a RunnableNetwork with messages from AIQChatRequest."""
+        """Set up a RunnableNetwork with messages from AIQChatRequest.
+
+        When the request continues the conversation of a previous request, the
+        network of that request is extended with the new messages only.
+        """
         system_messages = []
         if hasattr(config, "system_message") and config.system_message:
             system_messages.append(SystemMessage(content=config.system_message))
@@ -254,64 +363,20 @@ class LCAgentFunction(Function[AIQChatRequest, str, str]):
             # Found existing conversation nodes, connect to them instead of duplicating
             return self._create_network_from_parent_node(reusable_parent_node)
 
-        # Create a RunnableNetwork with the specified configuration
-        with RunnableNetwork(default_node=self.lc_agent_node_name, chat_model_name=self.chat_model_name) as network:
+        messages = input_message.messages
+        network, cached_count = None, 0
+        if self._use_network_cache():
+            network, cached_count = self.network_cache.take(messages)
+        if network is not None:
+            logger.debug(f"Reusing the network of {cached_count} messages, adding {len(messages) - cached_count}")
+        else:
+            # Create a RunnableNetwork with the specified configuration
+            network = RunnableNetwork(default_node=self.lc_agent_node_name, chat_model_name=self.chat_model_name)
+
+        with network:
             # Convert AIQChatRequest messages to LangChain messages
-            for msg in input_message.messages:
-                # Handle both string and list content
-                if isinstance(msg.content, str):
-                    # Simple string content
-                    if msg.role == "user":
-                        RunnableHumanNode(msg.content)
-                    elif msg.role == "assistant":
-                        RunnableAINode(msg.content)
-                    elif msg.role == "system":
-                        system_messages.append(SystemMessage(content=msg.content))
-                elif isinstance(msg.content, list):
-                    # Complex content - convert back to LangChain format
-                    lc_content = []
-                    for item in msg.content:
-                        if hasattr(item, 'text'):
-                            # Regular TextContent
-                            lc_content.append({"type": "text", "text": item.text})
-                        elif hasattr(item, 'image_url'):
-                            # Check if this is our custom ImageData with base64 data
-                            if hasattr(item.image_url, 'data'):
-                                # ImageData with base64 - extract the data
-                                lc_content.append({
-                                    "type": "image_url",
-                                    "image_url": {"url": item.image_url.data}
-                                })
-                            else:
-                                # Standard ImageContent with URL
-                                lc_content.append({
-                                    "type": "image_url",
-                                    "image_url": {"url": str(item.image_url.url)}
-                                })
-                        else:
-                            # Unknown - convert to text
-                            lc_content.append({"type": "text", "text": str(item)})
-
-                    # Create nodes with complex content
-                    if msg.role == "user":
-                        from langchain_core.messages import HumanMessage
-                        human_msg = HumanMessage(content=lc_content)
-                        # Create a node that outputs this message
-                        from lc_agent import RunnableNode
-                        class MessageNode(RunnableNode):
-                            def __init__(self):
-                                super().__init__()
-                                self.outputs = human_msg
-                        MessageNode()
-                    elif msg.role == "assistant":
-                        from langchain_core.messages import AIMessage
-                        ai_msg = AIMessage(content=lc_content)
-                        from lc_agent import RunnableNode
-                        class MessageNode(RunnableNode):
-                            def __init__(self):
-                                super().__init__()
-                                self.outputs = ai_msg
-                        MessageNode()
+            for msg in messages[cached_count:]:
+                self._add_message_node(msg, system_messages)
 
             # if system_messages:
             #     # Add a node for the system message and LLM processing
@@ -327,6 +392,7 @@ class LCAgentFunction(Function[AIQChatRequest, str, str]):
         success = False
         error = None
         try:
+            use_network_cache = self._use_network_cache()
             network = await self.setup_network(self.config, value)
 
             # Invoke the network asynchronously to get the result
@@ -336,6 +402,10 @@ class LCAgentFunction(Function[AIQChatRequest, str, str]):
             if self.output_mode != "raw" and isinstance(response, str) and response.startswith("FINAL "):
                 response = response[6:]
 
+            if use_network_cache and isinstance(response, str):
+                # The next request of the conversation ends with this response and a new message
+                self.network_cache.put(value.messages, response, network)
+
             success = True
             return response
         except ValidationError as ve:
@@ -365,19 +435,31 @@ class LCAgentFunction(Function[AIQChatRequest, str, str]):
         success = False
         error = None
         try:
+            use_network_cache = self._use_network_cache()
             network = await self.setup_network(self.config, value)
             # Network instance created by lc_agent_function will be accessible via
             # parent_node.subnetwork after the first chunk is yielded in NATWrapper
 
             last_node = None
+            response_parts = []
+            # Token chunks are joined into frames to convert and send fewer chunks
+            framer = ChunkFramer(self.stream_frame_chars, self.stream_frame_interval)
+
+            # Stream the response, None when the buffered frame is due before the next chunk
+            async for chunk in framer.paced(network.astream()):
+                if chunk is None:
+                    frame = framer.flush()
+                    if frame is not None:
+                        yield frame
+                    continue
 
-            # Stream the response
-            async for chunk in network.astream():
                 if isinstance(chunk, AINodeMessageChunk):
                     current_node = chunk.node
                     if current_node != last_node:
                         if last_node:
-                            yield AINodeMessageChunk(content="\n\n", node=current_node)
+                            response_parts.append("\n\n")
+                            for frame in framer.add(AINodeMessageChunk(content="\n\n", node=current_node)):
+                                yield frame
 
                         last_node = chunk.node
 
@@ -392,7 +474,17 @@ class LCAgentFunction(Function[AIQChatRequest, str, str]):
                 if not chunk.content:
                     continue
 
-                yield chunk
+                response_parts.append(str(chunk.content))
+                for frame in framer.add(chunk):
+                    yield frame
+
+            frame = framer.flush()
+            if frame is not None:
+                yield frame
+
+            if use_network_cache:
+                # The next request of the conversation ends with the streamed response and a new message
+                self.network_cache.put(value.messages, "".join(response_parts), network)
 
             success = True
         except Exception as e:
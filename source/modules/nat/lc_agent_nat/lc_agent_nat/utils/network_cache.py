@@ -0,0 +1,160 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Cache of the live networks of chat conversations.
+
+A chat request carries the whole conversation. After a request, its network
+holds the nodes of every message and of the answer, so it is cached under the
+hash of the conversation including the answer. The next request of the same
+conversation starts with these messages: the network is taken out of the
+cache and only the new messages are added to it.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import threading
+import time
+
+from lc_agent import RunnableNetwork
+
+
+def _message_bytes(role: str, content: Any) -> bytes:
+    if not isinstance(content, str):
+        # Text and image items of the NAT messages
+        content = json.dumps(
+            [item.model_dump(mode="json") if hasattr(item, "model_dump") else item for item in content],
+            sort_keys=True,
+            default=str,
+        )
+    return f"{role}\n{content}".encode("utf-8")
+
+
+def _extend_hash(previous: bytes, data: bytes) -> bytes:
+    return hashlib.sha256(previous + hashlib.sha256(data).digest()).digest()
+
+
+def prefix_hashes(messages: Sequence[Any]) -> Tuple[List[bytes], int]:
+    """Rolling hashes of the message prefixes and the size of the messages.
+
+    The hash at index i covers the first i messages, index 0 is the empty
+    conversation.
+    """
+    hashes = [b""]
+    size = 0
+    for message in messages:
+        data = _message_bytes(message.role, message.content)
+        hashes.append(_extend_hash(hashes[-1], data))
+        size += len(data)
+    return hashes, size
+
+
+@dataclass
+class _CachedNetwork:
+    network: RunnableNetwork
+    size: int
+    last_used: float
+
+
+class NetworkCache:
+    """Bounded cache of conversation networks, evicted by age, count and size.
+
+    The size of a network is estimated with the size of the messages of its
+    conversation. A network is removed from the cache while a request uses it,
+    so two requests never extend the same network.
+
+    Args:
+        max_networks: Maximum number of cached networks, 0 disables the cache.
+        ttl: Seconds after which an unused network is evicted.
+        max_size: Maximum size of the messages of the cached networks in bytes.
+    """
+
+    def __init__(self, max_networks: int = 16, ttl: float = 900.0, max_size: int = 64 * 1024 * 1024):
+        self.max_networks = max_networks
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._networks: "OrderedDict[bytes, _CachedNetwork]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._networks)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def take(self, messages: Sequence[Any]) -> Tuple[Optional[RunnableNetwork], int]:
+        """Take the network of the longest cached prefix of the messages out of the cache.
+
+        Returns:
+            The network and the number of messages it holds, or None and 0 if
+            no prefix with at least one new message after it is cached.
+        """
+        if not self.max_networks:
+            return None, 0
+
+        hashes, _ = prefix_hashes(messages)
+        with self._lock:
+            self._evict(time.monotonic())
+            for count in range(len(messages) - 1, 0, -1):
+                cached = self._networks.pop(hashes[count], None)
+                if cached is not None:
+                    self._size -= cached.size
+                    self.hits += 1
+                    return cached.network, count
+
+            self.misses += 1
+            return None, 0
+
+    def put(self, messages: Sequence[Any], answer: str, network: RunnableNetwork) -> None:
+        """Cache the network of a request after it answered the messages."""
+        if not self.max_networks:
+            return
+
+        hashes, size = prefix_hashes(messages)
+        answer_data = _message_bytes("assistant", answer)
+        key = _extend_hash(hashes[-1], answer_data)
+        size += len(answer_data)
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            previous = self._networks.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            self._networks[key] = _CachedNetwork(network, size, time.monotonic())
+            self._size += size
+            self._evict(time.monotonic())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._networks.clear()
+            self._size = 0
+
+    def _evict(self, now: float) -> None:
+        # The least recently used networks are first
+        while self._networks:
+            oldest = next(iter(self._networks.values()))
+            if (
+                now - oldest.last_used <= self.ttl
+                and len(self._networks) <= self.max_networks
+                and self._size <= self.max_size
+            ):
+                break
+            _, evicted = self._networks.popitem(last=False)
+            self._size -= evicted.size
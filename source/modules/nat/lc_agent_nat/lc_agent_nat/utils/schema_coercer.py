@@ -0,0 +1,175 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Compiled input schemas of the functions called by the agents.
+
+The fields of an input schema are read once into a `SchemaCoercer`, which maps
+the raw input of a tool call to the schema and renders the schema help of the
+error messages returned to the chat model.
+"""
+
+from typing import Any, Optional, Type, Union
+import json
+import threading
+import weakref
+
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+# First characters of the JSON documents that json.loads accepts
+_JSON_STARTS = frozenset('{["-0123456789tfnNI')
+
+_coercers = weakref.WeakKeyDictionary()
+_coercers_lock = threading.Lock()
+
+
+def _type_name(annotation: Any) -> str:
+    return annotation.__name__ if hasattr(annotation, "__name__") else str(annotation)
+
+
+def format_validation_errors(error: ValidationError) -> str:
+    """One line per error of a Pydantic validation error."""
+    return "\n".join(
+        f"  - {'.'.join(str(loc) for loc in details['loc'])}: {details['msg']}" for details in error.errors()
+    )
+
+
+class SchemaCoercer:
+    """Maps the input of a function call to its input schema.
+
+    Use `get_coercer` to get the coercer of a schema; it is built once per schema.
+    """
+
+    def __init__(self, input_schema: Type[BaseModel]):
+        self.input_schema = input_schema
+
+        model_fields = input_schema.model_fields
+        self.field_names = tuple(model_fields)
+        self.single_field: Optional[str] = self.field_names[0] if len(self.field_names) == 1 else None
+        # A string input is the first field, the other required string fields are empty
+        self.empty_fields = {
+            name: ""
+            for name in self.field_names[1:]
+            if model_fields[name].annotation is str and model_fields[name].is_required()
+        }
+
+        schema_lines = []
+        required_lines = []
+        field_lines = []
+        for name, field in model_fields.items():
+            field_type = _type_name(field.annotation)
+            required = "required" if field.is_required() else "optional"
+            description = field.description or ""
+            default_info = f", default={field.default}" if field.default is not None and field.default != ... else ""
+            schema_lines.append(f"  - {name} ({field_type}, {required}{default_info}): {description}\n")
+            required_lines.append(f"  - {name} ({field_type}, {required}): {description}\n")
+            field_lines.append(f"- {name} ({field_type}): {description}")
+
+        self.schema_help = "".join(schema_lines)
+        self.required_help = "".join(required_lines)
+        self.fields_help = "\n".join(field_lines)
+        self.conversion_error = (
+            "Could not convert input to required schema. Input should be JSON formatted with these fields:\n"
+            f"{self.fields_help}"
+        )
+
+    def unwrap(self, value: Any) -> Any:
+        """Return the value of a dict that holds only the field of a single-field schema, the value otherwise."""
+        if self.single_field is not None and isinstance(value, dict) and len(value) == 1 and self.single_field in value:
+            return value[self.single_field]
+        return value
+
+    def from_string(self, value: str) -> Union[BaseModel, str]:
+        """Convert a string to the schema.
+
+        Returns:
+            An instance of the schema, or the conversion error message
+        """
+        input_schema = self.input_schema
+        field_name = self.single_field
+
+        if field_name is not None:
+            # Only a JSON object can name the field
+            if value.lstrip()[:1] == "{":
+                try:
+                    parsed_json = json.loads(value)
+                except ValueError:
+                    parsed_json = None
+                if isinstance(parsed_json, dict) and field_name in parsed_json:
+                    value = parsed_json[field_name]
+
+            if isinstance(value, dict) and field_name in value:
+                value = value[field_name]
+
+            try:
+                return input_schema(**{field_name: value})
+            except Exception:
+                return self.conversion_error
+
+        if not self.field_names:
+            return input_schema()
+
+        if value.lstrip()[:1] in _JSON_STARTS:
+            try:
+                json_data = json.loads(value)
+            except json.JSONDecodeError:
+                pass
+            else:
+                return input_schema(**json_data)
+
+        try:
+            return input_schema(**{self.field_names[0]: value, **self.empty_fields})
+        except Exception:
+            return self.conversion_error
+
+    def from_dict(self, value: dict) -> BaseModel:
+        """Validate a dict against the schema, raises ValidationError."""
+        field_name = self.single_field
+        if field_name is not None:
+            return self.input_schema(**{field_name: value[field_name] if field_name in value else value})
+        return self.input_schema(**value)
+
+    def input_error(self, error: ValidationError) -> str:
+        """The message of a validation error of a dict input, with the schema help."""
+        return (
+            "Tool call validation error. Please fix these issues and try again:\n"
+            f"{format_validation_errors(error)}"
+            f"\n\nRequired schema:\n{self.required_help}"
+        )
+
+
+def tool_error_message(
+    function_name: str,
+    error: ValidationError,
+    coercer: Optional[SchemaCoercer],
+    schema_title: str = "Required schema",
+) -> str:
+    """The message of a validation error of a function call, with the schema help if there is a schema."""
+    error_message = (
+        f"ERROR: Tool call to '{function_name}' failed due to validation errors:\n"
+        f"{format_validation_errors(error)}"
+        "\n\nThe function was NOT executed. Please retry with correct parameters."
+    )
+    if coercer is not None:
+        error_message += f"\n\n{schema_title}:\n{coercer.schema_help}"
+    return error_message
+
+
+def get_coercer(input_schema: Optional[Type[BaseModel]]) -> Optional[SchemaCoercer]:
+    """The cached coercer of an input schema, None if there is no schema."""
+    if input_schema is None:
+        return None
+
+    coercer = _coercers.get(input_schema)
+    if coercer is None:
+        coercer = SchemaCoercer(input_schema)
+        with _coercers_lock:
+            coercer = _coercers.setdefault(input_schema, coercer)
+    return coercer
@@ -0,0 +1,154 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+import asyncio
+import contextvars
+import datetime
+
+import pytest
+from lc_agent.runnable_node import AINodeMessageChunk
+from lc_agent_nat.utils import chunk_frames
+from lc_agent_nat.utils.chunk_frames import ChunkFramer, text_content
+from lc_agent_nat.utils.lc_agent_function import LCAgentFunction, _build_choice
+from nat.data_models.api_server import AIQChatResponseChunk
+
+
+def contents(frames):
+    return [frame.content for frame in frames]
+
+
+def test_frames_by_size():
+    framer = ChunkFramer(max_chars=5, max_interval=60.0)
+    node = object()
+    frames = []
+    for token in ["He", "llo", " w", "or", "ld", "!"]:
+        frames.extend(framer.add(AINodeMessageChunk(content=token, node=node, id="run-1")))
+    frames.append(framer.flush())
+
+    assert contents(frames) == ["Hello", " world", "!"]
+    assert all(frame.node is node and frame.id == "run-1" for frame in frames)
+    assert framer.flush() is None
+
+
+def test_frames_by_node_and_passthrough():
+    framer = ChunkFramer(max_chars=100, max_interval=60.0)
+    first, second = object(), object()
+    tool_chunk = AINodeMessageChunk(
+        content="", node=second, tool_call_chunks=[{"name": "tool", "args": "{}", "id": "1", "index": 0}]
+    )
+
+    frames = []
+    frames.extend(framer.add(AINodeMessageChunk(content="a", node=first)))
+    frames.extend(framer.add(AINodeMessageChunk(content="b", node=first)))
+    frames.extend(framer.add(AINodeMessageChunk(content="c", node=second)))
+    frames.extend(framer.add(tool_chunk))
+    frames.extend(framer.add(AINodeMessageChunk(content="d", node=second)))
+    frames.append(framer.flush())
+
+    assert contents(frames) == ["ab", "c", "", "d"]
+    assert [frame.node for frame in frames] == [first, second, second, second]
+    assert frames[2] is tool_chunk
+
+
+def test_frames_by_age(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(chunk_frames.time, "monotonic", lambda: now[0])
+    framer = ChunkFramer(max_chars=100, max_interval=0.05)
+    node = object()
+
+    assert framer.add(AINodeMessageChunk(content="a", node=node)) == ()
+    now[0] += 0.01
+    assert framer.add(AINodeMessageChunk(content="b", node=node)) == ()
+    now[0] += 0.05
+    assert contents(framer.add(AINodeMessageChunk(content="c", node=node))) == ["abc"]
+
+
+def test_paced_flushes_during_pause():
+    framer = ChunkFramer(max_chars=100, max_interval=0.01)
+    node = object()
+
+    async def stream():
+        yield AINodeMessageChunk(content="a", node=node)
+        yield AINodeMessageChunk(content="b", node=node)
+        # A tool call or a slow model
+        await asyncio.sleep(0.2)
+        yield AINodeMessageChunk(content="c", node=node)
+
+    async def collect():
+        events = []
+        async for chunk in framer.paced(stream()):
+            if chunk is None:
+                events.append(("due", framer.flush().content))
+            else:
+                events.append(("chunk", contents(framer.add(chunk))))
+        return events
+
+    events = asyncio.run(collect())
+    assert events[:3] == [("chunk", []), ("chunk", []), ("due", "ab")]
+    assert events[3:] == [("chunk", [])]
+    assert framer.flush().content == "c"
+
+
+def test_paced_keeps_context_of_stream():
+    var = contextvars.ContextVar("var", default=None)
+    framer = ChunkFramer(max_chars=100, max_interval=0.01)
+
+    async def stream():
+        token = var.set("set")
+        yield AINodeMessageChunk(content="a", node=None)
+        await asyncio.sleep(0.05)
+        yield AINodeMessageChunk(content=var.get(), node=None)
+        var.reset(token)
+
+    async def collect():
+        found = []
+        async for chunk in framer.paced(stream()):
+            if chunk is None:
+                framer.flush()
+            else:
+                found.append(chunk.content)
+                framer.add(chunk)
+        return found
+
+    assert asyncio.run(collect()) == ["a", "set"]
+
+
+def test_disabled_frames():
+    framer = ChunkFramer(max_chars=0)
+    chunk = AINodeMessageChunk(content="a", node=object())
+    assert framer.add(chunk) == (chunk,)
+    assert framer.flush() is None
+
+
+@pytest.mark.parametrize("content", ["Hello", "", [{"type": "text", "text": "Hello"}]])
+def test_convert_chunk_matches_validated_chunk(content):
+    chunk = AINodeMessageChunk(content=content, id="run-1")
+    converted = LCAgentFunction.convert_chunk(chunk)
+
+    expected = AIQChatResponseChunk(
+        id="run-1", choices=[_build_choice(content, "assistant")], created=converted.created
+    )
+    assert isinstance(converted.created, datetime.datetime)
+    assert converted.model_dump() == expected.model_dump()
+    assert converted.model_dump_json() == expected.model_dump_json()
+    assert converted.choices[0].delta.content == text_content(content)
+
+    # The templates are not changed by the copies
+    assert LCAgentFunction.convert_chunk(AINodeMessageChunk(content="other", id="run-2")).id == "run-2"
+    assert converted.id == "run-1"
+
+
+def test_text_content():
+    assert text_content("Hello") == "Hello"
+    assert text_content(None) is None
+    assert text_content(["Hel", {"type": "text", "text": "lo"}, {"type": "image_url", "image_url": {}}]) == "Hello"
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "test_chunk_frames.py"])
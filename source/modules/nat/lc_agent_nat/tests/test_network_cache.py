@@ -0,0 +1,129 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+from types import SimpleNamespace
+
+import pytest
+from lc_agent import RunnableAINode, RunnableHumanNode, RunnableNetwork
+from lc_agent_nat.utils import network_cache as network_cache_module
+from lc_agent_nat.utils.network_cache import NetworkCache, prefix_hashes
+
+
+def message(role, content):
+    return SimpleNamespace(role=role, content=content)
+
+
+def conversation(turns):
+    messages = []
+    for turn in range(turns):
+        messages.append(message("user", f"question {turn}"))
+        messages.append(message("assistant", f"answer {turn}"))
+    return messages
+
+
+def answered_network(messages, answer):
+    with RunnableNetwork() as network:
+        for msg in messages:
+            RunnableHumanNode(msg.content) if msg.role == "user" else RunnableAINode(msg.content)
+        RunnableAINode(answer)
+    return network
+
+
+def test_prefix_hashes():
+    messages = conversation(2)
+    hashes, size = prefix_hashes(messages)
+    assert len(hashes) == 5
+    assert len(set(hashes)) == 5
+    assert hashes[:3] == prefix_hashes(messages[:2])[0]
+    assert size == sum(len(f"{msg.role}\n{msg.content}") for msg in messages)
+
+    # Same text in another role or split differently is another conversation
+    assert prefix_hashes([message("assistant", "question 0")])[0] != prefix_hashes(messages[:1])[0]
+    assert prefix_hashes([message("user", "a"), message("user", "b")])[0][-1] != prefix_hashes(
+        [message("user", "a\nuser\nb")]
+    )[0][-1]
+
+
+def test_continued_conversation_reuses_the_network():
+    cache = NetworkCache()
+    request = conversation(3) + [message("user", "question 3")]
+    assert cache.take(request) == (None, 0)
+
+    network = answered_network(request, "answer 3")
+    cache.put(request, "answer 3", network)
+    assert len(cache) == 1
+
+    next_request = request + [message("assistant", "answer 3"), message("user", "question 4")]
+    assert cache.take(next_request) == (network, len(request) + 1)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # The network is used by one request at a time
+    assert cache.take(next_request) == (None, 0)
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_other_conversations_miss():
+    cache = NetworkCache()
+    request = conversation(1) + [message("user", "question 1")]
+    cache.put(request, "answer 1", answered_network(request, "answer 1"))
+
+    assert cache.take(request + [message("assistant", "edited answer"), message("user", "q")]) == (None, 0)
+    assert cache.take(conversation(2)[:-1] + [message("user", "question 1")]) == (None, 0)
+    # Nothing new to answer
+    assert cache.take(request + [message("assistant", "answer 1")]) == (None, 0)
+
+
+def test_list_content():
+    cache = NetworkCache()
+    content = [SimpleNamespace(model_dump=lambda mode: {"type": "text", "text": "look"}), {"type": "text", "text": "x"}]
+    request = [message("user", content)]
+    network = answered_network([message("user", "look")], "seen")
+    cache.put(request, "seen", network)
+    assert cache.take(request + [message("assistant", "seen"), message("user", "more")]) == (network, 2)
+
+
+def test_eviction(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(network_cache_module.time, "monotonic", lambda: now[0])
+    cache = NetworkCache(max_networks=2, ttl=10.0, max_size=200)
+
+    requests = [[message("user", f"question {index}")] for index in range(3)]
+    for request in requests:
+        cache.put(request, "answer", answered_network(request, "answer"))
+        now[0] += 1.0
+
+    # The least recently cached network is evicted first
+    assert len(cache) == 2
+    assert cache.take(requests[0] + [message("assistant", "answer"), message("user", "q")]) == (None, 0)
+
+    now[0] += 10.0
+    assert cache.take(requests[2] + [message("assistant", "answer"), message("user", "q")]) == (None, 0)
+    assert len(cache) == 0
+
+    # Networks over the size limit are not cached
+    large = [message("user", "x" * 300)]
+    cache.put(large, "answer", answered_network(large, "answer"))
+    assert len(cache) == 0
+
+    medium = [[message("user", f"{index}" * 80)] for index in range(2)]
+    for request in medium:
+        cache.put(request, "answer", answered_network(request, "answer"))
+    assert len(cache) == 1 and cache.size <= 200
+
+
+def test_disabled_cache():
+    cache = NetworkCache(max_networks=0)
+    request = [message("user", "question")]
+    cache.put(request, "answer", answered_network(request, "answer"))
+    assert len(cache) == 0
+    assert cache.take(request + [message("assistant", "answer"), message("user", "q")]) == (None, 0)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "test_network_cache.py"])
@@ -0,0 +1,102 @@
+## Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+from typing import Optional
+
+import pytest
+from lc_agent_nat.utils.schema_coercer import get_coercer, tool_error_message
+from pydantic import BaseModel, Field, ValidationError
+
+
+class QuerySchema(BaseModel):
+    query: str = Field(..., description="The search query")
+
+
+class CountSchema(BaseModel):
+    count: int
+
+
+class SearchSchema(BaseModel):
+    query: str = Field(..., description="The search query")
+    scope: str = Field(..., description="Where to search")
+    limit: Optional[int] = Field(10, description="Maximum results")
+
+
+class EmptySchema(BaseModel):
+    pass
+
+
+def test_coercer_is_cached():
+    assert get_coercer(QuerySchema) is get_coercer(QuerySchema)
+    assert get_coercer(QuerySchema) is not get_coercer(SearchSchema)
+    assert get_coercer(None) is None
+
+
+def test_single_field_from_string():
+    coercer = get_coercer(QuerySchema)
+    assert coercer.from_string("find usd prims") == QuerySchema(query="find usd prims")
+    assert coercer.from_string('{"query": "lights"}') == QuerySchema(query="lights")
+    assert coercer.from_string('  {"query": {"query": "nested"}}') == QuerySchema(query="nested")
+    # JSON that does not name the field is the value itself
+    assert coercer.from_string('{"other": 1}') == QuerySchema(query='{"other": 1}')
+    assert coercer.from_string("[1, 2]") == QuerySchema(query="[1, 2]")
+
+    count = get_coercer(CountSchema)
+    assert count.from_string("12") == CountSchema(count=12)
+    assert count.from_string("many") == count.conversion_error
+    assert count.conversion_error.endswith("fields:\n- count (int): ")
+
+
+def test_multi_field_from_string():
+    coercer = get_coercer(SearchSchema)
+    assert coercer.from_string('{"query": "a", "scope": "b"}') == SearchSchema(query="a", scope="b")
+    # Plain text is the first field and the other required string fields are empty
+    assert coercer.from_string("cube") == SearchSchema(query="cube", scope="")
+    with pytest.raises(ValidationError):
+        coercer.from_string('{"query": "a"}')
+
+    assert get_coercer(EmptySchema).from_string("anything") == EmptySchema()
+
+
+def test_dict_inputs():
+    coercer = get_coercer(QuerySchema)
+    assert coercer.from_dict({"query": "a"}) == QuerySchema(query="a")
+    assert coercer.unwrap({"query": "a"}) == "a"
+    assert coercer.unwrap({"query": "a", "other": "b"}) == {"query": "a", "other": "b"}
+    assert get_coercer(SearchSchema).unwrap({"query": "a"}) == {"query": "a"}
+    with pytest.raises(ValidationError):
+        get_coercer(SearchSchema).from_dict({"query": "a"})
+
+
+def test_error_messages():
+    coercer = get_coercer(SearchSchema)
+    with pytest.raises(ValidationError) as info:
+        coercer.from_dict({"query": "a"})
+
+    assert coercer.input_error(info.value) == (
+        "Tool call validation error. Please fix these issues and try again:\n"
+        "  - scope: Field required\n\n"
+        "Required schema:\n"
+        "  - query (str, required): The search query\n"
+        "  - scope (str, required): Where to search\n"
+        "  - limit (Optional, optional): Maximum results\n"
+    )
+
+    message = tool_error_message("search", info.value, coercer, "Required schema for 'search'")
+    assert message.startswith(
+        "ERROR: Tool call to 'search' failed due to validation errors:\n  - scope: Field required\n\n"
+        "The function was NOT executed. Please retry with correct parameters.\n\n"
+        "Required schema for 'search':\n"
+    )
+    assert message.endswith("  - limit (Optional, optional, default=10): Maximum results\n")
+    assert "Required schema" not in tool_error_message("search", info.value, None)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "test_schema_coercer.py"])
@@ -12,13 +12,12 @@ from langchain_core.messages import BaseMessage
 from langchain_core.messages.utils import _convert_to_message as convert_to_message
 from langchain_core.prompt_values import ChatPromptValue
 from langchain_core.runnables.base import RunnableLambda
-from langchain_core.vectorstores import VectorStoreRetriever
 from lc_agent import get_retriever_registry
 from lc_agent.utils.profiling_utils import Profiler
 from lc_agent.utils.pydantic import BaseModel
 from pydantic import model_serializer
 from typing import Callable, Literal, Optional
-import time
+import asyncio
 
 
 # Define constants for RAG prompt and item templates
@@ -52,6 +51,95 @@ QA_RAG_ITEM = """Info {idx}
 """
 
 
+# Without a token budget the retriever is asked for `top_k` documents. With a
+# budget it's asked for `top_k * OVERFETCH_FACTOR` documents first, and the
+# number is doubled until `top_k` documents fit the budget, but never above
+# `top_k * MAX_OVERFETCH_FACTOR`.
+OVERFETCH_FACTOR = 2
+MAX_OVERFETCH_FACTOR = 16
+
+# The default `k` of langchain vector store retrievers
+DEFAULT_TOP_K = 4
+
+
+def get_document_tokens(document) -> int:
+    """Returns the number of tokens the document adds to the prompt."""
+    metadata = document.metadata
+    return metadata.get("index_text_tokens", 0) + metadata.get("content_tokens", 0)
+
+
+class _BudgetedSearch:
+    """
+    Retrieves documents until `top_k` of them fit the token budget.
+
+    Documents are packed greedily in the order of relevance: a document that
+    doesn't fit the remaining budget is skipped and the next one is tried, so
+    the skipped documents don't leave the context under-filled.
+    """
+
+    def __init__(self, retriever, top_k: Optional[int], max_tokens: Optional[int]):
+        self._constrained = bool(top_k or max_tokens)
+        if top_k is not None:
+            self._k = top_k
+        else:
+            self._k = getattr(retriever, "search_kwargs", {}).get("k") or DEFAULT_TOP_K
+        self._max_tokens = max_tokens
+        self._fetch_k = self._k * OVERFETCH_FACTOR if max_tokens else self._k
+        self._documents = None
+        self._packed = None
+        self._done = False
+
+    def needs_fetch(self) -> bool:
+        return not self._done
+
+    def search_kwargs(self) -> dict:
+        if not self._constrained:
+            return {}
+
+        # FAISS uses fetch_k instead of k when the retriever has a filter
+        return {"k": self._fetch_k, "fetch_k": self._fetch_k}
+
+    def add_results(self, documents):
+        """Takes the documents of the last fetch and decides if more are needed."""
+        self._documents = documents or []
+        if not self._max_tokens:
+            self._done = True
+            return
+
+        self._packed = self._pack(self._documents)
+        max_fetch_k = self._k * MAX_OVERFETCH_FACTOR
+        self._done = (
+            len(self._packed) >= self._k
+            # The store doesn't have more documents
+            or len(self._documents) < self._fetch_k
+            or self._fetch_k >= max_fetch_k
+        )
+        if not self._done:
+            self._fetch_k = min(self._fetch_k * 2, max_fetch_k)
+
+    def results(self):
+        if not self._constrained:
+            return self._documents
+        if not self._max_tokens:
+            return self._documents[: self._k]
+        return self._packed
+
+    def _pack(self, documents):
+        packed = []
+        total_tokens = 0
+        for document in documents:
+            tokens = get_document_tokens(document)
+            if total_tokens + tokens > self._max_tokens:
+                continue
+
+            total_tokens += tokens
+            packed.append(document)
+            if len(packed) >= self._k:
+                break
+
+        return packed
+
+
 class BaseRetrieverMessage(BaseModel, RunnableLambda, ABC):
     """Base class for handling retrieving and formatting messages with examples."""
 
@@ -60,17 +148,22 @@ class BaseRetrieverMessage(BaseModel, RunnableLambda, ABC):
     # This is "role". In BaseMessage it's called "type"
     type: str = "system"
     func: Optional[Callable] = None
+    afunc: Optional[Callable] = None
     # TODO: keep the result here and don't format and don't invoke if it's already there
     result: Optional[str] = None
 
     def __init__(self, **kwargs):
         BaseModel.__init__(self, **kwargs)
-        RunnableLambda.__init__(self, lambda x, s=self, **kwargs: s._execute(x))
+        RunnableLambda.__init__(
+            self,
+            lambda x, s=self, **kwargs: s._execute(x),
+            afunc=lambda x, s=self, **kwargs: s._aexecute(x),
+        )
 
     def _iter(self, *args, **kwargs):
         """Pydantic serialization method"""
         # No func
-        kwargs["exclude"] = (kwargs.get("exclude", None) or set()) | {"func"}
+        kwargs["exclude"] = (kwargs.get("exclude", None) or set()) | {"func", "afunc"}
 
         # Call super
         yield from super()._iter(*args, **kwargs)
@@ -78,10 +171,10 @@ class BaseRetrieverMessage(BaseModel, RunnableLambda, ABC):
     @model_serializer
     def serialize_model(self) -> dict:
         """Pydantic 2 serialization method using model_serializer"""
-        # Create a base dictionary with all fields except func
+        # Create a base dictionary with all fields except func and afunc
         result = {}
         for field_name, field_value in self:
-            if field_name != "func":
+            if field_name not in ("func", "afunc"):
                 result[field_name] = field_value
 
         return result
@@ -91,18 +184,28 @@ class BaseRetrieverMessage(BaseModel, RunnableLambda, ABC):
         """Process the question and return the formatted message."""
         pass
 
-    def _execute(self, input):
-        """Execute the retriever and format the message."""
-        p = Profiler(
+    async def _aprocess_question(self, question):
+        """
+        Async version of `_process_question`. By default it runs
+        `_process_question` in a thread so it doesn't block the event loop.
+        """
+        return await asyncio.to_thread(self._process_question, question)
+
+    def _create_profiler(self, input) -> Profiler:
+        return Profiler(
             "retriever_execute_" + type(self).__name__,
             "retriever",
-            retriever_name=getattr(self, 'retriever_name', None),
-            question_type=type(input).__name__ if input else 'None'
+            retriever_name=getattr(self, "retriever_name", None),
+            question_type=type(input).__name__ if input else "None",
         )
-        
-        result = input
-        start_time = time.time()
 
+    def _extract_question(self, input):
+        """
+        Finds the question in the input and formats it with the input values.
+
+        Returns:
+            The question message or None if there is no question.
+        """
         if self.question:
             question = self.question
         else:
@@ -123,8 +226,7 @@ class BaseRetrieverMessage(BaseModel, RunnableLambda, ABC):
                 question = None
 
         if not question:
-            # Question not found. Pass through.
-            return input
+            return None
 
         if isinstance(input, list):
             input = input[0] if input else None
@@ -136,28 +238,52 @@ class BaseRetrieverMessage(BaseModel, RunnableLambda, ABC):
             for k, v in input.items():
                 question = question.replace("{" + k + "}", str(v))
 
-        message = convert_to_message((self.type, question))
-        text = self._process_question(message.content)
-        if text:
-            if isinstance(text, BaseMessage):
-                message = text
-            else:
-                message.content = text
-
-            if isinstance(result, ChatPromptValue):
-                result.messages.append(message)
-            elif isinstance(result, list):
-                result.append(message)
-            elif isinstance(result, dict):
-                result = [result, message]
-            else:
-                # TODO: We need more types here
-                result = ChatPromptValue(messages=[message])
+        return convert_to_message((self.type, question))
+
+    def _append_result(self, result, message, text):
+        """Appends the processed text to the input of the message."""
+        if not text:
+            return result
 
-        print(f"RetrieverMessage took {time.time() - start_time} seconds")
+        if isinstance(text, BaseMessage):
+            message = text
+        else:
+            message.content = text
+
+        if isinstance(result, ChatPromptValue):
+            result.messages.append(message)
+        elif isinstance(result, list):
+            result.append(message)
+        elif isinstance(result, dict):
+            result = [result, message]
+        else:
+            # TODO: We need more types here
+            result = ChatPromptValue(messages=[message])
 
         return result
 
+    def _execute(self, input):
+        """Execute the retriever and format the message."""
+        with self._create_profiler(input):
+            message = self._extract_question(input)
+            if message is None:
+                # Question not found. Pass through.
+                return input
+
+            text = self._process_question(message.content)
+            return self._append_result(input, message, text)
+
+    async def _aexecute(self, input):
+        """Async version of `_execute`."""
+        with self._create_profiler(input):
+            message = self._extract_question(input)
+            if message is None:
+                # Question not found. Pass through.
+                return input
+
+            text = await self._aprocess_question(message.content)
+            return self._append_result(input, message, text)
+
 
 class RetrieverMessage(BaseRetrieverMessage):
     """Class to handle retrieving and formatting messages with examples."""
@@ -170,10 +296,13 @@ class RetrieverMessage(BaseRetrieverMessage):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    def _needs_retriever(self) -> bool:
+        # No retriever or constraints. Pass through.
+        return not (self.top_k == 0 or self.max_tokens == 0 or not self.retriever_name)
+
     def _process_question(self, question):
         """Process the question and return the formatted message."""
-        if self.top_k == 0 or self.max_tokens == 0 or not self.retriever_name:
-            # No retriever or constraints. Pass through.
+        if not self._needs_retriever():
             return None
 
         retriever_results = self._invoke_retriever(question)
@@ -181,79 +310,54 @@ class RetrieverMessage(BaseRetrieverMessage):
             formatted_message = self._format_message(retriever_results)
             return formatted_message
 
-    def _invoke_retriever(self, question: str):
-        """Invoke the retriever with the given question and apply search constraints.
+    async def _aprocess_question(self, question):
+        """Async version of `_process_question`."""
+        if not self._needs_retriever():
+            return None
 
-        Args:
-            question: The query string to search for relevant documents.
+        retriever_results = await self._ainvoke_retriever(question)
+        if retriever_results:
+            formatted_message = self._format_message(retriever_results)
+            return formatted_message
 
-        Returns:
-            Retrieved documents if successful, None otherwise.
-        """
+    def _get_retriever(self):
         if not self.retriever_name:
             return None
 
-        retriever = get_retriever_registry().get_retriever(self.retriever_name)
-        if not retriever:
-            return None
-
-        search_kwargs = self._build_search_kwargs(retriever)
-        if search_kwargs:
-            retriever = retriever.copy(update={"search_kwargs": search_kwargs})
+        return get_retriever_registry().get_retriever(self.retriever_name)
 
-        return retriever.invoke(question)
-
-    def _build_search_kwargs(self, retriever):
-        """Build search parameters based on configured constraints.
+    def _invoke_retriever(self, question: str):
+        """Invoke the retriever with the given question and apply search constraints.
 
         Args:
-            retriever: The base retriever instance.
+            question: The query string to search for relevant documents.
 
         Returns:
-            dict: Search parameters including top_k and filter if applicable.
+            Retrieved documents if successful, None otherwise.
         """
-        if not (self.top_k or self.max_tokens):
+        retriever = self._get_retriever()
+        if not retriever:
             return None
 
-        k = self.top_k if self.top_k is not None else retriever.search_kwargs.get("k")
-        filter = self._create_token_filter() if self.max_tokens else None
+        search = _BudgetedSearch(retriever, self.top_k, self.max_tokens)
+        while search.needs_fetch():
+            # The search parameters are passed per call, so the registered
+            # retriever and its store are shared without copying.
+            search.add_results(retriever.invoke(question, **search.search_kwargs()))
 
-        # We need to set fetch_k because of the implementation of FAISS retriever:
-        #
-        # The file langchain_community\vectorstores\faiss.py
-        # In the method similarity_search_with_score_by_vector there is the code:
-        # scores, indices = self.index.search(vector, k if filter is None else fetch_k)
-        #
-        # It means FAISS ignores k if filter is set.
-        search_kwargs = {}
-        if k is not None:
-            search_kwargs["k"] = k
-            search_kwargs["fetch_k"] = k
-        if filter is not None:
-            search_kwargs["filter"] = filter
+        return search.results()
 
-        return search_kwargs
-
-    def _create_token_filter(self):
-        """Create a filter function to limit total tokens in retrieved documents.
-
-        Returns:
-            Callable: Filter function that tracks cumulative token count.
-        """
-        tokens_state = [0, self.max_tokens]  # [current_total, max_allowed]
-
-        def filter_func(metadata):
-            index_tokens = metadata.get("index_text_tokens", 0)
-            content_tokens = metadata.get("content_tokens", 0)
-            total_tokens = index_tokens + content_tokens
-
-            if tokens_state[0] + total_tokens > tokens_state[1]:
-                return False
+    async def _ainvoke_retriever(self, question: str):
+        """Async version of `_invoke_retriever`."""
+        retriever = self._get_retriever()
+        if not retriever:
+            return None
 
-            tokens_state[0] += total_tokens
-            return True
+        search = _BudgetedSearch(retriever, self.top_k, self.max_tokens)
+        while search.needs_fetch():
+            search.add_results(await retriever.ainvoke(question, **search.search_kwargs()))
 
-        return filter_func
+        return search.results()
 
     def _format_message(self, retriever_results):
         """Format the retriever results into a message."""
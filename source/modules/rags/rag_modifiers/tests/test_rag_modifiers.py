@@ -9,6 +9,8 @@
 
 import pytest
 from langchain_community.chat_models.fake import FakeListChatModel
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
 from lc_agent import (
     FromRunnableNode,
     RunnableHumanNode,
@@ -16,8 +18,10 @@ from lc_agent import (
     RunnableNode,
     get_chat_model_registry,
     get_node_factory,
+    get_retriever_registry,
 )
 from lc_agent_rag_modifiers import RetrieverMessage, SystemRagModifier, HumanRagModifier
+from typing import List
 
 # Register fake chat model
 get_chat_model_registry().register(
@@ -86,3 +90,86 @@ def test_human_rag_modifier(network_with_human_rag_modifier):
     ), f"Unexpected question: {retriever_message.question}"
 
     assert result.content == "who are you", f"Unexpected content: {result.content}"
+
+
+class CountingRetriever(BaseRetriever):
+    """Returns the first `k` documents and remembers the requested `k`."""
+
+    documents: List[Document]
+    search_kwargs: dict = {}
+    requested_k: List[int] = []
+
+    def _get_relevant_documents(self, query, *, run_manager, **kwargs):
+        k = {**self.search_kwargs, **kwargs}.get("k", 4)
+        self.requested_k.append(k)
+        return self.documents[:k]
+
+    async def _aget_relevant_documents(self, query, *, run_manager, **kwargs):
+        return self._get_relevant_documents(query, run_manager=run_manager, **kwargs)
+
+
+def make_documents(token_counts):
+    return [
+        Document(page_content=f"doc {i}", metadata={"index_text": f"title {i}", "content_tokens": tokens})
+        for i, tokens in enumerate(token_counts)
+    ]
+
+
+@pytest.fixture
+def counting_retriever():
+    # The first documents are too large, so the budget can only be filled
+    # with the documents after them
+    retriever = CountingRetriever(documents=make_documents([500] * 6 + [10] * 10))
+    get_retriever_registry().register("counting", retriever)
+    yield retriever
+    get_retriever_registry().unregister("counting")
+
+
+def test_retriever_message_overfetches_to_fill_token_budget(counting_retriever):
+    message = RetrieverMessage(retriever_name="counting", question="cube", top_k=3, max_tokens=100)
+
+    documents = message._invoke_retriever("cube")
+
+    assert [d.page_content for d in documents] == ["doc 6", "doc 7", "doc 8"]
+    assert counting_retriever.requested_k == [6, 12]
+
+
+def test_retriever_message_packs_greedily(counting_retriever):
+    message = RetrieverMessage(retriever_name="counting", question="cube", top_k=3, max_tokens=520)
+
+    documents = message._invoke_retriever("cube")
+
+    # The second large document doesn't fit, so the small ones are packed
+    assert [d.page_content for d in documents] == ["doc 0", "doc 6", "doc 7"]
+
+
+def test_retriever_message_stops_when_store_is_exhausted(counting_retriever):
+    message = RetrieverMessage(retriever_name="counting", question="cube", top_k=20, max_tokens=50)
+
+    documents = message._invoke_retriever("cube")
+
+    assert len(documents) == 5
+    assert counting_retriever.requested_k == [40]
+
+
+def test_retriever_message_without_budget(counting_retriever):
+    message = RetrieverMessage(retriever_name="counting", question="cube", top_k=2)
+
+    documents = message._invoke_retriever("cube")
+
+    assert [d.page_content for d in documents] == ["doc 0", "doc 1"]
+    assert counting_retriever.requested_k == [2]
+    # The registered retriever is not modified
+    assert counting_retriever.search_kwargs == {}
+
+
+@pytest.mark.asyncio
+async def test_retriever_message_ainvoke(counting_retriever):
+    message = RetrieverMessage(retriever_name="counting", type="system", top_k=3, max_tokens=100)
+
+    result = await message.ainvoke("How to create a cube?")
+
+    assert counting_retriever.requested_k == [6, 12]
+    content = result.messages[-1].content
+    assert "doc 6" in content and "doc 8" in content
+    assert "doc 0" not in content
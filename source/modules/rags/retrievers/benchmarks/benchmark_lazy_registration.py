@@ -0,0 +1,128 @@
+## Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+"""
+Benchmark of the process start cost of `register_all` with and without lazy
+loading of the FAISS indexes.
+
+Every mode runs in a fresh Python process that imports the package, calls
+`register_all` and optionally runs one query against one retriever, which is
+what a session that uses only one retriever does. The script reports the wall
+time and the peak RSS of each process.
+
+Usage:
+    # The indexes shipped with the package (needs NVIDIA_API_KEY for --query)
+    python benchmark_lazy_registration.py
+
+    # Synthetic indexes with a local fake embedder
+    python benchmark_lazy_registration.py --synthetic 200000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+
+CHILD_SCRIPT = """
+import json
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+
+from lc_agent import get_retriever_registry
+import lc_agent_retrievers.register_retrievers as register_retrievers
+
+options = json.loads(sys.argv[1])
+
+if options["index_dir"]:
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    register_retrievers.FAISS_INDEXES = {
+        name: f"{options['index_dir']}/{name}" for name in register_retrievers.FAISS_INDEXES
+    }
+    register_retrievers._get_nvidia_embedder = lambda **kwargs: DeterministicFakeEmbedding(size=options["dim"])
+
+register_retrievers.register_all(lazy=options["lazy"], memory_map=options["memory_map"])
+registered = time.perf_counter()
+
+if options["query"]:
+    get_retriever_registry().get_retriever("usd_metafunctions").invoke("How to create a cube?")
+queried = time.perf_counter()
+
+print(
+    json.dumps(
+        {
+            "register_s": registered - start,
+            "total_s": queried - start,
+            "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        }
+    )
+)
+"""
+
+
+def build_synthetic_indexes(index_dir: str, num_vectors: int, dim: int):
+    """Saves one random FAISS index per registered retriever."""
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores.faiss import FAISS
+    from langchain_core.documents import Document
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from lc_agent_retrievers.register_retrievers import FAISS_INDEXES
+    import faiss
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    for name in FAISS_INDEXES:
+        index = faiss.IndexFlatL2(dim)
+        index.add(rng.random((num_vectors, dim), dtype=np.float32))
+        docstore = InMemoryDocstore({str(i): Document(page_content=f"document {i}") for i in range(num_vectors)})
+        index_to_docstore_id = {i: str(i) for i in range(num_vectors)}
+        vectordb = FAISS(DeterministicFakeEmbedding(size=dim), index, docstore, index_to_docstore_id)
+        vectordb.save_local(f"{index_dir}/{name}")
+
+
+def run_child(options: dict) -> dict:
+    output = subprocess.check_output([sys.executable, "-c", CHILD_SCRIPT, json.dumps(options)], text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--synthetic", type=int, default=0, help="Number of vectors in each synthetic index")
+    parser.add_argument("--dim", type=int, default=1024, help="Dimension of the synthetic vectors")
+    parser.add_argument("--query", action="store_true", help="Run one query against one retriever")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of processes per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        if args.synthetic:
+            build_synthetic_indexes(index_dir, args.synthetic, args.dim)
+        else:
+            index_dir = None
+
+        modes = [("eager", False, False), ("lazy", True, False), ("lazy+mmap", True, True)]
+        print(f"{'mode':<12}{'register s':>12}{'total s':>12}{'max RSS MB':>12}")
+        for mode, lazy, memory_map in modes:
+            options = {
+                "index_dir": index_dir,
+                "dim": args.dim,
+                "lazy": lazy,
+                "memory_map": memory_map,
+                "query": args.query,
+            }
+            runs = [run_child(options) for _ in range(args.repeat)]
+            best = min(runs, key=lambda r: r["total_s"])
+            print(f"{mode:<12}{best['register_s']:>12.3f}{best['total_s']:>12.3f}{best['max_rss_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
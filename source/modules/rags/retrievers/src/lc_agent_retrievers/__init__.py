@@ -7,5 +7,6 @@
 ## license agreement from NVIDIA CORPORATION is strictly prohibited.
 ##
 
+from .lazy_faiss_retriever import LazyFaissRetriever
 from .register_retrievers import register_all
 from .register_retrievers import unregister_all
@@ -0,0 +1,144 @@
+## Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+##
+## NVIDIA CORPORATION and its licensors retain all intellectual property
+## and proprietary rights in and to this software, related documentation
+## and any modifications thereto.  Any use, reproduction, disclosure or
+## distribution of this software and related documentation without an express
+## license agreement from NVIDIA CORPORATION is strictly prohibited.
+##
+
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from pydantic import PrivateAttr
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import threading
+import time
+
+
+class LazyFaissRetriever(BaseRetriever):
+    """
+    FAISS retriever that loads its index on first use.
+
+    The registry entry only keeps the path of the index and a factory for the
+    embedder, so registering retrievers that a session never uses costs
+    nothing. The index is loaded once under a lock, even when several
+    requests hit it at the same time.
+
+    Attributes:
+        index_path: Folder with `index.faiss` and `index.pkl`.
+        embedder_factory: Creates the embedder used to embed the queries.
+        search_type: The search type of the underlying vector store retriever.
+        search_kwargs: The default search parameters, like `k`.
+        memory_map: Memory map the index file instead of reading it into
+            memory. Falls back to reading when the index type can't be mapped.
+        idle_timeout: Unload the index when it's not used for this many
+            seconds. None keeps it loaded.
+    """
+
+    index_path: str
+    embedder_factory: Callable[[], Any]
+    search_type: str = "similarity"
+    search_kwargs: Dict[str, Any] = {}
+    memory_map: bool = False
+    idle_timeout: Optional[float] = None
+
+    _vectorstore: Any = PrivateAttr(None)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+    _last_used: float = PrivateAttr(0.0)
+    _idle_timer: Optional[threading.Timer] = PrivateAttr(None)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._vectorstore is not None
+
+    def load(self):
+        """Loads the index if it's not loaded and returns the vector store."""
+        self._last_used = time.monotonic()
+
+        vectorstore = self._vectorstore
+        if vectorstore is not None:
+            return vectorstore
+
+        with self._lock:
+            if self._vectorstore is None:
+                self._vectorstore = self._load_vectorstore()
+                self._schedule_idle_check(self.idle_timeout)
+
+            return self._vectorstore
+
+    def unload(self):
+        """Releases the index. It will be loaded again on the next use."""
+        with self._lock:
+            self._vectorstore = None
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+
+    def prewarm(self) -> threading.Thread:
+        """Loads the index in a background thread."""
+        thread = threading.Thread(target=self.load, name=f"prewarm {self.index_path}", daemon=True)
+        thread.start()
+        return thread
+
+    def _load_vectorstore(self):
+        from langchain_community.vectorstores.faiss import FAISS
+
+        embedder = self.embedder_factory()
+
+        if self.memory_map:
+            import faiss
+
+            try:
+                return FAISS.load_local(
+                    self.index_path,
+                    embedder,
+                    allow_dangerous_deserialization=True,
+                    io_flags=faiss.IO_FLAG_MMAP,
+                )
+            except RuntimeError:
+                # Not every index type supports memory mapping
+                pass
+
+        return FAISS.load_local(self.index_path, embedder, allow_dangerous_deserialization=True)
+
+    def _schedule_idle_check(self, delay: Optional[float]):
+        if delay is None:
+            return
+
+        self._idle_timer = threading.Timer(delay, self._check_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _check_idle(self):
+        with self._lock:
+            if self._vectorstore is None:
+                return
+
+            idle = time.monotonic() - self._last_used
+            if idle >= self.idle_timeout:
+                self._vectorstore = None
+                self._idle_timer = None
+            else:
+                self._schedule_idle_check(self.idle_timeout - idle)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun, **kwargs: Any
+    ) -> List[Document]:
+        retriever = self.load().as_retriever(search_type=self.search_type, search_kwargs=self.search_kwargs)
+        return retriever._get_relevant_documents(query, run_manager=run_manager, **kwargs)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun, **kwargs: Any
+    ) -> List[Document]:
+        vectorstore = self._vectorstore
+        if vectorstore is None:
+            # Don't block the event loop while the index is loading
+            vectorstore = await asyncio.to_thread(self.load)
+        else:
+            self._last_used = time.monotonic()
+
+        retriever = vectorstore.as_retriever(search_type=self.search_type, search_kwargs=self.search_kwargs)
+        return await retriever._aget_relevant_documents(query, run_manager=run_manager, **kwargs)
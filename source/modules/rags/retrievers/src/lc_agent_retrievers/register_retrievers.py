@@ -7,13 +7,28 @@
 ## license agreement from NVIDIA CORPORATION is strictly prohibited.
 ##
 
-from langchain_community.vectorstores.faiss import FAISS
-from langchain_nvidia_ai_endpoints import NVIDIAEmbeddings
+from .lazy_faiss_retriever import LazyFaissRetriever
 from lc_agent import get_retriever_registry
+from typing import Optional
+import functools
 import os
 
+# Name of the registered retriever -> folder of its FAISS index
+FAISS_INDEXES = {
+    # Code retriever
+    "embedqa": "../data/faiss_index_embedqa_3346",
+    # Metafunction retriever
+    "usd_metafunctions": "../data/faiss_usd_metafunctions_01",
+    # Knowledge retriever
+    "usd_knowledge_qa": "../data/faiss_index_ai-embed-qa-4_ousd_sdgqa",
+    # Code 06262024 retriever
+    "usd_code06262024": "../data/faiss_index_ai-embed-qa-4_code06262024",
+}
+
 
 def _get_nvidia_embedder(api_key: str = None, func_id: str = None, model: str = None):
+    from langchain_nvidia_ai_endpoints import NVIDIAEmbeddings
+
     embedding = NVIDIAEmbeddings(model="nvidia/nv-embedqa-e5-v5", truncate="END", nvidia_api_key=api_key)
     if model:
         embedding.model = model
@@ -30,44 +45,90 @@ def _get_nvidia_embedder(api_key: str = None, func_id: str = None, model: str =
 
 
 def register_faiss_retriever(
-    name, vectordb_index_name: str, top_k: int = 3, api_key: str = None, func_id: str = None, model: str = None
+    name,
+    vectordb_index_name: str,
+    top_k: int = 3,
+    api_key: str = None,
+    func_id: str = None,
+    model: str = None,
+    lazy: bool = False,
+    memory_map: bool = False,
+    prewarm: bool = False,
+    idle_timeout: Optional[float] = None,
 ):
-    embedder = _get_nvidia_embedder(api_key=api_key, func_id=func_id, model=model)
-    if not embedder:
-        return
-
-    vectordb = FAISS.load_local(vectordb_index_name, embedder, allow_dangerous_deserialization=True)
-
-    retriever = vectordb.as_retriever(search_type="similarity", search_kwargs={"k": top_k})
+    """
+    Registers a FAISS retriever in the retriever registry.
+
+    Args:
+        name: The name of the retriever in the registry.
+        vectordb_index_name: The folder of the FAISS index.
+        top_k: The number of documents to retrieve.
+        api_key, func_id, model: Passed to the NVIDIA embedder.
+        lazy: Register the path only and load the index on first use.
+        memory_map: Memory map the index file when it's loaded lazily.
+        prewarm: Start loading the lazy index in the background right away.
+        idle_timeout: Unload the lazy index after it's not used for this many
+            seconds.
+    """
+    embedder_factory = functools.partial(_get_nvidia_embedder, api_key=api_key, func_id=func_id, model=model)
+
+    if lazy:
+        retriever = LazyFaissRetriever(
+            index_path=vectordb_index_name,
+            embedder_factory=embedder_factory,
+            search_type="similarity",
+            search_kwargs={"k": top_k},
+            memory_map=memory_map,
+            idle_timeout=idle_timeout,
+        )
+        if prewarm:
+            retriever.prewarm()
+    else:
+        from langchain_community.vectorstores.faiss import FAISS
+
+        embedder = embedder_factory()
+        if not embedder:
+            return
+
+        vectordb = FAISS.load_local(vectordb_index_name, embedder, allow_dangerous_deserialization=True)
+
+        retriever = vectordb.as_retriever(search_type="similarity", search_kwargs={"k": top_k})
 
     get_retriever_registry().register(name, retriever)
 
 
-def register_all(top_k: int = 3, api_key: str = None, func_id: str = None, model: str = None):
-
-    # Code retriever
-    faiss_index_code_embedqa = "../data/faiss_index_embedqa_3346"
-    faiss_index_code_embedqa = os.path.abspath(f"{__file__}/{faiss_index_code_embedqa}")
-    register_faiss_retriever("embedqa", faiss_index_code_embedqa, top_k, api_key, func_id, model)
-
-    # Metafunction retriever
-    faiss_usd_metafunctions = "../data/faiss_usd_metafunctions_01"
-    faiss_usd_metafunctions = os.path.abspath(f"{__file__}/{faiss_usd_metafunctions}")
-    register_faiss_retriever("usd_metafunctions", faiss_usd_metafunctions, top_k, api_key, func_id, model)
-
-    # Knowledge retriever
-    faiss_index_usd_knowledge_qa = "../data/faiss_index_ai-embed-qa-4_ousd_sdgqa"
-    faiss_index_usd_knowledge_qa = os.path.abspath(f"{__file__}/{faiss_index_usd_knowledge_qa}")
-    register_faiss_retriever("usd_knowledge_qa", faiss_index_usd_knowledge_qa, top_k, api_key, func_id, model)
-
-    # Code 06262024 retriever
-    faiss_index_usd_code06262024 = "../data/faiss_index_ai-embed-qa-4_code06262024"
-    faiss_index_usd_code06262024 = os.path.abspath(f"{__file__}/{faiss_index_usd_code06262024}")
-    register_faiss_retriever("usd_code06262024", faiss_index_usd_code06262024, top_k, api_key, func_id, model)
+def register_all(
+    top_k: int = 3,
+    api_key: str = None,
+    func_id: str = None,
+    model: str = None,
+    lazy: bool = True,
+    memory_map: bool = False,
+    prewarm: bool = False,
+    idle_timeout: Optional[float] = None,
+):
+    """
+    Registers all the FAISS retrievers of the package.
+
+    By default the indexes are loaded when they are used for the first time.
+    See `register_faiss_retriever` for the arguments.
+    """
+    for name, index_path in FAISS_INDEXES.items():
+        index_path = os.path.abspath(os.path.join(__file__, index_path))
+        register_faiss_retriever(
+            name,
+            index_path,
+            top_k,
+            api_key,
+            func_id,
+            model,
+            lazy=lazy,
+            memory_map=memory_map,
+            prewarm=prewarm,
+            idle_timeout=idle_timeout,
+        )
 
 
 def unregister_all():
-    get_retriever_registry().unregister("embedqa")
-    get_retriever_registry().unregister("usd_metafunctions")
-    get_retriever_registry().unregister("usd_knowledge_qa")
-    get_retriever_registry().unregister("usd_code06262024")
+    for name in FAISS_INDEXES:
+        get_retriever_registry().unregister(name)